@@ -0,0 +1,100 @@
+# Copyright (c) 2026, Inria
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Compare the throughput of the JSON backends on the documents handled by PowerAPI.
+Usage: python benchmarks/json_backends.py [number of iterations]
+"""
+
+import sys
+from datetime import datetime, UTC
+from timeit import timeit
+
+from powerapi.database.json_backends import get_json_backend
+from powerapi.report import PowerReport
+
+
+def make_hwpc_document(sockets: int = 2, cpus_per_socket: int = 16) -> dict:
+    """
+    Create a HwPC report document, as sent by the hwpc-sensor.
+    :param sockets: Number of CPU sockets
+    :param cpus_per_socket: Number of CPU per socket
+    :return: HwPC report document
+    """
+    events = ('CPU_CLK_THREAD_UNHALTED:REF_P', 'CPU_CLK_THREAD_UNHALTED:THREAD_P', 'INSTRUCTIONS_RETIRED', 'LLC_MISSES')
+    return {
+        'timestamp': 1767225600000,
+        'sensor': 'sensor',
+        'target': '/kubepods.slice/kubepods-burstable.slice/cri-containerd-0123456789abcdef.scope',
+        'groups': {
+            'core': {
+                str(socket): {
+                    str(cpu): {'time_enabled': 500123456, 'time_running': 500123456} | {event: 123456789 + cpu for event in events}
+                    for cpu in range(socket * cpus_per_socket, (socket + 1) * cpus_per_socket)
+                }
+                for socket in range(sockets)
+            },
+            'rapl': {'0': {'0': {'RAPL_ENERGY_PKG': 4194304000, 'time_enabled': 500123456, 'time_running': 500123456}}},
+        },
+        'metadata': {'k8s': {'namespace': 'default', 'pod': 'pytest-0', 'container': 'pytest'}},
+    }
+
+
+def make_power_document() -> dict:
+    """
+    Create the document of a power report, as written by the JSON output.
+    :return: Power report document
+    """
+    report = PowerReport(datetime(2026, 1, 1, tzinfo=UTC), 'sensor', 'target', 42.195, {'scope': 'cpu', 'socket': 0})
+    return vars(report)
+
+
+def main(iterations: int) -> None:
+    """
+    Run the benchmark for each installed backend.
+    :param iterations: Number of operations measured per document and backend
+    """
+    documents = {'hwpc': make_hwpc_document(), 'power': make_power_document()}
+
+    print(f'{"backend":<10}{"document":<10}{"dumps (ops/s)":>16}{"loads (ops/s)":>16}')
+    for name in ('json', 'orjson', 'msgspec'):
+        try:
+            backend = get_json_backend(name)
+        except ValueError:
+            print(f'{name:<10}not installed')
+            continue
+
+        for document_name, document in documents.items():
+            encoded = backend.dumps(document)
+            dumps_time = timeit('dumps(document)', globals={'dumps': backend.dumps, 'document': document}, number=iterations)
+            loads_time = timeit('loads(encoded)', globals={'loads': backend.loads, 'encoded': encoded}, number=iterations)
+            print(f'{name:<10}{document_name:<10}{iterations / dumps_time:>16.0f}{iterations / loads_time:>16.0f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
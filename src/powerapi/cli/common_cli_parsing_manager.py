@@ -207,6 +207,63 @@ class CommonCLIParsingManager(RootConfigParsingManager):
             help_text='MongoDB collection name',
             is_mandatory=True
         )
+        subparser_mongo_input.add_argument(
+            'b', 'batch-size',
+            help_text='Number of documents claimed (and deleted) at once in stream mode',
+            argument_type=int,
+            default_value=1000,
+        )
+        subparser_mongo_input.add_argument(
+            't', 'tailable',
+            help_text='Follow the capped collection with a tailable cursor in stream mode, without deleting the documents',
+            is_flag=True,
+            action=store_true,
+            default_value=False,
+        )
+        subparser_mongo_input.add_argument(
+            'F', 'from',
+            help_text='Start of the time window of the reports to read, inclusive (ISO 8601 timestamp, UTC if no offset)',
+        )
+        subparser_mongo_input.add_argument(
+            'T', 'to',
+            help_text='End of the time window of the reports to read, exclusive (ISO 8601 timestamp, UTC if no offset)',
+        )
+        subparser_mongo_input.add_argument(
+            's', 'sensors',
+            help_text='Comma-separated list of the sensors of the reports to read',
+            argument_type=list,
+        )
+        subparser_mongo_input.add_argument(
+            'a', 'targets',
+            help_text='Comma-separated list of the targets of the reports to read',
+            argument_type=list,
+        )
+        subparser_mongo_input.add_argument(
+            'g', 'groups',
+            help_text='Comma-separated list of the event groups to retrieve from the reports',
+            argument_type=list,
+        )
+        subparser_mongo_input.add_argument(
+            'e', 'events',
+            help_text='Comma-separated list of the events to keep in the reports (including time_enabled/time_running if needed)',
+            argument_type=list,
+        )
+        subparser_mongo_input.add_argument(
+            'k', 'cursor-batch-size',
+            help_text='Number of documents returned by each batch of the cursor, 0 to use the server default',
+            argument_type=int,
+            default_value=0,
+        )
+        subparser_mongo_input.add_argument(
+            'i', 'hint',
+            help_text='Name of the index to use to read the documents',
+        )
+        subparser_mongo_input.add_argument(
+            'p', 'readers',
+            help_text='Number of reader threads reading _id ranges of the collection concurrently (non-stream mode only)',
+            argument_type=int,
+            default_value=1,
+        )
 
         self.add_subgroup_parser('input', subparser_mongo_input)
 
@@ -218,7 +275,7 @@ class CommonCLIParsingManager(RootConfigParsingManager):
 
         subparser_socket_input.add_argument(
             'h', 'host',
-            help_text='Host address the socket listens on',
+            help_text='Host address the socket listens on, or listen URI: tcp://HOST:PORT, udp://HOST:PORT, or unix://PATH',
             default_value='localhost'
         )
         subparser_socket_input.add_argument(
@@ -227,6 +284,17 @@ class CommonCLIParsingManager(RootConfigParsingManager):
             argument_type=int,
             default_value=9080,
         )
+        subparser_socket_input.add_argument(
+            'P', 'protocol',
+            help_text='Wire protocol expected from the sensors: auto, json, or binary',
+            default_value='auto'
+        )
+        subparser_socket_input.add_argument(
+            'w', 'workers',
+            help_text='Number of ingestion worker processes sharing the TCP/UDP listen address',
+            argument_type=int,
+            default_value=1,
+        )
 
         self.add_subgroup_parser('input', subparser_socket_input)
 
@@ -242,6 +310,25 @@ class CommonCLIParsingManager(RootConfigParsingManager):
             argument_type=list,
             is_mandatory=True
         )
+        subparser_csv_input.add_argument(
+            'c', 'compression',
+            help_text='Input compression format: auto, gzip, lzma, zstd, or none',
+            default_value='auto'
+        )
+        subparser_csv_input.add_argument(
+            'w', 'workers',
+            help_text='Number of worker processes parsing the uncompressed input files in memory-mapped chunks',
+            argument_type=int,
+            default_value=1,
+        )
+        subparser_csv_input.add_argument(
+            'F', 'from',
+            help_text='Start of the time window of the reports to read, inclusive (ISO 8601 timestamp, UTC if no offset)',
+        )
+        subparser_csv_input.add_argument(
+            'T', 'to',
+            help_text='End of the time window of the reports to read, exclusive (ISO 8601 timestamp, UTC if no offset)',
+        )
 
         self.add_subgroup_parser('input', subparser_csv_input)
 
@@ -253,14 +340,35 @@ class CommonCLIParsingManager(RootConfigParsingManager):
 
         subparser_json_input.add_argument(
             'f', 'filepath',
-            help_text='Path to the JSON input file',
+            help_text='Path to the JSON input file, or glob pattern of the JSON input files',
             is_mandatory=True
         )
         subparser_json_input.add_argument(
             'c', 'compression',
-            help_text='Input compression format: auto, gzip, lzma, or none',
+            help_text='Input compression format: auto, gzip, lzma, zstd, or none',
             default_value='auto'
         )
+        subparser_json_input.add_argument(
+            'w', 'workers',
+            help_text='Number of worker threads decompressing and decoding the input files concurrently',
+            argument_type=int,
+            default_value=1,
+        )
+        subparser_json_input.add_argument(
+            'u', 'unordered',
+            help_text='Return the reports of multiple input files as soon as they are read instead of merging them in timestamp order',
+            is_flag=True,
+            action=store_true,
+            default_value=False,
+        )
+        subparser_json_input.add_argument(
+            'F', 'from',
+            help_text='Start of the time window of the reports to read, inclusive (ISO 8601 timestamp, UTC if no offset)',
+        )
+        subparser_json_input.add_argument(
+            'T', 'to',
+            help_text='End of the time window of the reports to read, exclusive (ISO 8601 timestamp, UTC if no offset)',
+        )
 
         self.add_subgroup_parser('input', subparser_json_input)
 
@@ -296,6 +404,46 @@ class CommonCLIParsingManager(RootConfigParsingManager):
             help_text='MongoDB collection name',
             is_mandatory=True
         )
+        subparser_mongo_output.add_argument(
+            'o', 'unordered',
+            help_text='Insert the reports with unordered bulk writes, that the server can apply in parallel',
+            is_flag=True,
+            action=store_true,
+            default_value=False,
+        )
+        subparser_mongo_output.add_argument(
+            'w', 'write-concern',
+            help_text='Write concern of the inserts: number of acknowledging members, or majority (server default if unset)',
+        )
+        subparser_mongo_output.add_argument(
+            'j', 'journal',
+            help_text='Wait for the inserts to be written to the on-disk journal',
+            is_flag=True,
+            action=store_true,
+            default_value=False,
+        )
+        subparser_mongo_output.add_argument(
+            'g', 'timeseries-granularity',
+            help_text='Create the collection as a time-series collection with this granularity: seconds, minutes or hours',
+        )
+        subparser_mongo_output.add_argument(
+            'M', 'timeseries-meta-field',
+            help_text='Meta field of the time-series collection',
+            default_value='metadata',
+        )
+        subparser_mongo_output.add_argument(
+            'C', 'compact',
+            help_text='Store the reports in a compact schema (timestamps in milliseconds since epoch, flattened metadata)',
+            is_flag=True,
+            action=store_true,
+            default_value=False,
+        )
+        subparser_mongo_output.add_argument(
+            'q', 'write-queue-size',
+            help_text='Number of report batches queued for the background writer thread (0 to write synchronously)',
+            argument_type=int,
+            default_value=0,
+        )
 
         self.add_subgroup_parser('output', subparser_mongo_output)
 
@@ -331,6 +479,30 @@ class CommonCLIParsingManager(RootConfigParsingManager):
             help_text='Comma-separated list of report metadata fields exposed as metric labels',
             argument_type=list
         )
+        subparser_prometheus_output.add_argument(
+            'T', 'samples-ttl',
+            help_text='Expiration time in seconds of the metric samples, the series of the expired samples being removed',
+            argument_type=float,
+            default_value=300.0
+        )
+        subparser_prometheus_output.add_argument(
+            'S', 'max-series',
+            help_text='Maximum number of series exposed by the metric, the least recently updated being evicted (0 for no limit)',
+            argument_type=int,
+            default_value=0
+        )
+        subparser_prometheus_output.add_argument(
+            'a', 'aggregates',
+            help_text='Comma-separated list of aggregates summing the power by labels, the labels of an aggregate being joined by "+"',
+            argument_type=list
+        )
+        subparser_prometheus_output.add_argument(
+            'A', 'aggregates-only',
+            help_text='Expose only the aggregates, not the series of the targets',
+            is_flag=True,
+            action=store_true,
+            default_value=False
+        )
 
         self.add_subgroup_parser('output', subparser_prometheus_output)
 
@@ -345,6 +517,40 @@ class CommonCLIParsingManager(RootConfigParsingManager):
             help_text='Directory where CSV output files are written',
             is_mandatory=True
         )
+        subparser_csv_output.add_argument(
+            'c', 'compression',
+            help_text='Output compression format: gzip, lzma, zstd, or none',
+            default_value='none'
+        )
+        subparser_csv_output.add_argument(
+            'b', 'buffer-size',
+            help_text='Size (in characters) of the write buffer of each output file',
+            argument_type=int,
+            default_value=64 * 1024,
+        )
+        subparser_csv_output.add_argument(
+            'r', 'rotation-size',
+            help_text='Size (in characters) from which an output file is rotated (0 to disable)',
+            argument_type=int,
+            default_value=0,
+        )
+        subparser_csv_output.add_argument(
+            'i', 'rotation-interval',
+            help_text='Duration (in seconds) after which an output file is rotated (0 to disable)',
+            argument_type=float,
+            default_value=0.0,
+        )
+        subparser_csv_output.add_argument(
+            's', 'segments-compression',
+            help_text='Compression format of the rotated output files: gzip, lzma, zstd, or none',
+            default_value='none'
+        )
+        subparser_csv_output.add_argument(
+            'x', 'index-block-size',
+            help_text='Size (in bytes) of the blocks of the sidecar time index of the uncompressed output files (0 to disable)',
+            argument_type=int,
+            default_value=0,
+        )
 
         self.add_subgroup_parser('output', subparser_csv_output)
 
@@ -361,9 +567,55 @@ class CommonCLIParsingManager(RootConfigParsingManager):
         )
         subparser_json_output.add_argument(
             'c', 'compression',
-            help_text='Output compression format: auto, gzip, lzma, or none',
+            help_text='Output compression format: auto, gzip, lzma, zstd, or none',
             default_value='auto'
         )
+        subparser_json_output.add_argument(
+            'l', 'compression-level',
+            help_text='Compression level of the output file (default level of the compression format if not set)',
+            argument_type=int,
+        )
+        subparser_json_output.add_argument(
+            'T', 'compression-threads',
+            help_text='Number of threads used to compress the output file, zstd only (0 to compress from the writing thread)',
+            argument_type=int,
+            default_value=0,
+        )
+        subparser_json_output.add_argument(
+            'r', 'rotation-size',
+            help_text='Size (in characters) from which an output file is rotated (0 to disable)',
+            argument_type=int,
+            default_value=0,
+        )
+        subparser_json_output.add_argument(
+            't', 'rotation-interval',
+            help_text='Duration (in seconds) of the time window of an output file, aligned on the UTC clock (0 to disable)',
+            argument_type=float,
+            default_value=0.0,
+        )
+        subparser_json_output.add_argument(
+            'x', 'index-block-size',
+            help_text='Size (in bytes) of the blocks of the sidecar time index of the uncompressed output files (0 to disable)',
+            argument_type=int,
+            default_value=0,
+        )
+        subparser_json_output.add_argument(
+            'q', 'write-queue-size',
+            help_text='Number of report batches queued for the background writer thread (0 to write synchronously)',
+            argument_type=int,
+            default_value=0,
+        )
+        subparser_json_output.add_argument(
+            's', 'fsync-policy',
+            help_text='When the output file is synchronized to the storage device: never, close, batch, or periodic',
+            default_value='close'
+        )
+        subparser_json_output.add_argument(
+            'i', 'fsync-interval',
+            help_text='Minimum duration (in seconds) between two synchronizations of the output file with the periodic policy',
+            argument_type=float,
+            default_value=1.0,
+        )
 
         self.add_subgroup_parser('output', subparser_json_output)
 
@@ -393,6 +645,53 @@ class CommonCLIParsingManager(RootConfigParsingManager):
             help_text='InfluxDB bucket name',
             is_mandatory=True
         )
+        subparser_influx2_output.add_argument(
+            'w', 'write-mode',
+            help_text='Write mode: synchronous (one request per batch of reports) or batching (buffered by the client)',
+            default_value='batching',
+        )
+        subparser_influx2_output.add_argument(
+            's', 'batch-size',
+            help_text='Number of points sent in a request in batching mode',
+            argument_type=int,
+            default_value=1000,
+        )
+        subparser_influx2_output.add_argument(
+            'i', 'flush-interval',
+            help_text='Maximum duration (in seconds) the points are buffered in batching mode',
+            argument_type=float,
+            default_value=1.0,
+        )
+        subparser_influx2_output.add_argument(
+            'z', 'gzip',
+            help_text='Compress the requests with gzip',
+            is_flag=True,
+            action=store_true,
+            default_value=False,
+        )
+        subparser_influx2_output.add_argument(
+            'p', 'precision',
+            help_text='Precision of the timestamps: ns, us, ms or s',
+            default_value='ns',
+        )
+        subparser_influx2_output.add_argument(
+            'r', 'max-retries',
+            help_text='Maximum number of retries of a write failing with a transient error, 0 to disable the retries',
+            argument_type=int,
+            default_value=5,
+        )
+        subparser_influx2_output.add_argument(
+            'R', 'retry-interval',
+            help_text='Delay (in seconds) before the first retry of a write, doubled after each attempt',
+            argument_type=float,
+            default_value=5.0,
+        )
+        subparser_influx2_output.add_argument(
+            'D', 'max-retry-delay',
+            help_text='Maximum delay (in seconds) between two retries of a write',
+            argument_type=float,
+            default_value=125.0,
+        )
 
         self.add_subgroup_parser('output', subparser_influx2_output)
 
@@ -428,6 +727,60 @@ class CommonCLIParsingManager(RootConfigParsingManager):
             help_text='ClickHouse database name',
             default_value='default',
         )
+        subparser_clickhouse_output.add_argument(
+            'r', 'buffer-rows',
+            help_text='Maximum number of reports buffered before being inserted in a single block',
+            argument_type=int,
+            default_value=100_000,
+        )
+        subparser_clickhouse_output.add_argument(
+            'b', 'buffer-bytes',
+            help_text='Maximum (approximate) size in bytes of the reports buffered before being inserted in a single block',
+            argument_type=int,
+            default_value=16 * 1024 * 1024,
+        )
+        subparser_clickhouse_output.add_argument(
+            'i', 'flush-interval',
+            help_text='Maximum time (in seconds) a report is buffered before being inserted (0 to insert the reports on each write)',
+            argument_type=float,
+            default_value=1.0,
+        )
+        subparser_clickhouse_output.add_argument(
+            'a', 'async-insert',
+            help_text='Use server-side asynchronous inserts, the server buffering the inserted rows of all the clients',
+            is_flag=True,
+            action=store_true,
+            default_value=False,
+        )
+        subparser_clickhouse_output.add_argument(
+            'N', 'async-insert-no-wait',
+            help_text='Do not wait for the asynchronous inserts to be written to the table before acknowledging them',
+            is_flag=True,
+            action=store_true,
+            default_value=False,
+        )
+        subparser_clickhouse_output.add_argument(
+            'B', 'partition-by',
+            help_text='Partitioning of the tables by period of time: none, day, week or month',
+            default_value='none',
+        )
+        subparser_clickhouse_output.add_argument(
+            't', 'ttl',
+            help_text='Number of days the reports are kept in the table (0 to keep them forever)',
+            argument_type=int,
+            default_value=0,
+        )
+        subparser_clickhouse_output.add_argument(
+            'R', 'rollups',
+            help_text='Comma-separated list of power rollups maintained by materialized views: minute, hour',
+            argument_type=list,
+        )
+        subparser_clickhouse_output.add_argument(
+            'T', 'rollup-ttl',
+            help_text='Number of days the rows of the rollups are kept (0 to keep them forever)',
+            argument_type=int,
+            default_value=0,
+        )
 
         self.add_subgroup_parser('output', subparser_clickhouse_output)
 
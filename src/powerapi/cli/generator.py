@@ -213,7 +213,7 @@ class PullerGenerator(DBActorGenerator):
         CSV Input database factory method.
         """
         from powerapi.database.csv.driver import CSVInputFactory
-        return CSVInputFactory(conf['model'], conf['files'])
+        return CSVInputFactory(conf['model'], conf['files'], conf.get('compression', 'auto'), conf.get('workers', 1), conf.get('from'), conf.get('to'))
 
     @staticmethod
     def _json_input_database_factory(conf: dict) -> ReadableDatabaseFactory:
@@ -221,7 +221,8 @@ class PullerGenerator(DBActorGenerator):
         JSON Input database factory method.
         """
         from powerapi.database.json.driver import JsonInputFactory
-        return JsonInputFactory(conf['model'], conf['filepath'], conf['compression'])
+        return JsonInputFactory(conf['model'], conf['filepath'], conf['compression'], conf.get('from'), conf.get('to'), conf.get('workers', 1),
+                                not conf.get('unordered', False))
 
     @staticmethod
     def _socket_database_factory(conf: dict) -> ReadableDatabaseFactory:
@@ -229,15 +230,20 @@ class PullerGenerator(DBActorGenerator):
         Socket Input database factory method.
         """
         from powerapi.database.socket.driver import SocketInputFactory
-        return SocketInputFactory(conf['model'], conf['host'], conf['port'])
+        return SocketInputFactory(conf['model'], conf['host'], conf['port'], conf.get('protocol', 'auto'), conf.get('workers', 1))
 
     @staticmethod
     def _mongodb_database_factory(conf: dict) -> ReadableDatabaseFactory:
         """
         MongoDB Input database factory method.
         """
-        from powerapi.database.mongodb.driver import MongodbInputFactory
-        return MongodbInputFactory(conf['model'], conf['uri'], conf['db'], conf['collection'])
+        from powerapi.database.mongodb.driver import MongodbInputFactory, MongodbQuery
+        from powerapi.database.time_index import parse_time_window_bound
+        query = MongodbQuery(parse_time_window_bound(conf.get('from')), parse_time_window_bound(conf.get('to')), tuple(conf.get('sensors', ())),
+                             tuple(conf.get('targets', ())), tuple(conf.get('groups', ())), tuple(conf.get('events', ())),
+                             conf.get('cursor-batch-size', 0), conf.get('hint'))
+        return MongodbInputFactory(conf['model'], conf['uri'], conf['db'], conf['collection'], conf.get('batch-size', 1000), conf.get('tailable', False),
+                                   query, conf.get('readers', 1))
 
     def __init__(self, report_filter: ReportFilter):
         """
@@ -277,7 +283,9 @@ class PusherGenerator(DBActorGenerator):
         CSV Output database factory method.
         """
         from powerapi.database.csv.driver import CSVOutputFactory
-        return CSVOutputFactory(conf['model'], conf['directory'])
+        return CSVOutputFactory(conf['model'], conf['directory'], conf.get('compression', 'none'), conf.get('buffer-size', 64 * 1024),
+                                conf.get('rotation-size', 0), conf.get('rotation-interval', 0.0), conf.get('segments-compression', 'none'),
+                                conf.get('index-block-size', 0))
 
     @staticmethod
     def _json_output_database_factory(conf: dict) -> WritableDatabaseFactory:
@@ -285,23 +293,31 @@ class PusherGenerator(DBActorGenerator):
         JSON Output database factory method.
         """
         from powerapi.database.json.driver import JsonOutputFactory
-        return JsonOutputFactory(conf['model'], conf['filepath'], conf['compression'])
+        return JsonOutputFactory(conf['model'], conf['filepath'], conf['compression'], conf.get('write-queue-size', 0),
+                                 conf.get('fsync-policy', 'close'), conf.get('fsync-interval', 1.0), conf.get('rotation-size', 0),
+                                 conf.get('rotation-interval', 0.0), conf.get('compression-level'), conf.get('compression-threads', 0),
+                                 conf.get('index-block-size', 0))
 
     @staticmethod
     def _mongodb_database_factory(conf: dict) -> WritableDatabaseFactory:
         """
         MongoDB Output database factory method.
         """
-        from powerapi.database.mongodb.driver import MongodbOutputFactory
-        return MongodbOutputFactory(conf['model'], conf['uri'], conf['db'], conf['collection'])
+        from powerapi.database.mongodb.driver import MongodbOutputFactory, MongodbWriteOptions
+        write_options = MongodbWriteOptions(not conf.get('unordered', False), conf.get('write-concern'), conf.get('journal', False),
+                                            conf.get('timeseries-granularity'), conf.get('timeseries-meta-field', 'metadata'), conf.get('compact', False))
+        return MongodbOutputFactory(conf['model'], conf['uri'], conf['db'], conf['collection'], write_options, conf.get('write-queue-size', 0))
 
     @staticmethod
     def _influxdb2_database_factory(conf: dict) -> WritableDatabaseFactory:
         """
         InfluxDB2 database factory method.
         """
-        from powerapi.database.influxdb2.driver import InfluxDB2OutputFactory
-        return InfluxDB2OutputFactory(conf['model'], conf['uri'], conf['org'], conf['bucket'], conf['token'])
+        from powerapi.database.influxdb2.driver import InfluxDB2OutputFactory, InfluxDB2WriteOptions
+        write_options = InfluxDB2WriteOptions(conf.get('write-mode', 'batching'), conf.get('batch-size', 1000), conf.get('flush-interval', 1.0),
+                                              conf.get('gzip', False), conf.get('precision', 'ns'), conf.get('max-retries', 5),
+                                              conf.get('retry-interval', 5.0), conf.get('max-retry-delay', 125.0))
+        return InfluxDB2OutputFactory(conf['model'], conf['uri'], conf['org'], conf['bucket'], conf['token'], write_options)
 
     @staticmethod
     def _prometheus_database_factory(conf: dict) -> WritableDatabaseFactory:
@@ -309,15 +325,24 @@ class PusherGenerator(DBActorGenerator):
         Prometheus database factory method.
         """
         from powerapi.database.prometheus.driver import PrometheusOutputFactory
-        return PrometheusOutputFactory(conf['model'], conf['addr'], conf['port'], conf.get('tags', []))
+        aggregates = [aggregate.split('+') for aggregate in conf.get('aggregates', [])]
+        return PrometheusOutputFactory(conf['model'], conf['addr'], conf['port'], conf.get('tags', []), conf.get('samples-ttl', 300.0),
+                                       conf.get('max-series', 0), aggregates, not conf.get('aggregates-only', False))
 
     @staticmethod
     def _clickhouse_database_factory(conf: dict) -> WritableDatabaseFactory:
         """
         ClickHouse output database factory method.
         """
-        from powerapi.database.clickhouse.driver import ClickHouseOutputFactory
-        return ClickHouseOutputFactory(conf['model'], conf['host'], conf['port'], conf['username'], conf['password'], conf['database'])
+        from powerapi.database.clickhouse.driver import ClickHouseOutputFactory, ClickHouseWriteOptions
+        from powerapi.database.clickhouse.schema import TableOptions
+        write_options = ClickHouseWriteOptions(conf.get('buffer-rows', 100_000), conf.get('buffer-bytes', 16 * 1024 * 1024),
+                                               conf.get('flush-interval', 1.0), conf.get('async-insert', False),
+                                               not conf.get('async-insert-no-wait', False))
+        table_options = TableOptions(conf.get('partition-by', 'none'), conf.get('ttl', 0), tuple(conf.get('rollups', [])),
+                                     conf.get('rollup-ttl', 0))
+        return ClickHouseOutputFactory(conf['model'], conf['host'], conf['port'], conf['username'], conf['password'], conf['database'],
+                                       write_options, table_options)
 
     def __init__(self):
         super().__init__('output')
@@ -0,0 +1,122 @@
+# Copyright (c) 2026, Inria
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from collections.abc import Callable
+from queue import Empty, Queue
+from threading import Thread
+
+
+class BackgroundWriterThread[T](Thread):
+    """
+    Background Writer Thread.
+    Writes the data submitted by a database driver from a dedicated thread, so that the slow write operations (compression,
+    file or network I/O) do not block the actor.
+    The data queued while a write is in progress are given at once to the next write.
+    A write error is raised to the driver on its next submission, the data submitted afterward are discarded.
+    """
+
+    def __init__(self, write: Callable[[list[T]], None], queue_size: int, error_types: tuple[type[Exception], ...] = (OSError,)):
+        """
+        :param write: Function writing a list of submitted data, in submission order, called from the thread
+        :param queue_size: Maximum number of pending submissions, the submission blocks when it is reached
+        :param error_types: Types of the write errors raised to the driver
+        """
+        super().__init__(name='background-writer-thread', daemon=True)
+
+        self._write = write
+        self._error_types = error_types
+        self._queue: Queue[T | None] = Queue(maxsize=queue_size)
+        self._error: Exception | None = None
+
+    def _check_error(self) -> None:
+        """
+        Raise the error of a previous write, if any.
+        :raise: The error of a previous write, or OSError if the thread is stopped
+        """
+        if self._error is not None:
+            raise self._error
+
+        if not self.is_alive():
+            raise OSError('Background writer thread is stopped')
+
+    def submit(self, data: T) -> None:
+        """
+        Submit data to be written by the thread.
+        :param data: Data to write
+        :raise: The error of a previous write, or OSError if the thread is stopped
+        """
+        self._check_error()
+        self._queue.put(data)
+
+    def close(self) -> None:
+        """
+        Write the pending data and stop the thread.
+        :raise: The error of a write, if any
+        """
+        if self.is_alive():
+            self._queue.put(None)
+            self.join()
+
+        if self._error is not None:
+            raise self._error
+
+    def _take_pending_data(self, data: T) -> tuple[list[T], bool]:
+        """
+        Gather the given data with the ones waiting in the queue.
+        :param data: Data retrieved from the queue
+        :return: Tuple containing the list of data to write and whether the thread has been asked to stop
+        """
+        pending_data = [data]
+        while True:
+            try:
+                next_data = self._queue.get_nowait()
+            except Empty:
+                return pending_data, False
+
+            if next_data is None:
+                return pending_data, True
+
+            pending_data.append(next_data)
+
+    def run(self) -> None:
+        """
+        Entrypoint of the background writer thread.
+        """
+        stop = False
+        while not stop:
+            if (data := self._queue.get()) is None:
+                break
+
+            pending_data, stop = self._take_pending_data(data)
+            if self._error is not None:
+                continue
+
+            try:
+                self._write(pending_data)
+            except self._error_types as exn:
+                self._error = exn
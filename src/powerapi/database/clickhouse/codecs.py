@@ -26,8 +26,24 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import ClassVar
+
 from powerapi.database.codec import CodecOptions, ReportEncoder, ReportEncoderRegistry
-from powerapi.report import PowerReport
+from powerapi.database.tags import TagsPlanCache, flatten_tags, flattened_tags_plan
+from powerapi.report import FormulaReport, HWPCReport, PowerReport, Report
+
+
+@dataclass
+class EncoderOptions(CodecOptions):
+    """
+    Encoder options for the ClickHouse database.
+    """
+    tags_plans: TagsPlanCache = field(default_factory=lambda: TagsPlanCache(flattened_tags_plan))
+
+
+_DEFAULT_ENCODER_OPTIONS = EncoderOptions()
 
 
 class PowerReportEncoder(ReportEncoder[PowerReport, tuple]):
@@ -36,20 +52,152 @@ class PowerReportEncoder(ReportEncoder[PowerReport, tuple]):
     """
 
     @staticmethod
-    def encode(report: PowerReport, opts: CodecOptions | None = None) -> tuple:
+    def encode(report: PowerReport, opts: EncoderOptions | None = None) -> tuple:
+        opts = opts if opts is not None else _DEFAULT_ENCODER_OPTIONS
         return (
             report.timestamp,
             report.sensor,
             report.target,
             report.power,
-            report.flatten_tags(report.metadata),
+            flatten_tags(report.metadata, opts.tags_plans.get(report.metadata)),
         )
 
 
+def _metadata_column_value(report: Report, opts: EncoderOptions) -> tuple[dict[str, str], int]:
+    """
+    Flatten the metadata of a report into the value of a metadata column, the values of the tags being converted to strings.
+    :param report: Report to encode
+    :param opts: Encoder options
+    :return: Flattened metadata and its approximate size in bytes
+    """
+    tags = flatten_tags(report.metadata, opts.tags_plans.get(report.metadata))
+    for name, value in tags.items():
+        if not isinstance(value, str):
+            tags[name] = str(value)
+
+    return tags, sum([len(name) + len(value) for name, value in tags.items()])
+
+
+class PowerReportColumnsEncoder:
+    """
+    Encode power reports directly into the columns of a ClickHouse table, for column-oriented inserts.
+    """
+    column_names: ClassVar[tuple[str, ...]] = ('timestamp', 'sensor', 'target', 'power', 'metadata')
+
+    # Approximate size in bytes of the fixed-size values of a row: timestamp and power.
+    _FIXED_ROW_SIZE: ClassVar[int] = 16
+
+    @staticmethod
+    def encode(reports: Iterable[PowerReport], columns: list[list], opts: EncoderOptions | None = None) -> int:
+        """
+        Append the values of the reports to the columns.
+        :param reports: Iterable of reports
+        :param columns: Lists of the values of each column, in the order of the column names
+        :param opts: Encoder options
+        :return: Approximate size in bytes of the appended values
+        """
+        opts = opts if opts is not None else _DEFAULT_ENCODER_OPTIONS
+        timestamps, sensors, targets, powers, metadata = columns
+        size = 0
+        for report in reports:
+            tags, tags_size = _metadata_column_value(report, opts)
+            timestamps.append(report.timestamp)
+            sensors.append(report.sensor)
+            targets.append(report.target)
+            powers.append(report.power)
+            metadata.append(tags)
+            size += PowerReportColumnsEncoder._FIXED_ROW_SIZE + len(report.sensor) + len(report.target) + tags_size
+
+        return size
+
+
+class HWPCReportColumnsEncoder:
+    """
+    Encode HWPC reports directly into the columns of a ClickHouse table, one row being appended for each CPU of each
+    events group.
+    """
+    column_names: ClassVar[tuple[str, ...]] = ('timestamp', 'sensor', 'target', 'group', 'socket', 'cpu', 'counters', 'metadata')
+
+    # Approximate size in bytes of the fixed-size values of a row, and of each counter: timestamp and counter value.
+    _FIXED_ROW_SIZE: ClassVar[int] = 8
+    _COUNTER_SIZE: ClassVar[int] = 8
+
+    @staticmethod
+    def encode(reports: Iterable[HWPCReport], columns: list[list], opts: EncoderOptions | None = None) -> int:
+        """
+        Append the values of the reports to the columns.
+        :param reports: Iterable of reports
+        :param columns: Lists of the values of each column, in the order of the column names
+        :param opts: Encoder options
+        :return: Approximate size in bytes of the appended values
+        """
+        opts = opts if opts is not None else _DEFAULT_ENCODER_OPTIONS
+        timestamps, sensors, targets, groups, sockets, cpus, counters, metadata = columns
+        size = 0
+        for report in reports:
+            tags, tags_size = _metadata_column_value(report, opts)
+            row_size = HWPCReportColumnsEncoder._FIXED_ROW_SIZE + len(report.sensor) + len(report.target) + tags_size
+            for group_name, group in report.groups.items():
+                for socket, socket_cpus in group.items():
+                    for cpu, events in socket_cpus.items():
+                        timestamps.append(report.timestamp)
+                        sensors.append(report.sensor)
+                        targets.append(report.target)
+                        groups.append(group_name)
+                        sockets.append(str(socket))
+                        cpus.append(str(cpu))
+                        counters.append(events)
+                        metadata.append(tags)
+                        size += row_size + len(group_name) + sum([len(event) + HWPCReportColumnsEncoder._COUNTER_SIZE for event in events])
+
+        return size
+
+
+class FormulaReportColumnsEncoder:
+    """
+    Encode formula reports directly into the columns of a ClickHouse table.
+    """
+    column_names: ClassVar[tuple[str, ...]] = ('timestamp', 'sensor', 'target', 'metadata')
+
+    # Approximate size in bytes of the fixed-size values of a row: timestamp.
+    _FIXED_ROW_SIZE: ClassVar[int] = 8
+
+    @staticmethod
+    def encode(reports: Iterable[FormulaReport], columns: list[list], opts: EncoderOptions | None = None) -> int:
+        """
+        Append the values of the reports to the columns.
+        :param reports: Iterable of reports
+        :param columns: Lists of the values of each column, in the order of the column names
+        :param opts: Encoder options
+        :return: Approximate size in bytes of the appended values
+        """
+        opts = opts if opts is not None else _DEFAULT_ENCODER_OPTIONS
+        timestamps, sensors, targets, metadata = columns
+        size = 0
+        for report in reports:
+            tags, tags_size = _metadata_column_value(report, opts)
+            timestamps.append(report.timestamp)
+            sensors.append(report.sensor)
+            targets.append(report.target)
+            metadata.append(tags)
+            size += FormulaReportColumnsEncoder._FIXED_ROW_SIZE + len(report.sensor) + len(report.target) + tags_size
+
+        return size
+
+
 class ReportEncoders(ReportEncoderRegistry):
     """
     Report encoders supported by the ClickHouse output database driver.
     """
 
 
+class ReportColumnsEncoders(ReportEncoderRegistry):
+    """
+    Report columns encoders supported by the ClickHouse output database driver.
+    """
+
+
 ReportEncoders.register(PowerReport, PowerReportEncoder)
+ReportColumnsEncoders.register(PowerReport, PowerReportColumnsEncoder)
+ReportColumnsEncoders.register(HWPCReport, HWPCReportColumnsEncoder)
+ReportColumnsEncoders.register(FormulaReport, FormulaReportColumnsEncoder)
@@ -26,25 +26,55 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import logging
 from collections.abc import Iterable
+from dataclasses import dataclass
+from time import monotonic
 
 import clickhouse_connect
 from clickhouse_connect.driver.exceptions import ClickHouseError
 
-from powerapi.database.clickhouse.codecs import ReportEncoders
-from powerapi.database.clickhouse.schema import TableSchemaRegistry
+from powerapi.database.clickhouse.codecs import EncoderOptions, ReportColumnsEncoders
+from powerapi.database.clickhouse.schema import TableOptions, TableSchemaRegistry
 from powerapi.database.driver import WritableDatabase, WritableDatabaseFactory
 from powerapi.database.exceptions import ConnectionFailed, WriteFailed
 from powerapi.report import Report
 
 
+@dataclass(frozen=True)
+class ClickHouseWriteOptions:
+    """
+    Options of the inserts of the reports into the ClickHouse database.
+    The reports are buffered by the driver and inserted in a single block when the buffer holds the maximum number of rows
+    or bytes, or when the flush interval is elapsed since the oldest buffered report, as each insert creates a new part.
+    With asynchronous inserts, the server buffers the inserted rows itself and merges the inserts of all the clients.
+    """
+    buffer_rows: int = 100_000
+    buffer_bytes: int = 16 * 1024 * 1024
+    flush_interval: float = 1.0
+    async_insert: bool = False
+    wait_for_async_insert: bool = True
+
+    def insert_settings(self) -> dict[str, int]:
+        """
+        Return the ClickHouse settings of the inserts.
+        :return: Dictionary of settings
+        """
+        if not self.async_insert:
+            return {}
+
+        return {'async_insert': 1, 'wait_for_async_insert': int(self.wait_for_async_insert)}
+
+
 class ClickHouseOutput(WritableDatabase):
     """
     ClickHouse output database driver.
     Allow to persist reports to a ClickHouse database.
+    The reports are encoded directly into the columns of the table, and inserted with column-oriented inserts.
     """
 
-    def __init__(self, report_type: type[Report], host: str, port: int, username: str, password: str, database_name: str):
+    def __init__(self, report_type: type[Report], host: str, port: int, username: str, password: str, database_name: str,
+                 write_options: ClickHouseWriteOptions | None = None, table_options: TableOptions | None = None):
         """
         :param report_type: Type of the report handled by this database
         :param host: ClickHouse server host
@@ -52,38 +82,52 @@ class ClickHouseOutput(WritableDatabase):
         :param username: Username to use for authentication
         :param password: Password to use for authentication
         :param database_name: Name of the database where the reports will be stored
+        :param write_options: Options of the inserts, None to use the default ones
+        :param table_options: Options of the created tables, None to use the default ones
         """
         self.host = host
         self.port = port
         self.username = username
         self.password = password
         self.database_name = database_name
+        self.write_options = write_options if write_options is not None else ClickHouseWriteOptions()
+        self.table_options = table_options if table_options is not None else TableOptions()
 
-        self._report_encoder = ReportEncoders.get(report_type)
+        self._report_encoder = ReportColumnsEncoders.get(report_type)
+        self._report_encoder_opts = EncoderOptions()
         self._table_schema = TableSchemaRegistry.get(report_type)
         self._client = None
         self._insert_context = None
 
+        self._columns: list[list] = [[] for _ in self._report_encoder.column_names]
+        self._buffered_bytes = 0
+        self._buffer_start_ts: float | None = None
+
     @staticmethod
     def supported_write_types() -> Iterable[type[Report]]:
         """
         Return the report types that can be persisted to the ClickHouse database.
         :return: Iterable of report types
         """
-        return ReportEncoders.supported_types()
+        return ReportColumnsEncoders.supported_types()
 
     def _create_table(self) -> None:
         """
-        Create the table where the reports will be stored.
+        Create the table where the reports will be stored, and its rollup tables and materialized views.
         """
-        self._client.command(self._table_schema.build_create_table_query())
+        self._client.command(self._table_schema.build_create_table_query(self.table_options))
+        for query in self._table_schema.build_create_rollup_queries(self.table_options):
+            self._client.command(query)
 
     def _create_insert_context(self) -> None:
         """
         Create the insert context used to persist reports to the table.
         The context is bound to the configured table and report schema and is reused sequentially across report batches.
         """
-        self._insert_context = self._client.create_insert_context(table=self._table_schema.table_name)
+        self._insert_context = self._client.create_insert_context(table=self._table_schema.table_name,
+                                                                  column_names=self._report_encoder.column_names,
+                                                                  column_oriented=True,
+                                                                  settings=self.write_options.insert_settings())
 
     def connect(self) -> None:
         """
@@ -106,24 +150,69 @@ class ClickHouseOutput(WritableDatabase):
 
     def disconnect(self) -> None:
         """
-        Disconnect from the ClickHouse server.
+        Insert the buffered reports and disconnect from the ClickHouse server.
         """
+        logging.debug('ClickHouse output tags plan cache: %s', self._report_encoder_opts.tags_plans.cache_info())
+        try:
+            self._flush()
+        except (ClickHouseError, OSError, TypeError, ValueError) as exn:
+            logging.error('Failed to write the buffered reports to the ClickHouse database: %s', exn)
+
         try:
             self._client.close()
         except (ClickHouseError, OSError):
             # Errors can happen when closing the client, but nothing can be done in this case.
             pass
 
+    def _flush(self) -> None:
+        """
+        Insert the buffered reports into the table and clear the buffer.
+        """
+        if not self._columns[0]:
+            return
+
+        self._client.insert(data=self._columns, context=self._insert_context)
+        self._columns = [[] for _ in self._columns]
+        self._buffered_bytes = 0
+        self._buffer_start_ts = None
+
+    def _is_buffer_full(self) -> bool:
+        """
+        Return whether the buffered reports have to be inserted.
+        :return: True if the buffer holds the maximum number of rows or bytes, or if the flush interval is elapsed
+        """
+        if self._buffer_start_ts is None:
+            return False
+
+        return (len(self._columns[0]) >= self.write_options.buffer_rows or
+                self._buffered_bytes >= self.write_options.buffer_bytes or
+                monotonic() - self._buffer_start_ts >= self.write_options.flush_interval)
+
     def write(self, reports: Iterable[Report]) -> None:
         """
         Write reports to the ClickHouse database.
+        The reports are buffered, and inserted with the previously buffered ones once the buffer is full.
+        If the insert fails, the given reports are removed from the buffer, so that the caller can submit them again.
         :param reports: Iterable of reports
         :raise WriteFailed: If the write operation fails
         """
+        buffered_rows = len(self._columns[0])
+        buffered_bytes = self._buffered_bytes
         try:
-            encoded_reports = [self._report_encoder.encode(report) for report in reports]
-            self._client.insert(data=encoded_reports, context=self._insert_context)
+            self._buffered_bytes += self._report_encoder.encode(reports, self._columns, self._report_encoder_opts)
+            if self._buffer_start_ts is None and self._columns[0]:
+                self._buffer_start_ts = monotonic()
+
+            if self._is_buffer_full():
+                self._flush()
         except (ClickHouseError, OSError, TypeError, ValueError) as exn:
+            for column in self._columns:
+                del column[buffered_rows:]
+
+            self._buffered_bytes = buffered_bytes
+            if not buffered_rows:
+                self._buffer_start_ts = None
+
             raise WriteFailed(f'Failed to write reports to the ClickHouse database: {exn}') from exn
 
 
@@ -132,7 +221,8 @@ class ClickHouseOutputFactory(WritableDatabaseFactory):
     ClickHouse output database driver factory.
     """
 
-    def __init__(self, report_type: type[Report], host: str, port: int, username: str, password: str, database_name: str):
+    def __init__(self, report_type: type[Report], host: str, port: int, username: str, password: str, database_name: str,
+                 write_options: ClickHouseWriteOptions | None = None, table_options: TableOptions | None = None):
         """
         :param report_type: Type of the report handled by this database
         :param host: ClickHouse server host
@@ -140,20 +230,46 @@ class ClickHouseOutputFactory(WritableDatabaseFactory):
         :param username: Username to use for authentication
         :param password: Password to use for authentication
         :param database_name: Database where the reports will be stored
+        :param write_options: Options of the inserts, None to use the default ones
+        :param table_options: Options of the created tables, None to use the default ones
         """
-        if report_type not in ReportEncoders.supported_types():
+        if report_type not in ReportColumnsEncoders.supported_types():
             raise ValueError(f'Unsupported report type: {report_type.__name__}')
 
+        write_options = write_options if write_options is not None else ClickHouseWriteOptions()
+        if write_options.buffer_rows < 1 or write_options.buffer_bytes < 1:
+            raise ValueError(f'Invalid buffer size: {write_options.buffer_rows} rows, {write_options.buffer_bytes} bytes')
+
+        if write_options.flush_interval < 0:
+            raise ValueError(f'Invalid flush interval: {write_options.flush_interval}')
+
+        table_options = table_options if table_options is not None else TableOptions()
+        if table_options.partition_by not in TableOptions.partitions:
+            raise ValueError(f'Invalid partitioning: {table_options.partition_by}')
+
+        if table_options.ttl_days < 0 or table_options.rollup_ttl_days < 0:
+            raise ValueError(f'Invalid TTL: {table_options.ttl_days} days, {table_options.rollup_ttl_days} days for the rollups')
+
+        for rollup in table_options.rollups:
+            if rollup not in TableOptions.rollup_periods:
+                raise ValueError(f'Invalid rollup: {rollup}')
+
+        if table_options.rollups and not TableSchemaRegistry.get(report_type).supports_rollups:
+            raise ValueError(f'Invalid rollup: not supported for {report_type.__name__}')
+
         self.report_type = report_type
         self.host = host
         self.port = port
         self.username = username
         self.password = password
         self.database_name = database_name
+        self.write_options = write_options
+        self.table_options = table_options
 
     def create(self) -> WritableDatabase:
         """
         Create a ClickHouse output database driver.
         :return: Initialized ClickHouse output database driver
         """
-        return ClickHouseOutput(self.report_type, self.host, self.port, self.username, self.password, self.database_name)
+        return ClickHouseOutput(self.report_type, self.host, self.port, self.username, self.password, self.database_name,
+                                self.write_options, self.table_options)
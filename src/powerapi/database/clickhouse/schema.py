@@ -27,9 +27,53 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import ClassVar
 
-from powerapi.report import PowerReport, Report
+from powerapi.report import FormulaReport, HWPCReport, PowerReport, Report
+
+
+@dataclass(frozen=True)
+class TableOptions:
+    """
+    Options of the tables created to store the reports.
+    The tables can be partitioned by period of time, and their rows deleted after a number of days.
+    The rollups are tables filled by materialized views with the power of the targets aggregated by period of time.
+    """
+    partition_by: str = 'none'
+    ttl_days: int = 0
+    rollups: tuple[str, ...] = ()
+    rollup_ttl_days: int = 0
+
+    partitions: ClassVar[dict[str, str | None]] = {
+        'none': None,
+        'day': 'toYYYYMMDD({column})',
+        'week': 'toMonday({column})',
+        'month': 'toYYYYMM({column})',
+    }
+    rollup_periods: ClassVar[dict[str, str]] = {
+        'minute': 'toStartOfMinute',
+        'hour': 'toStartOfHour',
+    }
+
+    def storage_clauses(self, column: str, ttl_days: int) -> str:
+        """
+        Build the partitioning and TTL clauses of a table.
+        :param column: Name of the time column of the table
+        :param ttl_days: Number of days the rows are kept, 0 to keep them forever
+        :return: Partitioning and TTL clauses, empty if the table is not partitioned and its rows are kept forever
+        """
+        clauses = []
+        if (partition := self.partitions[self.partition_by]) is not None:
+            clauses.append(f'PARTITION BY {partition.format(column=column)}')
+
+        if ttl_days > 0:
+            clauses.append(f'TTL toDateTime({column}) + INTERVAL {ttl_days} DAY')
+
+        return '\n        '.join(clauses)
+
+
+_DEFAULT_TABLE_OPTIONS = TableOptions()
 
 
 class TableSchema(ABC):
@@ -38,10 +82,20 @@ class TableSchema(ABC):
     Subclasses define the target table name and implement the create table query builder method.
     """
     table_name: ClassVar[str]
+    supports_rollups: ClassVar[bool] = False
 
     @classmethod
     @abstractmethod
-    def build_create_table_query(cls) -> str: ...
+    def build_create_table_query(cls, options: TableOptions | None = None) -> str: ...
+
+    @classmethod
+    def build_create_rollup_queries(cls, options: TableOptions | None = None) -> list[str]:
+        """
+        Build the ClickHouse queries creating the rollup tables and their materialized views.
+        :param options: Options of the tables
+        :return: List of ClickHouse queries, empty for the schemas without rollups
+        """
+        return []
 
 
 class PowerReportTableSchema(TableSchema):
@@ -49,13 +103,16 @@ class PowerReportTableSchema(TableSchema):
     ClickHouse table schema used to persist PowerReport instances.
     """
     table_name = 'powerrep'
+    supports_rollups = True
 
     @classmethod
-    def build_create_table_query(cls) -> str:
+    def build_create_table_query(cls, options: TableOptions | None = None) -> str:
         """
         Build ClickHouse create table query for the table schema used to persist PowerReport instances.
+        :param options: Options of the table
         :return: ClickHouse create table query string
         """
+        options = options if options is not None else _DEFAULT_TABLE_OPTIONS
         return f"""
         CREATE TABLE IF NOT EXISTS `{cls.table_name}`
         (
@@ -67,6 +124,110 @@ class PowerReportTableSchema(TableSchema):
         )
         ENGINE = MergeTree
         ORDER BY (target, sensor, timestamp)
+        {options.storage_clauses('timestamp', options.ttl_days)}
+        """
+
+    @classmethod
+    def build_create_rollup_queries(cls, options: TableOptions | None = None) -> list[str]:
+        """
+        Build the ClickHouse queries creating the power rollup tables and the materialized views filling them.
+        The rollups store the sum, maximum and number of the power samples of each target by period, the average power
+        being given by the sum of the power divided by the number of samples.
+        :param options: Options of the tables
+        :return: List of ClickHouse queries
+        """
+        options = options if options is not None else _DEFAULT_TABLE_OPTIONS
+        queries = []
+        for period in options.rollups:
+            rollup_table_name = f'{cls.table_name}_{period}'
+            queries.append(f"""
+            CREATE TABLE IF NOT EXISTS `{rollup_table_name}`
+            (
+                `period` DateTime('UTC') CODEC(DoubleDelta, LZ4),
+                `sensor` LowCardinality(String),
+                `target` String,
+                `power_sum` SimpleAggregateFunction(sum, Float64),
+                `power_max` SimpleAggregateFunction(max, Float64),
+                `samples` SimpleAggregateFunction(sum, UInt64)
+            )
+            ENGINE = AggregatingMergeTree
+            ORDER BY (target, sensor, period)
+            {options.storage_clauses('period', options.rollup_ttl_days)}
+            """)
+            queries.append(f"""
+            CREATE MATERIALIZED VIEW IF NOT EXISTS `{rollup_table_name}_mv` TO `{rollup_table_name}`
+            AS SELECT
+                {options.rollup_periods[period]}(`timestamp`) AS `period`,
+                `sensor`,
+                `target`,
+                sum(`power`) AS `power_sum`,
+                max(`power`) AS `power_max`,
+                count() AS `samples`
+            FROM `{cls.table_name}`
+            GROUP BY `period`, `sensor`, `target`
+            """)
+
+        return queries
+
+
+class HWPCReportTableSchema(TableSchema):
+    """
+    ClickHouse table schema used to persist HWPCReport instances.
+    Each row holds the counters of an events group for a CPU, the counters being stored in a compressed map.
+    """
+    table_name = 'hwpcrep'
+
+    @classmethod
+    def build_create_table_query(cls, options: TableOptions | None = None) -> str:
+        """
+        Build ClickHouse create table query for the table schema used to persist HWPCReport instances.
+        :param options: Options of the table
+        :return: ClickHouse create table query string
+        """
+        options = options if options is not None else _DEFAULT_TABLE_OPTIONS
+        return f"""
+        CREATE TABLE IF NOT EXISTS `{cls.table_name}`
+        (
+            `timestamp` DateTime64(6, 'UTC') CODEC(DoubleDelta, LZ4),
+            `sensor` LowCardinality(String),
+            `target` String,
+            `group` LowCardinality(String),
+            `socket` LowCardinality(String),
+            `cpu` LowCardinality(String),
+            `counters` Map(LowCardinality(String), UInt64) CODEC(ZSTD(1)),
+            `metadata` Map(LowCardinality(String), String)
+        )
+        ENGINE = MergeTree
+        ORDER BY (target, sensor, `group`, socket, cpu, timestamp)
+        {options.storage_clauses('timestamp', options.ttl_days)}
+        """
+
+
+class FormulaReportTableSchema(TableSchema):
+    """
+    ClickHouse table schema used to persist FormulaReport instances.
+    """
+    table_name = 'formularep'
+
+    @classmethod
+    def build_create_table_query(cls, options: TableOptions | None = None) -> str:
+        """
+        Build ClickHouse create table query for the table schema used to persist FormulaReport instances.
+        :param options: Options of the table
+        :return: ClickHouse create table query string
+        """
+        options = options if options is not None else _DEFAULT_TABLE_OPTIONS
+        return f"""
+        CREATE TABLE IF NOT EXISTS `{cls.table_name}`
+        (
+            `timestamp` DateTime64(6, 'UTC') CODEC(DoubleDelta, LZ4),
+            `sensor` LowCardinality(String),
+            `target` String,
+            `metadata` Map(LowCardinality(String), String)
+        )
+        ENGINE = MergeTree
+        ORDER BY (target, sensor, timestamp)
+        {options.storage_clauses('timestamp', options.ttl_days)}
         """
 
 
@@ -76,6 +237,8 @@ class TableSchemaRegistry:
     """
     schemas: ClassVar[dict[type[Report], type[TableSchema]]] = {
         PowerReport: PowerReportTableSchema,
+        HWPCReport: HWPCReportTableSchema,
+        FormulaReport: FormulaReportTableSchema,
     }
 
     @classmethod
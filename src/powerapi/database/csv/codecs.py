@@ -29,70 +29,108 @@
 
 from collections import defaultdict
 from datetime import datetime, UTC
+from functools import lru_cache
+from itertools import chain, islice
+from operator import itemgetter
 
 from powerapi.database.codec import CodecOptions, ReportEncoder, ReportEncoderRegistry, ReportDecoder, ReportDecoderRegistry
+from powerapi.database.csv.fileio_handlers import CsvRows
 from powerapi.report import PowerReport, FormulaReport, HWPCReport
 
-_SourcedCsvRowsType = dict[str, list[dict[str, str]]]  # filename, rows (column name, value)
+_SourcedCsvPositionalRowsType = dict[str, CsvRows]  # filename, rows (values ordered as the columns of the file)
 
 
-class PowerReportEncoder(ReportEncoder[PowerReport, _SourcedCsvRowsType]):
+@lru_cache(maxsize=1024)
+def _format_timestamp(timestamp: datetime) -> str:
+    """
+    Format the timestamp of a report.
+    Cached as the reports computed for the different targets of a same tick share their timestamp.
+    :param timestamp: Timestamp of the report
+    :return: ISO 8601 formatted timestamp, with a milliseconds precision
+    """
+    return timestamp.isoformat(timespec='milliseconds')
+
+
+class PowerReportEncoder(ReportEncoder[PowerReport, _SourcedCsvPositionalRowsType]):
     """
     Power Report encoder for the CSV database.
     """
+    fieldnames = ('timestamp', 'sensor', 'target', 'power')
 
     @staticmethod
-    def encode(report: PowerReport, opts: CodecOptions | None = None) -> _SourcedCsvRowsType:
-        return {
-            'power': [{
-                'timestamp': report.timestamp.isoformat(timespec='milliseconds'),
-                'sensor': report.sensor,
-                'target': report.target,
-                'power': str(report.power)
-            }]
-        }
-
-
-class FormulaReportEncoder(ReportEncoder[FormulaReport, _SourcedCsvRowsType]):
+    def encode(report: PowerReport, opts: CodecOptions | None = None) -> _SourcedCsvPositionalRowsType:
+        row = (_format_timestamp(report.timestamp), report.sensor, report.target, str(report.power))
+        return {'power': CsvRows(PowerReportEncoder.fieldnames, [row])}
+
+
+class FormulaReportEncoder(ReportEncoder[FormulaReport, _SourcedCsvPositionalRowsType]):
     """
     Formula report encoder for the CSV database.
     """
+    fieldnames = ('timestamp', 'sensor', 'target')
 
     @staticmethod
-    def encode(report: FormulaReport, opts: CodecOptions | None = None) -> _SourcedCsvRowsType:
-        return {
-            'formula': [{
-                'timestamp': report.timestamp.isoformat(timespec='milliseconds'),
-                'sensor': report.sensor,
-                'target': report.target
-            }]
-        }
+    def encode(report: FormulaReport, opts: CodecOptions | None = None) -> _SourcedCsvPositionalRowsType:
+        row = (_format_timestamp(report.timestamp), report.sensor, report.target)
+        return {'formula': CsvRows(FormulaReportEncoder.fieldnames, [row])}
 
 
 _HWPC_NON_EVENT_COLUMNS = frozenset(('timestamp', 'sensor', 'target', 'socket', 'cpu', 'metadata'))
 
-class HWPCReportDecoder(ReportDecoder[_SourcedCsvRowsType, HWPCReport]):
+
+@lru_cache(maxsize=256)
+def _hwpc_columns_layout(fieldnames: tuple[str, ...]) -> tuple[itemgetter, itemgetter, tuple[str, ...], itemgetter]:
+    """
+    Resolve the position of the HwPC report columns from the header of a CSV file.
+    :param fieldnames: Column names of the CSV file
+    :return: Tuple containing the getters of the timestamp/sensor/target and socket/cpu values, the event names and the events values getter
+    :raise KeyError: If a report column is missing
+    """
+    columns_index = {name: index for index, name in enumerate(fieldnames)}
+    cursor_columns = itemgetter(*(columns_index[name] for name in ('timestamp', 'sensor', 'target')))
+    location_columns = itemgetter(columns_index['socket'], columns_index['cpu'])
+
+    event_names = tuple(name for name in columns_index if name not in _HWPC_NON_EVENT_COLUMNS)
+    event_indexes = [columns_index[name] for name in event_names]
+    if not event_indexes or event_indexes == list(range(event_indexes[0], event_indexes[-1] + 1)):
+        # The events are usually stored in contiguous columns, a slice avoids gathering them one by one.
+        events_columns = itemgetter(slice(event_indexes[0], event_indexes[-1] + 1) if event_indexes else slice(0, 0))
+    else:
+        events_columns = itemgetter(*event_indexes) if len(event_indexes) > 1 else itemgetter(slice(event_indexes[0], event_indexes[0] + 1))
+
+    return cursor_columns, location_columns, event_names, events_columns
+
+
+class HWPCReportDecoder(ReportDecoder[_SourcedCsvPositionalRowsType, HWPCReport]):
     """
     HwPC Report decoder for the CSV database.
+    The columns layout is resolved once per file header, the rows are then decoded by position.
     """
 
     @staticmethod
-    def decode(data: _SourcedCsvRowsType, opts: CodecOptions | None = None) -> HWPCReport:
-        first_row = next(iter(data.values()))[0]
-        timestamp = datetime.fromtimestamp(int(first_row['timestamp']) / 1000, tz=UTC)
-        sensor = first_row['sensor']
-        target = first_row['target']
+    def decode(data: _SourcedCsvPositionalRowsType, opts: CodecOptions | None = None) -> HWPCReport:
+        first_group = next(iter(data.values()))
+        cursor_columns, _, _, _ = _hwpc_columns_layout(first_group.fieldnames)
+        timestamp, sensor, target = cursor_columns(first_group.rows[0])
 
         groups = {}
-        for group_name, rows in data.items():
-            event_names = [event_name for event_name in rows[0] if event_name not in _HWPC_NON_EVENT_COLUMNS]
+        for group_name, group_rows in data.items():
+            _, location_columns, event_names, events_columns = _hwpc_columns_layout(group_rows.fieldnames)
+            rows = group_rows.rows
+
+            # The counters of the whole group are converted at once, a short row is detected by the total values count.
+            values = list(map(int, chain.from_iterable(map(events_columns, rows))))
+            if len(values) != len(rows) * len(event_names):
+                raise ValueError(f'Missing event values in the rows of group {group_name}')
+
             group = defaultdict(dict)
-            for row in rows:
-                group[row['socket']][row['cpu']] = {event_name: int(row[event_name]) for event_name in event_names}
+            values_iterator = iter(values)
+            for socket, cpu in map(location_columns, rows):
+                group[socket][cpu] = dict(zip(event_names, islice(values_iterator, len(event_names)), strict=False))
 
             groups[group_name] = dict(group)  # Prevent missing-key access from mutating the decoded report.
 
-        return HWPCReport(timestamp, sensor, target, groups, {})
+        return HWPCReport(datetime.fromtimestamp(int(timestamp) / 1000, tz=UTC), sensor, target, groups, {})
 
 
 class ReportEncoders(ReportEncoderRegistry):
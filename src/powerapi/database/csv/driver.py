@@ -28,12 +28,15 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 from collections.abc import Iterable
+from datetime import datetime
 from pathlib import Path
 
 from powerapi.database.csv.codecs import ReportDecoders, ReportEncoders
+from powerapi.database.csv.file_handlers import FileHandlerRegistry
 from powerapi.database.csv.fileio_handlers import MultiCsvFileReader, MultiCsvFileWriter
 from powerapi.database.driver import ReadableDatabase, ReadableDatabaseFactory, WritableDatabase, WritableDatabaseFactory
 from powerapi.database.exceptions import ConnectionFailed, ReadFailed, WriteFailed
+from powerapi.database.time_index import in_time_window, parse_time_window_bound
 from powerapi.report import Report
 
 
@@ -41,18 +44,29 @@ class CSVInput(ReadableDatabase):
     """
     CSV input database driver.
     Allow to retrieve reports from CSV file(s).
+    Only the reports of the time window are returned, the sidecar time index of the uncompressed files being used (when it
+    exists) to read only the part of the files containing them.
     """
 
-    def __init__(self, report_type: type[Report], input_files: list[str]):
+    def __init__(self, report_type: type[Report], input_files: list[str], compression: str = 'auto', parsing_workers: int = 1,
+                 time_from: datetime | None = None, time_to: datetime | None = None):
         """
         :param report_type: Type of the report handled by this database
         :param input_files: List of input file paths
+        :param compression: Compression method of the input files, or auto to infer it from the suffix of each file
+        :param parsing_workers: Number of worker processes parsing the uncompressed input files, a single value means the files are parsed in-process
+        :param time_from: Start of the time window of the reports to read (inclusive), None for an unbounded window
+        :param time_to: End of the time window of the reports to read (exclusive), None for an unbounded window
         """
         super().__init__()
 
         self.input_filepaths = [Path(file_path) for file_path in input_files]
+        self.compression = compression
+        self.parsing_workers = parsing_workers
+        self.time_from = time_from
+        self.time_to = time_to
 
-        self._input_file_handler = MultiCsvFileReader(self.input_filepaths)
+        self._input_file_handler = MultiCsvFileReader(self.input_filepaths, compression, parsing_workers, time_from, time_to)
         self._report_decoder = ReportDecoders.get(report_type)
 
     def connect(self) -> None:
@@ -62,7 +76,7 @@ class CSVInput(ReadableDatabase):
         """
         try:
             self._input_file_handler.open()
-        except (OSError, KeyError, TypeError, ValueError) as exn:
+        except (OSError, IndexError, KeyError, TypeError, ValueError) as exn:
             raise ConnectionFailed(f'Failed to open CSV input file: {exn}') from exn
 
     def disconnect(self) -> None:
@@ -86,10 +100,13 @@ class CSVInput(ReadableDatabase):
         :return: Iterable of reports
         :raise: ReadFailed if the read operation fails
         """
+        filter_time_window = self.time_from is not None or self.time_to is not None
         try:
-            while rows := self._input_file_handler.next_rows():
-                yield self._report_decoder.decode(rows)
-        except (OSError, KeyError, TypeError, ValueError) as exn:
+            while rows := self._input_file_handler.next_csv_rows():
+                report = self._report_decoder.decode(rows)
+                if not filter_time_window or in_time_window(report.timestamp, self.time_from, self.time_to):
+                    yield report
+        except (OSError, IndexError, KeyError, TypeError, ValueError) as exn:
             raise ReadFailed(f'Failed to read reports from CSV files: {exn}') from exn
 
 
@@ -98,23 +115,41 @@ class CSVInputFactory(ReadableDatabaseFactory):
     CSV input database factory.
     """
 
-    def __init__(self, report_type: type[Report], input_files: list[str]):
+    def __init__(self, report_type: type[Report], input_files: list[str], compression: str = 'auto', parsing_workers: int = 1,
+                 time_from: str | datetime | None = None, time_to: str | datetime | None = None):
         """
         :param report_type: Type of the report handled by this database
         :param input_files: List of input file paths
+        :param compression: Compression method of the input files, or auto to infer it from the suffix of each file
+        :param parsing_workers: Number of worker processes parsing the uncompressed input files, a single value means the files are parsed in-process
+        :param time_from: Start of the time window of the reports to read (inclusive, ISO 8601), None for an unbounded window
+        :param time_to: End of the time window of the reports to read (exclusive, ISO 8601), None for an unbounded window
         """
         if report_type not in CSVInput.supported_read_types():
             raise ValueError(f'Unsupported report type: {report_type.__name__}')
 
+        for input_file in input_files:
+            FileHandlerRegistry.get(compression, Path(input_file))
+
+        if parsing_workers < 1:
+            raise ValueError(f'Invalid number of parsing workers: {parsing_workers}')
+
+        self.time_from = parse_time_window_bound(time_from)
+        self.time_to = parse_time_window_bound(time_to)
+        if self.time_from is not None and self.time_to is not None and self.time_from >= self.time_to:
+            raise ValueError(f'Invalid time window: {self.time_from.isoformat()} - {self.time_to.isoformat()}')
+
         self.report_type = report_type
         self.input_files = input_files
+        self.compression = compression
+        self.parsing_workers = parsing_workers
 
     def create(self) -> ReadableDatabase:
         """
         Create the CSV input database driver.
         :return: Initialized CSV input database driver
         """
-        return CSVInput(self.report_type, self.input_files)
+        return CSVInput(self.report_type, self.input_files, self.compression, self.parsing_workers, self.time_from, self.time_to)
 
 
 class CSVOutput(WritableDatabase):
@@ -123,17 +158,26 @@ class CSVOutput(WritableDatabase):
     Allow to persist reports to CSV file(s).
     """
 
-    def __init__(self, report_type: type[Report], output_directory: str):
+    def __init__(self, report_type: type[Report], output_directory: str, compression: str = 'none', buffer_size: int = 64 * 1024,
+                 rotation_size: int = 0, rotation_interval: float = 0.0, segments_compression: str = 'none', index_block_size: int = 0):
         """
         :param report_type: Type of the report handled by this database
         :param output_directory: Path to the output directory
+        :param compression: Compression method of the output files
+        :param buffer_size: Size (in characters) of the write buffer of each file
+        :param rotation_size: Size (in characters) from which an output file is rotated, 0 to disable
+        :param rotation_interval: Duration (in seconds) after which an output file is rotated, 0 to disable
+        :param segments_compression: Compression method applied to the output files once rotated
+        :param index_block_size: Size (in bytes) of the blocks of the sidecar time index of each file, 0 to disable the index
         """
         super().__init__()
 
         self.output_directory = Path(output_directory)
+        self.compression = compression
 
         self._report_encoder = ReportEncoders.get(report_type)
-        self._output_file_handler = MultiCsvFileWriter(self.output_directory)
+        self._output_file_handler = MultiCsvFileWriter(self.output_directory, compression, buffer_size, rotation_size, rotation_interval,
+                                                       segments_compression, index_block_size)
 
     def connect(self) -> None:
         """
@@ -168,7 +212,7 @@ class CSVOutput(WritableDatabase):
         """
         try:
             for report in reports:
-                self._output_file_handler.write_rows(self._report_encoder.encode(report))
+                self._output_file_handler.write_csv_rows(self._report_encoder.encode(report))
         except (OSError, ValueError) as exn:
             raise WriteFailed(f'Failed to write reports to CSV files: {exn}') from exn
 
@@ -178,20 +222,46 @@ class CSVOutputFactory(WritableDatabaseFactory):
     CSV output database factory.
     """
 
-    def __init__(self, report_type: type[Report], output_directory: str):
+    def __init__(self, report_type: type[Report], output_directory: str, compression: str = 'none', buffer_size: int = 64 * 1024,
+                 rotation_size: int = 0, rotation_interval: float = 0.0, segments_compression: str = 'none', index_block_size: int = 0):
         """
         :param report_type: Type of the report handled by this database
         :param output_directory: Path to the output directory
+        :param compression: Compression method of the output files
+        :param buffer_size: Size (in characters) of the write buffer of each file
+        :param rotation_size: Size (in characters) from which an output file is rotated, 0 to disable
+        :param rotation_interval: Duration (in seconds) after which an output file is rotated, 0 to disable
+        :param segments_compression: Compression method applied to the output files once rotated
+        :param index_block_size: Size (in bytes) of the blocks of the sidecar time index of each file, 0 to disable the index
         """
         if report_type not in CSVOutput.supported_write_types():
             raise ValueError(f'Unsupported report type: {report_type.__name__}')
 
+        if buffer_size < 0:
+            raise ValueError(f'Invalid write buffer size: {buffer_size}')
+
+        if rotation_size < 0 or rotation_interval < 0:
+            raise ValueError(f'Invalid rotation size or interval: {rotation_size}, {rotation_interval}')
+
+        if index_block_size < 0:
+            raise ValueError(f'Invalid time index block size: {index_block_size}')
+
+        # The writer checks the compression methods and their compatibility without touching the filesystem.
+        MultiCsvFileWriter(Path(output_directory), compression, buffer_size, rotation_size, rotation_interval, segments_compression, index_block_size)
+
         self.report_type = report_type
         self.output_directory = output_directory
+        self.compression = compression
+        self.buffer_size = buffer_size
+        self.rotation_size = rotation_size
+        self.rotation_interval = rotation_interval
+        self.segments_compression = segments_compression
+        self.index_block_size = index_block_size
 
     def create(self) -> WritableDatabase:
         """
         Create the CSV output database driver.
         :return: Initialized CSV output database driver
         """
-        return CSVOutput(self.report_type, self.output_directory)
+        return CSVOutput(self.report_type, self.output_directory, self.compression, self.buffer_size, self.rotation_size,
+                         self.rotation_interval, self.segments_compression, self.index_block_size)
@@ -0,0 +1,82 @@
+# Copyright (c) 2026, Inria
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from pathlib import Path
+from typing import TextIO
+
+from powerapi.database.file_handlers import CompressionOptions, FileHandler, BaseFileHandlerRegistry, GzipFileHandler, LzmaFileHandler, ZstdFileHandler, _OPEN_MODES
+
+
+class RawFileHandler(FileHandler):
+    """
+    File handler for uncompressed CSV files.
+    """
+    compression_method = 'none'
+    supported_suffixes = ('.csv', '')
+
+    @classmethod
+    def open(cls, filepath: Path, mode: _OPEN_MODES, opts: CompressionOptions | None = None) -> TextIO:
+        return open(filepath, mode, encoding='utf-8')
+
+
+class FileHandlerRegistry(BaseFileHandlerRegistry):
+    """
+    Registry of CSV file handlers.
+    """
+
+    @classmethod
+    def _get_from_file_extension(cls, filepath: Path) -> type[FileHandler]:
+        """
+        Infer a handler from the suffix of the given filepath.
+        Files without a compression suffix are considered uncompressed, whatever their extension.
+        :param filepath: Path to the file
+        :return: Handler matching the filepath suffix
+        """
+        try:
+            return super()._get_from_file_extension(filepath)
+        except ValueError:
+            return RawFileHandler
+
+    @classmethod
+    def stem(cls, filepath: Path, handler: type[FileHandler]) -> str:
+        """
+        Return the name of the file without its compression suffix and its extension.
+        :param filepath: Path to the file
+        :param handler: File handler used to open the file
+        :return: Stem of the uncompressed file name
+        """
+        if handler is not RawFileHandler and filepath.suffix.casefold() in handler.supported_suffixes:
+            filepath = filepath.with_suffix('')
+
+        return filepath.stem
+
+
+FileHandlerRegistry.register(RawFileHandler)
+FileHandlerRegistry.register(GzipFileHandler)
+FileHandlerRegistry.register(LzmaFileHandler)
+FileHandlerRegistry.register(ZstdFileHandler)
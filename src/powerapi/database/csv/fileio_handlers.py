@@ -27,12 +27,50 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import logging
+import os
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections import deque
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import ExitStack
-from csv import DictReader, DictWriter
+from csv import DictWriter, reader as csv_reader, writer as csv_writer
 from dataclasses import dataclass
+from datetime import UTC, datetime
+from heapq import heapify, heappop, heappush
+from io import StringIO
+from itertools import chain, groupby
+from mmap import ACCESS_READ, mmap
+from multiprocessing import get_context
+from operator import itemgetter
 from pathlib import Path
+from shutil import copyfileobj
+from time import monotonic
+
+from powerapi.database.csv.file_handlers import FileHandlerRegistry, RawFileHandler
+from powerapi.database.file_handlers import FileHandler
+from powerapi.database.time_index import TimeIndexBuilder, parse_timestamp_milliseconds, read_time_index, time_index_filepath, time_index_range
+
+_CURSOR_COLUMNS = ('timestamp', 'sensor', 'target')
+
+_ParsedCsvChunk = tuple[list[tuple[tuple[int, str, str], list[list[str]], int]], int]
+
+
+@dataclass(slots=True)
+class CsvRows:
+    """
+    Rows of a CSV file, stored as sequences of values ordered as the columns of the file.
+    """
+    fieldnames: tuple[str, ...]
+    rows: list[Sequence[str]]
+
+    def as_dicts(self) -> list[dict[str, str]]:
+        """
+        Return the rows as column/value pairs.
+        :return: List of dict representing the rows as column/value pairs
+        """
+        fieldnames = self.fieldnames
+        return [dict(zip(fieldnames, row, strict=False)) for row in self.rows]
 
 
 class CsvFilesReader(ABC):
@@ -49,6 +87,9 @@ class CsvFilesReader(ABC):
     @abstractmethod
     def next_rows(self) -> dict[str, list[dict[str, str]]]: ...
 
+    @abstractmethod
+    def next_csv_rows(self) -> dict[str, CsvRows]: ...
+
 
 class CsvFilesWriter(ABC):
     """
@@ -64,6 +105,9 @@ class CsvFilesWriter(ABC):
     @abstractmethod
     def write_rows(self, rows: dict[str, list[dict[str, str]]]) -> None: ...
 
+    @abstractmethod
+    def write_csv_rows(self, rows: dict[str, CsvRows]) -> None: ...
+
 
 @dataclass(eq=True, order=True, frozen=True, slots=True)
 class _RowCursor:
@@ -80,41 +124,89 @@ class SingleCsvFileReader:
     Single file CSV reader class.
     Handles reports exported into a single file while using the flat format.
     Requires monotonic timestamps and the rows to be sorted by timestamp/sensor/target to work.
+    The read of an uncompressed file can be restricted to a byte range, starting and ending at the beginning of a row.
     """
 
-    def __init__(self, input_filepath: Path) -> None:
+    def __init__(self, input_filepath: Path, compression: str = 'auto', byte_range: tuple[int, int | None] | None = None) -> None:
         """
         :param input_filepath: Path to the input file
+        :param compression: Compression method of the input file, or auto to infer it from the file suffix
+        :param byte_range: Start and end offsets (None for the end of the file) of the rows to read, None to read the whole file
+        :raises ValueError: If the compression method is not supported
         """
         super().__init__()
 
         self.input_filepath = input_filepath
-        self.group_name = input_filepath.stem
+        self.byte_range = byte_range
+        self._file_handler = FileHandlerRegistry.get(compression, input_filepath)
+        self.group_name = FileHandlerRegistry.stem(input_filepath, self._file_handler)
+        self.fieldnames: tuple[str, ...] = ()
 
         self._file = None
         self._reader = None
+        self._rows_groups = None
         self._row_cursor = None
         self._last_row_buffer = None
 
     def open(self) -> None:
         """
         Open the input file and initialize the reader.
+        The position of the cursor columns is resolved once from the header of the file, the rows are then grouped by
+        their raw timestamp/sensor/target values.
         :raises OSError: if the file cannot be opened
         """
-        self._file = open(self.input_filepath, encoding='utf-8')
-        self._reader = DictReader(self._file)
+        if self.byte_range is not None:
+            self._open_byte_range()
+        else:
+            self._file = self._file_handler.open(self.input_filepath, 'r')
+            self._reader = csv_reader(self._file)
 
         # Prime the cursor without consuming the first logical group.
-        # next_rows() will return this buffered row on its first call.
+        # next_rows() will return these buffered rows on its first call.
         try:
-            first_row = next(self._reader, None)
+            if self.byte_range is None:
+                self.fieldnames = tuple(next(self._reader, ()))
+            rows = filter(None, self._reader)  # Skip the blank lines.
+            first_row = next(rows, None)
             if first_row is not None:
-                self._row_cursor = _RowCursor(int(first_row['timestamp']), first_row['sensor'], first_row['target'])
-                self._last_row_buffer = first_row
-        except (OSError, KeyError, ValueError):
+                columns_index = {name: index for index, name in enumerate(self.fieldnames)}
+                cursor_columns = itemgetter(*(columns_index[name] for name in _CURSOR_COLUMNS))
+                self._rows_groups = groupby(chain((first_row,), rows), cursor_columns)
+                (timestamp, sensor, target), group_rows = next(self._rows_groups)
+                self._row_cursor = _RowCursor(int(timestamp), sensor, target)
+                self._last_row_buffer = list(group_rows)
+        except (OSError, IndexError, KeyError, ValueError):
             self.close()
             raise
 
+    def _open_byte_range(self) -> None:
+        """
+        Open the uncompressed input file in binary mode and position it at the start of the byte range.
+        :raises OSError: if the file cannot be opened
+        """
+        self._file = open(self.input_filepath, 'rb')
+        header_line = self._file.readline()
+        self.fieldnames = tuple(next(csv_reader([header_line.decode('utf-8')]), ()))
+
+        start, end = self.byte_range
+        start = max(start, len(header_line))
+        self._file.seek(start)
+        self._reader = csv_reader(self._byte_range_lines(start, end))
+
+    def _byte_range_lines(self, position: int, end: int | None) -> Iterable[str]:
+        """
+        Return the lines of the input file until the end of the byte range.
+        :param position: Current position in the file
+        :param end: End offset of the byte range, None for the end of the file
+        :return: Iterable of decoded lines
+        """
+        for line in self._file:
+            if end is not None and position >= end:
+                return
+
+            position += len(line)
+            yield line.decode('utf-8')
+
     def close(self) -> None:
         """
         Close the input file and cleanup the reader context.
@@ -130,6 +222,7 @@ class SingleCsvFileReader:
 
         self._file = None
         self._reader = None
+        self._rows_groups = None
         self._row_cursor = None
         self._last_row_buffer = None
 
@@ -147,32 +240,278 @@ class SingleCsvFileReader:
         :return: List of dict representing the rows as column/value pairs
         :raises ValueError: If timestamps move backward while reading rows
         """
-        rows = []
+        return self.next_csv_rows(row_cursor).as_dicts()
 
-        if row_cursor is not None and row_cursor != self._row_cursor:
-            return rows
+    def next_csv_rows(self, row_cursor: _RowCursor | None = None) -> CsvRows:
+        """
+        Returns the next rows sharing the same timestamp/sensor/target from the input file.
+        The rows of the following group are read ahead to position the cursor.
+        :param row_cursor: Tuple of str representing the expected row cursor
+        :return: Rows stored as lists of values
+        :raises ValueError: If timestamps move backward while reading rows
+        """
+        if self._last_row_buffer is None or (row_cursor is not None and row_cursor != self._row_cursor):
+            return CsvRows(self.fieldnames, [])
 
-        if self._last_row_buffer is not None:
-            rows.append(self._last_row_buffer)
-            self._last_row_buffer = None
+        rows, self._last_row_buffer = self._last_row_buffer, None
 
-        for row in self._reader:
-            current_cursor = _RowCursor(int(row['timestamp']), row['sensor'], row['target'])
+        for (timestamp, sensor, target), group_rows in self._rows_groups:
+            current_cursor = _RowCursor(int(timestamp), sensor, target)
 
-            if self._row_cursor is not None and current_cursor.timestamp < self._row_cursor.timestamp:
+            if current_cursor.timestamp < self._row_cursor.timestamp:
                 raise ValueError(f'Timestamp regression at {self.input_filepath}:{self._reader.line_num}')
 
+            # Same cursor written differently (e.g. leading zeros in the timestamp).
             if current_cursor == self._row_cursor:
-                rows.append(row)
+                rows.extend(group_rows)
             else:
                 self._row_cursor = current_cursor
-                self._last_row_buffer = row
+                self._last_row_buffer = list(group_rows)
                 break
         else:
             # The file is exhausted and has no pending cursor.
             self._row_cursor = None
 
-        return rows
+        return CsvRows(self.fieldnames, rows)
+
+
+def _parse_csv_chunk(input_filepath: Path, start: int, end: int, cursor_indexes: tuple[int, ...]) -> _ParsedCsvChunk:
+    """
+    Parse a chunk of a CSV file into groups of rows sharing the same timestamp/sensor/target.
+    Executed by the worker processes of the ParallelCsvFileReader, the chunk is read from a memory map of the file.
+    :param input_filepath: Path to the input file
+    :param start: Offset of the first byte of the chunk, at the start of a line
+    :param end: Offset following the last byte of the chunk, at the start of a line or at the end of the file
+    :param cursor_indexes: Index of the timestamp, sensor and target columns
+    :return: Tuple of the groups (cursor, rows, line number of the first row relative to the chunk) and of the number of lines of the chunk
+    :raises ValueError: If a timestamp is not an integer
+    :raises IndexError: If a row is missing one of the cursor columns
+    """
+    with open(input_filepath, 'rb') as file, mmap(file.fileno(), 0, access=ACCESS_READ) as buffer:
+        reader = csv_reader(StringIO(buffer[start:end].decode('utf-8'), newline=None))
+
+    # Repeated values (cursor, socket, cpu, ...) are deduplicated so that they are serialized only once per chunk, this
+    # noticeably reduces the time spent by the reader process to deserialize the result.
+    intern = {}.setdefault
+    groups = []
+    for (timestamp, sensor, target), group_rows in groupby(filter(None, reader), itemgetter(*cursor_indexes)):
+        # The reader is positioned on the first row of the group when groupby yields its key.
+        line_num = reader.line_num
+        groups.append(((int(timestamp), sensor, target), [list(map(intern, row, row)) for row in group_rows], line_num))
+
+    return groups, reader.line_num
+
+
+class ParallelCsvFileReader:
+    """
+    Parallel single file CSV reader class.
+    The input file is memory-mapped and split into chunks aligned on the timestamp/sensor/target group boundaries.
+    The chunks are parsed by the worker processes of an executor and merged back in the order of the file.
+    Requires an uncompressed file without line breaks within its values, with monotonic timestamps and the rows sorted by
+    timestamp/sensor/target.
+    """
+
+    def __init__(self, input_filepath: Path, executor: Executor, max_pending_chunks: int, chunk_size: int) -> None:
+        """
+        :param input_filepath: Path to the input file
+        :param executor: Executor running the parsing of the chunks
+        :param max_pending_chunks: Maximum number of chunks submitted to the executor ahead of the reader
+        :param chunk_size: Minimum size of the chunks in bytes
+        """
+        super().__init__()
+
+        self.input_filepath = input_filepath
+        self.group_name = input_filepath.stem
+        self.fieldnames: tuple[str, ...] = ()
+        self.executor = executor
+        self.max_pending_chunks = max_pending_chunks
+        self.chunk_size = chunk_size
+
+        self._file = None
+        self._buffer = None
+        self._cursor_indexes = None
+        self._next_chunk_offset = 0
+        self._pending_chunks: deque[Future[_ParsedCsvChunk]] = deque()
+        self._chunk_groups = deque()
+        self._chunk_first_line = 0
+        self._lines_read = 0
+        self._row_cursor = None
+        self._last_row_buffer = None
+
+    def open(self) -> None:
+        """
+        Open and memory-map the input file, then start the parsing of its first chunks.
+        :raises OSError: if the file cannot be opened
+        """
+        self._file = open(self.input_filepath, 'rb')
+        try:
+            if os.fstat(self._file.fileno()).st_size == 0:
+                return
+
+            self._buffer = mmap(self._file.fileno(), 0, access=ACCESS_READ)
+            header_end = self._line_end(0)
+            self.fieldnames = tuple(next(csv_reader(self._buffer[:header_end].decode('utf-8').splitlines()), ()))
+            columns_index = {name: index for index, name in enumerate(self.fieldnames)}
+            self._cursor_indexes = tuple(columns_index[name] for name in _CURSOR_COLUMNS)
+            self._next_chunk_offset = header_end + 1
+            self._lines_read = 1
+
+            self._submit_chunks()
+            if (group := self._next_group()) is not None:
+                cursor, self._last_row_buffer, _ = group
+                self._row_cursor = _RowCursor(*cursor)
+        except (OSError, IndexError, KeyError, ValueError):
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """
+        Cancel the parsing of the pending chunks, then unmap and close the input file.
+        """
+        if self._file is None:
+            return
+
+        while self._pending_chunks:
+            self._pending_chunks.popleft().cancel()
+
+        if self._buffer is not None:
+            self._buffer.close()
+
+        try:
+            self._file.close()
+        except OSError:
+            # Unrecoverable errors can happen when closing the input file.
+            pass
+
+        self._file = None
+        self._buffer = None
+        self._chunk_groups.clear()
+        self._row_cursor = None
+        self._last_row_buffer = None
+
+    def cursor(self) -> _RowCursor | None:
+        """
+        Return the current row cursor.
+        :return: Row cursor object or None if no cursor is available
+        """
+        return self._row_cursor
+
+    def next_rows(self, row_cursor: _RowCursor | None = None) -> list[dict[str, str]]:
+        """
+        Returns the next rows sharing the same timestamp/sensor/target from the input file.
+        :param row_cursor: Tuple of str representing the expected row cursor
+        :return: List of dict representing the rows as column/value pairs
+        :raises ValueError: If timestamps move backward while reading rows
+        """
+        return self.next_csv_rows(row_cursor).as_dicts()
+
+    def next_csv_rows(self, row_cursor: _RowCursor | None = None) -> CsvRows:
+        """
+        Returns the next rows sharing the same timestamp/sensor/target from the input file.
+        The groups of consecutive chunks sharing the same cursor are merged back together.
+        :param row_cursor: Tuple of str representing the expected row cursor
+        :return: Rows stored as lists of values
+        :raises ValueError: If timestamps move backward while reading rows
+        """
+        if self._last_row_buffer is None or (row_cursor is not None and row_cursor != self._row_cursor):
+            return CsvRows(self.fieldnames, [])
+
+        rows, self._last_row_buffer = self._last_row_buffer, None
+
+        while (group := self._next_group()) is not None:
+            cursor, group_rows, line_num = group
+            current_cursor = _RowCursor(*cursor)
+
+            if current_cursor.timestamp < self._row_cursor.timestamp:
+                raise ValueError(f'Timestamp regression at {self.input_filepath}:{line_num}')
+
+            # Same cursor written differently (e.g. leading zeros in the timestamp) or split across chunks.
+            if current_cursor == self._row_cursor:
+                rows.extend(group_rows)
+            else:
+                self._row_cursor = current_cursor
+                self._last_row_buffer = group_rows
+                break
+        else:
+            # The file is exhausted and has no pending cursor.
+            self._row_cursor = None
+
+        return CsvRows(self.fieldnames, rows)
+
+    def _next_group(self) -> tuple[tuple[int, str, str], list[list[str]], int] | None:
+        """
+        Return the next group of rows parsed from the input file, waiting for the parsing of its chunk if needed.
+        :return: Tuple of the raw cursor, rows and line number of the group, or None if the file is exhausted
+        :raises ValueError: If a timestamp is not an integer
+        :raises IndexError: If a row is missing one of the cursor columns
+        """
+        while not self._chunk_groups:
+            if not self._pending_chunks:
+                return None
+
+            groups, lines_count = self._pending_chunks.popleft().result()
+            self._chunk_groups.extend(groups)
+            self._chunk_first_line = self._lines_read
+            self._lines_read += lines_count
+            self._submit_chunks()
+
+        cursor, rows, line_num = self._chunk_groups.popleft()
+        return cursor, rows, self._chunk_first_line + line_num
+
+    def _submit_chunks(self) -> None:
+        """
+        Submit the next chunks of the input file to the executor, up to the maximum number of pending chunks.
+        """
+        file_size = len(self._buffer)
+        while len(self._pending_chunks) < self.max_pending_chunks and self._next_chunk_offset < file_size:
+            start = self._next_chunk_offset
+            end = self._group_boundary(start + self.chunk_size)
+            self._pending_chunks.append(self.executor.submit(_parse_csv_chunk, self.input_filepath, start, end, self._cursor_indexes))
+            self._next_chunk_offset = end
+
+    def _group_boundary(self, offset: int) -> int:
+        """
+        Find the start of the first line following the given offset whose timestamp/sensor/target differs from the previous line.
+        :param offset: Offset from where to search the boundary
+        :return: Offset of the group boundary, or the size of the file if there is none
+        """
+        file_size = len(self._buffer)
+        if offset >= file_size:
+            return file_size
+
+        previous_line_end = self._line_end(offset)
+        previous_cursor = self._line_cursor(self._buffer.rfind(b'\n', 0, previous_line_end) + 1, previous_line_end)
+        line_start = previous_line_end + 1
+        while line_start < file_size:
+            line_end = self._line_end(line_start)
+            if self._line_cursor(line_start, line_end) != previous_cursor:
+                return line_start
+
+            line_start = line_end + 1
+
+        return file_size
+
+    def _line_end(self, offset: int) -> int:
+        """
+        Return the offset of the end of the line containing the given offset.
+        :param offset: Offset within the line
+        :return: Offset of the line feed ending the line, or the size of the file for the last line
+        """
+        line_end = self._buffer.find(b'\n', offset)
+        return line_end if line_end != -1 else len(self._buffer)
+
+    def _line_cursor(self, line_start: int, line_end: int) -> tuple[str, ...] | None:
+        """
+        Return the raw timestamp/sensor/target values of a line.
+        :param line_start: Offset of the start of the line
+        :param line_end: Offset of the end of the line
+        :return: Tuple of the raw cursor values, or None for blank or incomplete lines
+        """
+        row = next(csv_reader(self._buffer[line_start:line_end].decode('utf-8').splitlines()), None)
+        if not row or len(row) <= max(self._cursor_indexes):
+            return None
+
+        return tuple(row[index] for index in self._cursor_indexes)
 
 
 class MultiCsvFileReader(CsvFilesReader):
@@ -180,34 +519,88 @@ class MultiCsvFileReader(CsvFilesReader):
     Multi-files CSV reader class.
     Handles reports exported into multiple files using the flat format.
     Requires monotonic timestamps and the rows to be sorted by timestamp/sensor/target to work.
+    When a time window is given, only the part of the uncompressed files containing it is read, according to their sidecar
+    time index. The files without time index are read entirely, the rows outside the time window have to be filtered out.
     """
 
-    def __init__(self, input_filepaths: Iterable[Path]):
+    parsing_chunk_size = 4 * 1024 * 1024
+
+    def __init__(self, input_filepaths: Iterable[Path], compression: str = 'auto', parsing_workers: int = 1, time_from: datetime | None = None,
+                 time_to: datetime | None = None):
         """
         :param input_filepaths: Iterable of Path to the input files
+        :param compression: Compression method of the input files, or auto to infer it from the suffix of each file
+        :param parsing_workers: Number of worker processes parsing the uncompressed input files, a single value means the files are parsed in-process
+        :param time_from: Start of the time window of the rows to read (inclusive), None for an unbounded window
+        :param time_to: End of the time window of the rows to read (exclusive), None for an unbounded window
         """
         super().__init__()
 
         self.input_filepaths = input_filepaths
+        self.compression = compression
+        self.parsing_workers = parsing_workers
+        self.time_from = time_from
+        self.time_to = time_to
 
-        self._file_readers: dict[str, SingleCsvFileReader] = {}
+        self._file_readers: dict[str, SingleCsvFileReader | ParallelCsvFileReader] = {}
+        self._cursors_heap: list[tuple[_RowCursor, int, str]] | None = None
+        self._parsing_executor: ProcessPoolExecutor | None = None
 
     def open(self):
         """
         Open the input files and initialize theirs corresponding reader.
+        The uncompressed files are parsed by a pool of worker processes when more than one parsing worker is requested.
         :raises OSError: if a file cannot be opened
         """
         pending_readers = {}
         with ExitStack() as stack:
+            if self.parsing_workers > 1:
+                self._parsing_executor = ProcessPoolExecutor(self.parsing_workers, mp_context=get_context('spawn'))
+                stack.callback(self._shutdown_parsing_executor)
+
             for input_filepath in self.input_filepaths:
-                file_reader = SingleCsvFileReader(input_filepath)
+                file_handler = FileHandlerRegistry.get(self.compression, input_filepath)
+                group_name = FileHandlerRegistry.stem(input_filepath, file_handler)
+                byte_range = self._time_window_byte_range(input_filepath) if file_handler is RawFileHandler else None
+                if byte_range == (0, 0):
+                    continue  # The file has no row in the time window.
+
+                if byte_range is not None:
+                    file_reader = SingleCsvFileReader(input_filepath, self.compression, byte_range)
+                elif self._parsing_executor is not None and file_handler is RawFileHandler:
+                    file_reader = ParallelCsvFileReader(input_filepath, self._parsing_executor, 2 * self.parsing_workers, self.parsing_chunk_size)
+                else:
+                    file_reader = SingleCsvFileReader(input_filepath, self.compression)
                 stack.callback(file_reader.close)  # Register cleanup before opening to cover partial initialization failures.
                 file_reader.open()
-                pending_readers[input_filepath.stem] = file_reader
+                pending_readers[group_name] = file_reader
 
             self._file_readers.update(pending_readers)
             stack.pop_all()  # Transfer resource ownership to _file_readers after successful initialization.
 
+    def _time_window_byte_range(self, input_filepath: Path) -> tuple[int, int | None] | None:
+        """
+        Return the byte range of an uncompressed input file containing the time window, according to its time index.
+        :param input_filepath: Path to the input file
+        :return: Start and end offsets of the time window, (0, 0) if the file has no row in it, or None to read the whole file
+        """
+        if self.time_from is None and self.time_to is None:
+            return None
+
+        index_filepath = time_index_filepath(input_filepath)
+        try:
+            blocks = read_time_index(index_filepath)
+        except FileNotFoundError:
+            return None
+        except ValueError as exn:
+            logging.warning('Ignoring malformed time index %s: %s', index_filepath, exn)
+            return None
+
+        if not blocks:
+            return None
+
+        return time_index_range(blocks, self.time_from, self.time_to) or (0, 0)
+
     def close(self):
         """
         Close the input files and cleanup the readers context.
@@ -216,19 +609,56 @@ class MultiCsvFileReader(CsvFilesReader):
             _, reader = self._file_readers.popitem()
             reader.close()
 
+        self._shutdown_parsing_executor()
+        self._cursors_heap = None
+
+    def _shutdown_parsing_executor(self) -> None:
+        """
+        Stop the worker processes parsing the input files.
+        """
+        if self._parsing_executor is not None:
+            self._parsing_executor.shutdown(wait=True, cancel_futures=True)
+            self._parsing_executor = None
+
     def next_rows(self) -> dict[str, list[dict[str, str]]]:
         """
         Returns the next rows sharing the same timestamp/sensor/target across the input files.
         :return: Dict containing a list of rows per group
         """
-        current_cursor = None
-        if cursors := [cursor for reader in self._file_readers.values() if (cursor := reader.cursor()) is not None]:
-            current_cursor = min(cursors)
+        return {group_name: group_rows.as_dicts() for group_name, group_rows in self.next_csv_rows().items()}
+
+    def next_csv_rows(self) -> dict[str, CsvRows]:
+        """
+        Returns the next rows sharing the same timestamp/sensor/target across the input files.
+        The readers are merged using a heap ordered by their cursor, only the readers positioned at the current cursor are read.
+        :return: Dict containing the rows, stored as lists of values, per group
+        """
+        if self._cursors_heap is None:
+            self._cursors_heap = [
+                (cursor, index, group_name)
+                for index, (group_name, reader) in enumerate(self._file_readers.items())
+                if (cursor := reader.cursor()) is not None
+            ]
+            heapify(self._cursors_heap)
+
+        if not self._cursors_heap:
+            return {}
+
+        current_cursor = self._cursors_heap[0][0]
+        current_readers = []
+        while self._cursors_heap and self._cursors_heap[0][0] == current_cursor:
+            current_readers.append(heappop(self._cursors_heap))
 
         rows = {}
-        for group_name, reader in self._file_readers.items():
-            if group_rows := reader.next_rows(current_cursor):
-                rows[group_name] = group_rows
+        try:
+            for _, _, group_name in current_readers:
+                if (group_rows := self._file_readers[group_name].next_csv_rows(current_cursor)).rows:
+                    rows[group_name] = group_rows
+        finally:
+            # Reposition the readers, including when one of them failed, as their cursor can only move forward.
+            for _, index, group_name in current_readers:
+                if (cursor := self._file_readers[group_name].cursor()) is not None:
+                    heappush(self._cursors_heap, (cursor, index, group_name))
 
         return rows
 
@@ -236,44 +666,118 @@ class MultiCsvFileReader(CsvFilesReader):
 class SingleCsvFileWriter:
     """
     Single file CSV writer class.
+    The rows are formatted into an in-memory buffer which is written to the file once it exceeds the buffer size, or once it
+    has been held longer than the flush interval to keep the rows of low-rate pipelines visible to the readers.
+    A sparse sidecar time index can be written along the file, the content of the buffer being recorded when it is flushed.
     """
 
-    def __init__(self, output_filepath: Path, fieldnames: list[str]):
+    flush_interval = 1.0
+
+    def __init__(self, output_filepath: Path, fieldnames: Sequence[str], compression: str = 'auto', buffer_size: int = 0,
+                 index_block_size: int = 0):
         """
         :param output_filepath: Path to the output file
         :param fieldnames: List of column names
+        :param compression: Compression method of the output file, or auto to infer it from the file suffix
+        :param buffer_size: Size (in characters) of the write buffer, 0 to write the rows to the file on each call
+        :param index_block_size: Size (in bytes) of the blocks of the sidecar time index, 0 to disable the index
+        :raises ValueError: If the compression method is not supported
         """
         super().__init__()
 
         self.fieldnames = fieldnames
         self.output_filepath = output_filepath
+        self.buffer_size = buffer_size
+        self.index_block_size = index_block_size
 
+        self._flushed_size = 0
+        self._file_handler = FileHandlerRegistry.get(compression, output_filepath)
         self._file = None
+        self._buffer = StringIO(newline='')
         self._writer = None
+        self._dict_writer = None
+        self._time_index: TimeIndexBuilder | None = None
+        self._buffered_timestamps: set[str] = set()
+        self._flush_deadline = 0.0
 
     def open(self) -> None:
         """
         Open the output file and initialize the writer.
         """
-        self._file = open(self.output_filepath, 'w', encoding='utf-8')
-        self._writer = DictWriter(self._file, self.fieldnames)
-        self._writer.writeheader()
+        if self.index_block_size > 0:
+            self._time_index = TimeIndexBuilder(self.index_block_size)
+
+        self._file = self._file_handler.open(self.output_filepath, 'w')
+        self._flush_deadline = monotonic() + self.flush_interval
+        self._writer = csv_writer(self._buffer)
+        self._dict_writer = DictWriter(self._buffer, self.fieldnames)
+        self._writer.writerow(self.fieldnames)
+        self._flush_if_full()
 
     def close(self) -> None:
         """
-        Close the output file.
+        Flush the write buffer and close the output file.
         """
         if self._file is None:
             return
 
         try:
+            self.flush()
             self._file.close()
+            if self._time_index is not None:
+                self._time_index.write(time_index_filepath(self.output_filepath))
         except OSError:
             # Unrecoverable errors can happen when closing the output file.
             pass
 
         self._writer = None
+        self._dict_writer = None
         self._file = None
+        self._time_index = None
+
+    @property
+    def size(self) -> int:
+        """
+        Return the size (in characters) of the content written by the writer, including the buffered content.
+        """
+        return self._flushed_size + self._buffer.tell()
+
+    def flush(self) -> None:
+        """
+        Write the content of the write buffer to the output file.
+        :raise: OSError if something went wrong during the operation
+        """
+        if data := self._buffer.getvalue():
+            self._file.write(data)
+            self._flushed_size += len(data)
+            self._buffer.seek(0)
+            self._buffer.truncate()
+            self._flush_deadline = monotonic() + self.flush_interval
+
+            if self._time_index is not None:
+                self._record_time_index(len(data) if data.isascii() else len(data.encode('utf-8')))
+
+    def _record_time_index(self, size: int) -> None:
+        """
+        Record the flushed content of the write buffer into the time index.
+        :param size: Size (in bytes) of the flushed content
+        :raise: ValueError if a timestamp of the flushed rows is malformed
+        """
+        if not self._buffered_timestamps:
+            self._time_index.skip(size)
+            return
+
+        timestamps = [parse_timestamp_milliseconds(timestamp) for timestamp in self._buffered_timestamps]
+        self._buffered_timestamps.clear()
+        self._time_index.add(size, min(timestamps), max(timestamps))
+
+    def _flush_if_full(self) -> None:
+        """
+        Flush the write buffer if it exceeds the buffer size or if the flush interval has elapsed since the last flush.
+        :raise: OSError if something went wrong during the operation
+        """
+        if self._buffer.tell() >= self.buffer_size or monotonic() >= self._flush_deadline:
+            self.flush()
 
     def write_rows(self, rows: list[dict[str, str]]) -> None:
         """
@@ -281,24 +785,96 @@ class SingleCsvFileWriter:
         :param rows: List of dict representing the rows as column/value pairs
         :raise: OSError if something went wrong during the operation
         """
+        if self._time_index is not None:
+            self._buffered_timestamps.update(row['timestamp'] for row in rows)
+
+        self._dict_writer.writerows(rows)
+        self._flush_if_full()
+
+    def write_csv_rows(self, rows: Iterable[Sequence[str]]) -> None:
+        """
+        Write rows, stored as sequences of values ordered as the fieldnames, to the output file.
+        :param rows: Iterable of rows
+        :raise: OSError if something went wrong during the operation
+        """
+        if self._time_index is not None:
+            rows = list(rows)
+            timestamp_column = self.fieldnames.index('timestamp')
+            self._buffered_timestamps.update(row[timestamp_column] for row in rows)
+
         self._writer.writerows(rows)
+        self._flush_if_full()
+
+
+def _compress_segment(filepath: Path, file_handler: type[FileHandler]) -> None:
+    """
+    Compress a closed segment file, then remove it.
+    The compressed file is written under a temporary name and renamed once complete.
+    :param filepath: Path to the segment file
+    :param file_handler: File handler of the compression method
+    """
+    compressed_filepath = filepath.with_name(f'{filepath.name}{file_handler.supported_suffixes[0]}')
+    partial_filepath = compressed_filepath.with_name(f'{compressed_filepath.name}.part')
+    try:
+        with open(filepath, encoding='utf-8', newline='') as segment, file_handler.open(partial_filepath, 'w') as compressed_segment:
+            copyfileobj(segment, compressed_segment, 1024 * 1024)
+        partial_filepath.replace(compressed_filepath)
+        filepath.unlink()
+    except OSError as exn:
+        logging.warning('Failed to compress CSV segment %s: %s', filepath, exn)
+        partial_filepath.unlink(missing_ok=True)
 
 
 class MultiCsvFileWriter(CsvFilesWriter):
     """
     Multi-file csv writer class.
     Allow to export reports into multiple csv files using the flat format.
+    When the rotation is enabled, the rows of each group are written into segment files named after their creation time.
     """
 
-    def __init__(self, output_directory: Path):
+    def __init__(self, output_directory: Path, compression: str = 'none', buffer_size: int = 0, rotation_size: int = 0,
+                 rotation_interval: float = 0.0, segments_compression: str = 'none', index_block_size: int = 0):
         """
         :param output_directory: Path to the output directory
+        :param compression: Compression method of the output files
+        :param buffer_size: Size (in characters) of the write buffer of each file
+        :param rotation_size: Size (in characters) from which a segment file is rotated, 0 to disable
+        :param rotation_interval: Duration (in seconds) after which a segment file is rotated, 0 to disable
+        :param segments_compression: Compression method applied to the segment files once rotated
+        :param index_block_size: Size (in bytes) of the blocks of the sidecar time index of each file, 0 to disable the index
+        :raises ValueError: If a compression method is not supported, if both the files and segments are compressed, or if
+                            the files are compressed while the time index is enabled
         """
         super().__init__()
 
         self.output_directory = output_directory
+        self.compression = compression
+        self.buffer_size = buffer_size
+        self.rotation_size = rotation_size
+        self.rotation_interval = rotation_interval
+        self.segments_compression = segments_compression
+        self.index_block_size = index_block_size
+
+        file_handler = FileHandlerRegistry.get(compression, output_directory)
+        self._file_suffix = '.csv' if file_handler is RawFileHandler else f'.csv{file_handler.supported_suffixes[0]}'
+
+        self._segments_file_handler = FileHandlerRegistry.get(segments_compression, output_directory)
+        if self._segments_file_handler is not RawFileHandler and file_handler is not RawFileHandler:
+            raise ValueError('Compression of the rotated segments requires uncompressed output files')
+
+        if index_block_size > 0 and (file_handler is not RawFileHandler or self._segments_file_handler is not RawFileHandler):
+            raise ValueError('The time index requires uncompressed output files')
 
         self._file_writers: dict[str, SingleCsvFileWriter] = {}
+        self._segments_deadline: dict[str, float] = {}
+        self._segments_compressor: ThreadPoolExecutor | None = None
+
+    @property
+    def rotation_enabled(self) -> bool:
+        """
+        Return whether the output files are rotated.
+        """
+        return self.rotation_size > 0 or self.rotation_interval > 0
 
     def open(self) -> None:
         """
@@ -308,23 +884,75 @@ class MultiCsvFileWriter(CsvFilesWriter):
 
     def close(self) -> None:
         """
-        Close the output file(s).
+        Close the output file(s) and wait for the compression of the rotated segments.
         """
         while self._file_writers:
-            _, writer = self._file_writers.popitem()
-            writer.close()
+            group_name, writer = self._file_writers.popitem()
+            self._close_group_file_writer(group_name, writer)
+
+        if self._segments_compressor is not None:
+            self._segments_compressor.shutdown(wait=True)
+            self._segments_compressor = None
 
-    def _setup_group_file_writer(self, group_name: str, fieldnames: list[str]) -> SingleCsvFileWriter:
+    def _segment_filepath(self, group_name: str) -> Path:
+        """
+        Return the path of a new file for the given group.
+        :param group_name: Name of the group
+        :return: Path of the group file, suffixed by its creation time when the rotation is enabled
+        """
+        if not self.rotation_enabled:
+            return self.output_directory / f'{group_name}{self._file_suffix}'
+
+        return self.output_directory / f'{group_name}-{datetime.now(UTC):%Y%m%dT%H%M%S%fZ}{self._file_suffix}'
+
+    def _setup_group_file_writer(self, group_name: str, fieldnames: Sequence[str]) -> SingleCsvFileWriter:
         """
         Set up a file writer for a specific group.
         :param group_name: Name of the group (will be the output filename)
         :param fieldnames: List of column names
         :return: File writer for the given group
         """
-        file_writer = SingleCsvFileWriter(self.output_directory / f'{group_name}.csv', fieldnames)
+        file_writer = SingleCsvFileWriter(self._segment_filepath(group_name), fieldnames, self.compression, self.buffer_size, self.index_block_size)
         file_writer.open()
 
         self._file_writers[group_name] = file_writer
+        if self.rotation_interval > 0:
+            self._segments_deadline[group_name] = monotonic() + self.rotation_interval
+
+        return file_writer
+
+    def _close_group_file_writer(self, group_name: str, file_writer: SingleCsvFileWriter) -> None:
+        """
+        Close the file writer of a group, then submit its file for compression when the segments are compressed.
+        :param group_name: Name of the group
+        :param file_writer: File writer of the group
+        """
+        file_writer.close()
+        self._segments_deadline.pop(group_name, None)
+
+        if self._segments_file_handler is not RawFileHandler:
+            if self._segments_compressor is None:
+                self._segments_compressor = ThreadPoolExecutor(1, thread_name_prefix='csv-segments-compressor')
+            self._segments_compressor.submit(_compress_segment, file_writer.output_filepath, self._segments_file_handler)
+
+    def _get_group_file_writer(self, group_name: str, fieldnames: Sequence[str]) -> SingleCsvFileWriter:
+        """
+        Return the file writer of a group, rotating its current segment when it exceeds the rotation size or interval.
+        :param group_name: Name of the group
+        :param fieldnames: List of column names, used when a new file writer is set up
+        :return: File writer for the given group
+        """
+        file_writer = self._file_writers.get(group_name)
+        if file_writer is not None and self.rotation_enabled:
+            deadline = self._segments_deadline.get(group_name)
+            if 0 < self.rotation_size <= file_writer.size or (deadline is not None and monotonic() >= deadline):
+                del self._file_writers[group_name]
+                self._close_group_file_writer(group_name, file_writer)
+                file_writer = None
+
+        if file_writer is None:
+            file_writer = self._setup_group_file_writer(group_name, fieldnames)
+
         return file_writer
 
     def write_rows(self, rows: dict[str, list[dict[str, str]]]) -> None:
@@ -337,9 +965,18 @@ class MultiCsvFileWriter(CsvFilesWriter):
             if not group_rows:
                 continue
 
-            file_writer = self._file_writers.get(group_name)
-            if file_writer is None:
-                fieldnames = list(next(iter(group_rows)).keys())
-                file_writer = self._setup_group_file_writer(group_name, fieldnames)
-
+            file_writer = self._get_group_file_writer(group_name, list(next(iter(group_rows)).keys()))
             file_writer.write_rows(group_rows)
+
+    def write_csv_rows(self, rows: dict[str, CsvRows]) -> None:
+        """
+        Write rows, stored as sequences of values, into output files.
+        :param rows: Dict containing the rows per group
+        :raises OSError: if a file cannot be opened
+        """
+        for group_name, group_rows in rows.items():
+            if not group_rows.rows:
+                continue
+
+            file_writer = self._get_group_file_writer(group_name, group_rows.fieldnames)
+            file_writer.write_csv_rows(group_rows.rows)
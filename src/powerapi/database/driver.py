@@ -58,6 +58,16 @@ class ReadableDatabase(DatabaseDriver, ABC):
     def read(self, stream_mode: bool = False) -> Iterable[Report]: ...
 
 
+class PushBasedDatabase(ReadableDatabase, ABC):
+    """
+    Interface for database drivers that receive the reports pushed by their producers.
+    Allows the readers to be woken up as soon as reports are available instead of polling the database periodically.
+    """
+
+    @abstractmethod
+    def wait_for_reports(self, timeout: float) -> bool: ...
+
+
 class ReadableDatabaseFactory(ABC):
     """
     Interface for factories that create readable database drivers.
@@ -0,0 +1,217 @@
+# Copyright (c) 2026, Inria
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import sys
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from importlib.util import find_spec
+from io import TextIOWrapper
+from pathlib import Path
+from typing import Literal, TextIO, ClassVar
+
+
+_OPEN_MODES = Literal['r', 'w']
+
+
+@dataclass(frozen=True)
+class CompressionOptions:
+    """
+    Options of the compression applied when writing a file.
+    Handlers ignore the options they do not support, and the options are not used when reading a file.
+    """
+    level: int | None = None
+    threads: int = 0
+
+
+class FileHandler(ABC):
+    """
+    Base class for file opening strategies.
+    """
+    compression_method: str = ''
+    supported_suffixes: tuple[str, ...] = ()
+
+    @classmethod
+    @abstractmethod
+    def open(cls, filepath: Path, mode: _OPEN_MODES, opts: CompressionOptions | None = None) -> TextIO:
+        """
+        Open a file as a UTF-8 text stream using the handler strategy.
+        :param filepath: Path to the file to open
+        :param mode: Text mode used to open the file
+        :param opts: Compression options, the default ones of the method are used when not given
+        :return: Open text stream
+        """
+        ...
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """
+        Return whether the dependencies required by the handler are installed.
+        :return: True if the handler can be used, False otherwise
+        """
+        return True
+
+
+class GzipFileHandler(FileHandler):
+    """
+    File handler for gzip-compressed files.
+    """
+    compression_method = 'gzip'
+    supported_suffixes = ('.gz', '.gzip')
+
+    @classmethod
+    def open(cls, filepath: Path, mode: _OPEN_MODES, opts: CompressionOptions | None = None) -> TextIO:
+        from gzip import GzipFile
+        if mode == 'w' and opts is not None and opts.level is not None:
+            gzip_file = GzipFile(filepath, mode, compresslevel=opts.level)
+        else:
+            gzip_file = GzipFile(filepath, mode)
+        text_handler = TextIOWrapper(gzip_file, encoding='utf-8')
+        return text_handler
+
+
+class LzmaFileHandler(FileHandler):
+    """"
+    File handler for lzma-compressed files.
+    """
+    compression_method = 'lzma'
+    supported_suffixes = ('.xz', '.lzma')
+
+    @classmethod
+    def open(cls, filepath: Path, mode: _OPEN_MODES, opts: CompressionOptions | None = None) -> TextIO:
+        from lzma import LZMAFile
+        preset = opts.level if mode == 'w' and opts is not None else None
+        lzma_file = LZMAFile(filepath, mode, preset=preset)
+        text_handler = TextIOWrapper(lzma_file, encoding='utf-8')
+        return text_handler
+
+
+class ZstdFileHandler(FileHandler):
+    """
+    File handler for zstd-compressed files.
+    Uses the standard library on Python 3.14 and later, the `zstandard` package otherwise.
+    The compression is multi-threaded when the number of threads of the options is positive.
+    """
+    compression_method = 'zstd'
+    supported_suffixes = ('.zst', '.zstd')
+    default_level = 3
+
+    @classmethod
+    def open(cls, filepath: Path, mode: _OPEN_MODES, opts: CompressionOptions | None = None) -> TextIO:
+        opts = opts if mode == 'w' and opts is not None else CompressionOptions()
+        level = opts.level if opts.level is not None else cls.default_level
+
+        if sys.version_info >= (3, 14):
+            from compression.zstd import CompressionParameter, ZstdFile
+            if mode == 'w':
+                options = {CompressionParameter.compression_level: level, CompressionParameter.nb_workers: opts.threads}
+                zstd_file = ZstdFile(filepath, mode, options=options)
+            else:
+                zstd_file = ZstdFile(filepath, mode)
+        else:
+            from zstandard import ZstdCompressor, open as zstd_open
+            zstd_file = zstd_open(filepath, f'{mode}b', cctx=ZstdCompressor(level=level, threads=opts.threads))
+
+        text_handler = TextIOWrapper(zstd_file, encoding='utf-8')
+        return text_handler
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return sys.version_info >= (3, 14) or find_spec('zstandard') is not None
+
+
+class BaseFileHandlerRegistry:
+    """
+    Generic file handlers registry class.
+    Used to manage the file handlers supported by a database.
+    """
+    _file_handlers: ClassVar[list[type[FileHandler]]]
+
+    def __init_subclass__(cls):
+        super().__init_subclass__()
+        cls._file_handlers = []  # Ensure each subclass has its own independent registry.
+
+    @classmethod
+    def register(cls, handler: type[FileHandler]) -> None:
+        """
+        Register a file handler in lookup order.
+        :param handler: Handler class to register
+        """
+        cls._file_handlers.append(handler)
+
+    @classmethod
+    def _get_from_compression_method(cls, compression_method: str) -> type[FileHandler]:
+        """
+        Retrieve a handler from its compression method name.
+        :param compression_method: Name of the compression method to resolve
+        :return: File handler matching the requested compression method
+        :raises ValueError: If the compression method is not recognized
+        """
+        for handler in cls._file_handlers:
+            if handler.compression_method == compression_method:
+                return handler
+
+        raise ValueError(f'Unknown compression method: {compression_method}')
+
+    @classmethod
+    def _get_from_file_extension(cls, filepath: Path) -> type[FileHandler]:
+        """
+        Infer a handler from the suffix of the given filepath.
+        :param filepath: Path to the file
+        :return: Handler matching the filepath suffix
+        :raises ValueError: If the file extension is not recognized
+        """
+        suffix = filepath.suffix.casefold()
+        for handler in cls._file_handlers:
+            if suffix in handler.supported_suffixes:
+                return handler
+
+        raise ValueError(f'Unknown file extension for: {filepath}')
+
+    @classmethod
+    def get(cls, compression_method: str, filepath: Path) -> type[FileHandler]:
+        """
+        Resolve the file handler for a file.
+
+        When the ``compression_method`` parameter is ``auto``, the handler is inferred from the filepath suffix.
+        Otherwise, the compression method is resolved explicitly.
+
+        :param compression_method: Compression method name or ``auto``
+        :param filepath: Path to the file associated with the handler lookup
+        :return: Matching file handler
+        :raises ValueError: If no handler matches the requested method or file suffix, or if its dependencies are missing
+        """
+        method = compression_method.casefold()
+        if method == 'auto':
+            handler = cls._get_from_file_extension(filepath)
+        else:
+            handler = cls._get_from_compression_method(method)
+
+        if not handler.is_available():
+            raise ValueError(f'Unavailable compression method (missing dependencies): {handler.compression_method}')
+
+        return handler
@@ -27,38 +27,177 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, UTC
+from functools import lru_cache
+from math import isfinite
+from typing import Any
+
 from powerapi.database.codec import CodecOptions, ReportEncoder, ReportEncoderRegistry
-from powerapi.report import PowerReport, FormulaReport
+from powerapi.database.tags import TagGetter, TagsPlanCache
+from powerapi.report import PowerReport, FormulaReport, Report
+
+_ESCAPE_MEASUREMENT = str.maketrans({',': r'\,', ' ': r'\ ', '\n': r'\n', '\r': r'\r', '\t': r'\t'})
+_ESCAPE_KEY = str.maketrans({',': r'\,', ' ': r'\ ', '=': r'\=', '\n': r'\n', '\r': r'\r', '\t': r'\t'})
+_ESCAPE_STRING = str.maketrans({'\\': '\\\\', '"': r'\"'})
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Multiplier and divisor converting a timestamp in microseconds to the write precision.
+_PRECISION_SCALES = {'ns': (1000, 1), 'us': (1, 1), 'ms': (1, 1000), 's': (1, 1_000_000)}
+
+
+# Marker of the tags taken from the attributes of the report instead of its metadata.
+_REPORT_ATTRIBUTE = object()
+
+# Plan of the tag set of a report: prefix of each tag (leading comma, escaped key and equal sign) and location of its value.
+_TagSetPlan = tuple[tuple[str, str, str | object | None], ...]
+
+
+@lru_cache(maxsize=4096)
+def escape_key(key: str) -> str:
+    """
+    Escape a tag or field key for the line protocol.
+    The keys being the same for most of the reports, their escaped form is cached.
+    :param key: Tag or field key
+    :return: Escaped key
+    """
+    return key.translate(_ESCAPE_KEY)
+
+
+def tag_set_plan(getters: dict[str, TagGetter]) -> _TagSetPlan:
+    """
+    Build the plan encoding the tag set of the reports, the sensor and target tags being overridden by the metadata ones.
+    :param getters: Location of the flattened tags, indexed by their name
+    :return: Escaped key prefix and location of each tag, sorted by key
+    """
+    tags = {'sensor': ('sensor', _REPORT_ATTRIBUTE), 'target': ('target', _REPORT_ATTRIBUTE)} | getters
+    return tuple((f',{escape_key(name)}=', key, nested_key) for name, (key, nested_key) in sorted(tags.items()))
+
+
+@dataclass
+class EncoderOptions(CodecOptions):
+    """
+    Encoder options for the InfluxDB database.
+    """
+    precision: str = 'ns'
+    tags_plans: TagsPlanCache[_TagSetPlan] = field(default_factory=lambda: TagsPlanCache(tag_set_plan))
+
+
+_DEFAULT_ENCODER_OPTIONS = EncoderOptions()
+
+
+def encode_tag_set(tags: dict[str, Any]) -> str:
+    """
+    Encode the tags of a point for the line protocol, sorted by key as recommended by InfluxDB.
+    The tags without value are skipped, as they are not supported by the line protocol.
+    :param tags: Dictionary of tags
+    :return: Tag set, including its leading comma
+    """
+    return ''.join(f',{escape_key(key)}={str(value).translate(_ESCAPE_KEY)}' for key, value in sorted(tags.items())
+                   if value is not None and value != '')
+
+
+def encode_field_value(value: Any) -> str | None:
+    """
+    Encode a field value for the line protocol.
+    :param value: Field value
+    :return: Encoded value, or None if the value cannot be stored (NaN or infinite float)
+    """
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, int):
+        return f'{value}i'
+    if isinstance(value, float):
+        return repr(value) if isfinite(value) else None
+    return '"' + str(value).translate(_ESCAPE_STRING) + '"'
+
+
+def encode_field_set(fields: dict[str, Any]) -> str:
+    """
+    Encode the fields of a point for the line protocol.
+    :param fields: Dictionary of fields
+    :return: Field set, empty if no field can be stored
+    """
+    encoded_fields = ((escape_key(key), encode_field_value(value)) for key, value in fields.items())
+    return ','.join(f'{key}={value}' for key, value in encoded_fields if value is not None)
+
+
+def encode_timestamp(timestamp: datetime, precision: str) -> int:
+    """
+    Encode a timestamp for the line protocol, naive timestamps being considered as UTC.
+    :param timestamp: Timestamp to encode
+    :param precision: Write precision (ns, us, ms or s)
+    :return: Timestamp since epoch in the write precision
+    """
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=UTC)
+
+    multiplier, divisor = _PRECISION_SCALES[precision]
+    return (timestamp - _EPOCH) // _MICROSECOND * multiplier // divisor
+
+
+def encode_report_tag_set(report: Report, opts: EncoderOptions) -> str:
+    """
+    Encode the sensor, target and flattened metadata of a report as the tag set of its point, using the plan of its metadata.
+    :param report: Report to encode
+    :param opts: Encoder options
+    :return: Tag set, including its leading comma
+    """
+    metadata = report.metadata
+    encoded_tags = []
+    for prefix, key, nested_key in opts.tags_plans.get(metadata):
+        if nested_key is _REPORT_ATTRIBUTE:
+            value = getattr(report, key)
+        else:
+            value = metadata[key] if nested_key is None else metadata[key][nested_key]
+
+        if value is not None and value != '':
+            encoded_tags.append(prefix + str(value).translate(_ESCAPE_KEY))
+
+    return ''.join(encoded_tags)
+
+
+def encode_line(measurement: str, tag_set: str, fields: dict[str, Any], timestamp: datetime, opts: EncoderOptions) -> bytes:
+    """
+    Encode a point into a line of the line protocol.
+    :param measurement: Measurement name
+    :param tag_set: Encoded tag set of the point
+    :param fields: Dictionary of fields
+    :param timestamp: Timestamp of the point
+    :param opts: Encoder options
+    :return: Line of the point, without line feed, empty if the point has no field that can be stored
+    """
+    field_set = encode_field_set(fields)
+    if not field_set:
+        return b''
+
+    line = f'{measurement.translate(_ESCAPE_MEASUREMENT)}{tag_set} {field_set} {encode_timestamp(timestamp, opts.precision)}'
+    return line.encode('utf-8')
 
 
-class PowerReportEncoder(ReportEncoder[PowerReport, dict]):
+class PowerReportEncoder(ReportEncoder[PowerReport, bytes]):
     """
     Power Report encoder for the InfluxDB database.
     """
 
     @staticmethod
-    def encode(report: PowerReport, opts: CodecOptions | None = None) -> dict:
-        return {
-            'measurement': 'powerrep',
-            'tags': {'sensor': report.sensor, 'target': report.target} | report.flatten_tags(report.metadata),
-            'fields': {'power_estimation': report.power},
-            'time': report.timestamp,
-        }
+    def encode(report: PowerReport, opts: EncoderOptions | None = None) -> bytes:
+        opts = opts if opts is not None else _DEFAULT_ENCODER_OPTIONS
+        return encode_line('powerrep', encode_report_tag_set(report, opts), {'power_estimation': report.power}, report.timestamp, opts)
 
 
-class FormulaReportEncoder(ReportEncoder[FormulaReport, dict]):
+class FormulaReportEncoder(ReportEncoder[FormulaReport, bytes]):
     """
     Formula Report encoder for the InfluxDB database.
     """
 
     @staticmethod
-    def encode(report: FormulaReport, opts: CodecOptions | None = None) -> dict:
-        return {
-            'measurement': 'formularep',
-            'tags': {'sensor': report.sensor, 'target': report.target},
-            'fields': report.metadata,
-            'time': report.timestamp,
-        }
+    def encode(report: FormulaReport, opts: EncoderOptions | None = None) -> bytes:
+        opts = opts if opts is not None else _DEFAULT_ENCODER_OPTIONS
+        tag_set = encode_tag_set({'sensor': report.sensor, 'target': report.target})
+        return encode_line('formularep', tag_set, report.flatten_tags(report.metadata), report.timestamp, opts)
 
 
 class ReportEncoders(ReportEncoderRegistry):
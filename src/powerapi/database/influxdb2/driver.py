@@ -27,41 +27,80 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import logging
 from collections.abc import Iterable
+from dataclasses import dataclass
+from time import sleep
 
-from influxdb_client import InfluxDBClient
+from influxdb_client import InfluxDBClient, WriteOptions
 from influxdb_client.client.exceptions import InfluxDBError
+from influxdb_client.client.write_api import WriteType
 from urllib3.exceptions import HTTPError
 
 from powerapi.database.driver import WritableDatabase, WritableDatabaseFactory
 from powerapi.database.exceptions import ConnectionFailed, WriteFailed
-from powerapi.database.influxdb2.codecs import ReportEncoders
+from powerapi.database.influxdb2.codecs import EncoderOptions, ReportEncoders
 from powerapi.report import Report
 
 
+@dataclass(frozen=True)
+class InfluxDB2WriteOptions:
+    """
+    Options of the writes of the reports into the InfluxDB database.
+    In synchronous mode, each batch of reports is sent in a single request. In batching mode, the points are buffered and
+    sent by a background thread of the client when the batch is full or when the flush interval is elapsed.
+    The writes failing with a transient error (network error, server overloaded or unavailable) are retried with an
+    exponential backoff, by the client in batching mode and by the driver in synchronous mode.
+    """
+    mode: str = 'batching'
+    batch_size: int = 1000
+    flush_interval: float = 1.0
+    gzip: bool = False
+    precision: str = 'ns'
+    max_retries: int = 5
+    retry_interval: float = 5.0
+    max_retry_delay: float = 125.0
+
+    def client_write_options(self) -> WriteOptions:
+        """
+        Return the write options of the InfluxDB client.
+        :return: InfluxDB client write options
+        """
+        write_type = WriteType.synchronous if self.mode == 'synchronous' else WriteType.batching
+        return WriteOptions(write_type=write_type, batch_size=self.batch_size, flush_interval=int(self.flush_interval * 1000),
+                            max_retries=self.max_retries, retry_interval=int(self.retry_interval * 1000),
+                            max_retry_delay=int(self.max_retry_delay * 1000))
+
+
 class InfluxDB2Output(WritableDatabase):
     """
     InfluxDB2 database driver.
     Allow to persist reports to an InfluxDB (version 2) database.
+    The reports are directly encoded into the line protocol.
     """
+    write_modes = ('synchronous', 'batching')
+    write_precisions = ('ns', 'us', 'ms', 's')
 
-    def __init__(self, report_type: type[Report], url: str, org: str, bucket: str, token: str):
+    def __init__(self, report_type: type[Report], url: str, org: str, bucket: str, token: str, write_options: InfluxDB2WriteOptions | None = None):
         """
         :param report_type: Type of the report handled by this database
         :param url: InfluxDB server URL
         :param org: Organization name
         :param bucket: Bucket name
         :param token: Authentication token
+        :param write_options: Options of the writes, None to use the default ones
         """
         super().__init__()
 
         self._bucket_name = bucket
+        self.write_options = write_options if write_options is not None else InfluxDB2WriteOptions()
 
-        self._client = InfluxDBClient(url, token, org=org)
+        self._client = InfluxDBClient(url, token, org=org, enable_gzip=self.write_options.gzip)
         self._buckets_api = self._client.buckets_api()
-        self._write_api = self._client.write_api()
+        self._write_api = self._client.write_api(self.write_options.client_write_options(), error_callback=self._on_batch_error)
 
         self._report_encoder = ReportEncoders.get(report_type)
+        self._report_encoder_opts = EncoderOptions(self.write_options.precision)
 
     def connect(self) -> None:
         """
@@ -76,10 +115,22 @@ class InfluxDB2Output(WritableDatabase):
 
     def disconnect(self) -> None:
         """
-        Disconnect from the InfluxDB database.
+        Flush the buffered points and disconnect from the InfluxDB database.
         """
+        logging.debug('InfluxDB output tags plan cache: %s', self._report_encoder_opts.tags_plans.cache_info())
+        self._write_api.close()
         self._client.close()
 
+    @staticmethod
+    def _on_batch_error(conf: tuple[str, str, str], data: bytes, exn: Exception) -> None:
+        """
+        Report the failure of a batch written in background by the client, once its retries are exhausted.
+        :param conf: Bucket, organization and precision of the batch
+        :param data: Line protocol data of the batch
+        :param exn: Error of the write
+        """
+        logging.warning('Failed to save %d reports to the InfluxDB bucket %s: %s', data.count(b'\n') + 1, conf[0], exn)
+
     @staticmethod
     def supported_write_types() -> Iterable[type[Report]]:
         """
@@ -88,15 +139,47 @@ class InfluxDB2Output(WritableDatabase):
         """
         return ReportEncoders.supported_types()
 
+    @staticmethod
+    def _is_transient_error(exn: Exception) -> bool:
+        """
+        Return whether a write error is transient, and the write can be retried.
+        :param exn: Error of the write
+        :return: True if the error is a network error or if the server is overloaded or unavailable, False otherwise
+        """
+        status = getattr(exn, 'status', None)
+        return status is None or status == 429 or status >= 500
+
+    def _write_lines(self, lines: list[bytes]) -> None:
+        """
+        Write lines of the line protocol into the bucket, retrying the synchronous writes failing with a transient error.
+        :param lines: Lines to write
+        :raise: OSError, HTTPError or InfluxDBError if the write operation fails
+        """
+        retry_delay = self.write_options.retry_interval
+        for attempt in range(self.write_options.max_retries + 1):
+            try:
+                self._write_api.write(self._bucket_name, record=lines, write_precision=self.write_options.precision)
+                return
+            except (OSError, HTTPError, InfluxDBError) as exn:
+                if self.write_options.mode != 'synchronous' or attempt == self.write_options.max_retries or not self._is_transient_error(exn):
+                    raise
+
+                logging.warning('Failed to save reports to the InfluxDB database, retrying in %.1fs: %s', retry_delay, exn)
+                sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, self.write_options.max_retry_delay)
+
     def write(self, reports: Iterable[Report]) -> None:
         """
         Write the reports into the InfluxDB database.
         :param reports: Iterable of reports
         :raise: WriteFailed if the write operation fails
         """
+        lines = [line for report in reports if (line := self._report_encoder.encode(report, self._report_encoder_opts))]
+        if not lines:
+            return
+
         try:
-            encoded_reports = [self._report_encoder.encode(report) for report in reports]
-            self._write_api.write(self._bucket_name, record=encoded_reports)
+            self._write_lines(lines)
         except (OSError, HTTPError, InfluxDBError) as exn:
             raise WriteFailed(f'Failed to save report to the InfluxDB database: {exn}') from exn
 
@@ -106,26 +189,44 @@ class InfluxDB2OutputFactory(WritableDatabaseFactory):
     InfluxDB2 output database factory.
     """
 
-    def __init__(self, report_type: type[Report], url: str, org: str, bucket: str, token: str):
+    def __init__(self, report_type: type[Report], url: str, org: str, bucket: str, token: str, write_options: InfluxDB2WriteOptions | None = None):
         """
         :param report_type: Type of the report handled by this database
         :param url: InfluxDB server URL
         :param org: Organization name
         :param bucket: Bucket name
         :param token: Authentication token
+        :param write_options: Options of the writes, None to use the default ones
         """
         if report_type not in ReportEncoders.supported_types():
             raise ValueError(f'Unsupported report type: {report_type.__name__}')
 
+        write_options = write_options if write_options is not None else InfluxDB2WriteOptions()
+        if write_options.mode not in InfluxDB2Output.write_modes:
+            raise ValueError(f'Invalid write mode: {write_options.mode}')
+
+        if write_options.precision not in InfluxDB2Output.write_precisions:
+            raise ValueError(f'Invalid write precision: {write_options.precision}')
+
+        if write_options.batch_size < 1:
+            raise ValueError(f'Invalid batch size: {write_options.batch_size}')
+
+        if write_options.flush_interval <= 0:
+            raise ValueError(f'Invalid flush interval: {write_options.flush_interval}')
+
+        if write_options.max_retries < 0 or write_options.retry_interval < 0 or write_options.max_retry_delay < 0:
+            raise ValueError('Invalid retry options: the values must be positive')
+
         self.report_type = report_type
         self.url = url
         self.org = org
         self.bucket = bucket
         self.token = token
+        self.write_options = write_options
 
     def create(self) -> WritableDatabase:
         """
         Create the InfluxDB2 output database driver.
         :return: Initialized InfluxDB2 database driver
         """
-        return InfluxDB2Output(self.report_type, self.url, self.org, self.bucket, self.token)
+        return InfluxDB2Output(self.report_type, self.url, self.org, self.bucket, self.token, self.write_options)
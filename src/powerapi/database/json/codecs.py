@@ -27,22 +27,14 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import json
+from collections.abc import Iterable
 from datetime import datetime
 
 from powerapi.database.codec import CodecOptions, ReportEncoder, ReportEncoderRegistry, ReportDecoder, ReportDecoderRegistry
+from powerapi.database.json_backends import get_json_backend
 from powerapi.report import Report, PowerReport, FormulaReport, HWPCReport
 
-
-class ExtendedJsonEncoder(json.JSONEncoder):
-    """
-    JSONEncoder subclass that handles unsupported report attribute types.
-    """
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-
-        return super().default(obj)
+_json = get_json_backend()
 
 
 class GenericReportEncoder(ReportEncoder[Report, str]):
@@ -53,7 +45,17 @@ class GenericReportEncoder(ReportEncoder[Report, str]):
 
     @staticmethod
     def encode(report: Report, opts: CodecOptions | None = None) -> str:
-        return json.dumps(vars(report), cls=ExtendedJsonEncoder, indent=None, separators=(',', ':')) + '\n'
+        return _json.dumps(vars(report)) + '\n'
+
+    @staticmethod
+    def encode_batch(reports: Iterable[Report], opts: CodecOptions | None = None) -> str:
+        """
+        Encode a batch of reports into JSON lines in a single pass of the JSON backend.
+        :param reports: Iterable of reports
+        :param opts: Codec options
+        :return: JSON lines of the reports
+        """
+        return _json.dumps_lines(map(vars, reports))
 
 
 class HWPCReportDecoder(ReportDecoder[str, HWPCReport]):
@@ -63,7 +65,7 @@ class HWPCReportDecoder(ReportDecoder[str, HWPCReport]):
 
     @staticmethod
     def decode(data: str, opts: CodecOptions | None = None) -> HWPCReport:
-        doc = json.loads(data)
+        doc = _json.loads(data)
         timestamp = datetime.fromisoformat(doc['timestamp'])
         return HWPCReport(timestamp, doc['sensor'], doc['target'], doc['groups'], doc['metadata'])
 
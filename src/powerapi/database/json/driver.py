@@ -27,36 +27,70 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import logging
+import os
+from collections import deque
 from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import ExitStack
+from datetime import datetime, timedelta, UTC
+from glob import glob, has_magic
+from heapq import merge
+from itertools import chain, islice
+from operator import attrgetter
 from os import fsync
 from pathlib import Path
+from time import monotonic, sleep, time
 
-from powerapi.database.driver import ReadableDatabase, ReadableDatabaseFactory, WritableDatabase, WritableDatabaseFactory
+from powerapi.database.background_writer import BackgroundWriterThread
+from powerapi.database.driver import PushBasedDatabase, ReadableDatabase, ReadableDatabaseFactory, WritableDatabase, WritableDatabaseFactory
 from powerapi.database.exceptions import ConnectionFailed, WriteFailed, ReadFailed
+from powerapi.database.file_handlers import CompressionOptions
 from powerapi.database.json.codecs import ReportDecoders, ReportEncoders
-from powerapi.database.json.file_handlers import FileHandlerRegistry
+from powerapi.database.json.file_handlers import FileHandlerRegistry, RawFileHandler
+from powerapi.database.time_index import TimeIndexBuilder, in_time_window, parse_time_window_bound, read_time_index, time_index_filepath, \
+    time_index_range, timestamp_milliseconds
 from powerapi.report import Report
 
+# JSON lines of a batch of reports, with the minimum and maximum timestamps (in milliseconds since epoch) of the reports.
+_EncodedBatch = tuple[str, int, int]
 
-class JsonInput(ReadableDatabase):
+
+class JsonInput(PushBasedDatabase):
     """
     JSON input database driver.
     Allow to retrieve reports from a `jsonl` file.
     The input **should** follow the JSON Lines text format. (https://jsonlines.org/)
+    In stream mode, uncompressed files are followed (like `tail -F`): the reports appended to the file are read as they are
+    written, and the file is reopened when it is rotated or read from its start when it is truncated.
+    Only the reports of the time window are returned, the sidecar time index of an uncompressed file being used (when it
+    exists) to read only the part of the file containing them.
     """
+    read_ahead_size = 64 * 1024
+    follow_poll_interval = 0.05
 
-    def __init__(self, report_type: type[Report], input_filepath: str, compression: str):
+    def __init__(self, report_type: type[Report], input_filepath: str, compression: str, time_from: datetime | None = None,
+                 time_to: datetime | None = None):
         """
         :param report_type: Type of the report handled by this database
         :param input_filepath: Path to the input file
         :param compression: Compression method to use for the file
+        :param time_from: Start of the time window of the reports to read (inclusive), None for an unbounded window
+        :param time_to: End of the time window of the reports to read (exclusive), None for an unbounded window
         """
         self.input_filepath = Path(input_filepath)
         self.compression = compression
+        self.time_from = time_from
+        self.time_to = time_to
 
         self._report_decoder = ReportDecoders.get(report_type)
         self._file_handler = FileHandlerRegistry.get(compression, self.input_filepath)
         self._file = None
+        self._file_id = None
+        self._pending_lines: deque[bytes] = deque()
+        self._partial_line = b''
+        self._read_limit: int | None = None
+        self._indexed_end = 0
 
     def connect(self) -> None:
         """
@@ -64,7 +98,12 @@ class JsonInput(ReadableDatabase):
         :raise: ConnectionFailed if the operation fails
         """
         try:
-            self._file = self._file_handler.open(self.input_filepath, 'r')
+            if self._file_handler is RawFileHandler:
+                self._open_raw_file()
+                if self.time_from is not None or self.time_to is not None:
+                    self._seek_time_window()
+            else:
+                self._file = self._file_handler.open(self.input_filepath, 'r')
         except OSError as exn:
             raise ConnectionFailed(f'Failed to open input file: {exn}') from exn
 
@@ -86,28 +125,337 @@ class JsonInput(ReadableDatabase):
         """
         return ReportDecoders.supported_types()
 
-    def _reports_generator(self) -> Iterator[Report]:
+    def _open_raw_file(self) -> None:
+        """
+        Open the uncompressed input file in binary mode, to track its position and identity when following it.
+        :raise: OSError if the file cannot be opened
+        """
+        self._file = open(self.input_filepath, 'rb')
+        file_stat = os.fstat(self._file.fileno())
+        self._file_id = (file_stat.st_dev, file_stat.st_ino)
+        self._pending_lines.clear()
+        self._partial_line = b''
+        self._read_limit = None
+        self._indexed_end = 0
+
+    def _seek_time_window(self) -> None:
+        """
+        Restrict the read of the uncompressed input file to the part containing the time window, using its time index.
+        The whole file is read when it has no usable time index.
+        :raise: OSError if the operation fails
+        """
+        index_filepath = time_index_filepath(self.input_filepath)
+        try:
+            blocks = read_time_index(index_filepath)
+        except FileNotFoundError:
+            return
+        except ValueError as exn:
+            logging.warning('Ignoring malformed time index %s: %s', index_filepath, exn)
+            return
+
+        if not blocks:
+            return
+
+        self._indexed_end = blocks[-1].end
+        if (byte_range := time_index_range(blocks, self.time_from, self.time_to)) is None:
+            self._read_limit = self._file.seek(0, os.SEEK_END)
+            return
+
+        self._file.seek(byte_range[0])
+        self._read_limit = byte_range[1]
+
+    def _read_lines(self) -> Iterator[bytes]:
+        """
+        Read the complete lines available from the uncompressed input file.
+        The file is read by chunks, the lines of a chunk are kept until consumed and the trailing incomplete line is kept
+        until the rest of it is written, so that no data is read twice.
+        :return: Iterator of lines
+        :raise: OSError if the read operation fails
+        """
+        while True:
+            while self._pending_lines:
+                yield self._pending_lines.popleft()
+
+            read_size = self.read_ahead_size
+            if self._read_limit is not None:
+                read_size = min(read_size, self._read_limit - self._file.tell())
+
+            if read_size <= 0 or not (chunk := self._file.read(read_size)):
+                return
+
+            lines = (self._partial_line + chunk).split(b'\n')
+            self._partial_line = lines.pop()
+            self._pending_lines.extend(lines)
+
+    def _read_all_lines(self) -> Iterator[bytes]:
+        """
+        Read the remaining lines of the uncompressed input file, including its last line when it has no line feed.
+        :return: Iterator of lines
+        :raise: OSError if the read operation fails
+        """
+        yield from self._read_lines()
+        yield self._take_partial_line()
+
+    def _take_partial_line(self) -> bytes:
+        """
+        Return the trailing incomplete line, once it is known that nothing will be appended to it.
+        :return: Trailing line of the file
+        """
+        line, self._partial_line = self._partial_line, b''
+        return line
+
+    def _input_file_status(self) -> str | None:
+        """
+        Check the state of the followed input file.
+        :return: 'rotated' if the path now refers to another file, 'truncated' if the file is smaller than the current read
+                 position, 'appended' if data is available after the current read position, or None if nothing changed
+        :raise: OSError if the file status cannot be retrieved
+        """
+        try:
+            path_stat = os.stat(self.input_filepath)
+        except FileNotFoundError:
+            # The file has been moved and its replacement is not created yet.
+            return None
+
+        if (path_stat.st_dev, path_stat.st_ino) != self._file_id:
+            return 'rotated'
+
+        position = self._file.tell()
+        if path_stat.st_size < position:
+            return 'truncated'
+
+        return 'appended' if path_stat.st_size > position else None
+
+    def _skip_indexed_data(self) -> None:
+        """
+        Lift the read limit of the time window once it is reached, skipping the rest of the indexed data.
+        The indexed data after the limit are outside the time window, but the data appended after the index are followed.
+        :raise: OSError if the operation fails
+        """
+        if self._read_limit is None or self._file.tell() < self._read_limit:
+            return
+
+        self._file.seek(max(self._file.tell(), self._indexed_end))
+        self._partial_line = b''
+        self._read_limit = None
+
+    def _follow_lines(self) -> Iterator[bytes]:
+        """
+        Read the lines available from the followed input file, then handle its rotation or truncation.
+        :return: Iterator of lines
+        :raise: OSError if the read operation fails
+        """
+        yield from self._read_lines()
+        if self._read_limit is not None:
+            self._skip_indexed_data()
+            yield from self._read_lines()
+
+        match self._input_file_status():
+            case 'rotated':
+                # The remaining content of the previous file is read before switching to the new one.
+                yield from self._read_all_lines()
+                self._file.close()
+                self._open_raw_file()
+                logging.info('Input file %s has been rotated, following the new file', self.input_filepath)
+                yield from self._read_lines()
+            case 'truncated':
+                logging.warning('Input file %s has been truncated, reading it from the start', self.input_filepath)
+                self._file.seek(0)
+                self._pending_lines.clear()
+                self._partial_line = b''
+                self._read_limit = None
+                yield from self._read_lines()
+
+    def _reports_generator(self, stream_mode: bool) -> Iterator[Report]:
         """
         Return a generator that yields reports from the JSON file.
+        :param stream_mode: Whether the input file is followed
         :return: Iterator of reports
+        :raise: ReadFailed if the read operation fails
         """
-        while True:
-            line = self._file.readline()
-            if line is None:
-                break
-            yield self._report_decoder.decode(line)
+        try:
+            if self._file_handler is not RawFileHandler:
+                lines = iter(self._file)
+            elif stream_mode:
+                lines = self._follow_lines()
+            else:
+                lines = self._read_all_lines()
+
+            filter_time_window = self.time_from is not None or self.time_to is not None
+            for line in lines:
+                if not line.strip():
+                    continue
+
+                report = self._report_decoder.decode(line if isinstance(line, str) else line.decode('utf-8'))
+                if not filter_time_window or in_time_window(report.timestamp, self.time_from, self.time_to):
+                    yield report
+        except OSError as exn:
+            raise ReadFailed(f'Failed to read reports from input file: {exn}') from exn
+        except (KeyError, TypeError, ValueError) as exn:
+            raise ReadFailed(f'Failed to decode report from input file: {exn}') from exn
 
     def read(self, stream_mode: bool = False) -> Iterable[Report]:
         """
         Read reports from a `jsonl` file.
-        :param stream_mode: No-OP, this database driver does not support stream mode.
+        :param stream_mode: Whether to follow the file, only supported for uncompressed files
         :return: Iterable of reports
         :raise: ReadFailed if the read operation fails
         """
-        try:
-            return self._reports_generator()
-        except OSError as exn:
-            raise ReadFailed(f'Failed to read reports from input file: {exn}') from exn
+        return self._reports_generator(stream_mode)
+
+    def wait_for_reports(self, timeout: float) -> bool:
+        """
+        Wait for data to be appended to the followed input file, or for its rotation or truncation.
+        The status of the file is polled at a short interval.
+        :param timeout: Maximum time in seconds to wait
+        :return: True if new data is available, False otherwise
+        """
+        if self._pending_lines:
+            return True
+
+        deadline = monotonic() + timeout
+        while self._file_handler is RawFileHandler:
+            try:
+                if self._input_file_status() is not None:
+                    return True
+            except OSError:
+                return False
+
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                return False
+
+            sleep(min(self.follow_poll_interval, remaining))
+
+        sleep(timeout)
+        return False
+
+
+class MultiJsonInput(ReadableDatabase):
+    """
+    Multi-files JSON input database driver.
+    Allow to retrieve reports from several `jsonl` files, that are read (decompressed and decoded) concurrently by a pool of
+    worker threads, each file having a chunk of reports read ahead of the consumer.
+    The reports are merged in timestamp order, assuming the reports of each file are sorted by timestamp, or returned as soon
+    as they are decoded when the order does not matter.
+    The input files are read once, following them in stream mode is not supported.
+    """
+    read_chunk_size = 1024
+
+    def __init__(self, report_type: type[Report], input_filepaths: Iterable[str], compression: str, workers: int = 1,
+                 ordered: bool = True, time_from: datetime | None = None, time_to: datetime | None = None):
+        """
+        :param report_type: Type of the report handled by this database
+        :param input_filepaths: Iterable of paths to the input files
+        :param compression: Compression method to use for the files
+        :param workers: Number of worker threads reading the input files
+        :param ordered: Whether the reports of the files are merged in timestamp order
+        :param time_from: Start of the time window of the reports to read (inclusive), None for an unbounded window
+        :param time_to: End of the time window of the reports to read (exclusive), None for an unbounded window
+        """
+        self.workers = workers
+        self.ordered = ordered
+
+        self._inputs = [JsonInput(report_type, input_filepath, compression, time_from, time_to) for input_filepath in input_filepaths]
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def input_filepaths(self) -> list[Path]:
+        """
+        Return the paths to the input files.
+        """
+        return [json_input.input_filepath for json_input in self._inputs]
+
+    def connect(self) -> None:
+        """
+        Connect the multi-files JSON input database driver.
+        :raise: ConnectionFailed if an input file cannot be opened
+        """
+        with ExitStack() as stack:
+            for json_input in self._inputs:
+                json_input.connect()
+                stack.callback(json_input.disconnect)
+
+            self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix='json-input-reader')
+            stack.pop_all()  # Transfer resource ownership to the driver after successful initialization.
+
+    def disconnect(self) -> None:
+        """
+        Disconnect the multi-files JSON input database driver.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+        for json_input in self._inputs:
+            json_input.disconnect()
+
+    @staticmethod
+    def supported_read_types() -> Iterable[type[Report]]:
+        """
+        Return the report types that can be retrieved from the JSON input database.
+        :return: Iterable of report types
+        """
+        return ReportDecoders.supported_types()
+
+    @staticmethod
+    def _read_chunk(reports: Iterator[Report], size: int) -> list[Report]:
+        """
+        Read a chunk of reports from an input file, from a worker thread.
+        :param reports: Iterator of the reports of the input file
+        :param size: Maximum number of reports to read
+        :return: List of reports, empty when the file is exhausted
+        """
+        return list(islice(reports, size))
+
+    def _file_chunks(self, reports: Iterator[Report]) -> Iterator[list[Report]]:
+        """
+        Return a generator that yields the chunks of reports of an input file, the next chunk being read ahead by a worker
+        thread while the current one is consumed.
+        :param reports: Iterator of the reports of the input file
+        :return: Iterator of chunks of reports
+        :raise: ReadFailed if the read operation fails
+        """
+        future = self._executor.submit(self._read_chunk, reports, self.read_chunk_size)
+        while chunk := future.result():
+            future = self._executor.submit(self._read_chunk, reports, self.read_chunk_size)
+            yield chunk
+
+    def _ordered_reports(self, files_reports: list[Iterator[Report]]) -> Iterator[Report]:
+        """
+        Return a generator that yields the reports of the input files merged in timestamp order.
+        :param files_reports: List of iterators of the reports of each input file
+        :return: Iterator of reports
+        :raise: ReadFailed if the read operation fails
+        """
+        files_chunks = (chain.from_iterable(self._file_chunks(reports)) for reports in files_reports)
+        return merge(*files_chunks, key=attrgetter('timestamp'))
+
+    def _unordered_reports(self, files_reports: list[Iterator[Report]]) -> Iterator[Report]:
+        """
+        Return a generator that yields the chunks of reports of the input files as soon as they are read.
+        :param files_reports: List of iterators of the reports of each input file
+        :return: Iterator of reports
+        :raise: ReadFailed if the read operation fails
+        """
+        pending_chunks = {self._executor.submit(self._read_chunk, reports, self.read_chunk_size): reports for reports in files_reports}
+        while pending_chunks:
+            done, _ = wait(pending_chunks, return_when=FIRST_COMPLETED)
+            for future in done:
+                reports = pending_chunks.pop(future)
+                if chunk := future.result():
+                    pending_chunks[self._executor.submit(self._read_chunk, reports, self.read_chunk_size)] = reports
+                    yield from chunk
+
+    def read(self, stream_mode: bool = False) -> Iterable[Report]:
+        """
+        Read reports from the `jsonl` files.
+        :param stream_mode: Unused, the input files are read once
+        :return: Iterable of reports
+        :raise: ReadFailed if the read operation fails
+        """
+        files_reports = [json_input.read(False) for json_input in self._inputs]
+        return self._ordered_reports(files_reports) if self.ordered else self._unordered_reports(files_reports)
 
 
 class JsonInputFactory(ReadableDatabaseFactory):
@@ -115,25 +463,64 @@ class JsonInputFactory(ReadableDatabaseFactory):
     JSON input database factory.
     """
 
-    def __init__(self, report_type: type[Report], output_filepath: str, compression: str):
+    def __init__(self, report_type: type[Report], output_filepath: str | list[str], compression: str, time_from: str | datetime | None = None,
+                 time_to: str | datetime | None = None, workers: int = 1, ordered: bool = True):
         """
         :param report_type: Type of the report handled by this database
-        :param output_filepath: Path to the output file
+        :param output_filepath: Path to the input file, or list of paths and glob patterns of the input files
         :param compression: Compression method to use for the file
+        :param time_from: Start of the time window of the reports to read (inclusive, ISO 8601), None for an unbounded window
+        :param time_to: End of the time window of the reports to read (exclusive, ISO 8601), None for an unbounded window
+        :param workers: Number of worker threads reading the input files
+        :param ordered: Whether the reports of multiple input files are merged in timestamp order
         """
         if report_type not in ReportDecoders.supported_types():
             raise ValueError(f'Unsupported report type: {report_type.__name__}')
 
+        if workers < 1:
+            raise ValueError(f'Invalid number of workers: {workers}')
+
+        self.time_from = parse_time_window_bound(time_from)
+        self.time_to = parse_time_window_bound(time_to)
+        if self.time_from is not None and self.time_to is not None and self.time_from >= self.time_to:
+            raise ValueError(f'Invalid time window: {self.time_from.isoformat()} - {self.time_to.isoformat()}')
+
         self.report_type = report_type
         self.output_filepath = output_filepath
         self.compression = compression
+        self.workers = workers
+        self.ordered = ordered
+
+    def _input_filepaths(self) -> list[str]:
+        """
+        Return the paths to the input files, the glob patterns being expanded (in lexicographic order).
+        :return: List of paths to the input files
+        :raise: ValueError if a glob pattern matches no file
+        """
+        patterns = [self.output_filepath] if isinstance(self.output_filepath, str) else self.output_filepath
+        input_filepaths = []
+        for pattern in patterns:
+            if not has_magic(pattern):
+                input_filepaths.append(pattern)
+            elif matching_filepaths := sorted(glob(pattern)):
+                input_filepaths.extend(matching_filepaths)
+            else:
+                raise ValueError(f'No input file matches: {pattern}')
+
+        return input_filepaths
 
     def create(self) -> ReadableDatabase:
         """
         Create the JSON input database driver.
+        The multi-files driver is used when several input files are matched, or when more than one worker is requested.
         :return: Initialized JSON input database driver
+        :raise: ValueError if a glob pattern matches no file
         """
-        return JsonInput(self.report_type, self.output_filepath, self.compression)
+        input_filepaths = self._input_filepaths()
+        if len(input_filepaths) == 1 and self.workers == 1:
+            return JsonInput(self.report_type, input_filepaths[0], self.compression, self.time_from, self.time_to)
+
+        return MultiJsonInput(self.report_type, input_filepaths, self.compression, self.workers, self.ordered, self.time_from, self.time_to)
 
 
 class JsonOutput(WritableDatabase):
@@ -141,19 +528,60 @@ class JsonOutput(WritableDatabase):
     JSON output database driver.
     Allow to persist reports to a `jsonl` file.
     The output follows the JSON Lines text format. (https://jsonlines.org/)
+    The reports of a batch are encoded at once, and can be written (and compressed) by a background thread.
+    The fsync policy defines when the written data are synchronized to the storage device:
+    never, on close (default), after each batch, or periodically (at most once per interval, when writing).
+    When the rotation is enabled, the reports are written into segment files named after their creation time, the time
+    windows being aligned on the UTC clock. A segment is written under a temporary `.part` name, and renamed to its final
+    name once closed.
+    A sparse sidecar time index (`<file>.idx`) can be written along the uncompressed output files, to allow the JSON input to
+    read a time window without scanning the whole file.
     """
+    fsync_policies = ('never', 'close', 'batch', 'periodic')
 
-    def __init__(self, report_type: type[Report], output_filepath: str, compression: str):
+    def __init__(self, report_type: type[Report], output_filepath: str, compression: str, write_queue_size: int = 0,
+                 fsync_policy: str = 'close', fsync_interval: float = 1.0, rotation_size: int = 0, rotation_interval: float = 0.0,
+                 compression_level: int | None = None, compression_threads: int = 0, index_block_size: int = 0):
         """
         :param report_type: Type of the report handled by this database
         :param output_filepath: Path to the output file
+        :param compression: Compression method to use for the file
+        :param write_queue_size: Number of batches queued for the background writer thread, 0 to write synchronously
+        :param fsync_policy: When to synchronize the file to the storage device (never, close, batch or periodic)
+        :param fsync_interval: Minimum duration (in seconds) between two synchronizations with the periodic policy
+        :param rotation_size: Size (in characters) from which a segment file is rotated, 0 to disable
+        :param rotation_interval: Duration (in seconds) of the time window of a segment file, 0 to disable
+        :param compression_level: Compression level, None to use the default one of the compression method
+        :param compression_threads: Number of compression threads (zstd only), 0 to compress from the writing thread
+        :param index_block_size: Size (in bytes) of the blocks of the sidecar time index, 0 to disable the index
         """
         self.output_filepath = Path(output_filepath)
         self.compression = compression
+        self.write_queue_size = write_queue_size
+        self.fsync_policy = fsync_policy
+        self.fsync_interval = fsync_interval
+        self.rotation_size = rotation_size
+        self.rotation_interval = rotation_interval
+        self.index_block_size = index_block_size
 
         self._report_encoder = ReportEncoders.get(report_type)
         self._file_handler = FileHandlerRegistry.get(compression, self.output_filepath)
+        self._compression_opts = CompressionOptions(compression_level, compression_threads)
         self._file = None
+        self._writer_thread = None
+        self._next_fsync = 0.0
+        self._segment_filepath: Path | None = None
+        self._segment_size = 0
+        self._segment_deadline = 0.0
+        self._segment_creation_time = datetime.min.replace(tzinfo=UTC)
+        self._time_index: TimeIndexBuilder | None = None
+
+    @property
+    def rotation_enabled(self) -> bool:
+        """
+        Return whether the output file is rotated.
+        """
+        return self.rotation_size > 0 or self.rotation_interval > 0
 
     def connect(self) -> None:
         """
@@ -161,22 +589,93 @@ class JsonOutput(WritableDatabase):
         :raise: ConnectionFailed if the operation fails
         """
         try:
-            self._file = self._file_handler.open(self.output_filepath, 'w')
+            self._open_output_file()
         except OSError as exn:
             raise ConnectionFailed(f'Failed to open output file: {exn}') from exn
 
+        self._next_fsync = monotonic() + self.fsync_interval
+        if self.write_queue_size > 0:
+            self._writer_thread = BackgroundWriterThread(self._write_batches, self.write_queue_size)
+            self._writer_thread.start()
+
     def disconnect(self) -> None:
         """
         Disconnect the JSON output database driver.
         """
+        if self._writer_thread is not None:
+            try:
+                self._writer_thread.close()
+            except OSError as exn:
+                logging.warning('Failed to write reports to output file %s: %s', self.output_filepath, exn)
+
         try:
-            self._file.flush()
-            fsync(self._file.fileno())
-            self._file.close()
+            self._close_output_file()
         except OSError:
             # Errors can happen when closing the output file, but nothing can be done in this case.
             pass
 
+    def _new_segment_filepath(self) -> Path:
+        """
+        Return the path of a new segment file, named after the output file and suffixed by its creation time.
+        The timestamp is inserted before the extensions of the output file. (`power.jsonl.zst` -> `power-<time>.jsonl.zst`)
+        The creation times are strictly increasing, so that the segments have distinct names sorted in creation order.
+        :return: Path of the segment file
+        """
+        self._segment_creation_time = max(datetime.now(UTC), self._segment_creation_time + timedelta(microseconds=1))
+        name = self.output_filepath.name
+        suffixes = ''
+        for supported_suffixes in (self._file_handler.supported_suffixes, RawFileHandler.supported_suffixes):
+            suffix = Path(name).suffix
+            if suffix and suffix.casefold() in supported_suffixes:
+                name, suffixes = name.removesuffix(suffix), suffix + suffixes
+
+        return self.output_filepath.with_name(f'{name}-{self._segment_creation_time:%Y%m%dT%H%M%S%fZ}{suffixes}')
+
+    def _open_output_file(self) -> None:
+        """
+        Open the output file, or a new segment file when the rotation is enabled.
+        :raise: OSError if the operation fails
+        """
+        filepath = self.output_filepath
+        if self.rotation_enabled:
+            self._segment_filepath = self._new_segment_filepath()
+            filepath = self._segment_filepath.with_name(f'{self._segment_filepath.name}.part')
+            if self.rotation_interval > 0:
+                self._segment_deadline = (time() // self.rotation_interval + 1) * self.rotation_interval
+
+        self._file = self._file_handler.open(filepath, 'w', self._compression_opts)
+        self._segment_size = 0
+        if self.index_block_size > 0:
+            self._time_index = TimeIndexBuilder(self.index_block_size)
+
+    def _close_output_file(self) -> None:
+        """
+        Close the output file and write its time index, then give its final name to the segment file when the rotation is
+        enabled.
+        :raise: OSError if the operation fails
+        """
+        self._file.flush()
+        if self.fsync_policy != 'never':
+            fsync(self._file.fileno())
+        self._file.close()
+
+        if self._time_index is not None:
+            self._time_index.write(time_index_filepath(self._segment_filepath or self.output_filepath))
+            self._time_index = None
+
+        if self._segment_filepath is not None:
+            self._segment_filepath.with_name(f'{self._segment_filepath.name}.part').replace(self._segment_filepath)
+            self._segment_filepath = None
+
+    def _rotate_output_file(self) -> None:
+        """
+        Rotate the segment file when it exceeds the rotation size or when its time window is over.
+        :raise: OSError if the operation fails
+        """
+        if 0 < self.rotation_size <= self._segment_size or (self.rotation_interval > 0 and time() >= self._segment_deadline):
+            self._close_output_file()
+            self._open_output_file()
+
     @staticmethod
     def supported_write_types() -> Iterable[type[Report]]:
         """
@@ -185,14 +684,56 @@ class JsonOutput(WritableDatabase):
         """
         return ReportEncoders.supported_types()
 
+    def _sync_file(self) -> None:
+        """
+        Synchronize the output file to the storage device.
+        :raise: OSError if the operation fails
+        """
+        self._file.flush()
+        fsync(self._file.fileno())
+        self._next_fsync = monotonic() + self.fsync_interval
+
+    def _write_batches(self, batches: list[_EncodedBatch]) -> None:
+        """
+        Write the encoded batches of reports to the output file, then apply the fsync policy.
+        :param batches: List of encoded batches
+        :raise: OSError if the operation fails
+        """
+        for data, min_timestamp, max_timestamp in batches:
+            if self.rotation_enabled:
+                self._rotate_output_file()
+
+            self._file.write(data)
+            self._segment_size += len(data)
+
+            if self._time_index is not None:
+                self._time_index.add(len(data) if data.isascii() else len(data.encode('utf-8')), min_timestamp, max_timestamp)
+
+        if self.fsync_policy == 'batch' or (self.fsync_policy == 'periodic' and monotonic() >= self._next_fsync):
+            self._sync_file()
+
     def write(self, reports: Iterable[Report]) -> None:
         """
         Write the reports into a `jsonl` file.
         :param reports: Iterable of reports
         :raise: WriteFailed if the operation fails
         """
+        min_timestamp = max_timestamp = 0
+        if self.index_block_size > 0:
+            reports = list(reports)
+            if reports:
+                min_timestamp = timestamp_milliseconds(min(report.timestamp for report in reports))
+                max_timestamp = timestamp_milliseconds(max(report.timestamp for report in reports))
+
+        data = self._report_encoder.encode_batch(reports)
+        if not data:
+            return
+
         try:
-            self._file.writelines([self._report_encoder.encode(report) for report in reports])
+            if self._writer_thread is not None:
+                self._writer_thread.submit((data, min_timestamp, max_timestamp))
+            else:
+                self._write_batches([(data, min_timestamp, max_timestamp)])
         except OSError as exn:
             raise WriteFailed(f'Failed to write reports to output file: {exn}') from exn
 
@@ -202,22 +743,64 @@ class JsonOutputFactory(WritableDatabaseFactory):
     JSON output database factory.
     """
 
-    def __init__(self, report_type: type[Report], output_filepath: str, compression: str):
+    def __init__(self, report_type: type[Report], output_filepath: str, compression: str, write_queue_size: int = 0,
+                 fsync_policy: str = 'close', fsync_interval: float = 1.0, rotation_size: int = 0, rotation_interval: float = 0.0,
+                 compression_level: int | None = None, compression_threads: int = 0, index_block_size: int = 0):
         """
         :param report_type: Type of the report handled by this database
         :param output_filepath: Path to the output file
         :param compression: Compression method to use for the file
+        :param write_queue_size: Number of batches queued for the background writer thread, 0 to write synchronously
+        :param fsync_policy: When to synchronize the file to the storage device (never, close, batch or periodic)
+        :param fsync_interval: Minimum duration (in seconds) between two synchronizations with the periodic policy
+        :param rotation_size: Size (in characters) from which a segment file is rotated, 0 to disable
+        :param rotation_interval: Duration (in seconds) of the time window of a segment file, 0 to disable
+        :param compression_level: Compression level, None to use the default one of the compression method
+        :param compression_threads: Number of compression threads (zstd only), 0 to compress from the writing thread
+        :param index_block_size: Size (in bytes) of the blocks of the sidecar time index, 0 to disable the index
         """
         if report_type not in ReportEncoders.supported_types():
             raise ValueError(f'Unsupported report type: {report_type.__name__}')
 
+        if write_queue_size < 0:
+            raise ValueError(f'Invalid write queue size: {write_queue_size}')
+
+        if fsync_policy not in JsonOutput.fsync_policies:
+            raise ValueError(f'Invalid fsync policy: {fsync_policy}')
+
+        if fsync_interval <= 0:
+            raise ValueError(f'Invalid fsync interval: {fsync_interval}')
+
+        if rotation_size < 0 or rotation_interval < 0:
+            raise ValueError(f'Invalid rotation size or interval: {rotation_size}, {rotation_interval}')
+
+        if compression_threads < 0:
+            raise ValueError(f'Invalid number of compression threads: {compression_threads}')
+
+        if index_block_size < 0:
+            raise ValueError(f'Invalid time index block size: {index_block_size}')
+
+        # The file handler registry checks the compression method and its dependencies without touching the filesystem.
+        if FileHandlerRegistry.get(compression, Path(output_filepath)) is not RawFileHandler and index_block_size > 0:
+            raise ValueError('The time index requires an uncompressed output file')
+
         self.report_type = report_type
         self.output_filepath = output_filepath
         self.compression = compression
+        self.write_queue_size = write_queue_size
+        self.fsync_policy = fsync_policy
+        self.fsync_interval = fsync_interval
+        self.rotation_size = rotation_size
+        self.rotation_interval = rotation_interval
+        self.compression_level = compression_level
+        self.compression_threads = compression_threads
+        self.index_block_size = index_block_size
 
     def create(self) -> WritableDatabase:
         """
         Create the JSON output database driver.
         :return: Initialized JSON output database driver
         """
-        return JsonOutput(self.report_type, self.output_filepath, self.compression)
+        return JsonOutput(self.report_type, self.output_filepath, self.compression, self.write_queue_size, self.fsync_policy,
+                          self.fsync_interval, self.rotation_size, self.rotation_interval, self.compression_level,
+                          self.compression_threads, self.index_block_size)
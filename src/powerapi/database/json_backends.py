@@ -0,0 +1,174 @@
+# Copyright (c) 2026, Inria
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import json
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from functools import cache
+from itertools import chain, repeat
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class JsonBackend:
+    """
+    JSON serialization backend.
+    Every backend produces compact documents and serializes the date/time objects to their ISO 8601 representation.
+    Malformed documents raise a ValueError and objects that cannot be serialized raise a TypeError, whatever the backend.
+    The `dumps_lines` function serializes a batch of documents into JSON lines, each document being followed by a line feed.
+    """
+    name: str
+    dumps: Callable[[Any], str]
+    dumpb: Callable[[Any], bytes]
+    loads: Callable[[str | bytes], Any]
+    dumps_lines: Callable[[Iterable[Any]], str]
+
+
+def _isoformat_default(obj: Any) -> str:
+    """
+    Serialize the date/time objects unsupported by the stdlib JSON encoder.
+    :param obj: Object to serialize
+    :return: ISO 8601 representation of the object
+    :raise TypeError: If the object is not a date/time object
+    """
+    if isinstance(obj, (date, datetime, time)):
+        return obj.isoformat()
+
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+def _stdlib_backend() -> JsonBackend:
+    """
+    Create the JSON backend using the Python standard library.
+    :return: JSON backend
+    """
+    encode = json.JSONEncoder(default=_isoformat_default, separators=(',', ':')).encode
+
+    def dumps_lines(objs: Iterable[Any]) -> str:
+        return ''.join([encode(obj) + '\n' for obj in objs])
+
+    return JsonBackend('json', encode, lambda obj: encode(obj).encode('utf-8'), json.loads, dumps_lines)
+
+
+def _orjson_backend() -> JsonBackend:
+    """
+    Create the JSON backend using the orjson library.
+    :return: JSON backend
+    :raise ImportError: If the orjson library is not installed
+    """
+    import orjson
+
+    def dumpb(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def dumps_lines(objs: Iterable[Any]) -> str:
+        return b''.join([dumpb(obj) + b'\n' for obj in objs]).decode('utf-8')
+
+    # The batch is serialized as a single array, each document being followed by a raw line feed fragment. A compact JSON
+    # document never contains a raw line feed, so the separators around the fragments can be safely replaced afterward.
+    # The fragments are only available since orjson 3.9, older versions serialize the documents one by one.
+    line_feed = orjson.Fragment(b'\n') if hasattr(orjson, 'Fragment') else None
+
+    def dumps_lines_fragments(objs: Iterable[Any]) -> str:
+        items = list(chain.from_iterable(zip(objs, repeat(line_feed))))
+        if not items:
+            return ''
+
+        return dumpb(items)[1:-3].replace(b',\n,', b'\n').decode('utf-8') + '\n'
+
+    return JsonBackend('orjson', lambda obj: dumpb(obj).decode('utf-8'), dumpb, orjson.loads,
+                       dumps_lines if line_feed is None else dumps_lines_fragments)
+
+
+def _msgspec_backend() -> JsonBackend:
+    """
+    Create the JSON backend using the msgspec library.
+    :return: JSON backend
+    :raise ImportError: If the msgspec library is not installed
+    """
+    from msgspec import DecodeError, EncodeError, json as msgspec_json
+
+    encoder = msgspec_json.Encoder()
+    encode = encoder.encode
+    decode = msgspec_json.Decoder().decode
+
+    # The msgspec errors are converted to the exceptions raised by the other backends.
+    def dumpb(obj: Any) -> bytes:
+        try:
+            return encode(obj)
+        except EncodeError as exn:
+            raise TypeError(str(exn)) from exn
+
+    def loads(data: str | bytes) -> Any:
+        try:
+            return decode(data)
+        except DecodeError as exn:
+            raise ValueError(str(exn)) from exn
+
+    def dumps_lines(objs: Iterable[Any]) -> str:
+        try:
+            return encoder.encode_lines(list(objs)).decode('utf-8')
+        except EncodeError as exn:
+            raise TypeError(str(exn)) from exn
+
+    return JsonBackend('msgspec', lambda obj: dumpb(obj).decode('utf-8'), dumpb, loads, dumps_lines)
+
+
+# Ordered by preference, the first available backend is used by default.
+_JSON_BACKENDS: dict[str, Callable[[], JsonBackend]] = {
+    'orjson': _orjson_backend,
+    'msgspec': _msgspec_backend,
+    'json': _stdlib_backend,
+}
+
+
+@cache
+def get_json_backend(name: str = 'auto') -> JsonBackend:
+    """
+    Return the JSON backend of the given name.
+    :param name: Name of the backend (orjson, msgspec or json), or auto to use the fastest one installed
+    :return: JSON backend
+    :raise ValueError: If the backend is unknown or its library is not installed
+    """
+    if name == 'auto':
+        for backend_factory in _JSON_BACKENDS.values():
+            try:
+                return backend_factory()
+            except ImportError:
+                continue
+
+    try:
+        backend_factory = _JSON_BACKENDS[name]
+    except KeyError as exn:
+        raise ValueError(f'Unknown JSON backend: {name}') from exn
+
+    try:
+        return backend_factory()
+    except ImportError as exn:
+        raise ValueError(f'Unavailable JSON backend (missing dependencies): {name}') from exn
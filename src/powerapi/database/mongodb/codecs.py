@@ -27,8 +27,35 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+from dataclasses import dataclass
+
 from powerapi.database.codec import CodecOptions, ReportEncoder, ReportEncoderRegistry, ReportDecoder, ReportDecoderRegistry
-from powerapi.report import PowerReport, FormulaReport, HWPCReport
+from powerapi.database.time_index import timestamp_milliseconds
+from powerapi.report import PowerReport, FormulaReport, HWPCReport, Report
+
+
+@dataclass
+class EncoderOptions(CodecOptions):
+    """
+    Encoder options for the MongoDB database.
+    """
+    compact: bool = False
+
+
+def _encode_document(report: Report, opts: EncoderOptions | None) -> dict:
+    """
+    Encode a report into a document.
+    The attributes of the report are copied, as the MongoDB client adds the `_id` field to the inserted documents.
+    The compact schema stores the timestamp as milliseconds since epoch, naive timestamps being UTC, and flattens the metadata.
+    :param report: Report to encode
+    :param opts: Encoder options
+    :return: Document of the report
+    """
+    document = dict(vars(report))
+    if opts is not None and opts.compact:
+        document['timestamp'] = timestamp_milliseconds(report.timestamp)
+        document['metadata'] = report.flatten_tags(report.metadata)
+    return document
 
 
 class PowerReportEncoder(ReportEncoder[PowerReport, dict]):
@@ -37,8 +64,8 @@ class PowerReportEncoder(ReportEncoder[PowerReport, dict]):
     """
 
     @staticmethod
-    def encode(report: PowerReport, opts: CodecOptions | None = None) -> dict:
-        return vars(report)
+    def encode(report: PowerReport, opts: EncoderOptions | None = None) -> dict:
+        return _encode_document(report, opts)
 
 class FormulaReportEncoder(ReportEncoder[FormulaReport, dict]):
     """
@@ -46,8 +73,8 @@ class FormulaReportEncoder(ReportEncoder[FormulaReport, dict]):
     """
 
     @staticmethod
-    def encode(report: FormulaReport, opts: CodecOptions | None = None) -> dict:
-        return vars(report)
+    def encode(report: FormulaReport, opts: EncoderOptions | None = None) -> dict:
+        return _encode_document(report, opts)
 
 class HWPCReportDecoder(ReportDecoder[dict, HWPCReport]):
     """
@@ -27,17 +27,82 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from collections.abc import Iterable
+import logging
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import chain, islice
 
-from pymongo import MongoClient
-from pymongo.errors import PyMongoError
+from pymongo import ASCENDING, CursorType, MongoClient, WriteConcern
+from pymongo.errors import CollectionInvalid, PyMongoError
 
+from powerapi.database.background_writer import BackgroundWriterThread
 from powerapi.database.driver import DatabaseDriver, ReadableDatabase, ReadableDatabaseFactory, WritableDatabase, WritableDatabaseFactory
 from powerapi.database.exceptions import ConnectionFailed, ReadFailed, WriteFailed
-from powerapi.database.mongodb.codecs import ReportEncoders, ReportDecoders
+from powerapi.database.mongodb.codecs import EncoderOptions, ReportEncoders, ReportDecoders
 from powerapi.report import Report
 
 
+@dataclass(frozen=True)
+class MongodbQuery:
+    """
+    Query pushed down to the MongoDB server when reading reports.
+    The documents are filtered by the server, and only the needed groups are transferred.
+    """
+    time_from: datetime | None = None
+    time_to: datetime | None = None
+    sensors: tuple[str, ...] = ()
+    targets: tuple[str, ...] = ()
+    groups: tuple[str, ...] = ()
+    events: tuple[str, ...] = ()
+    batch_size: int = 0
+    hint: str | None = None
+
+    def filter(self) -> dict:
+        """
+        Return the filter of the documents matching the query.
+        :return: MongoDB query filter
+        """
+        query_filter = {}
+        if self.time_from is not None or self.time_to is not None:
+            query_filter['timestamp'] = {}
+            if self.time_from is not None:
+                query_filter['timestamp']['$gte'] = self.time_from
+            if self.time_to is not None:
+                query_filter['timestamp']['$lt'] = self.time_to
+        if self.sensors:
+            query_filter['sensor'] = {'$in': list(self.sensors)}
+        if self.targets:
+            query_filter['target'] = {'$in': list(self.targets)}
+        return query_filter
+
+    def projection(self) -> dict | None:
+        """
+        Return the projection of the fields of the documents to retrieve.
+        The events are nested under the socket and core of their group, they cannot be projected by the server.
+        :return: MongoDB projection, or None to retrieve every field
+        """
+        if not self.groups:
+            return None
+
+        return {'timestamp': 1, 'sensor': 1, 'target': 1, 'metadata': 1} | {f'groups.{group}': 1 for group in self.groups}
+
+    def prune_events(self, document: dict) -> dict:
+        """
+        Remove the events not needed by the query from a retrieved document.
+        :param document: Retrieved document
+        :return: The document, modified in place
+        """
+        if self.events:
+            for group in document.get('groups', {}).values():
+                for socket in group.values():
+                    for core in socket.values():
+                        for event in [event for event in core if event not in self.events]:
+                            del core[event]
+        return document
+
+
 class _MongodbDriver(DatabaseDriver):
     """
     Base MongoDB database driver.
@@ -58,7 +123,6 @@ class _MongodbDriver(DatabaseDriver):
 
         self._client = None
         self._collection = None
-        self._cursor = None
 
     def connect(self):
         """
@@ -71,7 +135,6 @@ class _MongodbDriver(DatabaseDriver):
 
             database = self._client.get_database(self.database_name)
             self._collection = database.get_collection(self.collection_name)
-            self._cursor = self._collection.find({})
         except PyMongoError as exn:
             raise ConnectionFailed(f'Failed to connect to the MongoDB server: {exn}') from exn
 
@@ -89,19 +152,38 @@ class _MongodbDriver(DatabaseDriver):
 class MongodbInput(_MongodbDriver, ReadableDatabase):
     """
     MongoDB input database driver.
-    Allow to persist reports to a MongoDB database.
+    Allow to retrieve reports from a MongoDB database.
+    The documents are filtered (time range, sensors and targets) and projected (groups) by the server according to the query.
+    In batch mode, the collection can be split into `_id` ranges that are read concurrently by several reader threads.
+    In stream mode, the reports are claimed by batches of documents sorted by `_id`, that are deleted at once after being
+    handed off. When the collection is capped, its documents can be followed with a tailable cursor instead, without deleting
+    them.
     """
+    read_chunk_size = 1000
 
-    def __init__(self, report_type: type[Report], uri: str, database_name: str, collection_name: str):
+    def __init__(self, report_type: type[Report], uri: str, database_name: str, collection_name: str, stream_batch_size: int = 1000,
+                 tailable: bool = False, query: MongodbQuery | None = None, readers: int = 1):
         """
         :param report_type: Type of the report handled by this database
         :param uri: URI of the MongoDB server
         :param database_name: Database name
         :param collection_name: Collection name
+        :param stream_batch_size: Number of documents claimed at once in stream mode
+        :param tailable: Whether to follow the (capped) collection with a tailable cursor in stream mode
+        :param query: Query of the documents to read, None to read every document
+        :param readers: Number of reader threads reading `_id` ranges of the collection concurrently in batch mode
         """
         super().__init__(uri, database_name, collection_name)
 
+        self.stream_batch_size = stream_batch_size
+        self.tailable = tailable
+        self.query = query if query is not None else MongodbQuery()
+        self.readers = readers
+
         self._report_decoder = ReportDecoders.get(report_type)
+        self._query_filter = self.query.filter()
+        self._tailable_cursor = None
+        self._last_tailed_id = None
 
     @staticmethod
     def supported_read_types() -> Iterable[type[Report]]:
@@ -111,79 +193,293 @@ class MongodbInput(_MongodbDriver, ReadableDatabase):
         """
         return ReportDecoders.supported_types()
 
+    def _find(self, query_filter: dict, **kwargs):
+        """
+        Open a cursor on the documents matching a filter, with the projection and cursor options of the query.
+        :param query_filter: Filter of the documents
+        :param kwargs: Additional options of the cursor
+        :return: Cursor on the documents
+        """
+        cursor = self._collection.find(query_filter, self.query.projection(), **kwargs)
+        if self.query.batch_size > 0:
+            cursor = cursor.batch_size(self.query.batch_size)
+        if self.query.hint is not None:
+            cursor = cursor.hint(self.query.hint)
+        return cursor
+
+    def _decode(self, document: dict) -> Report:
+        """
+        Decode a retrieved document into a report.
+        :param document: Retrieved document
+        :return: Decoded report
+        """
+        return self._report_decoder.decode(self.query.prune_events(document))
+
     def _reports_generator(self) -> Iterable[Report]:
         """
         Return a generator that yields reports from the database.
         This operation **is not** destructive, the reports are kept in the database.
         :return: Iterable of reports
+        :raise ReadFailed: If the read operation fails
         """
-        return (self._report_decoder.decode(report) for report in self._cursor)
+        try:
+            for document in self._find(self._query_filter):
+                yield self._decode(document)
+        except PyMongoError as exn:
+            raise ReadFailed(f'Failed to retrieve reports from the MongoDB database: {exn}') from exn
+
+    def _id_ranges(self) -> list[dict]:
+        """
+        Split the documents matching the query into `_id` ranges of similar size, one for each reader.
+        :return: List of `_id` filters of the ranges
+        :raise PyMongoError: If the operation fails
+        """
+        pipeline = [{'$match': self._query_filter}, {'$bucketAuto': {'groupBy': '$_id', 'buckets': self.readers}}]
+        buckets = list(self._collection.aggregate(pipeline))
+
+        # The upper bound of a bucket is exclusive, except for the last one.
+        id_ranges = [{'$gte': bucket['_id']['min'], '$lt': bucket['_id']['max']} for bucket in buckets[:-1]]
+        id_ranges.extend({'$gte': bucket['_id']['min'], '$lte': bucket['_id']['max']} for bucket in buckets[-1:])
+        return id_ranges
+
+    def _read_chunk(self, documents: Iterator[dict]) -> list[Report]:
+        """
+        Read and decode a chunk of documents, from a reader thread.
+        :param documents: Cursor on the documents of an `_id` range
+        :return: List of reports, empty when the range is exhausted
+        """
+        return [self._decode(document) for document in islice(documents, self.read_chunk_size)]
+
+    def _parallel_reports_generator(self) -> Iterable[Report]:
+        """
+        Return a generator that yields reports from the database, the `_id` ranges being read concurrently by reader threads.
+        The reports are returned as soon as they are read, without any specific order.
+        This operation **is not** destructive, the reports are kept in the database.
+        :return: Iterable of reports
+        :raise ReadFailed: If the read operation fails
+        """
+        try:
+            with ThreadPoolExecutor(self.readers, thread_name_prefix='mongodb-input-reader') as executor:
+                cursors = [self._find(self._query_filter | {'_id': id_range}) for id_range in self._id_ranges()]
+                pending_chunks = {executor.submit(self._read_chunk, cursor): cursor for cursor in cursors}
+                while pending_chunks:
+                    done, _ = wait(pending_chunks, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        cursor = pending_chunks.pop(future)
+                        if chunk := future.result():
+                            pending_chunks[executor.submit(self._read_chunk, cursor)] = cursor
+                            yield from chunk
+        except PyMongoError as exn:
+            raise ReadFailed(f'Failed to retrieve reports from the MongoDB database: {exn}') from exn
 
     def _streaming_reports_generator(self) -> Iterable[Report]:
         """
         Return a generator that yields reports from the database.
         This operation **is** destructive, the reports will be removed from the database.
+        The documents are claimed by batches, a batch being deleted once all its reports have been handed off. The documents of
+        a batch that is not entirely consumed are kept, and will be read again.
+        The malformed documents are skipped and deleted with their batch, so that they cannot block the stream.
         :return: Iterable of reports
+        :raise ReadFailed: If the read operation fails
         """
-        while True:
-            report = self._collection.find_one_and_delete({})
-            if report is None:
-                break
-            yield self._report_decoder.decode(report)
+        try:
+            while documents := list(self._find(self._query_filter, sort=[('_id', ASCENDING)], limit=self.stream_batch_size)):
+                for document in documents:
+                    try:
+                        report = self._decode(document)
+                    except (KeyError, TypeError, ValueError) as exn:
+                        logging.warning('Skipping malformed MongoDB document %s: %r', document.get('_id'), exn)
+                        continue
+
+                    yield report
+
+                # The claimed documents are deleted by their ids, documents inserted concurrently in the range are kept.
+                self._collection.delete_many({'_id': {'$in': [document['_id'] for document in documents]}})
+        except PyMongoError as exn:
+            raise ReadFailed(f'Failed to retrieve reports from the MongoDB database: {exn}') from exn
 
-    def read(self, stream_mode: bool = False) -> Iterable[Report]:
+    def _tailing_reports_generator(self) -> Iterable[Report]:
         """
-        Read reports from the MongoDB database.
-        :param stream_mode: If true, handle the reports as a continuous stream of data (**destructive**)
+        Return a generator that yields the reports inserted into the capped collection, using a tailable cursor.
+        This operation **is not** destructive, the reports are kept in the database.
+        The cursor is reopened after the last read document when it is invalidated.
         :return: Iterable of reports
         :raise ReadFailed: If the read operation fails
         """
         try:
-            return self._streaming_reports_generator() if stream_mode else self._reports_generator()
+            if self._tailable_cursor is None or not self._tailable_cursor.alive:
+                query_filter = self._query_filter
+                if self._last_tailed_id is not None:
+                    query_filter = query_filter | {'_id': {'$gt': self._last_tailed_id}}
+                self._tailable_cursor = self._find(query_filter, cursor_type=CursorType.TAILABLE_AWAIT)
+
+            # Iterating a tailable cursor stops when no more document is available, the cursor being kept alive.
+            for document in self._tailable_cursor:
+                self._last_tailed_id = document['_id']
+                yield self._decode(document)
         except PyMongoError as exn:
             raise ReadFailed(f'Failed to retrieve reports from the MongoDB database: {exn}') from exn
 
+    def read(self, stream_mode: bool = False) -> Iterable[Report]:
+        """
+        Read reports from the MongoDB database.
+        :param stream_mode: If true, handle the reports as a continuous stream of data (**destructive**, unless tailable)
+        :return: Iterable of reports
+        :raise ReadFailed: If the read operation fails
+        """
+        if stream_mode:
+            return self._tailing_reports_generator() if self.tailable else self._streaming_reports_generator()
+
+        return self._parallel_reports_generator() if self.readers > 1 else self._reports_generator()
+
+
 class MongodbInputFactory(ReadableDatabaseFactory):
     """
     Factory that creates a MongoDB input database driver.
     """
 
-    def __init__(self, report_type: type[Report], uri: str, database_name: str, collection_name: str):
+    def __init__(self, report_type: type[Report], uri: str, database_name: str, collection_name: str, stream_batch_size: int = 1000,
+                 tailable: bool = False, query: MongodbQuery | None = None, readers: int = 1):
         """
         :param report_type: Type of the report handled by this database
         :param uri: URI of the MongoDB server
         :param database_name: Database name
         :param collection_name: Collection name
+        :param stream_batch_size: Number of documents claimed at once in stream mode
+        :param tailable: Whether to follow the (capped) collection with a tailable cursor in stream mode
+        :param query: Query of the documents to read, None to read every document
+        :param readers: Number of reader threads reading `_id` ranges of the collection concurrently in batch mode
         """
+        if stream_batch_size < 1:
+            raise ValueError(f'Invalid stream batch size: {stream_batch_size}')
+
+        if readers < 1:
+            raise ValueError(f'Invalid number of readers: {readers}')
+
+        query = query if query is not None else MongodbQuery()
+        if query.time_from is not None and query.time_to is not None and query.time_from >= query.time_to:
+            raise ValueError(f'Invalid time window: {query.time_from.isoformat()} - {query.time_to.isoformat()}')
+
+        if query.batch_size < 0:
+            raise ValueError(f'Invalid cursor batch size: {query.batch_size}')
+
         self.report_type = report_type
         self.uri = uri
         self.database_name = database_name
         self.collection_name = collection_name
+        self.stream_batch_size = stream_batch_size
+        self.tailable = tailable
+        self.query = query
+        self.readers = readers
 
     def create(self) -> ReadableDatabase:
         """
         Creates a MongoDB input database driver.
         :return: Initialized MongoDB input database driver.
         """
-        return MongodbInput(self.report_type, self.uri, self.database_name, self.collection_name)
+        return MongodbInput(self.report_type, self.uri, self.database_name, self.collection_name, self.stream_batch_size, self.tailable,
+                            self.query, self.readers)
+
+
+@dataclass(frozen=True)
+class MongodbWriteOptions:
+    """
+    Options of the writes of the reports into the MongoDB database.
+    """
+    ordered: bool = True
+    write_concern: str | None = None
+    journal: bool = False
+    timeseries_granularity: str | None = None
+    timeseries_meta_field: str = 'metadata'
+    compact: bool = False
+
+    def mongodb_write_concern(self) -> WriteConcern:
+        """
+        Return the write concern of the writes.
+        :return: MongoDB write concern, the server default being used for the unset values
+        """
+        w = int(self.write_concern) if self.write_concern is not None and self.write_concern.isdigit() else self.write_concern
+        return WriteConcern(w=w, j=True if self.journal else None)
 
 
 class MongodbOutput(_MongodbDriver, WritableDatabase):
     """
     MongoDB output database driver.
     Allow to persist reports to a MongoDB database.
+    The reports of a batch are inserted at once, optionally unordered so that the server can apply them in parallel, and can be
+    written by a background thread so that the insert latency does not stall the pusher.
+    The collection can be created as a time-series collection, whose time field is the timestamp of the reports.
     """
+    timeseries_granularities = ('seconds', 'minutes', 'hours')
 
-    def __init__(self, report_type: type[Report], uri: str, database_name: str, collection_name: str):
+    def __init__(self, report_type: type[Report], uri: str, database_name: str, collection_name: str,
+                 write_options: MongodbWriteOptions | None = None, write_queue_size: int = 0):
         """
         :param report_type: Type of the report handled by this database
         :param uri: URI of the MongoDB server
         :param database_name: Database name
         :param collection_name: Collection name
+        :param write_options: Options of the writes, None to use the default ones
+        :param write_queue_size: Number of batches queued for the background writer thread, 0 to write synchronously
         """
         super().__init__(uri, database_name, collection_name)
 
+        self.write_options = write_options if write_options is not None else MongodbWriteOptions()
+        self.write_queue_size = write_queue_size
+
         self._report_encoder = ReportEncoders.get(report_type)
+        self._report_encoder_opts = EncoderOptions(self.write_options.compact)
+        self._writer_thread = None
+
+    def connect(self) -> None:
+        """
+        Connect to the MongoDB server, and create the time-series collection if needed.
+        :raise ConnectionFailed: If the connection to the MongoDB server fails
+        """
+        super().connect()
+
+        try:
+            if self.write_options.timeseries_granularity is not None:
+                self._create_timeseries_collection()
+        except PyMongoError as exn:
+            raise ConnectionFailed(f'Failed to create the MongoDB time-series collection: {exn}') from exn
+
+        self._collection = self._collection.with_options(write_concern=self.write_options.mongodb_write_concern())
+        if self.write_queue_size > 0:
+            self._writer_thread = BackgroundWriterThread(self._insert_documents, self.write_queue_size, (PyMongoError, OSError))
+            self._writer_thread.start()
+
+    def disconnect(self) -> None:
+        """
+        Write the pending reports and disconnect from the MongoDB database.
+        """
+        if self._writer_thread is not None:
+            try:
+                self._writer_thread.close()
+            except (PyMongoError, OSError) as exn:
+                logging.warning('Failed to write reports to the MongoDB database: %s', exn)
+
+        super().disconnect()
+
+    def _create_timeseries_collection(self) -> None:
+        """
+        Create the output collection as a time-series collection, unless it already exists.
+        :raise PyMongoError: If the operation fails
+        """
+        database = self._collection.database
+        if database.list_collection_names(filter={'name': self.collection_name}):
+            return
+
+        timeseries = {
+            'timeField': 'timestamp',
+            'metaField': self.write_options.timeseries_meta_field,
+            'granularity': self.write_options.timeseries_granularity,
+        }
+        try:
+            self._collection = database.create_collection(self.collection_name, timeseries=timeseries)
+        except CollectionInvalid:
+            # The collection has been created concurrently by another writer.
+            pass
 
     @staticmethod
     def supported_write_types() -> Iterable[type[Report]]:
@@ -193,16 +489,30 @@ class MongodbOutput(_MongodbDriver, WritableDatabase):
         """
         return ReportEncoders.supported_types()
 
+    def _insert_documents(self, batches: list[list[dict]]) -> None:
+        """
+        Insert batches of documents into the collection, with a single bulk write.
+        :param batches: List of batches of documents
+        :raise PyMongoError: If the operation fails
+        """
+        self._collection.insert_many(list(chain.from_iterable(batches)), ordered=self.write_options.ordered)
+
     def write(self, reports: Iterable[Report]) -> None:
         """
         Write the reports into the MongoDB database.
         :param reports: Iterable of reports
         :raise WriteFailed: If the write operation fails
         """
+        documents = [self._report_encoder.encode(report, self._report_encoder_opts) for report in reports]
+        if not documents:
+            return
+
         try:
-            encoded_reports = [self._report_encoder.encode(report) for report in reports]
-            self._collection.insert_many(encoded_reports)
-        except PyMongoError as exn:
+            if self._writer_thread is not None:
+                self._writer_thread.submit(documents)
+            else:
+                self._insert_documents([documents])
+        except (PyMongoError, OSError) as exn:
             raise WriteFailed(f'Failed to write reports to the MongoDB database: {exn}') from exn
 
 
@@ -211,24 +521,40 @@ class MongodbOutputFactory(WritableDatabaseFactory):
     Factory that creates a MongoDB output database driver.
     """
 
-    def __init__(self, report_type: type[Report], uri: str, database_name: str, collection_name: str):
+    def __init__(self, report_type: type[Report], uri: str, database_name: str, collection_name: str,
+                 write_options: MongodbWriteOptions | None = None, write_queue_size: int = 0):
         """
         :param report_type: Type of the report handled by this database
         :param uri: URI of the MongoDB server
         :param database_name: Database name
         :param collection_name: Collection name
+        :param write_options: Options of the writes, None to use the default ones
+        :param write_queue_size: Number of batches queued for the background writer thread, 0 to write synchronously
         """
         if report_type not in ReportEncoders.supported_types():
             raise ValueError(f'Unsupported report type: {report_type.__name__}')
 
+        write_options = write_options if write_options is not None else MongodbWriteOptions()
+        granularity = write_options.timeseries_granularity
+        if granularity is not None and granularity not in MongodbOutput.timeseries_granularities:
+            raise ValueError(f'Invalid time-series granularity: {granularity}')
+
+        if granularity is not None and write_options.compact:
+            raise ValueError('The time-series collections require the timestamps to be stored as dates, not in the compact schema')
+
+        if write_queue_size < 0:
+            raise ValueError(f'Invalid write queue size: {write_queue_size}')
+
         self.report_type = report_type
         self.uri = uri
         self.database_name = database_name
         self.collection_name = collection_name
+        self.write_options = write_options
+        self.write_queue_size = write_queue_size
 
     def create(self) -> WritableDatabase:
         """
         Create the MongoDB output database driver.
         :return: Initialized MongoDB output database driver
         """
-        return MongodbOutput(self.report_type, self.uri, self.database_name, self.collection_name)
+        return MongodbOutput(self.report_type, self.uri, self.database_name, self.collection_name, self.write_options, self.write_queue_size)
@@ -27,10 +27,11 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import NamedTuple
 
 from powerapi.database.codec import CodecOptions, ReportEncoder, ReportEncoderRegistry
+from powerapi.database.tags import TagGetter, TagsPlanCache
 from powerapi.report import PowerReport
 
 
@@ -38,8 +39,21 @@ from powerapi.report import PowerReport
 class EncoderOptions(CodecOptions):
     """
     Encoder options for the Prometheus database.
+    The plans of the tags give the location of the dynamic tags in the metadata of the reports.
     """
     dynamic_tags_name: list[str]
+    tags_plans: TagsPlanCache[tuple[TagGetter | None, ...]] = field(init=False)
+
+    def __post_init__(self):
+        self.tags_plans = TagsPlanCache(self._dynamic_tags_plan)
+
+    def _dynamic_tags_plan(self, getters: dict[str, TagGetter]) -> tuple[TagGetter | None, ...]:
+        """
+        Build the plan gathering the dynamic tags of the reports.
+        :param getters: Location of the flattened tags, indexed by their name
+        :return: Location of each dynamic tag, None for the missing ones
+        """
+        return tuple(getters.get(tag_name) for tag_name in self.dynamic_tags_name)
 
 
 class PowerReportMetrics(NamedTuple):
@@ -58,8 +72,11 @@ class PowerReportEncoder(ReportEncoder[PowerReport, PowerReportMetrics]):
 
     @staticmethod
     def encode(report: PowerReport, opts: EncoderOptions | None = None) -> PowerReportMetrics:
-        flattened_tags = report.flatten_tags(report.metadata)
-        dynamic_tags = [flattened_tags.get(tag_name, 'unknown') for tag_name in opts.dynamic_tags_name]
+        metadata = report.metadata
+        dynamic_tags = [
+            'unknown' if getter is None else metadata[getter[0]] if getter[1] is None else metadata[getter[0]][getter[1]]
+            for getter in opts.tags_plans.get(metadata)
+        ]
         labels = (report.sensor, report.target, *dynamic_tags)
         return PowerReportMetrics(labels, report.timestamp.timestamp(), report.power)
 
@@ -27,14 +27,18 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import gzip
 from abc import abstractmethod
-from collections.abc import Iterable
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from math import inf
 from threading import Lock
 from time import time
 from typing import ClassVar
 
 from prometheus_client import Metric
-from prometheus_client.metrics_core import GaugeMetricFamily
+from prometheus_client.metrics_core import CounterMetricFamily, GaugeMetricFamily
 from prometheus_client.registry import Collector
 
 from powerapi.database.codec import ReportEncoder
@@ -42,38 +46,187 @@ from powerapi.database.prometheus.codecs import PowerReportMetrics, EncoderOptio
 from powerapi.report import PowerReport, Report
 
 
+# Snapshot of an aggregate: label values, summed power and latest timestamp of each group of series.
+AggregateSnapshot = tuple[tuple[tuple[str, ...], float, float], ...]
+
+
+@dataclass(frozen=True)
+class SamplesGeneration:
+    """
+    Immutable snapshot of the samples of a collector, built for the scrapes when the samples were modified.
+    """
+    samples: tuple[PowerReportMetrics, ...] = ()
+    aggregates: tuple[AggregateSnapshot, ...] = ()
+    expired_series: int = 0
+    evicted_series: int = 0
+
+
+class PowerAggregate:
+    """
+    Sum of the power of the series sharing the same values for a subset of the labels.
+    The sums are updated incrementally when the sample of a series is added, replaced or removed.
+    """
+
+    def __init__(self, labels: list[str], aggregate_labels: list[str]):
+        """
+        :param labels: List of labels name of the series
+        :param aggregate_labels: List of labels name the series are grouped by
+        """
+        self.labels = aggregate_labels
+
+        self._label_indices = [labels.index(label) for label in aggregate_labels]
+        self._groups: dict[tuple[str, ...], list] = {}  # Summed power, number of series and latest timestamp of each group
+
+    def _group_key(self, sample: PowerReportMetrics) -> tuple[str, ...]:
+        """
+        Return the key of the group of a sample.
+        :param sample: Sample of a series
+        :return: Values of the aggregate labels of the sample
+        """
+        return tuple([sample.label_values[index] for index in self._label_indices])
+
+    def add(self, sample: PowerReportMetrics) -> None:
+        """
+        Add the sample of a series to its group.
+        :param sample: Sample of a series
+        """
+        key = self._group_key(sample)
+        group = self._groups.get(key)
+        if group is None:
+            self._groups[key] = [sample.power_estimation, 1, sample.timestamp]
+            return
+
+        group[0] += sample.power_estimation
+        group[1] += 1
+        group[2] = max(group[2], sample.timestamp)
+
+    def remove(self, sample: PowerReportMetrics) -> None:
+        """
+        Remove the sample of a series from its group, the group being removed with its last series.
+        :param sample: Sample of a series previously added
+        """
+        key = self._group_key(sample)
+        group = self._groups[key]
+        if group[1] == 1:
+            del self._groups[key]
+            return
+
+        group[0] -= sample.power_estimation
+        group[1] -= 1
+
+    def snapshot(self) -> AggregateSnapshot:
+        """
+        Return a snapshot of the groups of the aggregate.
+        :return: Label values, summed power and latest timestamp of each group
+        """
+        return tuple([(key, power, timestamp) for key, (power, _, timestamp) in self._groups.items()])
+
+
+@dataclass
+class ExpositionCache:
+    """
+    Metrics of a generation of samples, with their rendered expositions indexed by content type and compression.
+    The cache is valid until its generation is replaced or one of its samples expires.
+    """
+    generation: SamplesGeneration
+    valid_until: float
+    metrics: list[Metric]
+    outputs: dict[tuple[str, bool], bytes] = field(default_factory=dict)
+
+    def collect(self) -> Iterable[Metric]:
+        """
+        Return the metrics of the generation, allowing the exposition encoders to render the cache.
+        :return: Prometheus metrics to be exported
+        """
+        return self.metrics
+
+
 class ReportCollector(Collector):
     """
     Base Report Collector class.
     """
 
-    def __init__(self, labels: list[str], samples_ttl: float):
+    def __init__(self, labels: list[str], samples_ttl: float, max_series: int = 0, aggregates: list[list[str]] | None = None,
+                 export_series: bool = True):
         """
         :param labels: List of labels name to use for the metrics
         :param samples_ttl: Expiration time of the metrics samples in seconds
+        :param max_series: Maximum number of series kept by the collector, 0 for no limit
+        :param aggregates: List of labels name subsets the series are summed by
+        :param export_series: Whether the series are exported, or only their aggregates
         """
         self.labels = labels
         self.samples_ttl = samples_ttl
+        self.max_series = max_series
+        self.aggregates = aggregates or []
+        self.export_series = export_series
 
     @abstractmethod
     def submit(self, reports: Iterable[Report], encoder: ReportEncoder, encoder_opts: EncoderOptions) -> None: ...
 
+    @abstractmethod
+    def exposition(self, encoder: Callable[[Collector], bytes], content_type: str, compressed: bool) -> bytes: ...
+
 
 class PowerReportCollector(ReportCollector):
     """
     Power Report Collector class.
     Used to export the power reports as Prometheus metrics.
+    The series are kept ordered by their last update, the expired series being removed from the least recently updated
+    ones, and the least recently updated series being evicted when the maximum number of series is reached.
+    The submissions only mark the samples as modified. The scrapes take an immutable generation of the samples, built at
+    most once per scrape and only when the samples were modified, and reuse the exposition rendered for it.
+    The aggregates sum the power of the series by subsets of their labels, and are updated with the series they contain.
     """
 
-    def __init__(self, labels: list[str], samples_ttl: float):
+    def __init__(self, labels: list[str], samples_ttl: float, max_series: int = 0, aggregates: list[list[str]] | None = None,
+                 export_series: bool = True):
         """
         :param labels: List of labels name to use for the metrics
         :param samples_ttl: Expiration time of the metrics samples in seconds
+        :param max_series: Maximum number of series kept by the collector, 0 for no limit
+        :param aggregates: List of labels name subsets the series are summed by
+        :param export_series: Whether the series are exported, or only their aggregates
         """
-        super().__init__(labels, samples_ttl)
+        super().__init__(labels, samples_ttl, max_series, aggregates, export_series)
 
         self._lock = Lock()
-        self._metrics: dict[tuple[str, ...], PowerReportMetrics] = {}
+        self._metrics: OrderedDict[tuple[str, ...], PowerReportMetrics] = OrderedDict()
+        self._power_aggregates = [PowerAggregate(labels, aggregate_labels) for aggregate_labels in self.aggregates]
+        self._expired_series = 0
+        self._evicted_series = 0
+
+        self._generation = SamplesGeneration(aggregates=tuple([() for _ in self._power_aggregates]))
+        self._modified = False
+        self._exposition_cache: ExpositionCache | None = None
+
+    def _remove_expired_series(self, current_timestamp: float) -> None:
+        """
+        Remove the least recently updated series whose sample is expired.
+        The removal stops at the first series having an unexpired sample, a series whose sample is older than one of the
+        series updated before it being removed once the series ahead of it are removed.
+        :param current_timestamp: Current timestamp in seconds
+        """
+        expiration_timestamp = current_timestamp - self.samples_ttl
+        while self._metrics:
+            label_values, sample = next(iter(self._metrics.items()))
+            if sample.timestamp > expiration_timestamp:
+                break
+
+            del self._metrics[label_values]
+            self._expired_series += 1
+            for aggregate in self._power_aggregates:
+                aggregate.remove(sample)
+
+    def _evict_series(self) -> None:
+        """
+        Evict the least recently updated series until the number of series is within its limit.
+        """
+        while len(self._metrics) > self.max_series:
+            _, sample = self._metrics.popitem(last=False)
+            self._evicted_series += 1
+            for aggregate in self._power_aggregates:
+                aggregate.remove(sample)
 
     def submit(self, reports: Iterable[Report], encoder: ReportEncoder, encoder_opts: EncoderOptions) -> None:
         """
@@ -85,21 +238,107 @@ class PowerReportCollector(ReportCollector):
         with self._lock:
             for report in reports:
                 sample = encoder.encode(report, encoder_opts)
+                previous_sample = self._metrics.get(sample.label_values)
                 self._metrics[sample.label_values] = sample
+                self._metrics.move_to_end(sample.label_values)
+                for aggregate in self._power_aggregates:
+                    if previous_sample is not None:
+                        aggregate.remove(previous_sample)
+                    aggregate.add(sample)
 
-    def collect(self) -> Iterable[Metric]:
+            self._remove_expired_series(time())
+            if self.max_series:
+                self._evict_series()
+
+            self._modified = True
+
+    def _latest_generation(self) -> SamplesGeneration:
         """
-        Returns Prometheus metrics from collected samples.
-        :return: Prometheus metrics to be exported
+        Return the latest generation of samples, building it if the samples were modified since the previous one.
+        The lock of the writer is only taken to build a new generation, whose cost does not fall on the submissions.
+        :return: Latest generation of samples
         """
-        gauge = GaugeMetricFamily('power_estimation_watts', 'Estimated power consumption for a target', labels=self.labels, unit='watts')
-        with self._lock:
-            current_timestamp = time()
-            for sample in self._metrics.values():
+        if self._modified:
+            with self._lock:
+                if self._modified:
+                    aggregates = tuple([aggregate.snapshot() for aggregate in self._power_aggregates])
+                    self._generation = SamplesGeneration(tuple(self._metrics.values()), aggregates, self._expired_series, self._evicted_series)
+                    self._modified = False
+
+        return self._generation
+
+    def _generation_metrics(self, generation: SamplesGeneration, current_timestamp: float) -> tuple[list[Metric], float]:
+        """
+        Build the Prometheus metrics of a generation of samples, ignoring its expired samples.
+        The groups of an aggregate are ignored once their latest sample is expired, their other samples being removed from
+        the aggregate by the next submission.
+        :param generation: Generation of samples
+        :param current_timestamp: Current timestamp in seconds
+        :return: Prometheus metrics and the timestamp at which the first of their samples expires
+        """
+        metrics = []
+        oldest_timestamp = inf
+        if self.export_series:
+            gauge = GaugeMetricFamily('power_estimation_watts', 'Estimated power consumption for a target', labels=self.labels, unit='watts')
+            for sample in generation.samples:
                 if (current_timestamp - sample.timestamp) < self.samples_ttl:
                     gauge.add_metric(sample.label_values, sample.power_estimation, sample.timestamp)
+                    oldest_timestamp = min(oldest_timestamp, sample.timestamp)
+
+            metrics.append(gauge)
+
+        for aggregate_labels, groups in zip(self.aggregates, generation.aggregates, strict=True):
+            gauge = GaugeMetricFamily(f'power_estimation_by_{"_".join(aggregate_labels)}', f'Estimated power consumption summed by {", ".join(aggregate_labels)}',
+                                      labels=aggregate_labels, unit='watts')
+            for label_values, power, timestamp in groups:
+                if (current_timestamp - timestamp) < self.samples_ttl:
+                    gauge.add_metric(label_values, power, timestamp)
+                    oldest_timestamp = min(oldest_timestamp, timestamp)
+
+            metrics.append(gauge)
+
+        metrics += [
+            GaugeMetricFamily('powerapi_prometheus_output_series', 'Number of series kept by the output', value=len(generation.samples)),
+            CounterMetricFamily('powerapi_prometheus_output_expired_series', 'Number of series removed as their sample expired',
+                                value=generation.expired_series),
+            CounterMetricFamily('powerapi_prometheus_output_evicted_series', 'Number of series evicted as the maximum number of series was reached',
+                                value=generation.evicted_series),
+        ]
+        return metrics, oldest_timestamp + self.samples_ttl
+
+    def collect(self) -> Iterable[Metric]:
+        """
+        Returns Prometheus metrics from the latest generation of samples.
+        :return: Prometheus metrics to be exported
+        """
+        metrics, _ = self._generation_metrics(self._latest_generation(), time())
+        return metrics
+
+    def exposition(self, encoder: Callable[[Collector], bytes], content_type: str, compressed: bool) -> bytes:
+        """
+        Return the exposition of the latest generation of samples, rendering it only if it is not in the cache.
+        Concurrent scrapes of a new generation can render it more than once, the last rendering being kept.
+        :param encoder: Exposition format encoder
+        :param content_type: Content type of the exposition format
+        :param compressed: Whether the exposition is compressed with gzip
+        :return: Rendered exposition
+        """
+        generation = self._latest_generation()
+        current_timestamp = time()
+        cache = self._exposition_cache
+        if cache is None or cache.generation is not generation or current_timestamp >= cache.valid_until:
+            metrics, valid_until = self._generation_metrics(generation, current_timestamp)
+            cache = self._exposition_cache = ExpositionCache(generation, valid_until, metrics)
+
+        output = cache.outputs.get((content_type, compressed))
+        if output is None:
+            output = encoder(cache)
+            if compressed:
+                output = gzip.compress(output)
+
+            cache.outputs[content_type, compressed] = output
 
-        yield gauge
+        return output
 
 
 class ReportProcessorFactory:
@@ -111,16 +350,20 @@ class ReportProcessorFactory:
     }
 
     @classmethod
-    def create_collector(cls, report_type: type[Report], labels: list[str], samples_ttl: float = 300) -> ReportCollector:
+    def create_collector(cls, report_type: type[Report], labels: list[str], samples_ttl: float = 300, max_series: int = 0,
+                         aggregates: list[list[str]] | None = None, export_series: bool = True) -> ReportCollector:
         """
         Creates a Prometheus Metrics Collector for a specific report type.
         :param report_type: Report type to create the report collector for
         :param labels: List of labels name to use for the metrics
         :param samples_ttl: Expiration time of the metrics samples in seconds
+        :param max_series: Maximum number of series kept by the collector, 0 for no limit
+        :param aggregates: List of labels name subsets the series are summed by
+        :param export_series: Whether the series are exported, or only their aggregates
         :return: Prometheus Metrics Collector
         """
         try:
             collector_cls = cls.collectors[report_type]
-            return collector_cls(labels, samples_ttl)
+            return collector_cls(labels, samples_ttl, max_series, aggregates, export_series)
         except KeyError as exn:
             raise ValueError(f'No metrics collector available for report type: {report_type}') from exn
@@ -27,14 +27,16 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import logging
 from collections.abc import Iterable
 
-from prometheus_client import start_http_server, CollectorRegistry
+from prometheus_client import CollectorRegistry
 
 from powerapi.database.driver import WritableDatabase, WritableDatabaseFactory
 from powerapi.database.exceptions import ConnectionFailed, WriteFailed
 from powerapi.database.prometheus.codecs import ReportEncoders, EncoderOptions
 from powerapi.database.prometheus.collectors import ReportProcessorFactory
+from powerapi.database.prometheus.exposition import start_exposition_server
 from powerapi.report import Report
 
 
@@ -44,22 +46,31 @@ class PrometheusOutput(WritableDatabase):
     Allow to export reports as a Prometheus metrics endpoint.
     """
 
-    def __init__(self, report_type: type[Report], listen_addr: str, listen_port: int, tags: list[str]):
+    def __init__(self, report_type: type[Report], listen_addr: str, listen_port: int, tags: list[str], samples_ttl: float = 300,
+                 max_series: int = 0, aggregates: list[list[str]] | None = None, export_series: bool = True):
         """
         :param report_type: Report type
         :param listen_addr: Address to listen on
         :param listen_port: Port to listen on
         :param tags: List of tags name that will be exposed by the metric
+        :param samples_ttl: Expiration time of the metrics samples in seconds
+        :param max_series: Maximum number of series exposed by the metric, 0 for no limit
+        :param aggregates: List of labels name subsets the power is summed by, the labels being added to the exposed tags
+        :param export_series: Whether the series of the targets are exposed, or only their aggregates
         """
         super().__init__()
 
+        aggregates = aggregates or []
+        aggregate_tags = [label for aggregate_labels in aggregates for label in aggregate_labels if label not in ('sensor', 'target')]
+
         self.listen_addr = (listen_addr, listen_port)
-        self.dynamic_tags = list(dict.fromkeys(tags))
-        self.metric_labels = list(dict.fromkeys(['sensor', 'target', *tags]))
+        self.dynamic_tags = list(dict.fromkeys([*tags, *aggregate_tags]))
+        self.metric_labels = list(dict.fromkeys(['sensor', 'target', *self.dynamic_tags]))
 
         self._http_server = None
         self._http_server_thread = None
-        self._metrics_collector = ReportProcessorFactory.create_collector(report_type, self.metric_labels)
+        self._metrics_collector = ReportProcessorFactory.create_collector(report_type, self.metric_labels, samples_ttl, max_series,
+                                                                          aggregates, export_series)
 
         self._report_encoder = ReportEncoders.get(report_type)
         self._report_encoder_opts = EncoderOptions(self.dynamic_tags)
@@ -74,7 +85,7 @@ class PrometheusOutput(WritableDatabase):
             registry.register(self._metrics_collector)
 
             addr, port = self.listen_addr
-            self._http_server, self._http_server_thread = start_http_server(port, addr, registry=registry)
+            self._http_server, self._http_server_thread = start_exposition_server(addr, port, self._metrics_collector, registry)
         except (OSError, RuntimeError) as exn:
             raise ConnectionFailed(f'Failed to connect the Prometheus database: {exn}') from exn
 
@@ -82,6 +93,7 @@ class PrometheusOutput(WritableDatabase):
         """
         Disconnect the Prometheus database.
         """
+        logging.debug('Prometheus output tags plan cache: %s', self._report_encoder_opts.tags_plans.cache_info())
         self._http_server.shutdown()
         self._http_server_thread.join()
 
@@ -110,24 +122,48 @@ class PrometheusOutputFactory(WritableDatabaseFactory):
     Prometheus database factory.
     """
 
-    def __init__(self, report_type: type[Report], listen_addr: str, listen_port: int, tags: list[str]):
+    def __init__(self, report_type: type[Report], listen_addr: str, listen_port: int, tags: list[str], samples_ttl: float = 300,
+                 max_series: int = 0, aggregates: list[list[str]] | None = None, export_series: bool = True):
         """
         :param report_type: Report type
         :param listen_addr: Address to listen on
         :param listen_port: Port to listen on
         :param tags: List of tags name that will be exposed by the metric
+        :param samples_ttl: Expiration time of the metrics samples in seconds
+        :param max_series: Maximum number of series exposed by the metric, 0 for no limit
+        :param aggregates: List of labels name subsets the power is summed by, the labels being added to the exposed tags
+        :param export_series: Whether the series of the targets are exposed, or only their aggregates
         """
         if report_type not in ReportEncoders.supported_types():
             raise ValueError(f'Unsupported report type: {report_type.__name__}')
 
+        if samples_ttl <= 0:
+            raise ValueError(f'Invalid samples TTL: {samples_ttl}')
+
+        if max_series < 0:
+            raise ValueError(f'Invalid maximum number of series: {max_series}')
+
+        aggregates = aggregates or []
+        for aggregate_labels in aggregates:
+            if not aggregate_labels or len(set(aggregate_labels)) != len(aggregate_labels):
+                raise ValueError(f'Invalid aggregate labels: {aggregate_labels}')
+
+        if not export_series and not aggregates:
+            raise ValueError('Invalid aggregates: at least one aggregate is required when the series are not exported')
+
         self.report_type = report_type
         self.listen_addr = listen_addr
         self.listen_port = listen_port
         self.tags = tags
+        self.samples_ttl = samples_ttl
+        self.max_series = max_series
+        self.aggregates = aggregates
+        self.export_series = export_series
 
     def create(self) -> WritableDatabase:
         """
         Create the Prometheus database driver.
         :return: Initialized Prometheus database driver
         """
-        return PrometheusOutput(self.report_type, self.listen_addr, self.listen_port, self.tags)
+        return PrometheusOutput(self.report_type, self.listen_addr, self.listen_port, self.tags, self.samples_ttl, self.max_series,
+                                self.aggregates, self.export_series)
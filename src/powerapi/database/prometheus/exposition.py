@@ -0,0 +1,99 @@
+# Copyright (c) 2026, Inria
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import socket
+from collections.abc import Callable, Iterable
+from threading import Thread
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+from prometheus_client import CollectorRegistry, make_wsgi_app
+from prometheus_client.exposition import ThreadingWSGIServer, choose_encoder, gzip_accepted
+
+from powerapi.database.prometheus.collectors import ReportCollector
+
+
+class SilentRequestHandler(WSGIRequestHandler):
+    """
+    WSGI request handler that does not log the requests.
+    """
+
+    def log_message(self, format, *args):  # noqa: A002
+        """
+        Log nothing.
+        """
+
+
+def make_exposition_app(collector: ReportCollector, registry: CollectorRegistry) -> Callable:
+    """
+    Create a WSGI application serving the cached exposition of the collector.
+    The requests filtering the metrics by name (or using another method than GET) are served by the registry.
+    :param collector: Report collector
+    :param registry: Registry of the collector
+    :return: WSGI application
+    """
+    registry_app = make_wsgi_app(registry)
+
+    def exposition_app(environ: dict, start_response: Callable) -> Iterable[bytes]:
+        if environ['REQUEST_METHOD'] != 'GET' or environ.get('QUERY_STRING') or environ.get('PATH_INFO') == '/favicon.ico':
+            return registry_app(environ, start_response)
+
+        encoder, content_type = choose_encoder(environ.get('HTTP_ACCEPT'))
+        compressed = gzip_accepted(environ.get('HTTP_ACCEPT_ENCODING'))
+
+        headers = [('Content-Type', content_type)]
+        if compressed:
+            headers.append(('Content-Encoding', 'gzip'))
+
+        output = collector.exposition(encoder, content_type, compressed)
+        start_response('200 OK', headers)
+        return [output]
+
+    return exposition_app
+
+
+def start_exposition_server(addr: str, port: int, collector: ReportCollector, registry: CollectorRegistry) -> tuple[WSGIServer, Thread]:
+    """
+    Start the HTTP server exposing the metrics of the collector in a daemon thread.
+    :param addr: Address to listen on
+    :param port: Port to listen on
+    :param collector: Report collector
+    :param registry: Registry of the collector
+    :return: HTTP server and its thread
+    """
+    family, _, _, _, sockaddr = socket.getaddrinfo(addr, port, type=socket.SOCK_STREAM, flags=socket.AI_PASSIVE)[0]
+
+    class ExpositionServer(ThreadingWSGIServer):
+        """
+        Threading WSGI server listening on the address family of the address.
+        """
+        address_family = family
+
+    http_server = make_server(sockaddr[0], port, make_exposition_app(collector, registry), ExpositionServer, handler_class=SilentRequestHandler)
+    http_server_thread = Thread(target=http_server.serve_forever, daemon=True)
+    http_server_thread.start()
+    return http_server, http_server_thread
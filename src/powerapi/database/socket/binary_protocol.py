@@ -0,0 +1,268 @@
+# Copyright (c) 2026, Inria
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from collections.abc import Iterator
+from functools import lru_cache
+from itertools import repeat
+from struct import Struct, error as StructError
+
+from powerapi.database.json_backends import get_json_backend
+
+# Connection preamble sent by the client before the first frame.
+# The first byte is not a valid start of an UTF-8 encoded JSON document, which allows the protocol to be auto-detected.
+PROTOCOL_MAGIC = b'\x93PWB'
+PROTOCOL_VERSION = 1
+PROTOCOL_PREAMBLE = PROTOCOL_MAGIC + bytes((PROTOCOL_VERSION,))
+
+FRAME_TYPE_EVENT_NAMES = 0x01
+FRAME_TYPE_HWPC_REPORT = 0x02
+
+FRAME_HEADER = Struct('<I')  # Length of the frame payload in bytes
+MAX_FRAME_LENGTH = 16 * 1024 * 1024
+
+_U16 = Struct('<H')
+_U32 = Struct('<I')
+_REPORT_HEADER = Struct('<Bq')  # Frame type, Unix timestamp in milliseconds
+_GROUP_HEADER = Struct('<HH')  # Number of events, number of sockets
+
+_STRINGS_SEPARATOR = '\x00'
+
+_json = get_json_backend()
+
+
+@lru_cache(maxsize=256)
+def _array_struct(type_code: str, length: int) -> Struct:
+    """
+    Return a precompiled struct for an array of fixed-size values.
+    :param type_code: Struct type code of the array values
+    :param length: Number of values in the array
+    :return: Precompiled struct
+    """
+    return Struct(f'<{length}{type_code}')
+
+
+def _pack_strings(values: list[str]) -> bytes:
+    """
+    Encode a list of strings as a single NUL-separated string prefixed by its length.
+    :param values: List of strings
+    :return: Encoded strings
+    """
+    encoded = _STRINGS_SEPARATOR.join(values).encode('utf-8')
+    return _U32.pack(len(encoded)) + encoded
+
+
+def _unpack_strings(buffer: bytes, offset: int) -> tuple[list[str], int]:
+    """
+    Decode a list of strings encoded by `_pack_strings`.
+    :param buffer: Buffer to decode from
+    :param offset: Offset of the encoded strings in the buffer
+    :return: Tuple containing the decoded strings and the offset of the next value
+    """
+    (length,) = _U32.unpack_from(buffer, offset)
+    offset += _U32.size
+    return buffer[offset:offset + length].decode('utf-8').split(_STRINGS_SEPARATOR), offset + length
+
+
+def iter_frames(buffer: bytes, offset: int = 0) -> Iterator[bytes]:
+    """
+    Split the length-prefixed frames contained in a buffer.
+    :param buffer: Buffer containing complete frames
+    :param offset: Offset of the first frame in the buffer
+    :return: Iterator over the frames payload
+    :raise ValueError: If the last frame of the buffer is truncated
+    """
+    while offset < len(buffer):
+        if len(buffer) - offset < FRAME_HEADER.size:
+            raise ValueError('Truncated frame header')
+
+        (frame_length,) = FRAME_HEADER.unpack_from(buffer, offset)
+        offset += FRAME_HEADER.size
+        if len(buffer) - offset < frame_length:
+            raise ValueError('Truncated frame')
+
+        yield buffer[offset:offset + frame_length]
+        offset += frame_length
+
+
+class BinaryFrameDecoder:
+    """
+    Decoder for the length-prefixed binary protocol of the Socket database.
+
+    The event names are negotiated once per connection with event names frames, report frames then refer to the
+    events by their index in the connection dictionary. For each socket of a group, the cpu identifiers are stored as
+    a single string and the counters values as a packed array of unsigned 64-bit integers, which allows to decode them
+    in bulk.
+    The decoded documents have the same layout as the JSON documents received by the Socket database.
+    """
+
+    def __init__(self):
+        self.event_names: list[str] = []
+
+    def decode(self, frame: bytes) -> dict | None:
+        """
+        Decode a frame payload.
+        :param frame: Frame payload (without the length prefix)
+        :return: Decoded report document, or None if the frame does not contain a report
+        :raise ValueError: If the frame is malformed
+        """
+        try:
+            frame_type = frame[0]
+            if frame_type == FRAME_TYPE_EVENT_NAMES:
+                self._decode_event_names(frame)
+                return None
+            if frame_type == FRAME_TYPE_HWPC_REPORT:
+                return self._decode_hwpc_report(frame)
+        except (IndexError, StructError) as exn:
+            raise ValueError(f'Malformed frame: {exn}') from exn
+
+        raise ValueError(f'Unknown frame type: {frame_type}')
+
+    def _decode_event_names(self, frame: bytes) -> None:
+        """
+        Append the event names of the frame to the connection dictionary.
+        :param frame: Event names frame payload
+        """
+        event_names, offset = _unpack_strings(frame, 1)
+        if offset != len(frame):
+            raise ValueError('Unexpected trailing data in event names frame')
+
+        self.event_names.extend(event_names)
+
+    def _decode_hwpc_report(self, frame: bytes) -> dict:
+        """
+        Decode a HwPC report frame.
+        :param frame: HwPC report frame payload
+        :return: Decoded report document
+        """
+        _, timestamp = _REPORT_HEADER.unpack_from(frame, 0)
+        (sensor, target), offset = _unpack_strings(frame, _REPORT_HEADER.size)
+
+        (metadata_length,) = _U32.unpack_from(frame, offset)
+        offset += _U32.size
+        metadata = _json.loads(frame[offset:offset + metadata_length]) if metadata_length else {}
+        offset += metadata_length
+
+        group_names, offset = _unpack_strings(frame, offset)
+        groups = {}
+        for group_name in group_names:
+            events_count, sockets_count = _GROUP_HEADER.unpack_from(frame, offset)
+            offset += _GROUP_HEADER.size
+
+            events_struct = _array_struct('H', events_count)
+            event_names = [self.event_names[event_id] for event_id in events_struct.unpack_from(frame, offset)]
+            offset += events_struct.size
+
+            group = {}
+            for _ in range(sockets_count):
+                (socket, *cpus), offset = _unpack_strings(frame, offset)
+                values_struct = _array_struct('Q', events_count * len(cpus))
+                values = iter(values_struct.unpack_from(frame, offset))
+                offset += values_struct.size
+
+                rows_values = zip(*[values] * events_count, strict=True) if events_count else repeat((), len(cpus))
+                group[socket] = dict(zip(cpus, map(dict, map(zip, repeat(event_names), rows_values)), strict=True))
+
+            groups[group_name] = group
+
+        if offset != len(frame):
+            raise ValueError('Unexpected trailing data in report frame')
+
+        return {'timestamp': timestamp, 'sensor': sensor, 'target': target, 'groups': groups, 'metadata': metadata}
+
+
+class BinaryFrameEncoder:
+    """
+    Encoder for the length-prefixed binary protocol of the Socket database.
+    Keeps track of the event names already sent on the connection and emits an event names frame when needed.
+    """
+
+    def __init__(self):
+        self._event_ids: dict[str, int] = {}
+
+    @staticmethod
+    def _frame(payload: bytes) -> bytes:
+        """
+        Prefix the given payload with its length.
+        :param payload: Frame payload
+        :return: Encoded frame
+        """
+        if len(payload) > MAX_FRAME_LENGTH:
+            raise ValueError(f'Frame length exceeds the maximum allowed length: {len(payload)}')
+
+        return FRAME_HEADER.pack(len(payload)) + payload
+
+    def _encode_event_names(self, event_names: list[str]) -> bytes:
+        """
+        Register the given event names and encode them as an event names frame.
+        :param event_names: List of new event names
+        :return: Encoded frame
+        """
+        for event_name in event_names:
+            self._event_ids[event_name] = len(self._event_ids)
+
+        return self._frame(bytes((FRAME_TYPE_EVENT_NAMES,)) + _pack_strings(event_names))
+
+    def encode(self, document: dict) -> bytes:
+        """
+        Encode a HwPC report document, using the same layout as the JSON documents, into frame(s).
+        An event names frame is prepended when the report contains events not yet sent on the connection.
+        :param document: HwPC report document
+        :return: Encoded frame(s)
+        :raise ValueError: If the rows of a group do not share the same events
+        """
+        groups = {}
+        for group_name, group in document['groups'].items():
+            event_names = next((list(counters) for cpus in group.values() for counters in cpus.values()), [])
+            if any(counters.keys() != set(event_names) for cpus in group.values() for counters in cpus.values()):
+                raise ValueError(f'Inconsistent events in group {group_name}')
+
+            groups[group_name] = (event_names, group)
+
+        new_event_names = {
+            event_name: None for event_names, _ in groups.values() for event_name in event_names if event_name not in self._event_ids
+        }
+        event_names_frame = self._encode_event_names(list(new_event_names)) if new_event_names else b''
+
+        metadata = _json.dumpb(document['metadata']) if document.get('metadata') else b''
+        payload = [
+            _REPORT_HEADER.pack(FRAME_TYPE_HWPC_REPORT, document['timestamp']),
+            _pack_strings([document['sensor'], document['target']]),
+            _U32.pack(len(metadata)),
+            metadata,
+            _pack_strings(list(groups)),
+        ]
+        for event_names, group in groups.values():
+            payload.append(_GROUP_HEADER.pack(len(event_names), len(group)))
+            payload.append(_array_struct('H', len(event_names)).pack(*(self._event_ids[name] for name in event_names)))
+            for socket, cpus in group.items():
+                payload.append(_pack_strings([str(socket), *map(str, cpus)]))
+                payload.append(_array_struct('Q', len(event_names) * len(cpus)).pack(
+                    *(counters[event_name] for counters in cpus.values() for event_name in event_names)
+                ))
+
+        return event_names_frame + self._frame(b''.join(payload))
@@ -27,51 +27,194 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import socket
 from collections.abc import Iterable
+from contextlib import suppress
+from multiprocessing import get_context
 from queue import SimpleQueue, Empty
+from socketserver import BaseServer, BaseRequestHandler
 from threading import Thread
+from typing import ClassVar
+from urllib.parse import urlsplit
 
-from powerapi.database.driver import ReadableDatabase, ReadableDatabaseFactory
+from powerapi.database.driver import ReadableDatabase, ReadableDatabaseFactory, PushBasedDatabase
 from powerapi.database.exceptions import ConnectionFailed
 from powerapi.database.socket.codecs import ReportDecoders
-from powerapi.database.socket.tcp_server import tcpserver_thread_target
+from powerapi.database.socket.statistics import SourcesStatistics
+from powerapi.database.socket.tcp_server import ThreadedTCPServer, ThreadedUnixStreamServer, MultiProtocolRequestHandler, SUPPORTED_PROTOCOLS
+from powerapi.database.socket.udp_server import ReportsUDPServer, DatagramRequestHandler
+from powerapi.database.socket.workers import SocketIngestionWorker
 from powerapi.report import Report
 
 
-class SocketInput(ReadableDatabase):
+def parse_listen_address(host: str, port: int) -> tuple[str, str | tuple[str, int]]:
+    """
+    Parse the listen address of the Socket database.
+    The host can either be a hostname/ip address (TCP), or an URI using the `tcp://`, `udp://` or `unix://` scheme.
+    The given port is used when the URI does not specify one.
+    :param host: The host address or URI to listen on
+    :param port: The port number to listen on
+    :return: Tuple containing the transport name and the address to listen on
+    :raise ValueError: If the listen address is invalid
+    """
+    if '://' not in host:
+        return 'tcp', (host, port)
+
+    uri = urlsplit(host)
+    if uri.scheme == 'unix':
+        path = uri.netloc + uri.path
+        if not path:
+            raise ValueError(f'Missing socket path in listen address: {host}')
+        return 'unix', path
+
+    if uri.scheme in ('tcp', 'udp'):
+        return uri.scheme, (uri.hostname or '', uri.port if uri.port is not None else port)
+
+    raise ValueError(f'Unsupported listen address scheme: {uri.scheme}')
+
+
+class SocketInput(PushBasedDatabase):
     """
     Socket database driver.
+    Listen for the reports sent by the sensors over TCP, UDP or a Unix domain socket.
+    The TCP and UDP reports can be received and decoded by several ingestion worker processes sharing the listen address.
     """
+    servers: ClassVar[dict[str, tuple[type[BaseServer], type[BaseRequestHandler]]]] = {
+        'tcp': (ThreadedTCPServer, MultiProtocolRequestHandler),
+        'unix': (ThreadedUnixStreamServer, MultiProtocolRequestHandler),
+        'udp': (ReportsUDPServer, DatagramRequestHandler),
+    }
+    workers_startup_timeout = 30.0
+    workers_shutdown_timeout = 5.0
 
-    def __init__(self, report_type: type[Report], host: str, port: int):
+    def __init__(self, report_type: type[Report], host: str, port: int, protocol: str = 'auto', workers: int = 1):
         """
         :param report_type: The type of report to create
-        :param host: The host address to listen on
+        :param host: The host address or URI (tcp://, udp:// or unix://) to listen on
         :param port: The port number to listen on
+        :param protocol: The wire protocol expected from the clients (auto, json or binary)
+        :param workers: Number of ingestion worker processes, a single value means the reports are received in-process
         """
         super().__init__()
 
-        self.listen_addr = (host, port)
+        self.report_type = report_type
+        self.transport, self.listen_addr = parse_listen_address(host, port)
+        self.protocol = protocol
+        self.workers = workers
+        self.statistics = SourcesStatistics()
 
         self._report_decoder = ReportDecoders.get(report_type)
         self._received_data_queue = SimpleQueue()
-        thread_args = (self.listen_addr, self._received_data_queue)
-        self._tcp_server_thread = Thread(target=tcpserver_thread_target, args=thread_args, daemon=True)
+        self._pending_reports: list[Report] = []
+        self._server: BaseServer | None = None
+        self._server_thread: Thread | None = None
+        self._workers: list[SocketIngestionWorker] = []
+        self._workers_address: tuple[str, int] | None = None
+        self._workers_queue = None
+        self._workers_stop_event = None
+
+    @property
+    def server_address(self) -> str | tuple[str, int] | None:
+        """
+        Return the address the server is bound to.
+        :return: The bound address, or None if the database is not connected
+        """
+        if self._workers:
+            return self._workers_address
+
+        return self._server.server_address if self._server is not None else None
 
     def connect(self) -> None:
         """
         Connect the Socket database driver.
         :raise: ConnectionFailed if the operation fails
         """
+        if self.workers > 1:
+            self._start_workers()
+            return
+
+        server_cls, request_handler_cls = self.servers[self.transport]
+        try:
+            self._server = server_cls(self.listen_addr, request_handler_cls, self._received_data_queue, self.protocol, self.statistics)
+        except OSError as exn:
+            raise ConnectionFailed(f'Failed to connect the Socket database: {exn}') from exn
+
         try:
-            self._tcp_server_thread.start()
+            self._server_thread = Thread(target=self._server.serve_forever, name='socket-server-thread', daemon=True)
+            self._server_thread.start()
         except RuntimeError as exn:
+            self._server.server_close()
             raise ConnectionFailed(f'Failed to connect the Socket database: {exn}') from exn
 
+    def _start_workers(self) -> None:
+        """
+        Start the ingestion worker processes.
+        The first worker resolves the listen address (e.g. a random port), the others are then bound to the same address.
+        :raise: ConnectionFailed if a worker fails to bind the listen address
+        """
+        ctx = get_context('spawn')
+        self._workers_queue = ctx.Queue()
+        self._workers_stop_event = ctx.Event()
+        server_cls, request_handler_cls = self.servers[self.transport]
+
+        address = self.listen_addr
+        for batch in (range(1), range(1, self.workers)):
+            pending = []
+            for worker_id in batch:
+                ready_recv_conn, ready_send_conn = ctx.Pipe(duplex=False)
+                worker = SocketIngestionWorker(worker_id, server_cls, request_handler_cls, address, self.protocol, self.report_type,
+                                               self._workers_queue, ready_send_conn, self._workers_stop_event)
+                worker.start()
+                ready_send_conn.close()
+                self._workers.append(worker)
+                pending.append(ready_recv_conn)
+
+            for ready_recv_conn in pending:
+                try:
+                    result = ready_recv_conn.recv() if ready_recv_conn.poll(self.workers_startup_timeout) else TimeoutError('Worker startup timed out')
+                except EOFError:
+                    result = ConnectionError('Worker exited before binding the listen address')
+                finally:
+                    ready_recv_conn.close()
+
+                if isinstance(result, Exception):
+                    self._stop_workers()
+                    raise ConnectionFailed(f'Failed to connect the Socket database: {result}')
+
+                address = self._workers_address = result
+
+    def _stop_workers(self) -> None:
+        """
+        Stop the ingestion worker processes.
+        """
+        self._workers_stop_event.set()
+        for worker in self._workers:
+            worker.join(self.workers_shutdown_timeout)
+            if worker.is_alive():
+                worker.terminate()
+                worker.join()
+
+        self._workers_queue.close()
+        self._workers = []
+        self._workers_address = None
+
     def disconnect(self) -> None:
         """
         Disconnect from the socket database.
         """
+        if self._workers:
+            self._stop_workers()
+            return
+
+        if self._server is None:
+            return
+
+        if self._server_thread is not None and self._server_thread.is_alive():
+            self._server.shutdown()
+
+        self._server.server_close()
+        self._server = None
+        self._server_thread = None
 
     @staticmethod
     def supported_read_types() -> Iterable[type[Report]]:
@@ -81,15 +224,44 @@ class SocketInput(ReadableDatabase):
         """
         return ReportDecoders.supported_types()
 
+    def _receive_reports(self, timeout: float | None) -> list[Report]:
+        """
+        Receive the next report(s) from the server threads or the ingestion workers.
+        :param timeout: Maximum time in seconds to wait, None to return immediately
+        :return: List of received reports, can be empty when only statistics were received from a worker
+        :raise Empty: If nothing was received before the timeout expired
+        """
+        if self._workers:
+            reports, counters = self._workers_queue.get(block=timeout is not None, timeout=timeout)
+            self.statistics.merge(counters)
+            return reports
+
+        return [self._report_decoder.decode(self._received_data_queue.get(block=timeout is not None, timeout=timeout))]
+
+    def wait_for_reports(self, timeout: float) -> bool:
+        """
+        Wait until data is received from a client.
+        :param timeout: Maximum time in seconds to wait
+        :return: True if reports are available to be read, False if the timeout expired
+        """
+        if not self._pending_reports:
+            with suppress(Empty):
+                self._pending_reports = self._receive_reports(timeout)
+
+        return bool(self._pending_reports)
+
     def read(self, stream_mode: bool = False) -> Iterable[Report]:
         """
         Read reports from the Socket database.
         :param stream_mode: No-Op for this database driver, steam mode is the only supported mode
         :return: Iterable of reports
         """
+        reports, self._pending_reports = self._pending_reports, []
+        yield from reports
+
         while True:
             try:
-                yield self._report_decoder.decode(self._received_data_queue.get(block=False))
+                yield from self._receive_reports(None)
             except Empty:
                 break
 
@@ -98,22 +270,40 @@ class SocketInputFactory(ReadableDatabaseFactory):
     Factory that creates a socket database driver.
     """
 
-    def __init__(self, report_type: type[Report], host: str, port: int):
+    def __init__(self, report_type: type[Report], host: str, port: int, protocol: str = 'auto', workers: int = 1):
         """
         :param report_type: The type of report to create
-        :param host: The host address to listen on
+        :param host: The host address or URI (tcp://, udp:// or unix://) to listen on
         :param port: The port number to listen on
+        :param protocol: The wire protocol expected from the clients (auto, json or binary)
+        :param workers: Number of ingestion worker processes, a single value means the reports are received in-process
         """
         if report_type not in ReportDecoders.supported_types():
             raise ValueError(f'Unsupported report type: {report_type.__name__}')
 
+        if protocol not in SUPPORTED_PROTOCOLS:
+            raise ValueError(f'Unsupported protocol: {protocol}')
+
+        transport, _ = parse_listen_address(host, port)
+
+        if workers < 1:
+            raise ValueError(f'Invalid number of ingestion workers: {workers}')
+
+        if workers > 1 and transport == 'unix':
+            raise ValueError('Ingestion workers are not supported with Unix domain sockets')
+
+        if workers > 1 and not hasattr(socket, 'SO_REUSEPORT'):
+            raise ValueError('Ingestion workers are not supported on this platform (SO_REUSEPORT is unavailable)')
+
         self.report_type = report_type
         self.host = host
         self.port = port
+        self.protocol = protocol
+        self.workers = workers
 
     def create(self) -> ReadableDatabase:
         """
         Create the socket database driver.
         :return: Initialized socket database driver
         """
-        return SocketInput(self.report_type, self.host, self.port)
+        return SocketInput(self.report_type, self.host, self.port, self.protocol, self.workers)
@@ -0,0 +1,95 @@
+# Copyright (c) 2026, Inria
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from dataclasses import dataclass, replace
+from threading import Lock
+
+
+@dataclass
+class SourceCounters:
+    """
+    Counters of the data received from a source of the Socket database.
+    """
+    connections: int = 0
+    received_bytes: int = 0
+    received_documents: int = 0
+    malformed_documents: int = 0
+
+
+class SourcesStatistics:
+    """
+    Thread-safe registry of the per-source counters of the Socket database.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._sources: dict[str, SourceCounters] = {}
+
+    def record(self, source: str, connections: int = 0, received_bytes: int = 0, received_documents: int = 0, malformed_documents: int = 0) -> None:
+        """
+        Increment the counters of the given source.
+        :param source: Name of the source
+        :param connections: Number of new connections
+        :param received_bytes: Number of received bytes
+        :param received_documents: Number of successfully decoded documents
+        :param malformed_documents: Number of documents or frames that could not be decoded
+        """
+        with self._lock:
+            counters = self._sources.get(source)
+            if counters is None:
+                counters = self._sources[source] = SourceCounters()
+
+            counters.connections += connections
+            counters.received_bytes += received_bytes
+            counters.received_documents += received_documents
+            counters.malformed_documents += malformed_documents
+
+    def snapshot(self) -> dict[str, SourceCounters]:
+        """
+        Return a copy of the counters of every source.
+        :return: Dictionary mapping the sources name to their counters
+        """
+        with self._lock:
+            return {source: replace(counters) for source, counters in self._sources.items()}
+
+    def take(self) -> dict[str, SourceCounters]:
+        """
+        Return the counters of every source and reset them.
+        :return: Dictionary mapping the sources name to their counters accumulated since the previous call
+        """
+        with self._lock:
+            sources, self._sources = self._sources, {}
+            return sources
+
+    def merge(self, sources: dict[str, SourceCounters]) -> None:
+        """
+        Add the given counters to the ones of the registry.
+        :param sources: Dictionary mapping the sources name to their counters
+        """
+        for source, counters in sources.items():
+            self.record(source, counters.connections, counters.received_bytes, counters.received_documents, counters.malformed_documents)
@@ -28,35 +28,88 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import logging
+import os
+import socket
+import struct
 from collections.abc import Iterator
+from contextlib import suppress
 from json import JSONDecoder, JSONDecodeError
 from queue import SimpleQueue
-from socketserver import ThreadingMixIn, TCPServer, StreamRequestHandler
+from socketserver import ThreadingMixIn, TCPServer, UnixStreamServer, StreamRequestHandler
 
+from powerapi.database.json_backends import get_json_backend
+from powerapi.database.socket.binary_protocol import BinaryFrameDecoder, FRAME_HEADER, MAX_FRAME_LENGTH, PROTOCOL_PREAMBLE
+from powerapi.database.socket.statistics import SourcesStatistics
 
-class ThreadedTCPServer(ThreadingMixIn, TCPServer):
+SUPPORTED_PROTOCOLS = ('auto', 'json', 'binary')
+
+_json = get_json_backend()
+
+
+class ReportsServerMixin:
     """
-    TCP Server implementation.
-    Each client connected will be served by a separate thread.
+    Mixin holding the state shared by the servers of the Socket database.
     """
-    daemon_threads = True
-    allow_reuse_address = True
 
-    def __init__(self, server_address, request_handler_class, received_data_queue: SimpleQueue):
+    def __init__(self, server_address, request_handler_class, received_data_queue: SimpleQueue, protocol: str = 'auto',
+                 statistics: SourcesStatistics | None = None, reuse_port: bool = False):
         """
         :param server_address: The address to listen on
         :param request_handler_class: The request handler class to use when receiving requests
         :param received_data_queue: The data queue to store the received data
+        :param protocol: The wire protocol expected from the clients (auto, json or binary)
+        :param statistics: The registry where to record the per-source counters
+        :param reuse_port: Whether to allow several servers to bind the same address (SO_REUSEPORT)
         """
+        self.allow_reuse_port = reuse_port
         super().__init__(server_address, request_handler_class)
         self.received_data_queue = received_data_queue
+        self.protocol = protocol
+        self.statistics = statistics if statistics is not None else SourcesStatistics()
+
+
+class ThreadedTCPServer(ReportsServerMixin, ThreadingMixIn, TCPServer):
+    """
+    TCP Server implementation.
+    Each client connected will be served by a separate thread.
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class ThreadedUnixStreamServer(ReportsServerMixin, ThreadingMixIn, UnixStreamServer):
+    """
+    Unix domain socket Server implementation.
+    Each client connected will be served by a separate thread.
+    """
+    daemon_threads = True
+
+    def server_bind(self):
+        """
+        Bind the socket to its path, replacing the socket file left by a previous instance.
+        """
+        with suppress(FileNotFoundError):
+            os.unlink(self.server_address)
+
+        super().server_bind()
+
+    def server_close(self):
+        """
+        Close the socket and remove its file.
+        """
+        super().server_close()
+        with suppress(OSError):
+            os.unlink(self.server_address)
 
 
 class JsonRequestHandler(StreamRequestHandler):
     """
     Request handler that handles JSON documents received from the client.
     """
-    server: ThreadedTCPServer
+    server: ThreadedTCPServer | ThreadedUnixStreamServer
+
+    caddr: str
+    source: str
 
     @staticmethod
     def parse_json_documents(data: str) -> Iterator[dict]:
@@ -66,13 +119,21 @@ class JsonRequestHandler(StreamRequestHandler):
         :param data: The raw data to decode
         :return: Iterator over parsed json documents
         """
+        # Fast path for the common case of a single document, parsed with the JSON backend.
+        try:
+            document = _json.loads(data)
+        except ValueError:
+            pass
+        else:
+            yield document
+            return
+
         decoder = JSONDecoder()
         idx = 0
         while idx < len(data):
             try:
-                obj, end_idx = decoder.raw_decode(data, idx)
+                obj, idx = decoder.raw_decode(data, idx)
                 yield obj
-                idx += end_idx
 
             # Search and try to parse the remaining document(s)
             except JSONDecodeError as e:
@@ -80,42 +141,142 @@ class JsonRequestHandler(StreamRequestHandler):
                 if idx == -1:
                     break
 
-    def handle(self):
+    def setup(self):
         """
-        Handle incoming connections.
-        The received data is parsed and the result(s) stored in the data queue for further processing.
-        It is expected for the data to be in json format (utf-8 charset) and newline terminated.
+        Set up the connection and identify the client.
+        The source name identifies the client host (TCP) or process (Unix domain socket) in the statistics.
         """
-        caddr = '{}:{}'.format(*self.client_address)
-        logging.info('New incoming connection from %s', caddr)
+        super().setup()
+
+        if isinstance(self.client_address, tuple):
+            self.caddr = '{}:{}'.format(*self.client_address[:2])
+            self.source = f'tcp://{self.client_address[0]}'
+        else:
+            self.caddr = self.source = f'unix://{self.server.server_address}'
+            with suppress(AttributeError, OSError):
+                pid, _, _ = struct.unpack('3i', self.connection.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i')))
+                self.caddr = self.source = f'{self.source}?pid={pid}'
 
+        self.server.statistics.record(self.source, connections=1)
+
+    def handle_json_stream(self) -> None:
+        """
+        Handle a connection using the JSON protocol.
+        It is expected for the data to be in json format (utf-8 charset) and newline terminated.
+        """
         while True:
+            data = b''
             try:
                 data = self.rfile.readline()
                 if not data:
                     break
 
+                documents_count = 0
                 for obj in self.parse_json_documents(data.decode('utf-8')):
                     self.server.received_data_queue.put(obj)
+                    documents_count += 1
+
+                self.server.statistics.record(self.source, received_bytes=len(data), received_documents=documents_count)
 
             except ValueError as e:
-                logging.warning('[%s] Received malformed data: %s', caddr, e)
+                logging.warning('[%s] Received malformed data: %s', self.caddr, e)
+                self.server.statistics.record(self.source, received_bytes=len(data), malformed_documents=1)
                 continue
             except OSError as e:
-                logging.error('[%s] Caught OSError while handling request: %s', caddr, e)
+                logging.error('[%s] Caught OSError while handling request: %s', self.caddr, e)
                 break
             except KeyboardInterrupt:
                 break
 
-        logging.info('Connection from %s closed', caddr)
+    def handle(self):
+        """
+        Handle incoming connections.
+        The received data is parsed and the result(s) stored in the data queue for further processing.
+        """
+        logging.info('New incoming connection from %s', self.caddr)
 
+        self.handle_json_stream()
 
-def tcpserver_thread_target(listen_addr: tuple[str, int], received_data_queue: SimpleQueue) -> None:
+        logging.info('Connection from %s closed', self.caddr)
+
+
+class MultiProtocolRequestHandler(JsonRequestHandler):
     """
-    Target function of the thread that will run the TCP server in background.
-    :param listen_addr: The address to listen on (ip, port)
-    :param received_data_queue: The queue where to store the received data
+    Request handler that handles both the JSON and the length-prefixed binary protocols.
+    The protocol is either fixed by the server or detected from the first byte sent by the client.
     """
-    with ThreadedTCPServer(listen_addr, JsonRequestHandler, received_data_queue) as server:
-        logging.info('TCP socket is listening on %s:%s', *listen_addr)
-        server.serve_forever()
+
+    def detect_protocol(self) -> str | None:
+        """
+        Detect the protocol used by the client without consuming any data.
+        :return: The detected protocol name, or None if the connection was closed before sending any data
+        """
+        first_byte = self.rfile.peek(1)[:1]
+        if not first_byte:
+            return None
+
+        return 'binary' if first_byte == PROTOCOL_PREAMBLE[:1] else 'json'
+
+    def handle_binary_stream(self) -> None:
+        """
+        Handle a connection using the length-prefixed binary protocol.
+        The client is expected to send the protocol preamble followed by the frames.
+        """
+        if self.rfile.read(len(PROTOCOL_PREAMBLE)) != PROTOCOL_PREAMBLE:
+            logging.warning('[%s] Invalid binary protocol preamble', self.caddr)
+            return
+
+        decoder = BinaryFrameDecoder()
+        while True:
+            received_bytes = 0
+            try:
+                header = self.rfile.read(FRAME_HEADER.size)
+                if len(header) < FRAME_HEADER.size:
+                    break
+
+                (frame_length,) = FRAME_HEADER.unpack(header)
+                if frame_length > MAX_FRAME_LENGTH:
+                    logging.error('[%s] Received frame exceeding the maximum length: %d bytes', self.caddr, frame_length)
+                    break
+
+                frame = self.rfile.read(frame_length)
+                if len(frame) < frame_length:
+                    logging.warning('[%s] Received truncated frame', self.caddr)
+                    break
+
+                received_bytes = FRAME_HEADER.size + frame_length
+                if (obj := decoder.decode(frame)) is not None:
+                    self.server.received_data_queue.put(obj)
+                    self.server.statistics.record(self.source, received_bytes=received_bytes, received_documents=1)
+                else:
+                    self.server.statistics.record(self.source, received_bytes=received_bytes)
+
+            except ValueError as e:
+                logging.warning('[%s] Received malformed frame: %s', self.caddr, e)
+                self.server.statistics.record(self.source, received_bytes=received_bytes, malformed_documents=1)
+                continue
+            except OSError as e:
+                logging.error('[%s] Caught OSError while handling request: %s', self.caddr, e)
+                break
+            except KeyboardInterrupt:
+                break
+
+    def handle(self):
+        """
+        Handle incoming connections.
+        The received data is parsed and the result(s) stored in the data queue for further processing.
+        """
+        logging.info('New incoming connection from %s', self.caddr)
+
+        try:
+            protocol = self.server.protocol if self.server.protocol != 'auto' else self.detect_protocol()
+        except OSError as e:
+            logging.error('[%s] Caught OSError while detecting protocol: %s', self.caddr, e)
+            protocol = None
+
+        if protocol == 'binary':
+            self.handle_binary_stream()
+        elif protocol == 'json':
+            self.handle_json_stream()
+
+        logging.info('Connection from %s closed', self.caddr)
@@ -0,0 +1,102 @@
+# Copyright (c) 2026, Inria
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import logging
+import socket
+from contextlib import suppress
+from socketserver import UDPServer, BaseRequestHandler
+
+from powerapi.database.socket.binary_protocol import BinaryFrameDecoder, PROTOCOL_PREAMBLE, iter_frames
+from powerapi.database.socket.tcp_server import ReportsServerMixin, JsonRequestHandler
+
+
+class ReportsUDPServer(ReportsServerMixin, UDPServer):
+    """
+    UDP Server implementation.
+    The datagrams are handled sequentially by the server thread, no connection state is kept between datagrams.
+    """
+    allow_reuse_address = True
+    max_packet_size = 65507
+    receive_buffer_size = 4 * 1024 * 1024
+
+    def server_bind(self):
+        """
+        Bind the socket and enlarge its receive buffer to absorb bursts of datagrams.
+        """
+        with suppress(OSError):
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.receive_buffer_size)
+
+        super().server_bind()
+
+
+class DatagramRequestHandler(BaseRequestHandler):
+    """
+    Request handler that handles the datagrams received from the clients.
+
+    Each datagram must be self-contained: either JSON document(s), or the binary protocol preamble followed by complete
+    frames, including the event names frame(s) required to decode the report frame(s) of the datagram.
+    """
+    server: ReportsUDPServer
+
+    def decode_binary_datagram(self, data: bytes) -> list[dict]:
+        """
+        Decode the reports of a binary datagram.
+        :param data: Datagram content
+        :return: List of decoded report documents
+        :raise ValueError: If the datagram is malformed
+        """
+        decoder = BinaryFrameDecoder()
+        return [obj for frame in iter_frames(data, len(PROTOCOL_PREAMBLE)) if (obj := decoder.decode(frame)) is not None]
+
+    def handle(self):
+        """
+        Handle an incoming datagram.
+        The received data is parsed and the result(s) stored in the data queue for further processing.
+        """
+        data, _ = self.request
+        source = f'udp://{self.client_address[0]}'
+        protocol = self.server.protocol
+        if protocol == 'auto':
+            protocol = 'binary' if data.startswith(PROTOCOL_PREAMBLE[:1]) else 'json'
+
+        try:
+            if protocol == 'binary':
+                if not data.startswith(PROTOCOL_PREAMBLE):
+                    raise ValueError('Invalid binary protocol preamble')
+                documents = self.decode_binary_datagram(data)
+            else:
+                documents = list(JsonRequestHandler.parse_json_documents(data.decode('utf-8')))
+        except ValueError as e:
+            logging.warning('[%s] Received malformed datagram: %s', source, e)
+            self.server.statistics.record(source, received_bytes=len(data), malformed_documents=1)
+            return
+
+        for obj in documents:
+            self.server.received_data_queue.put(obj)
+
+        self.server.statistics.record(source, received_bytes=len(data), received_documents=len(documents))
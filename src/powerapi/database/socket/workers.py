@@ -0,0 +1,144 @@
+# Copyright (c) 2026, Inria
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import logging
+import signal
+from multiprocessing.connection import Connection
+from multiprocessing.context import SpawnProcess
+from multiprocessing.queues import Queue
+from multiprocessing.synchronize import Event
+from queue import SimpleQueue, Empty
+from socketserver import BaseServer, BaseRequestHandler
+from threading import Thread
+
+from powerapi.database.socket.codecs import ReportDecoders
+from powerapi.database.socket.statistics import SourcesStatistics
+from powerapi.report import Report
+
+
+class SocketIngestionWorker(SpawnProcess):
+    """
+    Ingestion worker process of the Socket database.
+    The workers listen on the same address (SO_REUSEPORT), the kernel distributing the connections/datagrams between them.
+    The received documents are decoded by the worker and forwarded by batch, along with the statistics, to the database driver.
+    The workers are spawned, forking the (multi-threaded) puller actor process is unsafe.
+    """
+    max_batch_size = 256
+    statistics_interval = 1.0
+
+    def __init__(self, worker_id: int, server_cls: type[BaseServer], request_handler_cls: type[BaseRequestHandler], listen_addr: tuple[str, int],
+                 protocol: str, report_type: type[Report], reports_queue: Queue, ready_conn: Connection, stop_event: Event):
+        """
+        :param worker_id: Identifier of the worker
+        :param server_cls: The server class to use
+        :param request_handler_cls: The request handler class to use when receiving requests
+        :param listen_addr: The address to listen on
+        :param protocol: The wire protocol expected from the clients (auto, json or binary)
+        :param report_type: The type of report to create
+        :param reports_queue: The queue where to forward the decoded reports and the statistics
+        :param ready_conn: The connection where to send the bound address, or the error preventing to bind it
+        :param stop_event: The event signaling the worker to stop
+        """
+        super().__init__(name=f'socket-ingestion-worker-{worker_id}', daemon=True)
+
+        self.server_cls = server_cls
+        self.request_handler_cls = request_handler_cls
+        self.listen_addr = listen_addr
+        self.protocol = protocol
+        self.report_type = report_type
+
+        self._reports_queue = reports_queue
+        self._ready_conn = ready_conn
+        self._stop_event = stop_event
+
+    def run(self) -> None:
+        """
+        Main code executed by the ingestion worker.
+        """
+        # The shutdown of the workers is handled by the database driver.
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+        received_data_queue = SimpleQueue()
+        statistics = SourcesStatistics()
+        try:
+            server = self.server_cls(self.listen_addr, self.request_handler_cls, received_data_queue, self.protocol, statistics, reuse_port=True)
+        except OSError as exn:
+            self._ready_conn.send(exn)
+            return
+
+        server_thread = Thread(target=server.serve_forever, name='socket-server-thread', daemon=True)
+        server_thread.start()
+        forwarder_thread = Thread(target=self._forward_reports, args=(received_data_queue, statistics), name='socket-forwarder-thread')
+        forwarder_thread.start()
+
+        self._ready_conn.send(server.server_address)
+        self._ready_conn.close()
+
+        self._stop_event.wait()
+
+        server.shutdown()
+        server.server_close()
+        received_data_queue.put(None)
+        forwarder_thread.join()
+
+    def _forward_reports(self, received_data_queue: SimpleQueue, statistics: SourcesStatistics) -> None:
+        """
+        Decode the received documents and forward them by batch to the database driver.
+        A batch contains the documents available when the first one is received, up to the maximum batch size.
+        The statistics are also periodically forwarded when no document is received.
+        :param received_data_queue: The queue containing the documents received by the server
+        :param statistics: The per-source counters of the server
+        """
+        report_decoder = ReportDecoders.get(self.report_type)
+        stop = False
+        while not stop:
+            try:
+                documents = [received_data_queue.get(timeout=self.statistics_interval)]
+            except Empty:
+                documents = []
+
+            while len(documents) < self.max_batch_size:
+                try:
+                    documents.append(received_data_queue.get(block=False))
+                except Empty:
+                    break
+
+            reports = []
+            for document in documents:
+                if document is None:
+                    stop = True
+                    continue
+
+                try:
+                    reports.append(report_decoder.decode(document))
+                except (KeyError, TypeError, ValueError) as exn:
+                    logging.warning('[%s] Failed to decode received report: %s', self.name, exn)
+
+            counters = statistics.take()
+            if reports or counters:
+                self._reports_queue.put((reports, counters))
@@ -0,0 +1,143 @@
+# Copyright (c) 2026, Inria
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+# Location of a flattened tag in the metadata of a report: key of the tag, and key in its nested dictionary (if any).
+TagGetter = tuple[str, str | None]
+
+
+class TagsPlanCacheInfo(NamedTuple):
+    """
+    Statistics of a tags plan cache.
+    """
+    hits: int
+    misses: int
+    max_size: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Return the ratio of the lookups that found their plan in the cache.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __str__(self) -> str:
+        return f'{self.hits} hits, {self.misses} misses, {self.size}/{self.max_size} plans, {self.hit_rate:.1%} hit rate'
+
+
+class TagsPlanCache[P]:
+    """
+    Bounded cache of the plans used by the encoders to gather the tags of the reports.
+    The metadata of the reports of a target almost always have the same keys, as the processors attach the same metadata
+    every time. The flattening of the metadata (and the naming or escaping of the tags) is done once for a shape of metadata
+    (its keys and the keys of its nested dictionaries), the resulting plan only having to gather the values of the tags.
+    The least recently used plans are evicted once the cache is full.
+    """
+
+    def __init__(self, build_plan: Callable[[dict[str, TagGetter]], P], max_size: int = 1024, separator: str = '_'):
+        """
+        :param build_plan: Function building the plan from the location of the flattened tags, indexed by their name
+        :param max_size: Maximum number of plans kept in the cache
+        :param separator: Separator of the keys of the flattened tags name, as in `Report.flatten_tags`
+        """
+        self.max_size = max_size
+        self.separator = separator
+
+        self._build_plan = build_plan
+        self._plans: OrderedDict[tuple, P] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def _metadata_shape(metadata: dict[str, Any]) -> tuple:
+        """
+        Return the shape of the metadata of a report.
+        :param metadata: Metadata of the report
+        :return: Tuple of the keys of the metadata, with the keys of their nested dictionary (if any)
+        """
+        return tuple([(key, tuple(value) if isinstance(value, dict) else None) for key, value in metadata.items()])
+
+    def _flattened_tags_getters(self, shape: tuple) -> dict[str, TagGetter]:
+        """
+        Return the location of the flattened tags of a shape of metadata, named as in `Report.flatten_tags`.
+        :param shape: Shape of the metadata
+        :return: Dictionary of the location of the tags, indexed by their flattened name
+        """
+        return {
+            f'{key}{self.separator}{nested_key}' if nested_key is not None else key: (key, nested_key)
+            for key, nested_keys in shape for nested_key in (nested_keys if nested_keys is not None else (None,))
+        }
+
+    def get(self, metadata: dict[str, Any]) -> P:
+        """
+        Return the plan of the tags of a report, building it if its metadata shape is not in the cache.
+        :param metadata: Metadata of the report
+        :return: Plan of the tags
+        """
+        shape = self._metadata_shape(metadata)
+        if (plan := self._plans.get(shape)) is not None:
+            self._hits += 1
+            self._plans.move_to_end(shape)
+            return plan
+
+        self._misses += 1
+        plan = self._plans[shape] = self._build_plan(self._flattened_tags_getters(shape))
+        if len(self._plans) > self.max_size:
+            self._plans.popitem(last=False)
+        return plan
+
+    def cache_info(self) -> TagsPlanCacheInfo:
+        """
+        Return the statistics of the cache.
+        :return: Hits, misses, maximum size and current size of the cache
+        """
+        return TagsPlanCacheInfo(self._hits, self._misses, self.max_size, len(self._plans))
+
+
+def flattened_tags_plan(getters: dict[str, TagGetter]) -> tuple[tuple[str, TagGetter], ...]:
+    """
+    Build the plan gathering the flattened tags of the reports.
+    :param getters: Location of the flattened tags, indexed by their name
+    :return: Plan of the tags, to be used by `flatten_tags`
+    """
+    return tuple(getters.items())
+
+
+def flatten_tags(metadata: dict[str, Any], plan: tuple[tuple[str, TagGetter], ...]) -> dict[str, Any]:
+    """
+    Flatten the metadata of a report according to its plan, as `Report.flatten_tags` does.
+    :param metadata: Metadata of the report
+    :param plan: Plan of the flattened tags of the metadata
+    :return: Flattened tags dictionary
+    """
+    return {name: metadata[key] if nested_key is None else metadata[key][nested_key] for name, (key, nested_key) in plan}
@@ -0,0 +1,212 @@
+# Copyright (c) 2026, Inria
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, UTC
+from pathlib import Path
+
+_TIME_INDEX_HEADER = '# powerapi-time-index v1 (start end min_timestamp max_timestamp)\n'
+
+
+@dataclass(frozen=True, slots=True)
+class TimeIndexBlock:
+    """
+    Block of a sparse time index.
+    Maps a byte range of a file to the range of timestamps (in milliseconds since epoch) of the reports stored in it.
+    """
+    start: int
+    end: int
+    min_timestamp: int
+    max_timestamp: int
+
+
+def time_index_filepath(filepath: Path) -> Path:
+    """
+    Return the path of the sidecar time index of a file.
+    :param filepath: Path to the indexed file
+    :return: Path to the time index file
+    """
+    return filepath.with_name(f'{filepath.name}.idx')
+
+
+def timestamp_milliseconds(timestamp: datetime) -> int:
+    """
+    Convert a timestamp to milliseconds since epoch, naive timestamps being considered as UTC.
+    :param timestamp: Timestamp to convert
+    :return: Number of milliseconds since epoch
+    """
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=UTC)
+
+    return int(timestamp.timestamp() * 1000)
+
+
+def parse_timestamp_milliseconds(value: str) -> int:
+    """
+    Parse a timestamp stored in a file, either in milliseconds since epoch or in ISO 8601 format.
+    :param value: Timestamp to parse
+    :return: Number of milliseconds since epoch
+    :raise ValueError: If the timestamp is malformed
+    """
+    if value.isdigit():
+        return int(value)
+
+    return timestamp_milliseconds(datetime.fromisoformat(value))
+
+
+def parse_time_window_bound(value: str | datetime | None) -> datetime | None:
+    """
+    Parse a bound of a time window, naive timestamps being considered as UTC.
+    :param value: ISO 8601 timestamp, datetime object, or None for an unbounded window
+    :return: Timezone-aware datetime object, or None for an unbounded window
+    :raise ValueError: If the timestamp is malformed
+    """
+    if value is None or value == '':
+        return None
+
+    timestamp = value if isinstance(value, datetime) else datetime.fromisoformat(value)
+    return timestamp if timestamp.tzinfo is not None else timestamp.replace(tzinfo=UTC)
+
+
+class TimeIndexBuilder:
+    """
+    Sparse time index builder.
+    The data written to a file are recorded as consecutive chunks, grouped into blocks of at least the block size.
+    """
+
+    def __init__(self, block_size: int, start_offset: int = 0):
+        """
+        :param block_size: Minimum size (in bytes) of the blocks of the index
+        :param start_offset: Offset (in bytes) of the first recorded chunk, to skip the header of the file
+        """
+        self.block_size = block_size
+
+        self._blocks: list[TimeIndexBlock] = []
+        self._offset = start_offset
+        self._block_start = start_offset
+        self._min_timestamp: int | None = None
+        self._max_timestamp: int | None = None
+
+    def add(self, size: int, min_timestamp: int, max_timestamp: int) -> None:
+        """
+        Record a chunk of data written after the previous one.
+        :param size: Size (in bytes) of the chunk
+        :param min_timestamp: Minimum timestamp (in milliseconds since epoch) of the reports of the chunk
+        :param max_timestamp: Maximum timestamp (in milliseconds since epoch) of the reports of the chunk
+        """
+        self._offset += size
+        self._min_timestamp = min_timestamp if self._min_timestamp is None else min(self._min_timestamp, min_timestamp)
+        self._max_timestamp = max_timestamp if self._max_timestamp is None else max(self._max_timestamp, max_timestamp)
+
+        if self._offset - self._block_start >= self.block_size:
+            self._close_block()
+
+    def skip(self, size: int) -> None:
+        """
+        Record a chunk of data written after the previous one that contains no report, such as the header of a file.
+        :param size: Size (in bytes) of the chunk
+        """
+        self._offset += size
+        if self._min_timestamp is None:
+            self._block_start = self._offset
+
+    def _close_block(self) -> None:
+        """
+        Close the current block of the index, if it contains data.
+        """
+        if self._min_timestamp is not None:
+            self._blocks.append(TimeIndexBlock(self._block_start, self._offset, self._min_timestamp, self._max_timestamp))
+
+        self._block_start = self._offset
+        self._min_timestamp = None
+        self._max_timestamp = None
+
+    def write(self, index_filepath: Path) -> None:
+        """
+        Write the index to a file.
+        The index is written under a temporary name and renamed once complete.
+        :param index_filepath: Path to the index file
+        :raise: OSError if the operation fails
+        """
+        self._close_block()
+
+        partial_filepath = index_filepath.with_name(f'{index_filepath.name}.part')
+        with open(partial_filepath, 'w', encoding='utf-8') as index_file:
+            index_file.write(_TIME_INDEX_HEADER)
+            index_file.writelines(f'{block.start} {block.end} {block.min_timestamp} {block.max_timestamp}\n' for block in self._blocks)
+        partial_filepath.replace(index_filepath)
+
+
+def read_time_index(index_filepath: Path) -> list[TimeIndexBlock]:
+    """
+    Read the blocks of a time index file.
+    :param index_filepath: Path to the index file
+    :return: List of blocks, ordered by offset
+    :raise: OSError if the file cannot be read
+    :raise: ValueError if the file is malformed
+    """
+    with open(index_filepath, encoding='utf-8') as index_file:
+        return [TimeIndexBlock(*map(int, line.split())) for line in index_file if line.strip() and not line.startswith('#')]
+
+
+def time_index_range(blocks: Sequence[TimeIndexBlock], time_from: datetime | None, time_to: datetime | None) -> tuple[int, int | None] | None:
+    """
+    Return the byte range of the blocks containing reports in the given time window.
+    The range ends at the end of the file when it includes the last block, as data can be written after the index.
+    :param blocks: Blocks of the index, ordered by offset, at least one
+    :param time_from: Start of the time window (inclusive), None for an unbounded window
+    :param time_to: End of the time window (exclusive), None for an unbounded window
+    :return: Tuple containing the start and end offsets (None for the end of the file), or None if no block matches
+    """
+    from_milliseconds = timestamp_milliseconds(time_from) if time_from is not None else None
+    to_milliseconds = timestamp_milliseconds(time_to) if time_to is not None else None
+    matching_blocks = [
+        index
+        for index, block in enumerate(blocks)
+        if (from_milliseconds is None or block.max_timestamp >= from_milliseconds) and (to_milliseconds is None or block.min_timestamp < to_milliseconds)
+    ]
+    if not matching_blocks:
+        # Only the data written after the index can be in a time window starting after the indexed reports.
+        if from_milliseconds is not None and all(block.max_timestamp < from_milliseconds for block in blocks):
+            return blocks[-1].end, None
+        return None
+
+    first_block, last_block = matching_blocks[0], matching_blocks[-1]
+    return blocks[first_block].start, blocks[last_block].end if last_block < len(blocks) - 1 else None
+
+
+def in_time_window(timestamp: datetime, time_from: datetime | None, time_to: datetime | None) -> bool:
+    """
+    Return whether a timestamp is in a time window.
+    :param timestamp: Timestamp to check
+    :param time_from: Start of the time window (inclusive), None for an unbounded window
+    :param time_to: End of the time window (exclusive), None for an unbounded window
+    :return: True if the timestamp is in the time window, False otherwise
+    """
+    return (time_from is None or timestamp >= time_from) and (time_to is None or timestamp < time_to)
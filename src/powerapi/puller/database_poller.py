@@ -36,10 +36,11 @@ from threading import Thread, Event
 from time import sleep
 from typing import TYPE_CHECKING
 
+from powerapi.database.driver import PushBasedDatabase
 from powerapi.database.exceptions import ConnectionFailed, ReadFailed
 
 if TYPE_CHECKING:
-    from powerapi.database.driver import ReadableDatabaseFactory
+    from powerapi.database.driver import ReadableDatabase, ReadableDatabaseFactory
     from powerapi.filter import ReportFilter
 
 
@@ -54,7 +55,7 @@ class DatabasePollerThread(Thread):
         :param database_factory: Factory used to create the database driver
         :param report_filter: Report filter used to dispatch the received reports
         :param stream_mode: If true, poll continuously from the database; otherwise, stop the poller thread on empty result
-        :param poll_interval: Interval in seconds between database polls
+        :param poll_interval: Interval in seconds between database polls, or maximum wait time for push-based databases
         """
         super().__init__(name='database-poller-thread', daemon=True)
 
@@ -114,7 +115,7 @@ class DatabasePollerThread(Thread):
             except ReadFailed as exn:
                 logging.error('Failed to fetch reports from database: %s', exn.msg)
 
-            sleep(self.poll_interval)
+            self._wait_for_reports(database)
 
         for dispatcher in self.report_filter.dispatchers():
             dispatcher.disconnect()
@@ -122,6 +123,17 @@ class DatabasePollerThread(Thread):
         database.disconnect()
         logging.info('Database poller thread stopped')
 
+    def _wait_for_reports(self, database: ReadableDatabase) -> None:
+        """
+        Wait before the next read of the database.
+        Push-based databases wake up the poller as soon as reports are available, others are polled periodically.
+        :param database: Database driver to wait for
+        """
+        if isinstance(database, PushBasedDatabase):
+            database.wait_for_reports(self.poll_interval)
+        else:
+            sleep(self.poll_interval)
+
     def wait_ready(self, timeout: float | None = None) -> bool:
         """
         Wait until the database poller thread is ready.
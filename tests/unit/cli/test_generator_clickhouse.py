@@ -94,3 +94,46 @@ def test_pusher_generator_with_missing_arguments_in_clickhouse_config(clickhouse
 
     with pytest.raises(PowerAPIException):
         generator.generate(clickhouse_config)
+
+
+def test_pusher_generator_with_clickhouse_write_options(clickhouse_config):
+    """
+    PusherGenerator should pass the write options to the ClickHouse database factory.
+    """
+    clickhouse_config['output']['pytest-clickhouse-pusher'] |= {
+        'buffer-rows': 5000, 'buffer-bytes': 1024, 'flush-interval': 0.5, 'async-insert': True, 'async-insert-no-wait': True
+    }
+
+    pushers = PusherGenerator().generate(clickhouse_config)
+
+    write_options = pushers['pytest-clickhouse-pusher'].database_factory.write_options
+    assert write_options.buffer_rows == 5000
+    assert write_options.buffer_bytes == 1024
+    assert write_options.flush_interval == 0.5
+    assert write_options.async_insert is True
+    assert write_options.wait_for_async_insert is False
+
+
+def test_pusher_generator_with_clickhouse_table_options(clickhouse_config):
+    """
+    PusherGenerator should pass the table options to the ClickHouse database factory.
+    """
+    clickhouse_config['output']['pytest-clickhouse-pusher'] |= {'partition-by': 'day', 'ttl': 30, 'rollups': ['minute', 'hour'], 'rollup-ttl': 365}
+
+    pushers = PusherGenerator().generate(clickhouse_config)
+
+    table_options = pushers['pytest-clickhouse-pusher'].database_factory.table_options
+    assert table_options.partition_by == 'day'
+    assert table_options.ttl_days == 30
+    assert table_options.rollups == ('minute', 'hour')
+    assert table_options.rollup_ttl_days == 365
+
+
+def test_pusher_generator_with_invalid_clickhouse_rollup(clickhouse_config):
+    """
+    PusherGenerator should raise an exception when an unknown rollup is requested.
+    """
+    clickhouse_config['output']['pytest-clickhouse-pusher']['rollups'] = ['second']
+
+    with pytest.raises(PowerAPIException):
+        PusherGenerator().generate(clickhouse_config)
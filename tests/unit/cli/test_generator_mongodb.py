@@ -88,6 +88,8 @@ def test_puller_generator_with_valid_mongodb_config(mongodb_config):
     assert db_factory.uri == expected_db_attributes['uri']
     assert db_factory.database_name == expected_db_attributes['db']
     assert db_factory.collection_name == expected_db_attributes['collection']
+    assert db_factory.stream_batch_size == 1000
+    assert db_factory.tailable is False
 
 
 @pytest.mark.parametrize('missing_arg', ['model', 'uri'])
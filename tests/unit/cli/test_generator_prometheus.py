@@ -89,3 +89,51 @@ def test_pusher_generator_with_missing_arguments_in_mongodb_config(prometheus_co
 
     with pytest.raises(PowerAPIException):
         generator.generate(prometheus_config)
+
+
+def test_pusher_generator_with_prometheus_series_limits(prometheus_config):
+    """
+    PusherGenerator should pass the expiration time of the samples and the maximum number of series to the Prometheus database factory.
+    """
+    prometheus_config['output']['pytest-prometheus-pusher'] |= {'samples-ttl': 60.0, 'max-series': 1000}
+
+    pushers = PusherGenerator().generate(prometheus_config)
+
+    db_factory = pushers['pytest-prometheus-pusher'].database_factory
+    assert db_factory.samples_ttl == 60.0
+    assert db_factory.max_series == 1000
+
+
+@pytest.mark.parametrize(('invalid_option', 'value'), [('samples-ttl', 0), ('max-series', -1)])
+def test_pusher_generator_with_invalid_prometheus_series_limits(prometheus_config, invalid_option, value):
+    """
+    PusherGenerator should raise an exception when the expiration time of the samples or the maximum number of series is invalid.
+    """
+    prometheus_config['output']['pytest-prometheus-pusher'][invalid_option] = value
+
+    with pytest.raises(PowerAPIException):
+        PusherGenerator().generate(prometheus_config)
+
+
+def test_pusher_generator_with_prometheus_aggregates(prometheus_config):
+    """
+    PusherGenerator should pass the aggregates, whose labels are joined by "+", to the Prometheus database factory.
+    """
+    prometheus_config['output']['pytest-prometheus-pusher'] |= {'aggregates': ['sensor', 'k8s_pod_namespace+sensor'], 'aggregates-only': True}
+
+    pushers = PusherGenerator().generate(prometheus_config)
+
+    db_factory = pushers['pytest-prometheus-pusher'].database_factory
+    assert db_factory.aggregates == [['sensor'], ['k8s_pod_namespace', 'sensor']]
+    assert db_factory.export_series is False
+
+
+@pytest.mark.parametrize(('aggregates', 'aggregates_only'), [(['sensor+sensor'], False), ([], True)])
+def test_pusher_generator_with_invalid_prometheus_aggregates(prometheus_config, aggregates, aggregates_only):
+    """
+    PusherGenerator should raise an exception when the aggregates are invalid, or missing while only them are exported.
+    """
+    prometheus_config['output']['pytest-prometheus-pusher'] |= {'aggregates': aggregates, 'aggregates-only': aggregates_only}
+
+    with pytest.raises(PowerAPIException):
+        PusherGenerator().generate(prometheus_config)
@@ -28,8 +28,10 @@
 
 from datetime import datetime, UTC
 
-from powerapi.database.clickhouse.codecs import PowerReportEncoder, ReportEncoders
-from powerapi.report import PowerReport
+from powerapi.database.clickhouse.codecs import (
+    FormulaReportColumnsEncoder, HWPCReportColumnsEncoder, PowerReportColumnsEncoder, PowerReportEncoder, ReportColumnsEncoders, ReportEncoders
+)
+from powerapi.report import FormulaReport, HWPCReport, PowerReport
 
 
 def test_get_power_report_encoder() -> None:
@@ -50,3 +52,72 @@ def test_encode_power_report() -> None:
 
     expected_metadata = {'scope': 'test', 'k8s_namespace': 'pytest'}
     assert encoded_report == (report.timestamp, 'sensor', 'pytest', 42.5, expected_metadata)
+
+
+def test_get_power_report_columns_encoder() -> None:
+    """
+    Registry should return the columns encoder corresponding to PowerReport.
+    """
+    assert ReportColumnsEncoders.get(PowerReport) is PowerReportColumnsEncoder
+
+
+def test_encode_power_reports_into_columns() -> None:
+    """
+    Columns encoder should append the values of the PowerReports to the columns and flatten their metadata.
+    """
+    timestamp = datetime.now(tz=UTC)
+    reports = [
+        PowerReport(timestamp, 'sensor', 'a', 42.5, {'scope': 'test', 'k8s': {'namespace': 'pytest'}}),
+        PowerReport(timestamp, 'sensor', 'b', 10.0),
+    ]
+    columns = [[] for _ in PowerReportColumnsEncoder.column_names]
+
+    size = PowerReportColumnsEncoder.encode(reports, columns)
+
+    assert columns == [
+        [timestamp, timestamp],
+        ['sensor', 'sensor'],
+        ['a', 'b'],
+        [42.5, 10.0],
+        [{'scope': 'test', 'k8s_namespace': 'pytest'}, {}],
+    ]
+    assert size == 2 * (16 + len('sensor') + 1) + len('scope') + len('test') + len('k8s_namespace') + len('pytest')
+
+
+def test_encode_hwpc_reports_into_columns() -> None:
+    """
+    Columns encoder should append a row for each CPU of each events group of the HWPCReports.
+    """
+    timestamp = datetime.now(tz=UTC)
+    groups = {
+        'rapl': {0: {0: {'RAPL_ENERGY_PKG': 1000}}},
+        'msr': {0: {0: {'TSC': 10, 'APERF': 5}, 1: {'TSC': 20, 'APERF': 6}}},
+    }
+    report = HWPCReport(timestamp, 'sensor', 'pytest', groups, {'socket': 0})
+    columns = [[] for _ in HWPCReportColumnsEncoder.column_names]
+
+    HWPCReportColumnsEncoder.encode([report], columns)
+
+    assert columns == [
+        [timestamp] * 3,
+        ['sensor'] * 3,
+        ['pytest'] * 3,
+        ['rapl', 'msr', 'msr'],
+        ['0', '0', '0'],
+        ['0', '0', '1'],
+        [{'RAPL_ENERGY_PKG': 1000}, {'TSC': 10, 'APERF': 5}, {'TSC': 20, 'APERF': 6}],
+        [{'socket': '0'}] * 3,
+    ]
+
+
+def test_encode_formula_reports_into_columns() -> None:
+    """
+    Columns encoder should append the values of the FormulaReports to the columns, their metadata values being converted to strings.
+    """
+    timestamp = datetime.now(tz=UTC)
+    report = FormulaReport(timestamp, 'sensor', 'pytest', {'ratio': 0.5, 'model': {'id': 3}})
+    columns = [[] for _ in FormulaReportColumnsEncoder.column_names]
+
+    FormulaReportColumnsEncoder.encode([report], columns)
+
+    assert columns == [[timestamp], ['sensor'], ['pytest'], [{'ratio': '0.5', 'model_id': '3'}]]
@@ -27,16 +27,21 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import pickle
+from datetime import datetime, UTC
 
 import pytest
 
 pytest.importorskip('powerapi.database.clickhouse.driver')  # The ClickHouse driver requires external dependencies to work.
 
-from powerapi.database.clickhouse.driver import ClickHouseOutput, ClickHouseOutputFactory
+from clickhouse_connect.driver.exceptions import OperationalError
+
+from powerapi.database.clickhouse.driver import ClickHouseOutput, ClickHouseOutputFactory, ClickHouseWriteOptions
+from powerapi.database.clickhouse.schema import TableOptions
+from powerapi.database.exceptions import WriteFailed
 from powerapi.report import PowerReport, Report, HWPCReport, FormulaReport
 
 
-@pytest.mark.parametrize('report_type', [PowerReport])
+@pytest.mark.parametrize('report_type', [PowerReport, HWPCReport, FormulaReport])
 def test_create_clickhouse_output(report_type: type[Report]) -> None:
     """
     Factory should create a ClickHouse output for supported report types.
@@ -53,7 +58,7 @@ def test_create_clickhouse_output(report_type: type[Report]) -> None:
     assert output.database_name == 'powerapi'
 
 
-@pytest.mark.parametrize('report_type', [Report, HWPCReport, FormulaReport])
+@pytest.mark.parametrize('report_type', [Report])
 def test_create_factory_with_unsupported_report_type(report_type: type[Report]) -> None:
     """
     Factory should reject report types unsupported by the ClickHouse output.
@@ -69,3 +74,156 @@ def test_clickhouse_output_factory_is_picklable() -> None:
     factory = ClickHouseOutputFactory(PowerReport, 'localhost', 8123, 'pytest', 'pytest', 'powerapi')
 
     pickle.dumps(factory)
+
+
+@pytest.mark.parametrize('write_options', [
+    ClickHouseWriteOptions(buffer_rows=0),
+    ClickHouseWriteOptions(buffer_bytes=0),
+    ClickHouseWriteOptions(flush_interval=-1.0),
+])
+def test_create_factory_with_invalid_write_options(write_options: ClickHouseWriteOptions) -> None:
+    """
+    Factory should reject invalid buffer sizes and flush intervals.
+    """
+    with pytest.raises(ValueError, match=r'Invalid (buffer size|flush interval)'):
+        ClickHouseOutputFactory(PowerReport, 'localhost', 8123, 'pytest', 'pytest', 'powerapi', write_options)
+
+
+@pytest.mark.parametrize(('report_type', 'table_options'), [
+    (PowerReport, TableOptions(partition_by='year')),
+    (PowerReport, TableOptions(ttl_days=-1)),
+    (PowerReport, TableOptions(rollup_ttl_days=-1)),
+    (PowerReport, TableOptions(rollups=('second',))),
+    (HWPCReport, TableOptions(rollups=('minute',))),
+])
+def test_create_factory_with_invalid_table_options(report_type: type[Report], table_options: TableOptions) -> None:
+    """
+    Factory should reject invalid partitionings, TTLs and rollups, and the rollups of the reports without power.
+    """
+    with pytest.raises(ValueError, match=r'Invalid (partitioning|TTL|rollup)'):
+        ClickHouseOutputFactory(report_type, 'localhost', 8123, 'pytest', 'pytest', 'powerapi', table_options=table_options)
+
+
+def test_async_insert_settings() -> None:
+    """
+    Write options should give the settings of the server-side asynchronous inserts, when enabled.
+    """
+    assert ClickHouseWriteOptions().insert_settings() == {}
+    assert ClickHouseWriteOptions(async_insert=True).insert_settings() == {'async_insert': 1, 'wait_for_async_insert': 1}
+    assert ClickHouseWriteOptions(async_insert=True, wait_for_async_insert=False).insert_settings() == {'async_insert': 1, 'wait_for_async_insert': 0}
+
+
+class InsertRecorder:
+    """
+    ClickHouse client stand-in recording the column-oriented inserts, optionally failing them.
+    """
+
+    def __init__(self):
+        self.inserts = []
+        self.fail = False
+
+    def insert(self, data: list[list], context: object) -> None:
+        if self.fail:
+            raise OperationalError('Server unavailable')
+
+        self.inserts.append([list(column) for column in data])
+
+    def close(self) -> None:
+        pass
+
+
+def make_output(write_options: ClickHouseWriteOptions) -> tuple[ClickHouseOutput, InsertRecorder]:
+    """
+    Create a ClickHouse output inserting into a recorder.
+    """
+    output = ClickHouseOutput(PowerReport, 'localhost', 8123, 'pytest', 'pytest', 'powerapi', write_options)
+    output._client = InsertRecorder()
+    return output, output._client
+
+
+def make_reports(*targets: str) -> list[PowerReport]:
+    """
+    Create a PowerReport for each given target.
+    """
+    return [PowerReport(datetime(2026, 1, 1, tzinfo=UTC), 'sensor', target, 42.0) for target in targets]
+
+
+def test_reports_are_buffered_until_buffer_is_full() -> None:
+    """
+    Output should insert the buffered reports in a single block once the buffer holds the maximum number of rows.
+    """
+    output, client = make_output(ClickHouseWriteOptions(buffer_rows=3, flush_interval=3600))
+
+    output.write(make_reports('a', 'b'))
+    assert client.inserts == []
+
+    output.write(make_reports('c'))
+    assert [insert[2] for insert in client.inserts] == [['a', 'b', 'c']]
+
+
+def test_reports_are_inserted_on_each_write_without_flush_interval() -> None:
+    """
+    Output should insert the reports on each write when the flush interval is zero.
+    """
+    output, client = make_output(ClickHouseWriteOptions(flush_interval=0))
+
+    output.write(make_reports('a'))
+    output.write(make_reports('b'))
+
+    assert [insert[2] for insert in client.inserts] == [['a'], ['b']]
+
+
+def test_buffered_reports_are_inserted_on_disconnect() -> None:
+    """
+    Output should insert the buffered reports when disconnecting.
+    """
+    output, client = make_output(ClickHouseWriteOptions(flush_interval=3600))
+
+    output.write(make_reports('a'))
+    output.disconnect()
+
+    assert [insert[2] for insert in client.inserts] == [['a']]
+
+
+def test_failed_write_removes_its_reports_from_buffer() -> None:
+    """
+    Output should remove the reports of a failed write from its buffer, keeping the previously buffered ones.
+    """
+    output, client = make_output(ClickHouseWriteOptions(buffer_rows=2, flush_interval=3600))
+    output.write(make_reports('a'))
+
+    client.fail = True
+    with pytest.raises(WriteFailed):
+        output.write(make_reports('b'))
+
+    client.fail = False
+    output.write(make_reports('b'))
+
+    assert [insert[2] for insert in client.inserts] == [['a', 'b']]
+
+
+class CommandRecorder(InsertRecorder):
+    """
+    ClickHouse client stand-in also recording the commands.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.commands = []
+
+    def command(self, query: str) -> None:
+        self.commands.append(query)
+
+
+def test_create_table_with_rollups() -> None:
+    """
+    Output should create the table of the reports, then the rollup tables and their materialized views.
+    """
+    output = ClickHouseOutput(PowerReport, 'localhost', 8123, 'pytest', 'pytest', 'powerapi',
+                              table_options=TableOptions(rollups=('minute', 'hour')))
+    output._client = CommandRecorder()
+
+    output._create_table()
+
+    created_objects = [query.split('`')[1] for query in output._client.commands]
+    assert created_objects == ['powerrep', 'powerrep_minute', 'powerrep_minute_mv', 'powerrep_hour', 'powerrep_hour_mv']
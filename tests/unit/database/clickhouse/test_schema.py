@@ -28,8 +28,10 @@
 
 import pytest
 
-from powerapi.database.clickhouse.schema import PowerReportTableSchema, TableSchemaRegistry
-from powerapi.report import Report, PowerReport
+from powerapi.database.clickhouse.schema import (
+    FormulaReportTableSchema, HWPCReportTableSchema, PowerReportTableSchema, TableOptions, TableSchemaRegistry
+)
+from powerapi.report import FormulaReport, HWPCReport, Report, PowerReport
 
 
 class UnsupportedReport(Report):
@@ -38,11 +40,16 @@ class UnsupportedReport(Report):
     """
 
 
-def test_get_known_report_table_schema() -> None:
+@pytest.mark.parametrize(('report_type', 'table_schema'), [
+    (PowerReport, PowerReportTableSchema),
+    (HWPCReport, HWPCReportTableSchema),
+    (FormulaReport, FormulaReportTableSchema),
+])
+def test_get_known_report_table_schema(report_type: type[Report], table_schema: type) -> None:
     """
     Registry should return the table schema corresponding to the report type.
     """
-    assert TableSchemaRegistry.get(PowerReport) is PowerReportTableSchema
+    assert TableSchemaRegistry.get(report_type) is table_schema
 
 
 def test_get_unknown_report_table_schema() -> None:
@@ -51,3 +58,39 @@ def test_get_unknown_report_table_schema() -> None:
     """
     with pytest.raises(ValueError, match=f'Unknown report type: {UnsupportedReport.__name__}'):
         TableSchemaRegistry.get(UnsupportedReport)
+
+
+@pytest.mark.parametrize('table_schema', [PowerReportTableSchema, HWPCReportTableSchema, FormulaReportTableSchema])
+def test_create_table_query_with_partitioning_and_ttl(table_schema: type) -> None:
+    """
+    Create table query should partition the table and delete its rows after the TTL, when requested.
+    """
+    query = table_schema.build_create_table_query(TableOptions(partition_by='month', ttl_days=30))
+
+    assert 'PARTITION BY toYYYYMM(timestamp)' in query
+    assert 'TTL toDateTime(timestamp) + INTERVAL 30 DAY' in query
+    assert 'PARTITION BY' not in table_schema.build_create_table_query()
+    assert 'TTL' not in table_schema.build_create_table_query()
+
+
+def test_create_power_rollup_queries() -> None:
+    """
+    Rollup queries should create a rollup table and the materialized view filling it for each period.
+    """
+    queries = PowerReportTableSchema.build_create_rollup_queries(TableOptions(partition_by='day', rollups=('hour',), rollup_ttl_days=365))
+
+    assert len(queries) == 2
+    create_table_query, create_view_query = queries
+    assert 'CREATE TABLE IF NOT EXISTS `powerrep_hour`' in create_table_query
+    assert 'PARTITION BY toYYYYMMDD(period)' in create_table_query
+    assert 'TTL toDateTime(period) + INTERVAL 365 DAY' in create_table_query
+    assert 'CREATE MATERIALIZED VIEW IF NOT EXISTS `powerrep_hour_mv` TO `powerrep_hour`' in create_view_query
+    assert 'toStartOfHour(`timestamp`) AS `period`' in create_view_query
+
+
+def test_create_rollup_queries_without_rollups() -> None:
+    """
+    Rollup queries should be empty when no rollup is requested, or for the reports without power.
+    """
+    assert PowerReportTableSchema.build_create_rollup_queries() == []
+    assert HWPCReportTableSchema.build_create_rollup_queries(TableOptions(rollups=('minute',))) == []
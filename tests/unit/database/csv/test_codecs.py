@@ -29,8 +29,11 @@
 
 from datetime import datetime, UTC
 
-from powerapi.database.csv.codecs import HWPCReportDecoder
-from powerapi.report import HWPCReport
+import pytest
+
+from powerapi.database.csv.codecs import FormulaReportEncoder, HWPCReportDecoder, PowerReportEncoder
+from powerapi.database.csv.fileio_handlers import CsvRows
+from powerapi.report import FormulaReport, HWPCReport, PowerReport
 
 
 class TestHwPCReportDecoder:
@@ -59,17 +62,27 @@ class TestHwPCReportDecoder:
             **events
         }
 
+    @staticmethod
+    def _make_csv_rows(rows: list[dict[str, str]]) -> CsvRows:
+        """
+        Create the positional rows of a CSV file from HWPC CSV rows.
+        :param rows: HWPC CSV rows as column/value pairs
+        :return: Rows stored as lists of values ordered as the columns of the file
+        """
+        fieldnames = tuple(rows[0])
+        return CsvRows(fieldnames, [[row[name] for name in fieldnames] for row in rows])
+
     def test_decode_valid_csv_lines_with_one_events_group(self):
         """
         Test to decode valid CSV lines with one events group.
         """
         ts = int(datetime.now(tz=UTC).timestamp() * 1000)  # milliseconds
-        rows = {'test': [
+        rows = {'test': self._make_csv_rows([
             self._make_row(timestamp=ts, sensor='pytest', target='example', socket='0', cpu='0', event1='1', event2='1'),
             self._make_row(timestamp=ts, sensor='pytest', target='example', socket='0', cpu='1', event1='2', event2='2'),
             self._make_row(timestamp=ts, sensor='pytest', target='example', socket='1', cpu='0', event1='3', event2='3'),
             self._make_row(timestamp=ts, sensor='pytest', target='example', socket='1', cpu='1', event1='4', event2='4'),
-        ]}
+        ])}
 
         report = HWPCReportDecoder.decode(rows)
 
@@ -93,14 +106,14 @@ class TestHwPCReportDecoder:
         """
         ts = int(datetime.now(tz=UTC).timestamp() * 1000)  # milliseconds
         rows = {
-            'core': [
+            'core': self._make_csv_rows([
                 self._make_row(timestamp=ts, sensor='pytest', target='example', socket='0', cpu='0', cycles='1', instructions='1'),
                 self._make_row(timestamp=ts, sensor='pytest', target='example', socket='1', cpu='1', cycles='2', instructions='2'),
-            ],
-            'rapl': [
+            ]),
+            'rapl': self._make_csv_rows([
                 self._make_row(timestamp=ts, sensor='pytest', target='example', socket='0', cpu='0', energy_uj='3'),
                 self._make_row(timestamp=ts, sensor='pytest', target='example', socket='1', cpu='1', energy_uj='4'),
-            ],
+            ]),
         }
 
         report = HWPCReportDecoder.decode(rows)
@@ -123,12 +136,12 @@ class TestHwPCReportDecoder:
         """
         Decoder should group rows by socket regardless of their input order.
         """
-        rows = {'test': [
+        rows = {'test': self._make_csv_rows([
             self._make_row(timestamp=0, sensor='pytest', target='example', socket='1', cpu='0', event='1'),
             self._make_row(timestamp=0, sensor='pytest', target='example', socket='0', cpu='0', event='2'),
             self._make_row(timestamp=0, sensor='pytest', target='example', socket='1', cpu='4', event='3'),
             self._make_row(timestamp=0, sensor='pytest', target='example', socket='0', cpu='4', event='4'),
-        ]}
+        ])}
 
         report = HWPCReportDecoder.decode(rows)
 
@@ -137,3 +150,51 @@ class TestHwPCReportDecoder:
         assert report.groups['test']['0']['0'] == {'event': 2}
         assert report.groups['test']['1']['4'] == {'event': 3}
         assert report.groups['test']['0']['4'] == {'event': 4}
+
+    def test_decode_non_contiguous_event_columns(self):
+        """
+        Decoder should locate the event columns when they are interleaved with the report columns.
+        """
+        rows = {'test': CsvRows(
+            ('event1', 'timestamp', 'sensor', 'target', 'metadata', 'socket', 'event2', 'cpu'),
+            [['1', '0', 'pytest', 'example', '', '0', '2', '0'], ['3', '0', 'pytest', 'example', '', '0', '4', '1']],
+        )}
+
+        report = HWPCReportDecoder.decode(rows)
+
+        assert report.groups['test']['0']['0'] == {'event1': 1, 'event2': 2}
+        assert report.groups['test']['0']['1'] == {'event1': 3, 'event2': 4}
+
+    def test_decode_rejects_rows_with_missing_event_values(self):
+        """
+        Decoder should reject rows having less values than the event columns of the file.
+        """
+        rows = {'test': CsvRows(
+            ('timestamp', 'sensor', 'target', 'socket', 'cpu', 'event1', 'event2'),
+            [['0', 'pytest', 'example', '0', '0', '1', '2'], ['0', 'pytest', 'example', '0', '1', '3']],
+        )}
+
+        with pytest.raises(ValueError, match='Missing event values'):
+            HWPCReportDecoder.decode(rows)
+
+
+def test_encode_power_report_as_positional_row():
+    """
+    Power report encoder should return a single row ordered as its fieldnames.
+    """
+    report = PowerReport(datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=UTC), 'pytest', 'example', 42.5)
+
+    assert PowerReportEncoder.encode(report) == {
+        'power': CsvRows(('timestamp', 'sensor', 'target', 'power'), [('2026-01-02T03:04:05.678+00:00', 'pytest', 'example', '42.5')]),
+    }
+
+
+def test_encode_formula_report_as_positional_row():
+    """
+    Formula report encoder should return a single row ordered as its fieldnames.
+    """
+    report = FormulaReport(datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC), 'pytest', 'example', {})
+
+    assert FormulaReportEncoder.encode(report) == {
+        'formula': CsvRows(('timestamp', 'sensor', 'target'), [('2026-01-02T03:04:05.000+00:00', 'pytest', 'example')]),
+    }
@@ -95,3 +95,58 @@ def test_csv_output_factory_is_picklable() -> None:
     factory = CSVOutputFactory(PowerReport, 'output')
 
     pickle.dumps(factory)
+
+
+def test_create_csv_input_factory_with_invalid_compression_method() -> None:
+    """
+    Factory should reject unknown input compression methods.
+    """
+    with pytest.raises(ValueError, match='Unknown compression method: invalid'):
+        CSVInputFactory(HWPCReport, ['core.csv'], 'invalid')
+
+
+def test_create_csv_output_factory_with_invalid_compression_method() -> None:
+    """
+    Factory should reject unknown output compression methods.
+    """
+    with pytest.raises(ValueError, match='Unknown compression method: invalid'):
+        CSVOutputFactory(PowerReport, 'output', 'invalid')
+
+
+@pytest.mark.parametrize('parsing_workers', [0, -1])
+def test_create_csv_input_factory_with_invalid_parsing_workers(parsing_workers: int) -> None:
+    """
+    Factory should reject a number of parsing workers lower than one.
+    """
+    with pytest.raises(ValueError, match=f'Invalid number of parsing workers: {parsing_workers}'):
+        CSVInputFactory(HWPCReport, ['core.csv'], parsing_workers=parsing_workers)
+
+
+@pytest.mark.parametrize(('time_from', 'time_to', 'expected_message'), [
+    ('2026-01-02', '2026-01-01', 'Invalid time window'),
+    ('2026-01-01', '2026-01-01T00:00:00+00:00', 'Invalid time window'),
+    ('yesterday', None, 'Invalid isoformat string'),
+])
+def test_create_csv_input_factory_with_invalid_time_window(time_from: str, time_to: str | None, expected_message: str) -> None:
+    """
+    Factory should reject malformed or empty time windows.
+    """
+    with pytest.raises(ValueError, match=expected_message):
+        CSVInputFactory(HWPCReport, ['core.csv'], time_from=time_from, time_to=time_to)
+
+
+@pytest.mark.parametrize(('options', 'expected_message'), [
+    ({'buffer_size': -1}, 'Invalid write buffer size'),
+    ({'rotation_size': -1}, 'Invalid rotation size or interval'),
+    ({'rotation_interval': -1.0}, 'Invalid rotation size or interval'),
+    ({'segments_compression': 'invalid'}, 'Unknown compression method: invalid'),
+    ({'compression': 'gzip', 'segments_compression': 'gzip'}, 'requires uncompressed output files'),
+    ({'index_block_size': -1}, 'Invalid time index block size'),
+    ({'compression': 'gzip', 'index_block_size': 1024}, 'The time index requires uncompressed output files'),
+])
+def test_create_csv_output_factory_with_invalid_options(options: dict, expected_message: str) -> None:
+    """
+    Factory should reject invalid buffering, rotation and segments compression options.
+    """
+    with pytest.raises(ValueError, match=expected_message):
+        CSVOutputFactory(PowerReport, 'output', **options)
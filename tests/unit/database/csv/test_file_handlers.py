@@ -0,0 +1,92 @@
+# Copyright (c) 2026, Inria
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from pathlib import Path
+
+import pytest
+
+from powerapi.database.csv.file_handlers import FileHandlerRegistry, RawFileHandler
+from powerapi.database.file_handlers import GzipFileHandler, LzmaFileHandler, ZstdFileHandler
+
+
+@pytest.mark.parametrize('file_extension', ['.csv', '.txt', ''])
+def test_registry_get_none_compression_method_from_file_extension(file_extension):
+    """
+    Auto-detection should resolve files without a compression suffix to the raw file handler.
+    """
+    handler = FileHandlerRegistry.get('auto', Path(f'/tmp/pytest-powerapi{file_extension}'))
+
+    assert handler is RawFileHandler
+
+
+@pytest.mark.parametrize(('file_extension', 'expected_handler'), [
+    ('.csv.gz', GzipFileHandler),
+    ('.csv.xz', LzmaFileHandler),
+    ('.csv.zst', ZstdFileHandler),
+])
+def test_registry_get_compressed_file_handler_from_file_extension(file_extension, expected_handler):
+    """
+    Auto-detection should resolve compression suffixes to their file handler.
+    """
+    handler = FileHandlerRegistry.get('auto', Path(f'/tmp/pytest-powerapi{file_extension}'))
+
+    assert handler is expected_handler
+
+
+def test_registry_get_invalid_compression_method():
+    """
+    Registry should raise a ValueError for an unsupported compression method.
+    """
+    with pytest.raises(ValueError, match='Unknown compression method'):
+        FileHandlerRegistry.get('invalid', Path('/tmp/pytest-powerapi.csv'))
+
+
+def test_registry_get_unavailable_compression_method(monkeypatch):
+    """
+    Registry should raise a ValueError when the dependencies of the compression method are missing.
+    """
+    monkeypatch.setattr(ZstdFileHandler, 'is_available', classmethod(lambda cls: False))
+
+    with pytest.raises(ValueError, match='Unavailable compression method'):
+        FileHandlerRegistry.get('zstd', Path('/tmp/pytest-powerapi.csv'))
+
+
+@pytest.mark.parametrize(('filename', 'expected_stem'), [
+    ('core.csv', 'core'),
+    ('core.csv.gz', 'core'),
+    ('core.csv.xz', 'core'),
+    ('core.csv.zst', 'core'),
+    ('core.v1.csv', 'core.v1'),
+])
+def test_registry_stem_strips_compression_suffix(filename, expected_stem):
+    """
+    Stem should strip the compression suffix and the extension of the file name.
+    """
+    filepath = Path('/tmp') / filename
+
+    assert FileHandlerRegistry.stem(filepath, FileHandlerRegistry.get('auto', filepath)) == expected_stem
@@ -27,14 +27,20 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import csv
+import gzip
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
 from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
 
+from powerapi.database.csv import fileio_handlers
 from powerapi.database.csv.fileio_handlers import (
+    CsvRows,
     MultiCsvFileReader,
     MultiCsvFileWriter,
+    ParallelCsvFileReader,
     SingleCsvFileReader,
     SingleCsvFileWriter,
 )
@@ -331,6 +337,47 @@ class TestSingleCsvFileReader:
         assert reader.next_rows() == [expected_row]
         reader.close()
 
+    def test_next_csv_rows_returns_positional_rows(self, csv_row_groups, csv_group_file_factory):
+        """
+        Reader should return the rows as lists of values along with the column names of the file.
+        """
+        filepath = csv_group_file_factory(csv_row_groups[:2], filename='positional.csv')
+        reader = SingleCsvFileReader(filepath)
+        reader.open()
+
+        csv_rows = reader.next_csv_rows()
+
+        assert csv_rows.fieldnames == tuple(FIELDNAMES)
+        assert csv_rows.rows == [list(row.values()) for row in csv_row_groups[0]]
+        reader.close()
+
+    def test_next_rows_skips_blank_lines(self, tmp_path):
+        """
+        Reader should ignore the blank lines of the input file.
+        """
+        filepath = tmp_path / 'blank-lines.csv'
+        filepath.write_text('timestamp,sensor,target,value\n\n100,sensor,target,1\n\n100,sensor,target,2\n', encoding='utf-8')
+        reader = SingleCsvFileReader(filepath)
+        reader.open()
+
+        assert reader.next_rows() == [make_row(100, value='1'), make_row(100, value='2')]
+        assert reader.next_rows() == []
+        reader.close()
+
+    def test_next_rows_merges_rows_with_equivalent_timestamps(self, csv_file_factory):
+        """
+        Reader should group rows whose timestamps have the same value but a different representation.
+        """
+        padded_row = make_row(100, value='2')
+        padded_row['timestamp'] = '0100'
+        filepath = csv_file_factory([make_row(100, value='1'), padded_row, make_row(101)], filename='padded-timestamp.csv')
+        reader = SingleCsvFileReader(filepath)
+        reader.open()
+
+        assert reader.next_rows() == [make_row(100, value='1'), padded_row]
+        assert reader.next_rows() == [make_row(101)]
+        reader.close()
+
     @pytest.mark.parametrize(
         'timestamp',
         ['invalid', '1.5', ''],
@@ -434,6 +481,111 @@ class TestSingleCsvFileReader:
         file.close.assert_called_once_with()
 
 
+class TestParallelCsvFileReader:
+    """
+    Test class for ParallelCsvFileReader.
+    """
+
+    @pytest.fixture
+    def executor(self):
+        """
+        Return an executor parsing the chunks in threads, to avoid spawning processes for each test.
+        """
+        with ThreadPoolExecutor(2) as executor:
+            yield executor
+
+    @pytest.mark.parametrize('chunk_size', [1, 64, 1024 * 1024])
+    def test_next_rows_returns_groups_in_file_order(self, csv_row_groups, csv_group_file_factory, executor, chunk_size):
+        """
+        Reader should return the same groups as the sequential reader whatever the size of the chunks.
+        """
+        filepath = csv_group_file_factory(csv_row_groups, filename='groups.csv')
+        reader = ParallelCsvFileReader(filepath, executor, 2, chunk_size)
+        reader.open()
+
+        assert [reader.next_rows() for _ in csv_row_groups] == csv_row_groups
+        assert reader.cursor() is None
+        assert reader.next_rows() == []
+        reader.close()
+
+    def test_chunks_are_aligned_on_group_boundaries(self, csv_group_file_factory, executor):
+        """
+        Reader should never split the rows of a group across several chunks.
+        """
+        row_groups = [[make_row(timestamp, value=str(index)) for index in range(8)] for timestamp in range(100, 110)]
+        filepath = csv_group_file_factory(row_groups, filename='large-groups.csv')
+        submitted_chunks = []
+        submit = executor.submit
+
+        def spy_submit(fn, *args):
+            future = submit(fn, *args)
+            submitted_chunks.append(future)
+            return future
+
+        with pytest.MonkeyPatch.context() as patch:
+            patch.setattr(executor, 'submit', spy_submit)
+            reader = ParallelCsvFileReader(filepath, executor, 4, 1)
+            reader.open()
+
+            assert [reader.next_rows() for _ in row_groups] == row_groups
+            reader.close()
+
+        assert len(submitted_chunks) == len(row_groups)
+        assert all(len(future.result()[0]) == 1 for future in submitted_chunks)
+
+    def test_next_rows_merges_rows_with_equivalent_timestamps(self, csv_file_factory, executor):
+        """
+        Reader should merge rows of the same cursor written differently, even when they are parsed in different chunks.
+        """
+        padded_row = make_row(100, value='2')
+        padded_row['timestamp'] = '0100'
+        filepath = csv_file_factory([make_row(100, value='1'), padded_row, make_row(101)], filename='padded-timestamp.csv')
+        reader = ParallelCsvFileReader(filepath, executor, 2, 1)
+        reader.open()
+
+        assert reader.next_rows() == [make_row(100, value='1'), padded_row]
+        assert reader.next_rows() == [make_row(101)]
+        reader.close()
+
+    @pytest.mark.parametrize('chunk_size', [1, 1024 * 1024])
+    def test_next_rows_rejects_decreasing_timestamp_with_its_line(self, csv_file_factory, executor, chunk_size):
+        """
+        Reader should report the line of a timestamp regression as the sequential reader does.
+        """
+        filepath = csv_file_factory([make_row(100), make_row(101), make_row(99)], filename='decreasing-timestamp.csv')
+        reader = ParallelCsvFileReader(filepath, executor, 2, chunk_size)
+        reader.open()
+        reader.next_rows()
+
+        with pytest.raises(ValueError, match=r'Timestamp regression at .*decreasing-timestamp\.csv:4$'):
+            reader.next_rows()
+
+        reader.close()
+
+    def test_open_empty_file_returns_no_rows(self, empty_csv_file, executor):
+        """
+        Reader should expose no cursor and return no rows for an empty file.
+        """
+        reader = ParallelCsvFileReader(empty_csv_file, executor, 2, 1)
+        reader.open()
+
+        assert reader.cursor() is None
+        assert reader.next_rows() == []
+        reader.close()
+
+    def test_open_rejects_missing_cursor_column(self, csv_file_factory, executor):
+        """
+        Reader should reject a file whose header is missing a cursor column, and release it.
+        """
+        filepath = csv_file_factory([{'timestamp': '100', 'sensor': 'sensor'}], filename='missing-target.csv')
+        reader = ParallelCsvFileReader(filepath, executor, 2, 1)
+
+        with pytest.raises(KeyError):
+            reader.open()
+
+        assert reader._file is None
+
+
 class TestMultiCsvFileReader:
     """
     Test class for MultiCsvFileReader.
@@ -514,6 +666,96 @@ class TestMultiCsvFileReader:
         assert reader.next_rows() == {'long': row_groups_by_filename['long.csv'][1]}
         reader.close()
 
+    def test_next_rows_only_reads_files_positioned_at_current_cursor(self, multi_csv_row_groups, multi_csv_file_factory):
+        """
+        Reader should not read the files whose cursor is ahead of the current cursor.
+        """
+        reader = MultiCsvFileReader(multi_csv_file_factory(multi_csv_row_groups))
+        reader.open()
+        read_group_names = []
+        next_csv_rows = SingleCsvFileReader.next_csv_rows
+
+        def spy_next_csv_rows(file_reader, row_cursor=None):
+            read_group_names.append(file_reader.group_name)
+            return next_csv_rows(file_reader, row_cursor)
+
+        with pytest.MonkeyPatch.context() as patch:
+            patch.setattr(SingleCsvFileReader, 'next_csv_rows', spy_next_csv_rows)
+            reader.next_rows()
+            reader.next_rows()
+
+        assert read_group_names == ['first', 'second', 'second']
+        reader.close()
+
+    def test_next_rows_rejects_decreasing_timestamp_in_one_file(self, multi_csv_file_factory):
+        """
+        Reader should propagate the timestamp regression detected in one of the input files.
+        """
+        row_groups_by_filename = {
+            'monotonic.csv': [[make_row(100)], [make_row(101)]],
+            'decreasing.csv': [[make_row(100)], [make_row(99)]],
+        }
+        reader = MultiCsvFileReader(multi_csv_file_factory(row_groups_by_filename))
+        reader.open()
+
+        with pytest.raises(ValueError, match='Timestamp regression'):
+            reader.next_rows()
+
+        reader.close()
+
+    def test_parsing_workers_read_uncompressed_and_compressed_files(self, multi_csv_row_groups, multi_csv_file_factory):
+        """
+        Reader should parse the uncompressed files in worker processes and merge them with the compressed files.
+        """
+        first_filepath, second_filepath = multi_csv_file_factory(multi_csv_row_groups)
+        compressed_filepath = second_filepath.with_name('second.csv.gz')
+        with gzip.open(compressed_filepath, 'wb') as file:
+            file.write(second_filepath.read_bytes())
+        second_filepath.unlink()
+
+        reader = MultiCsvFileReader([first_filepath, compressed_filepath], parsing_workers=2)
+        reader.open()
+
+        assert isinstance(reader._file_readers['first'], ParallelCsvFileReader)
+        assert isinstance(reader._file_readers['second'], SingleCsvFileReader)
+        assert reader.next_rows() == {
+            'first': multi_csv_row_groups['first.csv'][0],
+            'second': multi_csv_row_groups['second.csv'][0],
+        }
+        assert reader.next_rows() == {'second': multi_csv_row_groups['second.csv'][1]}
+        assert reader.next_rows() == {
+            'first': multi_csv_row_groups['first.csv'][1],
+            'second': multi_csv_row_groups['second.csv'][2],
+        }
+        assert reader.next_rows() == {}
+        reader.close()
+
+        assert reader._parsing_executor is None
+
+    def test_time_window_reads_only_the_indexed_blocks(self, tmp_path):
+        """
+        Reader should only read the blocks of the time index overlapping the time window, and skip the files without them.
+        """
+        writer = MultiCsvFileWriter(tmp_path, index_block_size=1)
+        writer.open()
+        for timestamp in range(100, 110):
+            writer.write_csv_rows({'first': CsvRows(tuple(FIELDNAMES), [tuple(make_row(timestamp).values())])})
+        writer.write_csv_rows({'second': CsvRows(tuple(FIELDNAMES), [tuple(make_row(200).values())])})
+        writer.close()
+
+        # Corrupt the first row, so that reading it makes the reader fail.
+        first_filepath = tmp_path / 'first.csv'
+        first_filepath.write_bytes(first_filepath.read_bytes().replace(b'100,', b'xyz,', 1))
+        time_window = (datetime.fromtimestamp(0.104, tz=UTC), datetime.fromtimestamp(0.106, tz=UTC))
+        reader = MultiCsvFileReader([first_filepath, tmp_path / 'second.csv'], time_from=time_window[0], time_to=time_window[1])
+        reader.open()
+
+        assert list(reader._file_readers) == ['first']
+        assert reader.next_rows() == {'first': [make_row(104)]}
+        assert reader.next_rows() == {'first': [make_row(105)]}
+        assert reader.next_rows() == {}
+        reader.close()
+
     def test_open_failure_closes_all_pending_readers(self):
         """
         Reader should roll back all pending readers when one file fails to open.
@@ -613,6 +855,64 @@ class TestSingleCsvFileWriter:
         with filepath.open(encoding='utf-8', newline='') as file:
             assert list(csv.DictReader(file)) == first_rows + second_rows
 
+    def test_write_csv_rows_writes_positional_rows(self, tmp_path):
+        """
+        Writer should write rows stored as tuples of values ordered as the fieldnames.
+        """
+        filepath = tmp_path / 'positional.csv'
+        writer = SingleCsvFileWriter(filepath, FIELDNAMES)
+
+        writer.open()
+        writer.write_csv_rows([('100', 'sensor', 'target', '1'), ('101', 'sensor', 'target', '2')])
+        writer.close()
+
+        with filepath.open(encoding='utf-8', newline='') as file:
+            assert list(csv.DictReader(file)) == [make_row(100, value='1'), make_row(101, value='2')]
+
+    def test_write_rows_are_buffered_until_the_buffer_is_full(self, tmp_path):
+        """
+        Writer should keep the rows in its buffer until it exceeds the buffer size, then write them all at once.
+        """
+        filepath = tmp_path / 'buffered.csv'
+        writer = SingleCsvFileWriter(filepath, FIELDNAMES, buffer_size=64)
+        writer.open()
+
+        writer.write_csv_rows([('100', 'sensor', 'target', '1')])
+        writer._file.flush()
+        assert filepath.read_text(encoding='utf-8') == ''
+
+        writer.write_csv_rows([('101', 'sensor', 'target', '2')])
+        writer._file.flush()
+        assert len(filepath.read_text(encoding='utf-8').splitlines()) == 3
+        assert writer.size == len(filepath.read_bytes())
+
+        writer.write_csv_rows([('102', 'sensor', 'target', '3')])
+        writer.close()
+
+        with filepath.open(encoding='utf-8', newline='') as file:
+            assert [row['value'] for row in csv.DictReader(file)] == ['1', '2', '3']
+
+    def test_write_rows_are_flushed_once_the_flush_interval_elapsed(self, tmp_path, monkeypatch):
+        """
+        Writer should write the buffered rows to the file once the flush interval elapsed, even if the buffer is not full.
+        """
+        clock = [0.0]
+        monkeypatch.setattr(fileio_handlers, 'monotonic', lambda: clock[0])
+        filepath = tmp_path / 'interval.csv'
+        writer = SingleCsvFileWriter(filepath, FIELDNAMES, buffer_size=1024)
+        writer.open()
+
+        writer.write_csv_rows([('100', 'sensor', 'target', '1')])
+        writer._file.flush()
+        assert filepath.read_text(encoding='utf-8') == ''
+
+        clock[0] += writer.flush_interval
+        writer.write_csv_rows([('101', 'sensor', 'target', '2')])
+        writer._file.flush()
+        assert len(filepath.read_text(encoding='utf-8').splitlines()) == 3
+
+        writer.close()
+
     def test_close_releases_file_and_clears_state(self, tmp_path):
         """
         Writer should close its file and clear all writing state.
@@ -729,3 +1029,137 @@ class TestMultiCsvFileWriter:
 
         first_writer.close.assert_called_once_with()
         second_writer.close.assert_called_once_with()
+
+    @pytest.mark.parametrize(('compression', 'expected_filename'), [
+        ('none', 'pytest.csv'),
+        ('gzip', 'pytest.csv.gz'),
+        ('lzma', 'pytest.csv.xz'),
+    ])
+    def test_compressed_files_are_read_back_with_their_group_name(self, tmp_path, compression, expected_filename):
+        """
+        Files written with a compression method should be suffixed accordingly and be read back transparently.
+        """
+        expected_rows = [make_row(100, value='first'), make_row(101, value='second')]
+        writer = MultiCsvFileWriter(tmp_path, compression)
+        writer.open()
+        writer.write_rows({'pytest': expected_rows})
+        writer.close()
+
+        assert [filepath.name for filepath in tmp_path.iterdir()] == [expected_filename]
+
+        reader = MultiCsvFileReader([tmp_path / expected_filename])
+        reader.open()
+
+        assert reader.next_rows() == {'pytest': expected_rows[:1]}
+        assert reader.next_rows() == {'pytest': expected_rows[1:]}
+        assert reader.next_rows() == {}
+        reader.close()
+
+    def test_zstd_compressed_files_are_read_back_with_their_group_name(self, tmp_path):
+        """
+        Files written with the zstd compression method should be read back transparently when it is available.
+        """
+        pytest.importorskip('zstandard')
+        expected_rows = [make_row(100)]
+        writer = MultiCsvFileWriter(tmp_path, 'zstd')
+        writer.open()
+        writer.write_rows({'pytest': expected_rows})
+        writer.close()
+
+        reader = MultiCsvFileReader([tmp_path / 'pytest.csv.zst'])
+        reader.open()
+
+        assert reader.next_rows() == {'pytest': expected_rows}
+        reader.close()
+
+    def test_invalid_compression_method_is_rejected(self, tmp_path):
+        """
+        Writer should reject an unknown compression method.
+        """
+        with pytest.raises(ValueError, match='Unknown compression method'):
+            MultiCsvFileWriter(tmp_path, 'invalid')
+
+    def test_write_csv_rows_creates_file_for_each_group(self, tmp_path):
+        """
+        Writer should write the positional rows of each group into its own file, with the group fieldnames as header.
+        """
+        writer = MultiCsvFileWriter(tmp_path)
+        writer.open()
+
+        writer.write_csv_rows({'power': CsvRows(('timestamp', 'power'), [('100', '42.0')]), 'empty': CsvRows(('timestamp',), [])})
+        writer.write_csv_rows({'power': CsvRows(('timestamp', 'power'), [('101', '43.0')])})
+        writer.close()
+
+        assert [filepath.name for filepath in tmp_path.iterdir()] == ['power.csv']
+        assert (tmp_path / 'power.csv').read_text(encoding='utf-8').splitlines() == ['timestamp,power', '100,42.0', '101,43.0']
+
+    def test_write_csv_rows_rotates_files_exceeding_rotation_size(self, tmp_path):
+        """
+        Writer should start a new segment file once the current one exceeds the rotation size.
+        """
+        writer = MultiCsvFileWriter(tmp_path, rotation_size=30)
+        writer.open()
+
+        for timestamp in range(100, 106):
+            writer.write_csv_rows({'power': CsvRows(('timestamp', 'power'), [(str(timestamp), '42.0')])})
+        writer.close()
+
+        segments = sorted(tmp_path.iterdir())
+        assert len(segments) == 3
+        assert all(filepath.name.startswith('power-') and filepath.suffix == '.csv' for filepath in segments)
+        assert [filepath.read_text(encoding='utf-8').splitlines() for filepath in segments] == [
+            ['timestamp,power', f'{timestamp},42.0', f'{timestamp + 1},42.0'] for timestamp in (100, 102, 104)
+        ]
+
+    def test_write_csv_rows_rotates_files_exceeding_rotation_interval(self, tmp_path):
+        """
+        Writer should start a new segment file once the rotation interval of the current one has elapsed.
+        """
+        clock = [0.0]
+        writer = MultiCsvFileWriter(tmp_path, rotation_interval=10.0)
+        writer.open()
+
+        with pytest.MonkeyPatch.context() as patch:
+            patch.setattr('powerapi.database.csv.fileio_handlers.monotonic', lambda: clock[0])
+            for timestamp, now in zip(range(100, 103), [0.0, 5.0, 10.0], strict=True):
+                clock[0] = now
+                writer.write_csv_rows({'power': CsvRows(('timestamp', 'power'), [(str(timestamp), '42.0')])})
+        writer.close()
+
+        segments = sorted(tmp_path.iterdir())
+        assert [len(filepath.read_text(encoding='utf-8').splitlines()) for filepath in segments] == [3, 2]
+
+    @pytest.mark.parametrize(('segments_compression', 'expected_suffix'), [('gzip', '.gz'), ('lzma', '.xz')])
+    def test_rotated_segments_are_compressed(self, tmp_path, segments_compression, expected_suffix):
+        """
+        Writer should compress the rotated segment files, and remove the uncompressed ones.
+        """
+        writer = MultiCsvFileWriter(tmp_path, rotation_size=1, segments_compression=segments_compression)
+        writer.open()
+
+        for timestamp in range(100, 103):
+            writer.write_csv_rows({'pytest': CsvRows(tuple(FIELDNAMES), [tuple(make_row(timestamp).values())])})
+        writer.close()
+
+        segments = sorted(tmp_path.iterdir())
+        assert len(segments) == 3
+        assert all(filepath.name.endswith(f'.csv{expected_suffix}') for filepath in segments)
+
+        reader = MultiCsvFileReader(segments[1:2])
+        reader.open()
+        assert reader.next_rows() == {segments[1].name.removesuffix(f'.csv{expected_suffix}'): [make_row(101)]}
+        reader.close()
+
+    def test_time_index_rejects_compressed_files(self, tmp_path):
+        """
+        Writer should reject the time index of compressed files.
+        """
+        with pytest.raises(ValueError, match='The time index requires uncompressed output files'):
+            MultiCsvFileWriter(tmp_path, 'gzip', index_block_size=1024)
+
+    def test_segments_compression_rejects_compressed_files(self, tmp_path):
+        """
+        Writer should reject the compression of segments that are already compressed.
+        """
+        with pytest.raises(ValueError, match='requires uncompressed output files'):
+            MultiCsvFileWriter(tmp_path, 'gzip', rotation_size=1, segments_compression='gzip')
@@ -0,0 +1,90 @@
+# Copyright (c) 2026, Inria
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from datetime import datetime, UTC
+
+import pytest
+
+from powerapi.database.influxdb2.codecs import EncoderOptions, FormulaReportEncoder, PowerReportEncoder, encode_timestamp
+from powerapi.report import FormulaReport, PowerReport
+
+
+def test_encode_power_report() -> None:
+    """
+    Encoder should encode a PowerReport into a line of the line protocol, with its tags sorted and its metadata flattened.
+    """
+    timestamp = datetime(2026, 1, 1, tzinfo=UTC)
+    report = PowerReport(timestamp, 'sensor', 'pytest', 42.5, {'scope': 'cpu', 'k8s': {'pod name': 'a,b=c'}, 'empty': ''})
+
+    line = PowerReportEncoder.encode(report)
+
+    assert line == rb'powerrep,k8s_pod\ name=a\,b\=c,scope=cpu,sensor=sensor,target=pytest power_estimation=42.5 1767225600000000000'
+
+
+def test_encode_power_report_with_empty_nested_metadata_key() -> None:
+    """
+    Encoder should take the value of a metadata nested under an empty key from the metadata, not from the report attributes.
+    """
+    report = PowerReport(datetime(2026, 1, 1, tzinfo=UTC), 'sensor', 'pytest', 42.5, {'k': {'': 'v'}})
+
+    line = PowerReportEncoder.encode(report)
+
+    assert line == b'powerrep,k_=v,sensor=sensor,target=pytest power_estimation=42.5 1767225600000000000'
+
+
+def test_encode_power_report_with_non_finite_power() -> None:
+    """
+    Encoder should skip a PowerReport whose power cannot be stored by InfluxDB.
+    """
+    report = PowerReport(datetime(2026, 1, 1, tzinfo=UTC), 'sensor', 'pytest', float('nan'))
+
+    assert PowerReportEncoder.encode(report) == b''
+
+
+def test_encode_formula_report() -> None:
+    """
+    Encoder should encode the metadata of a FormulaReport as the fields of its line, according to their types.
+    """
+    report = FormulaReport(datetime(2026, 1, 1, tzinfo=UTC), 'sensor', 'pytest', {'ratio': 0.5, 'count': 3, 'ok': True, 'msg': 'a "b"'})
+
+    line = FormulaReportEncoder.encode(report, EncoderOptions('s'))
+
+    assert line == b'formularep,sensor=sensor,target=pytest ratio=0.5,count=3i,ok=true,msg="a \\"b\\"" 1767225600'
+
+
+@pytest.mark.parametrize(('precision', 'expected_timestamp'), [
+    ('ns', 1767225600123456000),
+    ('us', 1767225600123456),
+    ('ms', 1767225600123),
+    ('s', 1767225600),
+])
+def test_encode_timestamp(precision: str, expected_timestamp: int) -> None:
+    """
+    Timestamps should be encoded exactly in the write precision, naive timestamps being considered as UTC.
+    """
+    assert encode_timestamp(datetime(2026, 1, 1, 0, 0, 0, 123456), precision) == expected_timestamp
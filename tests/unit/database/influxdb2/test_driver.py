@@ -0,0 +1,210 @@
+# Copyright (c) 2026, Inria
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import gzip
+import pickle
+from datetime import datetime, UTC
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+import pytest
+
+pytest.importorskip('powerapi.database.influxdb2.driver')  # The InfluxDB2 driver requires external dependencies to work.
+
+from powerapi.database.exceptions import WriteFailed
+from powerapi.database.influxdb2.driver import InfluxDB2Output, InfluxDB2OutputFactory, InfluxDB2WriteOptions
+from powerapi.report import PowerReport
+
+
+class InfluxDBStandIn(ThreadingHTTPServer):
+    """
+    Local HTTP server standing in for the write endpoint of an InfluxDB server, recording the request bodies.
+    """
+
+    def __init__(self, statuses: list[int]):
+        """
+        :param statuses: Status codes of the responses to the successive writes, 204 once exhausted
+        """
+        super().__init__(('127.0.0.1', 0), _InfluxDBStandInHandler)
+        self.statuses = statuses
+        self.requests: list[tuple[str, dict[str, str], bytes]] = []
+
+    @property
+    def url(self) -> str:
+        """
+        Return the URL of the server.
+        """
+        return f'http://127.0.0.1:{self.server_address[1]}'
+
+
+class _InfluxDBStandInHandler(BaseHTTPRequestHandler):
+    """
+    Request handler of the InfluxDB stand-in server.
+    """
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        if self.headers.get('Content-Encoding') == 'gzip':
+            body = gzip.decompress(body)
+        self.server.requests.append((self.path, dict(self.headers), body))
+
+        status = self.server.statuses.pop(0) if self.server.statuses else 204
+        self.send_response(status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def make_influxdb_stand_in():
+    """
+    Factory fixture for creating a running InfluxDB stand-in server.
+    """
+    servers = []
+
+    def _make(statuses: list[int] | None = None) -> InfluxDBStandIn:
+        server = InfluxDBStandIn(statuses or [])
+        Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield _make
+
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def make_power_reports(count: int) -> list[PowerReport]:
+    """
+    Create power reports with consecutive timestamps.
+    :param count: Number of reports
+    :return: List of power reports
+    """
+    return [PowerReport(datetime.fromtimestamp(timestamp, tz=UTC), 'sensor', 'pytest', 42.0) for timestamp in range(count)]
+
+
+def test_synchronous_write_sends_reports_in_a_single_request(make_influxdb_stand_in):
+    """
+    A synchronous write should send the line protocol of all the reports in a single request.
+    """
+    server = make_influxdb_stand_in()
+    write_options = InfluxDB2WriteOptions('synchronous', precision='s')
+    output = InfluxDB2Output(PowerReport, server.url, 'org', 'bucket', 'token', write_options)
+
+    output.write(make_power_reports(3))
+    output.disconnect()
+
+    assert len(server.requests) == 1
+    path, _, body = server.requests[0]
+    assert 'precision=s' in path
+    assert body.split(b'\n') == [f'powerrep,sensor=sensor,target=pytest power_estimation=42.0 {timestamp}'.encode() for timestamp in range(3)]
+
+
+def test_synchronous_write_with_gzip(make_influxdb_stand_in):
+    """
+    A synchronous write should compress the request body when gzip is enabled.
+    """
+    server = make_influxdb_stand_in()
+    output = InfluxDB2Output(PowerReport, server.url, 'org', 'bucket', 'token', InfluxDB2WriteOptions('synchronous', gzip=True))
+
+    output.write(make_power_reports(2))
+    output.disconnect()
+
+    _, headers, body = server.requests[0]
+    assert headers['Content-Encoding'] == 'gzip'
+    assert body.count(b'\n') == 1
+
+
+def test_batching_write_flushes_reports_on_disconnect(make_influxdb_stand_in):
+    """
+    A batching write should buffer the reports, and send them in batches of the configured size.
+    """
+    server = make_influxdb_stand_in()
+    output = InfluxDB2Output(PowerReport, server.url, 'org', 'bucket', 'token', InfluxDB2WriteOptions('batching', batch_size=2, flush_interval=60))
+
+    output.write(make_power_reports(3))
+    output.disconnect()
+
+    assert [body.count(b'\n') + 1 for _, _, body in server.requests] == [2, 1]
+
+
+def test_synchronous_write_retries_transient_errors(make_influxdb_stand_in):
+    """
+    A synchronous write failing with a transient error should be retried.
+    """
+    server = make_influxdb_stand_in([503, 429])
+    write_options = InfluxDB2WriteOptions('synchronous', max_retries=2, retry_interval=0.01)
+    output = InfluxDB2Output(PowerReport, server.url, 'org', 'bucket', 'token', write_options)
+
+    output.write(make_power_reports(1))
+    output.disconnect()
+
+    assert len(server.requests) == 3
+
+
+@pytest.mark.parametrize(('statuses', 'expected_requests'), [([400], 1), ([503, 503], 2)])
+def test_synchronous_write_raise_write_failed(make_influxdb_stand_in, statuses: list[int], expected_requests: int):
+    """
+    A synchronous write should raise WriteFailed on a non-transient error, or once its retries are exhausted.
+    """
+    server = make_influxdb_stand_in(statuses)
+    write_options = InfluxDB2WriteOptions('synchronous', max_retries=1, retry_interval=0.01)
+    output = InfluxDB2Output(PowerReport, server.url, 'org', 'bucket', 'token', write_options)
+
+    with pytest.raises(WriteFailed):
+        output.write(make_power_reports(1))
+    output.disconnect()
+
+    assert len(server.requests) == expected_requests
+
+
+@pytest.mark.parametrize(('write_options', 'expected_message'), [
+    (InfluxDB2WriteOptions(mode='asynchronous'), r'Invalid write mode'),
+    (InfluxDB2WriteOptions(precision='m'), r'Invalid write precision'),
+    (InfluxDB2WriteOptions(batch_size=0), r'Invalid batch size'),
+    (InfluxDB2WriteOptions(flush_interval=0), r'Invalid flush interval'),
+    (InfluxDB2WriteOptions(max_retries=-1), r'Invalid retry options'),
+])
+def test_create_factory_with_invalid_write_options(write_options: InfluxDB2WriteOptions, expected_message: str) -> None:
+    """
+    Factory should reject invalid write options.
+    """
+    with pytest.raises(ValueError, match=expected_message):
+        InfluxDB2OutputFactory(PowerReport, 'http://localhost:8086', 'org', 'bucket', 'token', write_options)
+
+
+def test_influxdb2_output_factory_is_picklable() -> None:
+    """
+    Factory arguments should be picklable so it can be passed to an actor running in a separate process.
+    """
+    factory = InfluxDB2OutputFactory(PowerReport, 'http://localhost:8086', 'org', 'bucket', 'token', InfluxDB2WriteOptions('synchronous'))
+
+    pickle.dumps(factory)
@@ -0,0 +1,548 @@
+# Copyright (c) 2026, Inria
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import gzip
+import json
+import re
+from datetime import datetime, UTC
+from pathlib import Path
+
+import pytest
+
+from powerapi.database.exceptions import ReadFailed, WriteFailed
+from powerapi.database.json.driver import JsonInput, JsonInputFactory, JsonOutput, JsonOutputFactory, MultiJsonInput
+from powerapi.database.time_index import TimeIndexBuilder, read_time_index, time_index_filepath
+from powerapi.report import HWPCReport, PowerReport
+
+
+def make_line(timestamp: int, target: str = 'pytest') -> str:
+    """
+    Create a JSON line of an HWPC report.
+    :param timestamp: Unix timestamp of the report in seconds
+    :param target: Target of the report
+    :return: JSON line of the report, with its line feed
+    """
+    document = {
+        'timestamp': datetime.fromtimestamp(timestamp, tz=UTC).isoformat(),
+        'sensor': 'sensor',
+        'target': target,
+        'groups': {},
+        'metadata': {},
+    }
+    return json.dumps(document) + '\n'
+
+
+def make_datetime(timestamp: int) -> datetime:
+    """
+    Create a timezone-aware datetime from a Unix timestamp.
+    :param timestamp: Unix timestamp in seconds
+    :return: Datetime object
+    """
+    return datetime.fromtimestamp(timestamp, tz=UTC)
+
+
+def read_timestamps(json_input: JsonInput, stream_mode: bool = False) -> list[int]:
+    """
+    Read the available reports from a JSON input.
+    :param json_input: JSON input database driver
+    :param stream_mode: Whether the input file is followed
+    :return: Timestamps of the read reports
+    """
+    return [int(report.timestamp.timestamp()) for report in json_input.read(stream_mode)]
+
+
+@pytest.fixture
+def input_filepath(tmp_path) -> Path:
+    """
+    Return the path of the JSON input file.
+    """
+    return tmp_path / 'input.jsonl'
+
+
+@pytest.fixture
+def json_input(input_filepath):
+    """
+    Return a connected JSON input following the input file.
+    """
+    input_filepath.write_text(make_line(1) + make_line(2), encoding='utf-8')
+    json_input = JsonInput(HWPCReport, str(input_filepath), 'auto')
+    json_input.connect()
+    yield json_input
+    json_input.disconnect()
+
+
+def test_read_returns_all_reports_of_the_file(input_filepath):
+    """
+    Reading in batch mode should return every report, including the last line without line feed, and skip blank lines.
+    """
+    input_filepath.write_text(make_line(1) + '\n' + make_line(2) + make_line(3).rstrip('\n'), encoding='utf-8')
+    json_input = JsonInput(HWPCReport, str(input_filepath), 'auto')
+    json_input.connect()
+
+    assert read_timestamps(json_input) == [1, 2, 3]
+    json_input.disconnect()
+
+
+def test_read_compressed_file(tmp_path):
+    """
+    Reading in batch mode should return every report of a compressed file.
+    """
+    input_filepath = tmp_path / 'input.jsonl.gz'
+    with gzip.open(input_filepath, 'wt', encoding='utf-8') as file:
+        file.write(make_line(1) + make_line(2))
+    json_input = JsonInput(HWPCReport, str(input_filepath), 'auto')
+    json_input.connect()
+
+    assert read_timestamps(json_input, stream_mode=True) == [1, 2]
+    assert read_timestamps(json_input, stream_mode=True) == []
+    json_input.disconnect()
+
+
+def test_stream_read_returns_appended_reports_once(json_input, input_filepath):
+    """
+    Reading in stream mode should only return the reports appended since the previous read.
+    """
+    assert read_timestamps(json_input, stream_mode=True) == [1, 2]
+    assert read_timestamps(json_input, stream_mode=True) == []
+
+    with input_filepath.open('a', encoding='utf-8') as file:
+        file.write(make_line(3))
+
+    assert read_timestamps(json_input, stream_mode=True) == [3]
+
+
+def test_stream_read_waits_for_the_end_of_partially_written_lines(json_input, input_filepath):
+    """
+    Reading in stream mode should not decode a line until its line feed has been written.
+    """
+    line = make_line(3)
+    with input_filepath.open('a', encoding='utf-8') as file:
+        file.write(line[:10])
+
+    assert read_timestamps(json_input, stream_mode=True) == [1, 2]
+
+    with input_filepath.open('a', encoding='utf-8') as file:
+        file.write(line[10:])
+
+    assert read_timestamps(json_input, stream_mode=True) == [3]
+
+
+def test_stream_read_follows_rotated_file(json_input, input_filepath):
+    """
+    Reading in stream mode should read the remaining reports of a rotated file, then the reports of its replacement.
+    """
+    assert read_timestamps(json_input, stream_mode=True) == [1, 2]
+
+    with input_filepath.open('a', encoding='utf-8') as file:
+        file.write(make_line(3))
+    input_filepath.rename(input_filepath.with_suffix('.jsonl.1'))
+    input_filepath.write_text(make_line(4), encoding='utf-8')
+
+    assert read_timestamps(json_input, stream_mode=True) == [3, 4]
+    assert read_timestamps(json_input, stream_mode=True) == []
+
+
+def test_stream_read_restarts_truncated_file(json_input, input_filepath):
+    """
+    Reading in stream mode should read a truncated file from its start.
+    """
+    assert read_timestamps(json_input, stream_mode=True) == [1, 2]
+
+    input_filepath.write_text(make_line(5), encoding='utf-8')
+
+    assert read_timestamps(json_input, stream_mode=True) == [5]
+
+
+def test_stream_read_skips_malformed_line(json_input, input_filepath):
+    """
+    Reading in stream mode should fail on a malformed line, then resume after it.
+    """
+    assert read_timestamps(json_input, stream_mode=True) == [1, 2]
+
+    with input_filepath.open('a', encoding='utf-8') as file:
+        file.write('{"malformed": \n' + make_line(3))
+
+    with pytest.raises(ReadFailed):
+        read_timestamps(json_input, stream_mode=True)
+
+    assert json_input.wait_for_reports(0.0)
+    assert read_timestamps(json_input, stream_mode=True) == [3]
+
+
+def test_wait_for_reports_returns_when_data_is_appended(json_input, input_filepath):
+    """
+    Waiting for reports should return True as soon as data is appended, and False once the timeout expires otherwise.
+    """
+    read_timestamps(json_input, stream_mode=True)
+
+    assert not json_input.wait_for_reports(0.1)
+
+    with input_filepath.open('a', encoding='utf-8') as file:
+        file.write(make_line(3))
+
+    assert json_input.wait_for_reports(10.0)
+
+
+def make_power_reports(first_timestamp: int, count: int) -> list[PowerReport]:
+    """
+    Create power reports with consecutive timestamps.
+    :param first_timestamp: Unix timestamp of the first report in seconds
+    :param count: Number of reports
+    :return: List of power reports
+    """
+    return [PowerReport(datetime.fromtimestamp(timestamp, tz=UTC), 'sensor', 'pytest', 42.5) for timestamp in range(first_timestamp, first_timestamp + count)]
+
+
+def read_output_timestamps(output_filepath: Path) -> list[int]:
+    """
+    Read the timestamps of the reports written to a JSON output file.
+    :param output_filepath: Path to the output file
+    :return: Timestamps of the written reports
+    """
+    opener = gzip.open if output_filepath.suffix == '.gz' else open
+    with opener(output_filepath, 'rt', encoding='utf-8') as file:
+        return [int(datetime.fromisoformat(json.loads(line)['timestamp']).timestamp()) for line in file]
+
+
+@pytest.mark.parametrize('write_queue_size', [0, 1, 16])
+@pytest.mark.parametrize('output_filename', ['output.jsonl', 'output.jsonl.gz'])
+def test_write_persists_reports_in_order(tmp_path, output_filename, write_queue_size):
+    """
+    Writing batches of reports, synchronously or from the background writer thread, should persist them in order.
+    """
+    output_filepath = tmp_path / output_filename
+    json_output = JsonOutput(PowerReport, str(output_filepath), 'auto', write_queue_size)
+    json_output.connect()
+
+    for first_timestamp in range(0, 100, 10):
+        json_output.write(make_power_reports(first_timestamp, 10))
+    json_output.write([])
+    json_output.disconnect()
+
+    assert read_output_timestamps(output_filepath) == list(range(100))
+
+
+@pytest.mark.parametrize('fsync_policy', ['never', 'close', 'batch', 'periodic'])
+def test_write_with_fsync_policy(tmp_path, monkeypatch, fsync_policy):
+    """
+    The output file should be synchronized according to the fsync policy.
+    """
+    synced_files = []
+    monkeypatch.setattr('powerapi.database.json.driver.fsync', synced_files.append)
+    output_filepath = tmp_path / 'output.jsonl'
+    json_output = JsonOutput(PowerReport, str(output_filepath), 'none', fsync_policy=fsync_policy, fsync_interval=3600.0)
+    json_output.connect()
+
+    json_output.write(make_power_reports(0, 2))
+    json_output.write(make_power_reports(2, 2))
+    writes_sync_count = len(synced_files)
+    json_output.disconnect()
+
+    assert writes_sync_count == {'never': 0, 'close': 0, 'batch': 2, 'periodic': 0}[fsync_policy]
+    assert len(synced_files) == writes_sync_count + (fsync_policy != 'never')
+    assert read_output_timestamps(output_filepath) == [0, 1, 2, 3]
+
+
+def test_background_write_error_is_raised_on_next_write(tmp_path, monkeypatch):
+    """
+    An error raised by the background writer thread should be reported by the next write of the driver.
+    """
+    def failing_write(batches: list) -> None:
+        raise OSError('No space left on device')
+
+    json_output = JsonOutput(PowerReport, str(tmp_path / 'output.jsonl'), 'none', write_queue_size=1)
+    monkeypatch.setattr(json_output, '_write_batches', failing_write)
+    json_output.connect()
+
+    json_output.write(make_power_reports(0, 1))
+    with pytest.raises(OSError, match=r'No space left on device'):
+        json_output._writer_thread.close()
+
+    with pytest.raises(WriteFailed) as exn_info:
+        json_output.write(make_power_reports(1, 1))
+    json_output.disconnect()
+
+    assert 'No space left on device' in exn_info.value.msg
+
+
+@pytest.mark.parametrize('kwargs', [{'write_queue_size': -1}, {'fsync_policy': 'always'}, {'fsync_interval': 0.0}])
+def test_output_factory_rejects_invalid_parameters(tmp_path, kwargs):
+    """
+    The JSON output factory should reject invalid parameters.
+    """
+    with pytest.raises(ValueError, match=r'^Invalid '):
+        JsonOutputFactory(PowerReport, str(tmp_path / 'output.jsonl'), 'none', **kwargs)
+
+
+def list_segments(directory: Path) -> list[Path]:
+    """
+    List the output files of a directory, sorted by name.
+    :param directory: Path to the directory
+    :return: Sorted paths of the files
+    """
+    return sorted(directory.iterdir())
+
+
+@pytest.mark.parametrize(('output_filename', 'segment_suffix'), [('power.jsonl', '.jsonl'), ('power.jsonl.gz', '.jsonl.gz'), ('power', '')])
+def test_write_rotates_segments_by_size(tmp_path, output_filename, segment_suffix):
+    """
+    The segment files should be rotated once their size is reached, and be renamed to their final name when closed.
+    """
+    json_output = JsonOutput(PowerReport, str(tmp_path / output_filename), 'auto', rotation_size=1)
+    json_output.connect()
+
+    for timestamp in range(3):
+        json_output.write(make_power_reports(timestamp, 1))
+        assert len(list(tmp_path.glob('*.part'))) == 1
+    json_output.disconnect()
+
+    segments = list_segments(tmp_path)
+    assert len(segments) == 3
+    assert all(re.fullmatch(rf'power-\d{{8}}T\d{{12}}Z{re.escape(segment_suffix)}', segment.name) for segment in segments)
+    opener = gzip.open if segment_suffix.endswith('.gz') else open
+    timestamps = []
+    for segment in segments:
+        with opener(segment, 'rt', encoding='utf-8') as file:
+            timestamps.extend(int(datetime.fromisoformat(json.loads(line)['timestamp']).timestamp()) for line in file)
+    assert timestamps == [0, 1, 2]
+
+
+def test_write_rotates_segments_at_the_end_of_time_windows(tmp_path, monkeypatch):
+    """
+    The segment files should be rotated when their time window, aligned on the clock, is over.
+    """
+    current_time = 3590.0
+    monkeypatch.setattr('powerapi.database.json.driver.time', lambda: current_time)
+    json_output = JsonOutput(PowerReport, str(tmp_path / 'power.jsonl'), 'none', rotation_interval=3600.0)
+    json_output.connect()
+
+    json_output.write(make_power_reports(0, 1))
+    current_time = 3599.0
+    json_output.write(make_power_reports(1, 1))
+    current_time = 3600.0
+    json_output.write(make_power_reports(2, 1))
+    json_output.disconnect()
+
+    segments = list_segments(tmp_path)
+    assert len(segments) == 2
+    assert [read_output_timestamps(segment) for segment in segments] == [[0, 1], [2]]
+
+
+@pytest.mark.parametrize('kwargs', [{'rotation_size': -1}, {'rotation_interval': -1.0}, {'compression_threads': -1}])
+def test_output_factory_rejects_invalid_rotation_and_compression_parameters(tmp_path, kwargs):
+    """
+    The JSON output factory should reject invalid rotation and compression parameters.
+    """
+    with pytest.raises(ValueError, match=r'^Invalid '):
+        JsonOutputFactory(PowerReport, str(tmp_path / 'output.jsonl'), 'none', **kwargs)
+
+
+def write_indexed_blocks(input_filepath: Path) -> None:
+    """
+    Write an input file of three blocks of reports (timestamps 0-9, 10-19 and 20-29) with its time index.
+    The first and last blocks end with a malformed line, that must not be read when the blocks are skipped.
+    :param input_filepath: Path of the input file
+    """
+    blocks_data = [
+        (''.join(make_line(timestamp) for timestamp in range(first_timestamp, first_timestamp + 10)) + '{"malformed"\n').encode('utf-8')
+        for first_timestamp in (0, 10, 20)
+    ]
+    blocks_data[1] = blocks_data[1].removesuffix(b'{"malformed"\n')
+    input_filepath.write_bytes(b''.join(blocks_data))
+    builder = TimeIndexBuilder(1)
+    for first_timestamp, block_data in zip((0, 10, 20), blocks_data, strict=True):
+        builder.add(len(block_data), first_timestamp * 1000, (first_timestamp + 9) * 1000)
+    builder.write(time_index_filepath(input_filepath))
+
+
+def test_read_time_window_only_reads_the_indexed_blocks(input_filepath):
+    """
+    Reading a time window should only read the blocks of the time index overlapping it, and filter out the other reports.
+    """
+    write_indexed_blocks(input_filepath)
+    json_input = JsonInput(HWPCReport, str(input_filepath), 'auto', make_datetime(12), make_datetime(18))
+    json_input.connect()
+
+    assert read_timestamps(json_input) == list(range(12, 18))
+    json_input.disconnect()
+
+
+def test_follow_time_window_reads_the_appended_reports(input_filepath):
+    """
+    Following a file with a time window should skip the indexed blocks after the window, then read the appended reports.
+    """
+    write_indexed_blocks(input_filepath)
+    json_input = JsonInput(HWPCReport, str(input_filepath), 'auto', make_datetime(12), make_datetime(18))
+    json_input.connect()
+
+    assert read_timestamps(json_input, stream_mode=True) == list(range(12, 18))
+    assert not json_input.wait_for_reports(0.0)
+
+    with open(input_filepath, 'a', encoding='utf-8') as input_file:
+        input_file.write(make_line(15) + make_line(40))
+
+    assert json_input.wait_for_reports(1.0)
+    assert read_timestamps(json_input, stream_mode=True) == [15]
+    assert not json_input.wait_for_reports(0.0)
+    json_input.disconnect()
+
+
+def test_read_time_window_without_index_filters_the_reports(input_filepath):
+    """
+    Reading a time window of a file without time index should read the whole file and filter out the other reports.
+    """
+    input_filepath.write_text(''.join(make_line(timestamp) for timestamp in range(10)), encoding='utf-8')
+    json_input = JsonInput(HWPCReport, str(input_filepath), 'auto', make_datetime(3), None)
+    json_input.connect()
+
+    assert read_timestamps(json_input) == list(range(3, 10))
+    json_input.disconnect()
+
+
+@pytest.fixture
+def multiple_input_filepaths(tmp_path) -> list[Path]:
+    """
+    Return the paths of JSON input files with interleaved timestamps, one of them being compressed.
+    """
+    first_filepath = tmp_path / 'input-1.jsonl'
+    first_filepath.write_text(''.join(make_line(timestamp) for timestamp in range(0, 30, 3)), encoding='utf-8')
+    second_filepath = tmp_path / 'input-2.jsonl.gz'
+    with gzip.open(second_filepath, 'wt', encoding='utf-8') as file:
+        file.write(''.join(make_line(timestamp) for timestamp in range(1, 30, 3)))
+    third_filepath = tmp_path / 'input-3.jsonl'
+    third_filepath.write_text(''.join(make_line(timestamp) for timestamp in range(2, 30, 3)), encoding='utf-8')
+    return [first_filepath, second_filepath, third_filepath]
+
+
+@pytest.mark.parametrize('workers', [1, 3])
+def test_read_multiple_files_merges_reports_in_timestamp_order(multiple_input_filepaths, workers):
+    """
+    Reading multiple files should return the reports of every file merged in timestamp order.
+    """
+    json_input = MultiJsonInput(HWPCReport, map(str, multiple_input_filepaths), 'auto', workers)
+    json_input.read_chunk_size = 4
+    json_input.connect()
+
+    assert read_timestamps(json_input) == list(range(30))
+    assert read_timestamps(json_input) == []
+    json_input.disconnect()
+
+
+def test_read_multiple_files_unordered_returns_all_reports(multiple_input_filepaths):
+    """
+    Reading multiple files without ordering should return the reports of every file.
+    """
+    json_input = MultiJsonInput(HWPCReport, map(str, multiple_input_filepaths), 'auto', 2, ordered=False)
+    json_input.read_chunk_size = 4
+    json_input.connect()
+
+    assert sorted(read_timestamps(json_input)) == list(range(30))
+    json_input.disconnect()
+
+
+def test_read_multiple_files_time_window(multiple_input_filepaths):
+    """
+    Reading multiple files should only return the reports of the time window.
+    """
+    json_input = MultiJsonInput(HWPCReport, map(str, multiple_input_filepaths), 'auto', 2, time_from=make_datetime(10), time_to=make_datetime(20))
+    json_input.connect()
+
+    assert read_timestamps(json_input) == list(range(10, 20))
+    json_input.disconnect()
+
+
+def test_read_multiple_files_with_malformed_report_raise_read_failed(multiple_input_filepaths):
+    """
+    Reading multiple files should raise ReadFailed when a report of one of them cannot be decoded.
+    """
+    with multiple_input_filepaths[2].open('a', encoding='utf-8') as file:
+        file.write('{"malformed"\n')
+    json_input = MultiJsonInput(HWPCReport, map(str, multiple_input_filepaths), 'auto', 2)
+    json_input.connect()
+
+    with pytest.raises(ReadFailed):
+        read_timestamps(json_input)
+    json_input.disconnect()
+
+
+def test_input_factory_expands_glob_pattern(multiple_input_filepaths, tmp_path):
+    """
+    The JSON input factory should create a multi-files input reading the files matching a glob pattern.
+    """
+    json_input = JsonInputFactory(HWPCReport, str(tmp_path / 'input-*.jsonl*'), 'auto').create()
+
+    assert isinstance(json_input, MultiJsonInput)
+    assert json_input.input_filepaths == multiple_input_filepaths
+
+
+def test_input_factory_creates_single_file_input(input_filepath):
+    """
+    The JSON input factory should create a single file input for a path without more than one worker.
+    """
+    assert isinstance(JsonInputFactory(HWPCReport, str(input_filepath), 'auto').create(), JsonInput)
+
+
+def test_input_factory_rejects_glob_pattern_without_match(tmp_path):
+    """
+    The JSON input factory should reject a glob pattern matching no file.
+    """
+    with pytest.raises(ValueError, match=r'No input file matches'):
+        JsonInputFactory(HWPCReport, str(tmp_path / '*.jsonl'), 'auto').create()
+
+
+def test_input_factory_rejects_invalid_number_of_workers(input_filepath):
+    """
+    The JSON input factory should reject an invalid number of workers.
+    """
+    with pytest.raises(ValueError, match=r'Invalid number of workers'):
+        JsonInputFactory(HWPCReport, str(input_filepath), 'auto', workers=0)
+
+
+def test_write_time_index(tmp_path):
+    """
+    The JSON output should write the time index of the output file, the blocks covering the written reports.
+    """
+    output_filepath = tmp_path / 'power.jsonl'
+    json_output = JsonOutput(PowerReport, str(output_filepath), 'none', index_block_size=1)
+    json_output.connect()
+    json_output.write(make_power_reports(0, 2))
+    json_output.write(make_power_reports(10, 3))
+    json_output.disconnect()
+
+    blocks = read_time_index(time_index_filepath(output_filepath))
+    assert [(block.min_timestamp, block.max_timestamp) for block in blocks] == [(0, 1000), (10000, 12000)]
+    assert blocks[0].start == 0
+    assert blocks[-1].end == output_filepath.stat().st_size
+
+
+def test_output_factory_rejects_time_index_of_compressed_file(tmp_path):
+    """
+    The JSON output factory should reject the time index of a compressed output file.
+    """
+    with pytest.raises(ValueError, match=r'requires an uncompressed output file'):
+        JsonOutputFactory(PowerReport, str(tmp_path / 'output.jsonl.gz'), 'auto', index_block_size=1024)
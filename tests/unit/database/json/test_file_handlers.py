@@ -30,7 +30,8 @@ from pathlib import Path
 
 import pytest
 
-from powerapi.database.json.file_handlers import FileHandlerRegistry, RawFileHandler, GzipFileHandler, LzmaFileHandler
+from powerapi.database.file_handlers import CompressionOptions
+from powerapi.database.json.file_handlers import FileHandlerRegistry, RawFileHandler, GzipFileHandler, LzmaFileHandler, ZstdFileHandler
 
 
 def make_filepath(suffix: str = '.jsonl', stem: str = "pytest-powerapi", root: str = "/tmp") -> Path:
@@ -44,11 +45,14 @@ def make_filepath(suffix: str = '.jsonl', stem: str = "pytest-powerapi", root: s
     return Path(root) / f"{stem}{suffix}"
 
 
-@pytest.mark.parametrize('compression_method', ['none', 'gzip', 'lzma'])
+@pytest.mark.parametrize('compression_method', ['none', 'gzip', 'lzma', 'zstd'])
 def test_registry_get_compression_method(compression_method):
     """
     Registry should return the handler matching an explicit compression method.
     """
+    if compression_method == 'zstd' and not ZstdFileHandler.is_available():
+        pytest.skip('zstd compression is not available')
+
     filepath = make_filepath()
     handler = FileHandlerRegistry.get(compression_method, filepath)
 
@@ -101,6 +105,39 @@ def test_registry_get_lzma_compression_method_from_file_extension(file_extension
     assert handler.compression_method == 'lzma'
 
 
+@pytest.mark.parametrize('file_extension', ['.zst', '.zstd'])
+def test_registry_get_zstd_compression_method_from_file_extension(file_extension):
+    """
+    Auto-detection should resolve zstd-related suffixes to the Zstd file handler.
+    """
+    if not ZstdFileHandler.is_available():
+        pytest.skip('zstd compression is not available')
+
+    filepath = make_filepath(file_extension)
+    handler = FileHandlerRegistry.get('auto', filepath)
+
+    assert handler is ZstdFileHandler
+    assert handler.compression_method == 'zstd'
+
+
+@pytest.mark.parametrize('opts', [None, CompressionOptions(level=1), CompressionOptions(level=9, threads=2)])
+@pytest.mark.parametrize('handler', [RawFileHandler, GzipFileHandler, LzmaFileHandler, ZstdFileHandler])
+def test_handler_round_trip_with_compression_options(tmp_path, handler, opts):
+    """
+    Files written with compression options should be read back identically.
+    """
+    if not handler.is_available():
+        pytest.skip(f'{handler.compression_method} compression is not available')
+
+    filepath = tmp_path / f'output.jsonl{handler.supported_suffixes[0]}'
+    content = '{"timestamp":"2026-01-01T00:00:00+00:00","power":42.5}\n' * 1000
+    with handler.open(filepath, 'w', opts) as file:
+        file.write(content)
+
+    with handler.open(filepath, 'r') as file:
+        assert file.read() == content
+
+
 def test_registry_get_unknown_compression_method_from_file_extension():
     """
     Auto-detection should raise a ValueError for an unknown file suffix.
@@ -0,0 +1,93 @@
+# Copyright (c) 2026, Inria
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import time
+from datetime import datetime, UTC
+
+import pytest
+
+from powerapi.database.mongodb.codecs import EncoderOptions, PowerReportEncoder, ReportEncoders
+from powerapi.report import PowerReport
+
+
+def test_get_power_report_encoder() -> None:
+    """
+    Registry should return the encoder corresponding to PowerReport.
+    """
+    assert ReportEncoders.get(PowerReport) is PowerReportEncoder
+
+
+def test_encode_power_report_copies_its_attributes() -> None:
+    """
+    Encoder should return a copy of the attributes of the report, so that the inserted `_id` does not modify the report.
+    """
+    report = PowerReport(datetime.now(tz=UTC), 'sensor', 'pytest', 42.5, {'scope': 'cpu'})
+
+    document = PowerReportEncoder.encode(report)
+    document['_id'] = 'pytest'
+
+    assert document == {'timestamp': report.timestamp, 'sensor': 'sensor', 'target': 'pytest', 'power': 42.5,
+                        'metadata': {'scope': 'cpu'}, '_id': 'pytest'}
+    assert not hasattr(report, '_id')
+
+
+def test_encode_power_report_in_compact_schema() -> None:
+    """
+    Encoder should store the timestamp in milliseconds since epoch and flatten the metadata in the compact schema.
+    """
+    report = PowerReport(datetime(2026, 1, 1, 0, 0, 0, 123000, tzinfo=UTC), 'sensor', 'pytest', 42.5, {'k8s': {'namespace': 'pytest'}})
+
+    document = PowerReportEncoder.encode(report, EncoderOptions(compact=True))
+
+    assert document == {'timestamp': 1767225600123, 'sensor': 'sensor', 'target': 'pytest', 'power': 42.5,
+                        'metadata': {'k8s_namespace': 'pytest'}}
+    assert report.metadata == {'k8s': {'namespace': 'pytest'}}
+
+
+@pytest.fixture
+def non_utc_timezone(monkeypatch):
+    """
+    Set the local timezone of the process to a timezone with an offset from UTC.
+    """
+    monkeypatch.setenv('TZ', 'Europe/Paris')
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+@pytest.mark.usefixtures('non_utc_timezone')
+def test_encode_power_report_with_naive_timestamp_in_compact_schema() -> None:
+    """
+    Encoder should consider the naive timestamps, as returned by the MongoDB client, as UTC in the compact schema.
+    """
+    report = PowerReport(datetime(2026, 1, 1), 'sensor', 'pytest', 42.5)
+
+    document = PowerReportEncoder.encode(report, EncoderOptions(compact=True))
+
+    assert document['timestamp'] == 1767225600000
@@ -0,0 +1,231 @@
+# Copyright (c) 2026, Inria
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import pickle
+from datetime import datetime, UTC
+
+import pytest
+
+pytest.importorskip('powerapi.database.mongodb.driver')  # The MongoDB driver requires external dependencies to work.
+
+from powerapi.database.mongodb.driver import MongodbInput, MongodbInputFactory, MongodbOutput, MongodbOutputFactory, MongodbQuery, \
+    MongodbWriteOptions
+from powerapi.report import HWPCReport, PowerReport
+
+
+def test_create_mongodb_input_with_stream_options() -> None:
+    """
+    Factory should create a MongoDB input with the given stream options.
+    """
+    factory = MongodbInputFactory(HWPCReport, 'mongodb://localhost:27017/', 'pytest', 'hwpc', 500, True)
+
+    database = factory.create()
+
+    assert isinstance(database, MongodbInput)
+    assert database.stream_batch_size == 500
+    assert database.tailable is True
+
+
+@pytest.mark.parametrize('stream_batch_size', [0, -1])
+def test_create_factory_with_invalid_stream_batch_size(stream_batch_size: int) -> None:
+    """
+    Factory should reject an invalid stream batch size.
+    """
+    with pytest.raises(ValueError, match=r'Invalid stream batch size'):
+        MongodbInputFactory(HWPCReport, 'mongodb://localhost:27017/', 'pytest', 'hwpc', stream_batch_size)
+
+
+def test_mongodb_input_factory_is_picklable() -> None:
+    """
+    Factory arguments should be picklable so it can be passed to an actor running in a separate process.
+    """
+    query = MongodbQuery(datetime(2026, 1, 1, tzinfo=UTC), None, ('sensor',), groups=('core',), hint='timestamp_1')
+    factory = MongodbInputFactory(HWPCReport, 'mongodb://localhost:27017/', 'pytest', 'hwpc', 500, True, query, 4)
+
+    pickle.dumps(factory)
+
+
+def test_query_filter() -> None:
+    """
+    Query should filter the documents by time window, sensors and targets.
+    """
+    time_from = datetime(2026, 1, 1, tzinfo=UTC)
+    time_to = datetime(2026, 1, 2, tzinfo=UTC)
+    query = MongodbQuery(time_from, time_to, ('sensor',), ('target-1', 'target-2'))
+
+    assert query.filter() == {
+        'timestamp': {'$gte': time_from, '$lt': time_to},
+        'sensor': {'$in': ['sensor']},
+        'target': {'$in': ['target-1', 'target-2']},
+    }
+
+
+def test_query_without_criteria_matches_every_document() -> None:
+    """
+    Query without criteria should match every document and retrieve every field.
+    """
+    query = MongodbQuery()
+
+    assert query.filter() == {}
+    assert query.projection() is None
+
+
+def test_query_projection_of_groups() -> None:
+    """
+    Query should only retrieve the requested groups, along with the fields of the report.
+    """
+    query = MongodbQuery(groups=('core', 'rapl'))
+
+    assert query.projection() == {'timestamp': 1, 'sensor': 1, 'target': 1, 'metadata': 1, 'groups.core': 1, 'groups.rapl': 1}
+
+
+def test_query_prune_events() -> None:
+    """
+    Query should remove the events that are not requested from the groups of a document.
+    """
+    document = {'groups': {'core': {'0': {'0': {'time_enabled': 1, 'time_running': 1, 'CYCLES': 2, 'INSTRUCTIONS': 3}}}}}
+    query = MongodbQuery(events=('time_enabled', 'time_running', 'CYCLES'))
+
+    assert query.prune_events(document) == {'groups': {'core': {'0': {'0': {'time_enabled': 1, 'time_running': 1, 'CYCLES': 2}}}}}
+
+
+@pytest.mark.parametrize('readers', [0, -1])
+def test_create_factory_with_invalid_number_of_readers(readers: int) -> None:
+    """
+    Factory should reject an invalid number of readers.
+    """
+    with pytest.raises(ValueError, match=r'Invalid number of readers'):
+        MongodbInputFactory(HWPCReport, 'mongodb://localhost:27017/', 'pytest', 'hwpc', readers=readers)
+
+
+def test_create_factory_with_invalid_time_window() -> None:
+    """
+    Factory should reject a time window whose start is not before its end.
+    """
+    query = MongodbQuery(datetime(2026, 1, 2, tzinfo=UTC), datetime(2026, 1, 1, tzinfo=UTC))
+
+    with pytest.raises(ValueError, match=r'Invalid time window'):
+        MongodbInputFactory(HWPCReport, 'mongodb://localhost:27017/', 'pytest', 'hwpc', query=query)
+
+
+def test_create_factory_with_invalid_cursor_batch_size() -> None:
+    """
+    Factory should reject a negative cursor batch size.
+    """
+    with pytest.raises(ValueError, match=r'Invalid cursor batch size'):
+        MongodbInputFactory(HWPCReport, 'mongodb://localhost:27017/', 'pytest', 'hwpc', query=MongodbQuery(batch_size=-1))
+
+
+def test_create_mongodb_output_with_write_options() -> None:
+    """
+    Factory should create a MongoDB output with the given write options.
+    """
+    write_options = MongodbWriteOptions(ordered=False, write_concern='majority', journal=True, timeseries_granularity='seconds')
+    factory = MongodbOutputFactory(PowerReport, 'mongodb://localhost:27017/', 'pytest', 'power', write_options, 8)
+
+    database = factory.create()
+
+    assert isinstance(database, MongodbOutput)
+    assert database.write_options == write_options
+    assert database.write_queue_size == 8
+    pickle.dumps(factory)
+
+
+@pytest.mark.parametrize(('write_concern', 'journal', 'expected_document'), [
+    (None, False, {}),
+    ('2', False, {'w': 2}),
+    ('majority', True, {'w': 'majority', 'j': True}),
+])
+def test_write_options_write_concern(write_concern: str | None, journal: bool, expected_document: dict) -> None:
+    """
+    Write options should build the write concern of the inserts.
+    """
+    write_options = MongodbWriteOptions(write_concern=write_concern, journal=journal)
+
+    assert write_options.mongodb_write_concern().document == expected_document
+
+
+def test_create_output_factory_with_invalid_timeseries_granularity() -> None:
+    """
+    Factory should reject an invalid time-series granularity.
+    """
+    with pytest.raises(ValueError, match=r'Invalid time-series granularity'):
+        MongodbOutputFactory(PowerReport, 'mongodb://localhost:27017/', 'pytest', 'power', MongodbWriteOptions(timeseries_granularity='days'))
+
+
+def test_create_output_factory_with_compact_timeseries_collection() -> None:
+    """
+    Factory should reject the compact schema for a time-series collection, whose time field has to be a date.
+    """
+    write_options = MongodbWriteOptions(timeseries_granularity='seconds', compact=True)
+
+    with pytest.raises(ValueError, match=r'require the timestamps to be stored as dates'):
+        MongodbOutputFactory(PowerReport, 'mongodb://localhost:27017/', 'pytest', 'power', write_options)
+
+
+def test_create_output_factory_with_invalid_write_queue_size() -> None:
+    """
+    Factory should reject a negative write queue size.
+    """
+    with pytest.raises(ValueError, match=r'Invalid write queue size'):
+        MongodbOutputFactory(PowerReport, 'mongodb://localhost:27017/', 'pytest', 'power', write_queue_size=-1)
+
+
+class StreamCollection:
+    """
+    MongoDB collection stand-in supporting the queries used to claim and delete the documents in stream mode.
+    """
+
+    def __init__(self, documents: list[dict]):
+        self.documents = documents
+
+    def find(self, query_filter: dict, projection: dict | None, sort: list, limit: int) -> list[dict]:
+        return self.documents[:limit]
+
+    def delete_many(self, query_filter: dict) -> None:
+        deleted_ids = set(query_filter['_id']['$in'])
+        self.documents = [document for document in self.documents if document['_id'] not in deleted_ids]
+
+
+def test_stream_skips_and_deletes_malformed_documents() -> None:
+    """
+    Stream mode should skip a malformed document in the middle of a batch, and delete it along with the other documents of the batch.
+    """
+    timestamp = datetime(2026, 1, 1, tzinfo=UTC)
+    documents = [
+        {'_id': 1, 'timestamp': timestamp, 'sensor': 'sensor', 'target': 'a', 'groups': {}},
+        {'_id': 2, 'timestamp': timestamp, 'sensor': 'sensor'},
+        {'_id': 3, 'timestamp': timestamp, 'sensor': 'sensor', 'target': 'c', 'groups': {}},
+    ]
+    database = MongodbInput(HWPCReport, 'mongodb://localhost:27017/', 'pytest', 'hwpc', stream_batch_size=10)
+    database._collection = StreamCollection(documents)
+
+    reports = list(database.read(stream_mode=True))
+
+    assert [report.target for report in reports] == ['a', 'c']
+    assert database._collection.documents == []
@@ -0,0 +1,225 @@
+# Copyright (c) 2026, Inria
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import gzip
+from datetime import datetime, UTC
+
+import pytest
+
+pytest.importorskip('powerapi.database.prometheus.collectors')  # The Prometheus driver requires external dependencies to work.
+
+from prometheus_client.exposition import generate_latest
+
+from powerapi.database.prometheus.codecs import EncoderOptions, PowerReportEncoder
+from powerapi.database.prometheus import collectors
+from powerapi.database.prometheus.collectors import PowerReportCollector
+from powerapi.report import PowerReport
+
+CURRENT_TIMESTAMP = 1767225600.0
+
+
+@pytest.fixture(autouse=True)
+def current_time(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """
+    Fixture that freezes the current time of the collectors, the returned list allowing the tests to move it.
+    """
+    current_time = [CURRENT_TIMESTAMP]
+    monkeypatch.setattr('powerapi.database.prometheus.collectors.time', lambda: current_time[0])
+    return current_time
+
+
+def make_report(target: str, age: float) -> PowerReport:
+    """
+    Create a PowerReport for the given target, with a timestamp older than the current time by the given age in seconds.
+    """
+    return PowerReport(datetime.fromtimestamp(CURRENT_TIMESTAMP - age, UTC), 'pytest', target, 42.0)
+
+
+def collect_samples(collector: PowerReportCollector) -> dict[str, dict[tuple[str, ...], float]]:
+    """
+    Collect the metrics of the collector, returning the value of the samples indexed by metric name and label values.
+    """
+    samples = {}
+    for metric in collector.collect():
+        for sample in metric.samples:
+            samples.setdefault(sample.name, {})[tuple(sample.labels.values())] = sample.value
+
+    return samples
+
+def test_expired_series_are_removed() -> None:
+    """
+    The series whose sample is expired should be removed from the collector and counted.
+    """
+    collector = PowerReportCollector(['sensor', 'target'], samples_ttl=60)
+    collector.submit([make_report('old', 120), make_report('recent', 10)], PowerReportEncoder, EncoderOptions([]))
+
+    samples = collect_samples(collector)
+
+    assert samples['power_estimation_watts'] == {('pytest', 'recent'): 42.0}
+    assert samples['powerapi_prometheus_output_series'] == {(): 1}
+    assert samples['powerapi_prometheus_output_expired_series_total'] == {(): 1}
+    assert samples['powerapi_prometheus_output_evicted_series_total'] == {(): 0}
+
+
+def test_updated_series_is_kept() -> None:
+    """
+    A series updated with a recent sample should be kept, even if its previous sample is expired.
+    """
+    collector = PowerReportCollector(['sensor', 'target'], samples_ttl=60)
+    collector.submit([make_report('a', 120), make_report('b', 30), make_report('a', 5)], PowerReportEncoder, EncoderOptions([]))
+
+    samples = collect_samples(collector)
+
+    assert samples['power_estimation_watts'] == {('pytest', 'b'): 42.0, ('pytest', 'a'): 42.0}
+    assert samples['powerapi_prometheus_output_expired_series_total'] == {(): 0}
+
+
+def test_least_recently_updated_series_are_evicted() -> None:
+    """
+    The least recently updated series should be evicted when the maximum number of series is reached.
+    """
+    collector = PowerReportCollector(['sensor', 'target'], samples_ttl=60, max_series=2)
+    collector.submit([make_report('a', 3), make_report('b', 2)], PowerReportEncoder, EncoderOptions([]))
+    collector.submit([make_report('a', 1), make_report('c', 1)], PowerReportEncoder, EncoderOptions([]))
+
+    samples = collect_samples(collector)
+
+    assert samples['power_estimation_watts'] == {('pytest', 'a'): 42.0, ('pytest', 'c'): 42.0}
+    assert samples['powerapi_prometheus_output_series'] == {(): 2}
+    assert samples['powerapi_prometheus_output_evicted_series_total'] == {(): 1}
+
+
+def test_exposition_is_cached_per_generation() -> None:
+    """
+    The exposition should be rendered once per generation of samples, and rendered again once new samples are submitted.
+    """
+    rendered_collectors = []
+
+    def encoder(collector) -> bytes:
+        rendered_collectors.append(collector)
+        return generate_latest(collector)
+
+    collector = PowerReportCollector(['sensor', 'target'], samples_ttl=60)
+    collector.submit([make_report('a', 1)], PowerReportEncoder, EncoderOptions([]))
+
+    output = collector.exposition(encoder, 'text/plain', False)
+    assert collector.exposition(encoder, 'text/plain', False) is output
+    assert b'power_estimation_watts{sensor="pytest",target="a"} 42.0' in output
+    assert gzip.decompress(collector.exposition(encoder, 'text/plain', True)) == output
+    assert len(rendered_collectors) == 2
+
+    collector.submit([make_report('b', 1)], PowerReportEncoder, EncoderOptions([]))
+
+    assert b'target="b"' in collector.exposition(encoder, 'text/plain', False)
+    assert len(rendered_collectors) == 3
+
+
+def test_exposition_is_rendered_again_when_a_sample_expires(current_time: list[float]) -> None:
+    """
+    The cached exposition should be rendered again once one of its samples expires, even without new samples.
+    """
+    collector = PowerReportCollector(['sensor', 'target'], samples_ttl=60)
+    collector.submit([make_report('a', 50), make_report('b', 1)], PowerReportEncoder, EncoderOptions([]))
+
+    assert b'target="a"' in collector.exposition(generate_latest, 'text/plain', False)
+
+    current_time[0] += 10
+
+    output = collector.exposition(generate_latest, 'text/plain', False)
+    assert b'target="a"' not in output
+    assert b'target="b"' in output
+
+
+def make_namespace_report(target: str, namespace: str, power: float, age: float) -> PowerReport:
+    """
+    Create a PowerReport of a target in the given Kubernetes namespace.
+    """
+    timestamp = datetime.fromtimestamp(CURRENT_TIMESTAMP - age, UTC)
+    return PowerReport(timestamp, 'pytest', target, power, {'k8s': {'pod_namespace': namespace}})
+
+
+def test_aggregates_are_updated_incrementally() -> None:
+    """
+    The aggregates should sum the latest sample of each series of their groups, and drop the expired and evicted series.
+    """
+    collector = PowerReportCollector(['sensor', 'target', 'k8s_pod_namespace'], samples_ttl=60, max_series=3,
+                                     aggregates=[['k8s_pod_namespace'], ['sensor']])
+    encoder_opts = EncoderOptions(['k8s_pod_namespace'])
+
+    collector.submit([
+        make_namespace_report('a', 'default', 10.0, 120),
+        make_namespace_report('b', 'default', 20.0, 5),
+        make_namespace_report('c', 'monitoring', 5.0, 5),
+        make_namespace_report('b', 'default', 25.0, 1),
+    ], PowerReportEncoder, encoder_opts)
+
+    samples = collect_samples(collector)
+    assert samples['power_estimation_by_k8s_pod_namespace_watts'] == {('default',): 25.0, ('monitoring',): 5.0}
+    assert samples['power_estimation_by_sensor_watts'] == {('pytest',): 30.0}
+
+    collector.submit([make_namespace_report('d', 'monitoring', 1.0, 1), make_namespace_report('e', 'monitoring', 2.0, 1)],
+                     PowerReportEncoder, encoder_opts)
+
+    samples = collect_samples(collector)
+    assert samples['power_estimation_by_k8s_pod_namespace_watts'] == {('default',): 25.0, ('monitoring',): 3.0}
+    assert samples['power_estimation_by_sensor_watts'] == {('pytest',): 28.0}
+
+
+def test_aggregates_only() -> None:
+    """
+    The series of the targets should not be exported when only the aggregates are exported.
+    """
+    collector = PowerReportCollector(['sensor', 'target'], samples_ttl=60, aggregates=[['sensor']], export_series=False)
+    collector.submit([make_report('a', 1), make_report('b', 1)], PowerReportEncoder, EncoderOptions([]))
+
+    samples = collect_samples(collector)
+
+    assert 'power_estimation_watts' not in samples
+    assert samples['power_estimation_by_sensor_watts'] == {('pytest',): 84.0}
+    assert samples['powerapi_prometheus_output_series'] == {(): 2}
+
+
+def test_submit_does_not_snapshot_the_series(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Submissions should not copy the series store, the generation of samples being built once by the next scrape.
+    """
+    collector = PowerReportCollector(['sensor', 'target'], samples_ttl=60)
+
+    built_generations = []
+    samples_generation_cls = collectors.SamplesGeneration
+    monkeypatch.setattr(collectors, 'SamplesGeneration', lambda *args: built_generations.append(args) or samples_generation_cls(*args))
+
+    for target in range(100):
+        collector.submit([make_report(str(target), 1)], PowerReportEncoder, EncoderOptions([]))
+
+    assert built_generations == []
+
+    output = collector.exposition(generate_latest, 'text/plain', False)
+    assert collector.exposition(generate_latest, 'text/plain', False) is output
+    assert b'target="99"' in output
+    assert len(built_generations) == 1
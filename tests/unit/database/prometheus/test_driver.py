@@ -0,0 +1,94 @@
+# Copyright (c) 2026, Inria
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import gzip
+from datetime import datetime, UTC
+from urllib.request import Request, urlopen
+
+import pytest
+
+pytest.importorskip('powerapi.database.prometheus.driver')  # The Prometheus driver requires external dependencies to work.
+
+from powerapi.database.prometheus.driver import PrometheusOutput
+from powerapi.report import PowerReport
+
+
+@pytest.fixture
+def prometheus_output() -> PrometheusOutput:
+    """
+    Fixture that provides a connected Prometheus output listening on a free local port.
+    """
+    output = PrometheusOutput(PowerReport, '127.0.0.1', 0, ['scope'])
+    output.connect()
+    yield output
+    output.disconnect()
+
+
+def scrape(output: PrometheusOutput, query: str = '', headers: dict[str, str] | None = None) -> tuple[dict[str, str], bytes]:
+    """
+    Scrape the metrics endpoint of the Prometheus output.
+    """
+    addr, port = output._http_server.server_address[:2]
+    with urlopen(Request(f'http://{addr}:{port}/metrics{query}', headers=headers or {}), timeout=5) as response:
+        return dict(response.headers), response.read()
+
+
+def test_scrape_power_reports(prometheus_output: PrometheusOutput) -> None:
+    """
+    The metrics endpoint should expose the submitted reports, compressed when requested by the scraper.
+    """
+    prometheus_output.write([PowerReport(datetime.now(UTC), 'pytest', 'target', 42.0, {'scope': 'cpu'})])
+
+    _, output = scrape(prometheus_output)
+    headers, compressed_output = scrape(prometheus_output, headers={'Accept-Encoding': 'gzip'})
+
+    assert b'power_estimation_watts{scope="cpu",sensor="pytest",target="target"} 42.0' in output
+    assert headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(compressed_output) == output
+
+
+def test_scrape_metrics_filtered_by_name(prometheus_output: PrometheusOutput) -> None:
+    """
+    The metrics endpoint should serve the requests filtering the metrics by name.
+    """
+    prometheus_output.write([PowerReport(datetime.now(UTC), 'pytest', 'target', 42.0, {'scope': 'cpu'})])
+
+    _, output = scrape(prometheus_output, '?name[]=powerapi_prometheus_output_series')
+
+    assert b'powerapi_prometheus_output_series 1.0' in output
+    assert b'power_estimation_watts{' not in output
+
+
+def test_aggregate_labels_are_added_to_the_tags() -> None:
+    """
+    The labels of the aggregates should be added to the tags exposed by the output, except the sensor and target ones.
+    """
+    output = PrometheusOutput(PowerReport, '127.0.0.1', 0, ['scope'], aggregates=[['k8s_pod_namespace', 'sensor'], ['scope']])
+
+    assert output.dynamic_tags == ['scope', 'k8s_pod_namespace']
+    assert output.metric_labels == ['sensor', 'target', 'scope', 'k8s_pod_namespace']
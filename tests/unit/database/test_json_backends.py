@@ -0,0 +1,140 @@
+# Copyright (c) 2026, Inria
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from datetime import datetime, UTC
+
+import pytest
+
+from powerapi.database import json_backends
+from powerapi.database.json_backends import JsonBackend, get_json_backend
+
+
+@pytest.fixture(params=['json', 'orjson', 'msgspec'])
+def json_backend(request) -> JsonBackend:
+    """
+    Return each JSON backend available in the test environment.
+    """
+    try:
+        return get_json_backend(request.param)
+    except ValueError:
+        pytest.skip(f'JSON backend {request.param} is not installed')
+
+
+def test_dumps_compact_document_with_datetime(json_backend):
+    """
+    Backends should produce compact documents with the datetime objects in ISO 8601 format.
+    """
+    document = {'timestamp': datetime(2026, 1, 2, 3, 4, 5, 678000, tzinfo=UTC), 'sensor': 'pytest', 'values': [1, 2.5]}
+
+    encoded = json_backend.dumps(document)
+
+    assert ' ' not in encoded
+    assert json_backend.dumpb(document) == encoded.encode('utf-8')
+    decoded = json_backend.loads(encoded)
+    assert datetime.fromisoformat(decoded.pop('timestamp')) == document.pop('timestamp')
+    assert decoded == document
+
+
+def test_dumps_lines_produces_one_document_per_line(json_backend):
+    """
+    Backends should serialize a batch of documents into JSON lines, even when the strings contain line feeds or separators.
+    """
+    documents = [{'sensor': 'a,\n,b', 'values': [1, 2]}, {'sensor': '},{', 'metadata': {}}, {}]
+
+    encoded = json_backend.dumps_lines(iter(documents))
+
+    assert encoded == ''.join(json_backend.dumps(document) + '\n' for document in documents)
+    assert [json_backend.loads(line) for line in encoded.splitlines()] == documents
+
+
+def test_dumps_lines_of_empty_batch(json_backend):
+    """
+    Backends should serialize an empty batch of documents into an empty string.
+    """
+    assert json_backend.dumps_lines([]) == ''
+
+
+@pytest.mark.parametrize('data', ['{"a": 1, "b": 2, "c": 3}', b'{"a": 1, "b": 2, "c": 3}'])
+def test_loads_str_and_bytes(json_backend, data):
+    """
+    Backends should decode documents stored in str and bytes objects.
+    """
+    assert json_backend.loads(data) == {'a': 1, 'b': 2, 'c': 3}
+
+
+@pytest.mark.parametrize('data', ['{"a": 1, "b":', '{"a": 1}{"b": 2}', ''])
+def test_loads_malformed_document_raises_value_error(json_backend, data):
+    """
+    Backends should raise a ValueError for malformed documents.
+    """
+    with pytest.raises(ValueError, match=r'.+'):
+        json_backend.loads(data)
+
+
+def test_dumps_unsupported_object_raises_type_error(json_backend):
+    """
+    Backends should raise a TypeError for objects that cannot be serialized.
+    """
+    with pytest.raises(TypeError):
+        json_backend.dumps({'value': object()})
+
+
+def test_orjson_backend_without_fragments(monkeypatch):
+    """
+    The orjson backend should serialize the batches of documents with the versions of orjson older than 3.9.
+    """
+    orjson = pytest.importorskip('orjson')
+    monkeypatch.delattr(orjson, 'Fragment', raising=False)
+    documents = [{'sensor': 'a,\n,b', 'values': [1, 2]}, {}]
+
+    backend = json_backends._orjson_backend()
+
+    assert backend.dumps_lines(iter(documents)) == '{"sensor":"a,\\n,b","values":[1,2]}\n{}\n'
+    assert backend.dumps_lines([]) == ''
+
+
+def test_get_unknown_json_backend():
+    """
+    Getting an unknown backend should raise a ValueError.
+    """
+    with pytest.raises(ValueError, match='Unknown JSON backend: invalid'):
+        get_json_backend('invalid')
+
+
+def test_get_auto_json_backend_returns_an_available_backend():
+    """
+    The default backend should be the first one installed, by order of preference.
+    """
+    installed_backends = []
+    for name in ('orjson', 'msgspec', 'json'):
+        try:
+            installed_backends.append(get_json_backend(name))
+        except ValueError:
+            continue
+
+    assert get_json_backend().name == installed_backends[0].name
@@ -27,9 +27,84 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import json
+import socket
+import time
+from datetime import datetime, UTC
+
 import pytest
 
+from powerapi.database.exceptions import ConnectionFailed
+from powerapi.database.socket.binary_protocol import BinaryFrameDecoder, BinaryFrameEncoder, FRAME_HEADER, PROTOCOL_PREAMBLE
+from powerapi.database.socket.driver import SocketInput, SocketInputFactory, parse_listen_address
 from powerapi.database.socket.tcp_server import JsonRequestHandler
+from powerapi.report import HWPCReport
+
+
+@pytest.fixture
+def hwpc_document() -> dict:
+    """
+    Return a HwPC report document using the layout sent by the sensor.
+    """
+    return {
+        'timestamp': 1700000000123,
+        'sensor': 'pytest-sensor',
+        'target': 'pytest-target',
+        'groups': {
+            'core': {
+                '0': {
+                    '0': {'CPU_CLK_THREAD_UNHALTED:REF_P': 1024, 'INSTRUCTIONS_RETIRED': 2 ** 40, 'time_enabled': 7},
+                    '1': {'CPU_CLK_THREAD_UNHALTED:REF_P': 2048, 'INSTRUCTIONS_RETIRED': 4096, 'time_enabled': 7},
+                },
+            },
+            'rapl': {
+                '0': {
+                    '0': {'RAPL_ENERGY_PKG': 123456, 'time_enabled': 7},
+                },
+            },
+        },
+        'metadata': {'scope': 'cpu'},
+    }
+
+
+def split_frames(data: bytes) -> list[bytes]:
+    """
+    Split the given data into frame payloads.
+    :param data: Encoded frames
+    :return: List of frame payloads
+    """
+    frames = []
+    offset = 0
+    while offset < len(data):
+        (length,) = FRAME_HEADER.unpack_from(data, offset)
+        offset += FRAME_HEADER.size
+        frames.append(data[offset:offset + length])
+        offset += length
+
+    return frames
+
+
+def send_data(address: str | tuple[str, int], data: bytes, family: int = socket.AF_INET, kind: int = socket.SOCK_STREAM) -> None:
+    """
+    Send the given data to the local socket listener.
+    """
+    with socket.socket(family, kind) as client:
+        client.settimeout(5.0)
+        client.connect(address)
+        client.sendall(data)
+
+
+def read_reports(database: SocketInput, count: int, timeout: float = 5.0) -> list:
+    """
+    Read reports from the socket database until the expected count is reached or the timeout expires.
+    """
+    reports = []
+    deadline = time.monotonic() + timeout
+    while len(reports) < count and time.monotonic() < deadline:
+        reports.extend(database.read(stream_mode=True))
+        time.sleep(0.01)
+
+    return reports
 
 
 def test_parse_json_empty_document():
@@ -82,6 +157,16 @@ def test_parse_multiple_json_documents():
     assert second_result == {"d": 4, "e": 5, "f": 6}
 
 
+def test_parse_three_json_documents():
+    """
+    Test parsing more than two JSON documents received on the same line.
+    """
+    document = '''{"a": 1}{"b": 2}{"c": 3}\n'''
+    results = JsonRequestHandler.parse_json_documents(document)
+
+    assert list(results) == [{"a": 1}, {"b": 2}, {"c": 3}]
+
+
 def test_parse_multiple_documents_first_valid_second_invalid():
     """
     Test parsing multiple JSON documents where the first document is valid and second is invalid.
@@ -94,3 +179,297 @@ def test_parse_multiple_documents_first_valid_second_invalid():
 
     with pytest.raises(StopIteration):
         next(results)
+
+
+def test_binary_frame_roundtrip(hwpc_document):
+    """
+    Test that a document encoded with the binary protocol is decoded to the same document.
+    """
+    encoder = BinaryFrameEncoder()
+    decoder = BinaryFrameDecoder()
+
+    results = [decoder.decode(frame) for frame in split_frames(encoder.encode(hwpc_document))]
+
+    assert results == [None, hwpc_document]
+
+
+def test_binary_frame_event_names_sent_once_per_connection(hwpc_document):
+    """
+    Test that the event names are only sent with the first report using them.
+    """
+    encoder = BinaryFrameEncoder()
+    decoder = BinaryFrameDecoder()
+    decoder.decode(split_frames(encoder.encode(hwpc_document))[0])
+
+    frames = split_frames(encoder.encode(hwpc_document))
+
+    assert len(frames) == 1
+    assert decoder.decode(frames[0]) == hwpc_document
+
+
+def test_binary_frame_without_metadata(hwpc_document):
+    """
+    Test that a document without metadata is decoded with an empty metadata dict.
+    """
+    hwpc_document.pop('metadata')
+    decoder = BinaryFrameDecoder()
+
+    result = [decoder.decode(frame) for frame in split_frames(BinaryFrameEncoder().encode(hwpc_document))][-1]
+
+    assert result['metadata'] == {}
+
+
+def test_binary_frame_with_unknown_event_id(hwpc_document):
+    """
+    Test that decoding a report referring to events that were not negotiated raises a ValueError.
+    """
+    report_frame = split_frames(BinaryFrameEncoder().encode(hwpc_document))[1]
+
+    with pytest.raises(ValueError, match='Malformed frame'):
+        BinaryFrameDecoder().decode(report_frame)
+
+
+@pytest.mark.parametrize('frame', [b'', b'\xff', b'\x02\x00\x01'])
+def test_binary_frame_malformed(frame):
+    """
+    Test that decoding a malformed frame raises a ValueError.
+    """
+    with pytest.raises(ValueError, match='frame'):
+        BinaryFrameDecoder().decode(frame)
+
+
+def test_binary_frame_encoder_rejects_inconsistent_group_events(hwpc_document):
+    """
+    Test that encoding a group whose rows do not share the same events raises a ValueError.
+    """
+    hwpc_document['groups']['core']['0']['1'].pop('time_enabled')
+
+    with pytest.raises(ValueError, match='Inconsistent events in group core'):
+        BinaryFrameEncoder().encode(hwpc_document)
+
+
+def test_socket_input_factory_with_unsupported_protocol():
+    """
+    Test that the factory rejects unknown protocols.
+    """
+    with pytest.raises(ValueError, match='Unsupported protocol: xml'):
+        SocketInputFactory(HWPCReport, 'localhost', 9080, 'xml')
+
+
+@pytest.fixture
+def socket_input_factory():
+    """
+    Return a factory creating connected socket databases, disconnected at the end of the test.
+    """
+    databases = []
+
+    def create_socket_input(host: str, protocol: str = 'auto', workers: int = 1) -> SocketInput:
+        database = SocketInputFactory(HWPCReport, host, 0, protocol, workers).create()
+        database.connect()
+        databases.append(database)
+        return database
+
+    yield create_socket_input
+
+    for database in databases:
+        database.disconnect()
+
+
+@pytest.fixture
+def expected_report(hwpc_document) -> HWPCReport:
+    """
+    Return the report expected to be decoded from the HwPC report document.
+    """
+    timestamp = datetime.fromtimestamp(hwpc_document['timestamp'] / 1000, tz=UTC)
+    return HWPCReport(timestamp, 'pytest-sensor', 'pytest-target', hwpc_document['groups'], {'scope': 'cpu'})
+
+
+def encode_clients_data(hwpc_document: dict, protocol: str) -> list[bytes]:
+    """
+    Encode the HwPC report document using the protocol(s) supported by a listener.
+    """
+    clients_data = []
+    if protocol in ('auto', 'json'):
+        clients_data.append((json.dumps(hwpc_document) + '\n').encode('utf-8'))
+    if protocol in ('auto', 'binary'):
+        clients_data.append(PROTOCOL_PREAMBLE + BinaryFrameEncoder().encode(hwpc_document))
+
+    return clients_data
+
+
+@pytest.mark.parametrize(('host', 'port', 'expected'), [
+    ('localhost', 9080, ('tcp', ('localhost', 9080))),
+    ('tcp://127.0.0.1', 9080, ('tcp', ('127.0.0.1', 9080))),
+    ('udp://0.0.0.0:9999', 9080, ('udp', ('0.0.0.0', 9999))),
+    ('udp://[::1]:9999', 9080, ('udp', ('::1', 9999))),
+    ('unix:///run/powerapi/sensor.sock', 9080, ('unix', '/run/powerapi/sensor.sock')),
+])
+def test_parse_listen_address(host, port, expected):
+    """
+    Test parsing the listen address of the socket database.
+    """
+    assert parse_listen_address(host, port) == expected
+
+
+@pytest.mark.parametrize(('host', 'error'), [
+    ('http://localhost', 'Unsupported listen address scheme: http'),
+    ('unix://', 'Missing socket path in listen address: unix://'),
+    ('udp://localhost:invalid', 'Port could not be cast to integer value'),
+])
+def test_socket_input_factory_with_invalid_listen_address(host, error):
+    """
+    Test that the factory rejects invalid listen addresses.
+    """
+    with pytest.raises(ValueError, match=error):
+        SocketInputFactory(HWPCReport, host, 9080)
+
+
+@pytest.mark.parametrize('protocol', ['auto', 'json', 'binary'])
+def test_socket_input_receive_reports(socket_input_factory, hwpc_document, expected_report, protocol):
+    """
+    Test that the socket input receives reports sent using the protocol supported by the listener.
+    """
+    database = socket_input_factory('127.0.0.1', protocol)
+    clients_data = encode_clients_data(hwpc_document, protocol)
+
+    for data in clients_data:
+        send_data(database.server_address, data)
+
+    assert read_reports(database, len(clients_data)) == [expected_report] * len(clients_data)
+
+
+@pytest.mark.parametrize('protocol', ['auto', 'json', 'binary'])
+def test_socket_input_receive_reports_over_unix_socket(socket_input_factory, tmp_path, hwpc_document, expected_report, protocol):
+    """
+    Test that the socket input receives reports sent over a Unix domain socket.
+    """
+    socket_path = tmp_path / 'powerapi.sock'
+    database = socket_input_factory(f'unix://{socket_path}', protocol)
+    clients_data = encode_clients_data(hwpc_document, protocol)
+
+    for data in clients_data:
+        send_data(str(socket_path), data, socket.AF_UNIX)
+
+    assert read_reports(database, len(clients_data)) == [expected_report] * len(clients_data)
+
+    (source, counters), = database.statistics.snapshot().items()
+    assert source.startswith(f'unix://{socket_path}')
+    assert counters.connections == len(clients_data)
+    assert counters.received_documents == len(clients_data)
+
+
+@pytest.mark.parametrize('protocol', ['auto', 'json', 'binary'])
+def test_socket_input_receive_reports_over_udp(socket_input_factory, hwpc_document, expected_report, protocol):
+    """
+    Test that the socket input receives reports sent as UDP datagrams.
+    """
+    database = socket_input_factory('udp://127.0.0.1', protocol)
+    clients_data = encode_clients_data(hwpc_document, protocol)
+
+    for data in clients_data:
+        send_data(database.server_address, data, kind=socket.SOCK_DGRAM)
+
+    assert read_reports(database, len(clients_data)) == [expected_report] * len(clients_data)
+
+
+def test_socket_input_records_per_source_statistics(socket_input_factory, hwpc_document):
+    """
+    Test that the socket input counts the received and malformed documents per source.
+    """
+    database = socket_input_factory('udp://127.0.0.1', 'binary')
+    valid_datagram = PROTOCOL_PREAMBLE + BinaryFrameEncoder().encode(hwpc_document)
+    malformed_datagram = valid_datagram[:-1]
+
+    for data in (valid_datagram, malformed_datagram, valid_datagram):
+        send_data(database.server_address, data, kind=socket.SOCK_DGRAM)
+
+    assert len(read_reports(database, 2)) == 2
+
+    counters = database.statistics.snapshot()['udp://127.0.0.1']
+    assert counters.received_documents == 2
+    assert counters.malformed_documents == 1
+    assert counters.received_bytes == 3 * len(valid_datagram) - 1
+
+
+def test_socket_input_connect_fails_when_address_in_use(socket_input_factory):
+    """
+    Test that connecting the socket input fails when the listen address is already in use.
+    """
+    database = socket_input_factory('127.0.0.1')
+    _, port = database.server_address
+
+    with pytest.raises(ConnectionFailed):
+        SocketInput(HWPCReport, '127.0.0.1', port).connect()
+
+
+def test_socket_input_wait_for_reports_timeout(socket_input_factory):
+    """
+    Test that waiting for reports returns False when no data is received before the timeout.
+    """
+    database = socket_input_factory('127.0.0.1')
+
+    assert database.wait_for_reports(timeout=0.05) is False
+    assert list(database.read(stream_mode=True)) == []
+
+
+def test_socket_input_wait_for_reports_wakes_up_on_data(socket_input_factory, hwpc_document, expected_report):
+    """
+    Test that waiting for reports returns as soon as data is received, and that the data is then read first.
+    """
+    database = socket_input_factory('127.0.0.1')
+    for data in encode_clients_data(hwpc_document, 'auto'):
+        send_data(database.server_address, data)
+
+    assert database.wait_for_reports(timeout=5.0) is True
+    assert database.wait_for_reports(timeout=5.0) is True
+    assert read_reports(database, 2) == [expected_report] * 2
+
+
+@pytest.mark.parametrize(('host', 'workers', 'error'), [
+    ('127.0.0.1', 0, 'Invalid number of ingestion workers: 0'),
+    ('unix:///run/powerapi/sensor.sock', 2, 'Ingestion workers are not supported with Unix domain sockets'),
+])
+def test_socket_input_factory_with_invalid_workers(host, workers, error):
+    """
+    Test that the factory rejects invalid ingestion workers configurations.
+    """
+    with pytest.raises(ValueError, match=error):
+        SocketInputFactory(HWPCReport, host, 9080, workers=workers)
+
+
+@pytest.mark.parametrize(('host', 'kind', 'source'), [
+    ('127.0.0.1', socket.SOCK_STREAM, 'tcp://127.0.0.1'),
+    ('udp://127.0.0.1', socket.SOCK_DGRAM, 'udp://127.0.0.1'),
+])
+def test_socket_input_receive_reports_with_ingestion_workers(socket_input_factory, hwpc_document, expected_report, host, kind, source):
+    """
+    Test that the reports received by the ingestion workers are merged, along with their statistics, by the socket input.
+    """
+    database = socket_input_factory(host, 'auto', workers=2)
+    clients_data = encode_clients_data(hwpc_document, 'auto') * 4
+
+    for data in clients_data:
+        send_data(database.server_address, data, kind=kind)
+
+    assert database.wait_for_reports(timeout=5.0) is True
+    assert read_reports(database, len(clients_data)) == [expected_report] * len(clients_data)
+
+    # The statistics of the workers can be forwarded after the reports.
+    deadline = time.monotonic() + 5.0
+    while database.statistics.snapshot()[source].received_documents < len(clients_data) and time.monotonic() < deadline:
+        database.wait_for_reports(timeout=0.1)
+
+    counters = database.statistics.snapshot()[source]
+    assert counters.received_documents == len(clients_data)
+    assert counters.malformed_documents == 0
+
+
+def test_socket_input_with_ingestion_workers_connect_fails_when_address_in_use(socket_input_factory):
+    """
+    Test that connecting the socket input with ingestion workers fails when the listen address is already in use.
+    """
+    database = socket_input_factory('127.0.0.1')
+    _, port = database.server_address
+
+    with pytest.raises(ConnectionFailed):
+        SocketInput(HWPCReport, '127.0.0.1', port, workers=2).connect()
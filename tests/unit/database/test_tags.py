@@ -0,0 +1,90 @@
+# Copyright (c) 2026, Inria
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import pytest
+
+from powerapi.database.tags import TagsPlanCache, flatten_tags, flattened_tags_plan
+from powerapi.report import Report
+
+
+@pytest.mark.parametrize('metadata', [
+    {},
+    {'scope': 'cpu', 'socket': 0},
+    {'scope': 'cpu', 'k8s': {'namespace': 'default', 'pod': 'app'}, 'empty': {}},
+])
+def test_flatten_tags_with_plan(metadata: dict) -> None:
+    """
+    Flattening the metadata with its plan should give the same tags as the report flattening.
+    """
+    cache = TagsPlanCache(flattened_tags_plan)
+
+    assert flatten_tags(metadata, cache.get(metadata)) == Report.flatten_tags(metadata)
+
+
+def test_plan_is_reused_for_same_metadata_shape() -> None:
+    """
+    The plan built for a metadata shape should be reused for the metadata having the same keys, whatever their values.
+    """
+    cache = TagsPlanCache(flattened_tags_plan)
+
+    plan = cache.get({'scope': 'cpu', 'k8s': {'pod': 'a'}})
+    same_shape_plan = cache.get({'scope': 'dram', 'k8s': {'pod': 'b'}})
+    other_shape_plan = cache.get({'scope': 'cpu', 'k8s': {'container': 'c'}})
+
+    assert same_shape_plan is plan
+    assert other_shape_plan is not plan
+    assert flatten_tags({'scope': 'dram', 'k8s': {'pod': 'b'}}, same_shape_plan) == {'scope': 'dram', 'k8s_pod': 'b'}
+
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.size) == (1, 2, 2)
+    assert info.hit_rate == pytest.approx(1 / 3)
+
+
+def test_least_recently_used_plan_is_evicted() -> None:
+    """
+    The least recently used plan should be evicted once the cache is full.
+    """
+    built_plans = []
+    cache = TagsPlanCache(lambda getters: built_plans.append(getters) or tuple(getters), max_size=2)
+
+    cache.get({'a': 1})
+    cache.get({'b': 1})
+    cache.get({'a': 2})
+    cache.get({'c': 1})
+    cache.get({'a': 3})
+    cache.get({'b': 2})
+
+    assert [tuple(getters) for getters in built_plans] == [('a',), ('b',), ('c',), ('b',)]
+    assert cache.cache_info().size == 2
+
+
+def test_hit_rate_without_lookup() -> None:
+    """
+    The hit rate of an unused cache should be zero.
+    """
+    assert TagsPlanCache(flattened_tags_plan).cache_info().hit_rate == 0.0
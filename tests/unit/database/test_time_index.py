@@ -0,0 +1,123 @@
+# Copyright (c) 2026, Inria
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from datetime import datetime, UTC
+
+import pytest
+
+from powerapi.database.time_index import TimeIndexBlock, TimeIndexBuilder, parse_time_window_bound, parse_timestamp_milliseconds, \
+    read_time_index, time_index_filepath, time_index_range
+
+
+def make_datetime(milliseconds: int) -> datetime:
+    """
+    Create a timezone-aware datetime from a number of milliseconds since epoch.
+    :param milliseconds: Number of milliseconds since epoch
+    :return: Datetime object
+    """
+    return datetime.fromtimestamp(milliseconds / 1000, tz=UTC)
+
+
+@pytest.fixture
+def blocks() -> list[TimeIndexBlock]:
+    """
+    Return the blocks of an index of three consecutive time ranges.
+    """
+    return [TimeIndexBlock(10, 100, 1000, 1999), TimeIndexBlock(100, 200, 2000, 2999), TimeIndexBlock(200, 300, 3000, 3999)]
+
+
+def test_builder_groups_chunks_into_blocks_of_the_block_size(tmp_path):
+    """
+    The builder should group the chunks into blocks of at least the block size, the skipped chunks being excluded.
+    """
+    builder = TimeIndexBuilder(100)
+    builder.skip(10)
+    builder.add(60, 1000, 1500)
+    builder.add(60, 1200, 1100)
+    builder.add(20, 3000, 3000)
+
+    index_filepath = time_index_filepath(tmp_path / 'power.jsonl')
+    builder.write(index_filepath)
+
+    assert index_filepath.name == 'power.jsonl.idx'
+    assert read_time_index(index_filepath) == [TimeIndexBlock(10, 130, 1000, 1500), TimeIndexBlock(130, 150, 3000, 3000)]
+    assert not list(tmp_path.glob('*.part'))
+
+
+def test_read_malformed_time_index_raises_value_error(tmp_path):
+    """
+    Reading a malformed index should raise a ValueError.
+    """
+    index_filepath = tmp_path / 'power.jsonl.idx'
+    index_filepath.write_text('10 100 invalid 1999\n', encoding='utf-8')
+
+    with pytest.raises(ValueError, match=r'invalid'):
+        read_time_index(index_filepath)
+
+
+@pytest.mark.parametrize(('time_from', 'time_to', 'expected_range'), [
+    (None, None, (10, None)),
+    (1500, 1600, (10, 100)),
+    (1999, 2000, (10, 100)),
+    (2500, 3500, (100, None)),
+    (None, 1000, None),
+    (5000, None, (300, None)),
+])
+def test_time_index_range(blocks, time_from, time_to, expected_range):
+    """
+    The byte range should cover the blocks overlapping the time window, and end with the file when it covers the last block.
+    """
+    time_from = make_datetime(time_from) if time_from is not None else None
+    time_to = make_datetime(time_to) if time_to is not None else None
+
+    assert time_index_range(blocks, time_from, time_to) == expected_range
+
+
+@pytest.mark.parametrize(('value', 'expected_milliseconds'), [
+    ('1767225600000', 1767225600000),
+    ('2026-01-01T00:00:00.000+00:00', 1767225600000),
+    ('2026-01-01T01:00:00+01:00', 1767225600000),
+    ('2026-01-01T00:00:00', 1767225600000),
+])
+def test_parse_timestamp_milliseconds(value, expected_milliseconds):
+    """
+    Timestamps stored in milliseconds or in ISO 8601 format (UTC if naive) should be parsed to milliseconds since epoch.
+    """
+    assert parse_timestamp_milliseconds(value) == expected_milliseconds
+
+
+def test_parse_time_window_bound():
+    """
+    Time window bounds should be parsed into timezone-aware datetime objects, naive timestamps being considered as UTC.
+    """
+    assert parse_time_window_bound(None) is None
+    assert parse_time_window_bound('2026-01-01') == datetime(2026, 1, 1, tzinfo=UTC)
+    assert parse_time_window_bound('2026-01-01T01:00:00+01:00') == datetime(2026, 1, 1, tzinfo=UTC)
+
+    with pytest.raises(ValueError, match=r'.+'):
+        parse_time_window_bound('yesterday')
@@ -0,0 +1,120 @@
+# Copyright (c) 2026, Inria
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import time
+from collections.abc import Iterable
+from queue import SimpleQueue, Empty
+from threading import Event
+from unittest.mock import Mock
+
+import pytest
+
+from powerapi.database.driver import PushBasedDatabase
+from powerapi.filter import BroadcastReportFilter
+from powerapi.puller.database_poller import DatabasePollerThread
+from powerapi.report import Report
+from tests.utils.db import PrebuiltDatabaseFactory, make_report
+
+
+class LocalPushBasedDatabase(PushBasedDatabase):
+    """
+    Push-based database storing the reports pushed by the test inside a local queue.
+    """
+
+    def __init__(self):
+        super().__init__()
+
+        self.q = SimpleQueue()
+        self.pending = []
+
+    def connect(self) -> None:
+        pass
+
+    def disconnect(self) -> None:
+        pass
+
+    @staticmethod
+    def supported_read_types() -> Iterable[type[Report]]:
+        return [Report]
+
+    def push(self, report: Report) -> None:
+        self.q.put(report)
+
+    def wait_for_reports(self, timeout: float) -> bool:
+        try:
+            self.pending.append(self.q.get(timeout=timeout))
+        except Empty:
+            return False
+
+        return True
+
+    def read(self, stream_mode: bool = False) -> Iterable[Report]:
+        reports, self.pending = self.pending, []
+        return reports
+
+
+@pytest.fixture
+def received_report_event():
+    """
+    Fixture for the event set when a report is dispatched.
+    """
+    return Event()
+
+
+@pytest.fixture
+def report_filter(received_report_event):
+    """
+    Fixture for a report filter routing every report to a single dispatcher.
+    """
+    dispatcher = Mock(name='dispatcher')
+    dispatcher.send_data.side_effect = lambda _: received_report_event.set()
+
+    report_filter = BroadcastReportFilter()
+    report_filter.register(lambda _: True, dispatcher)
+    return report_filter
+
+
+def test_database_poller_wakes_up_on_push_based_database_reports(report_filter, received_report_event):
+    """
+    Test that the database poller reads a push-based database as soon as reports are available.
+    """
+    database = LocalPushBasedDatabase()
+    poller = DatabasePollerThread(PrebuiltDatabaseFactory(database), report_filter, stream_mode=True, poll_interval=30.0)
+    poller.start()
+    assert poller.wait_ready(timeout=5.0)
+
+    time.sleep(0.1)  # Let the poller drain the database and wait for reports.
+    database.push(make_report())
+
+    try:
+        assert received_report_event.wait(timeout=5.0)
+    finally:
+        poller.stop()
+        database.push(make_report())  # Wake up the poller so that it can exit.
+        poller.join(timeout=5.0)